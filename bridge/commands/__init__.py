@@ -14,137 +14,229 @@ Role: Public interface declaration. Prevents hidden powers and ad-hoc actions.
 
 from __future__ import annotations
 
+import importlib
 import inspect
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from types import MappingProxyType
-from typing import Any
-
-from .backup import (
-    BackupCreateResult,
-    BackupListResult,
-    BackupRestoreResult,
-    BackupVerifyResult,
-    execute_backup_create,
-    execute_backup_list,
-    execute_backup_restore,
-    execute_backup_verify,
-)
-from .cleanup import (
-    CleanupResult,
-    execute_cleanup,
-)
-from .config import (
-    ConfigEditResult,
-    ConfigResetResult,
-    ConfigShowResult,
-    ConfigValidateResult,
-    execute_config_edit,
-    execute_config_reset,
-    execute_config_show,
-    execute_config_validate,
-)
-from .export import (
-    ExportFormat,
-    ExportRequest,
-    ExportType,
-    execute_export,
-    export_constitutional_report,
-    export_notes_markdown,
-    export_observations_json,
-)
-
-# Import all command modules
-from .investigate import (
-    InvestigationRequest,
-    InvestigationScope,
-    InvestigationType,
-    execute_investigation,
-    fork_investigation,
-    new_investigation,
-    resume_investigation,
-)
-from .observe import (
-    ObservationRequest,
-    ObservationType,
-    execute_observation,
-    observe_file_structure,
-    observe_imports,
-)
-from .pattern import (
-    PatternApplyResult,
-    PatternAddResult,
-    PatternCreateResult,
-    PatternListResult,
-    PatternScanCommandResult,
-    PatternSearchCommandResult,
-    PatternShareResult,
-    execute_pattern_apply,
-    execute_pattern_add,
-    execute_pattern_create,
-    execute_pattern_list,
-    execute_pattern_search,
-    execute_pattern_scan,
-    execute_pattern_share,
-)
-from .query import (
-    PatternName,
-    QueryRequest,
-    QueryType,
-    QuestionName,
-    execute_query,
-)
-from .repair import (
-    RepairResult,
-    execute_repair,
-)
-from .search import (
-    SearchCommandResult,
-    SearchResult,
-    SearchResults,
-    execute_search,
-)
-from .test_cmd import (
-    TestResult,
-    execute_test,
-)
-from .watch import (
-    execute_diff,
-    execute_status,
-    execute_watch,
-)
-from .team import (
-    execute_team_add,
-    execute_team_create,
-    execute_team_list,
-    execute_team_unlock,
-)
-from .share import (
-    execute_share_create,
-    execute_share_list,
-    execute_share_resolve,
-    execute_share_revoke,
-)
-from .comment import (
-    execute_comment_add,
-    execute_comment_list,
-    execute_comment_resolve,
-)
-from .history import (
-    execute_history,
-)
-from .graph import (
-    execute_graph,
-)
-from .recommendations import (
-    execute_recommendations,
-)
-from .search_semantic import (
-    execute_hybrid_search,
-    execute_index,
-    execute_semantic_search,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .backup import (
+        BackupCreateResult,
+        BackupListResult,
+        BackupRestoreResult,
+        BackupVerifyResult,
+        execute_backup_create,
+        execute_backup_list,
+        execute_backup_restore,
+        execute_backup_verify,
+    )
+    from .cleanup import (
+        CleanupResult,
+        execute_cleanup,
+    )
+    from .config import (
+        ConfigEditResult,
+        ConfigResetResult,
+        ConfigShowResult,
+        ConfigValidateResult,
+        execute_config_edit,
+        execute_config_reset,
+        execute_config_show,
+        execute_config_validate,
+    )
+    from .export import (
+        ExportFormat,
+        ExportRequest,
+        ExportType,
+        execute_export,
+        export_constitutional_report,
+        export_notes_markdown,
+        export_observations_json,
+    )
+
+    from .investigate import (
+        InvestigationRequest,
+        InvestigationScope,
+        InvestigationType,
+        execute_investigation,
+        fork_investigation,
+        new_investigation,
+        resume_investigation,
+    )
+    from .observe import (
+        ObservationRequest,
+        ObservationType,
+        execute_observation,
+        observe_file_structure,
+        observe_imports,
+    )
+    from .pattern import (
+        PatternApplyResult,
+        PatternAddResult,
+        PatternCreateResult,
+        PatternListResult,
+        PatternScanCommandResult,
+        PatternSearchCommandResult,
+        PatternShareResult,
+        execute_pattern_apply,
+        execute_pattern_add,
+        execute_pattern_create,
+        execute_pattern_list,
+        execute_pattern_search,
+        execute_pattern_scan,
+        execute_pattern_share,
+    )
+    from .query import (
+        PatternName,
+        QueryRequest,
+        QueryType,
+        QuestionName,
+        execute_query,
+    )
+    from .repair import (
+        RepairResult,
+        execute_repair,
+    )
+    from .search import (
+        SearchCommandResult,
+        SearchResult,
+        SearchResults,
+        execute_search,
+    )
+    from .test_cmd import (
+        TestResult,
+        execute_test,
+    )
+    from .watch import (
+        execute_diff,
+        execute_status,
+        execute_watch,
+    )
+    from .team import (
+        execute_team_add,
+        execute_team_create,
+        execute_team_list,
+        execute_team_unlock,
+    )
+    from .share import (
+        execute_share_create,
+        execute_share_list,
+        execute_share_resolve,
+        execute_share_revoke,
+    )
+    from .comment import (
+        execute_comment_add,
+        execute_comment_list,
+        execute_comment_resolve,
+    )
+    from .history import (
+        execute_history,
+    )
+    from .graph import (
+        execute_graph,
+    )
+    from .recommendations import (
+        execute_recommendations,
+    )
+    from .search_semantic import (
+        execute_hybrid_search,
+        execute_index,
+        execute_semantic_search,
+    )
+
+# Public name -> defining submodule. Command modules import most of the
+# system, so each is imported on first access (PEP 562) instead of with
+# the package: `codemarshal search` must not pay for `investigate`.
+_EXPORTS: dict[str, str] = {
+    "BackupCreateResult": ".backup",
+    "BackupListResult": ".backup",
+    "BackupRestoreResult": ".backup",
+    "BackupVerifyResult": ".backup",
+    "execute_backup_create": ".backup",
+    "execute_backup_list": ".backup",
+    "execute_backup_restore": ".backup",
+    "execute_backup_verify": ".backup",
+    "CleanupResult": ".cleanup",
+    "execute_cleanup": ".cleanup",
+    "ConfigEditResult": ".config",
+    "ConfigResetResult": ".config",
+    "ConfigShowResult": ".config",
+    "ConfigValidateResult": ".config",
+    "execute_config_edit": ".config",
+    "execute_config_reset": ".config",
+    "execute_config_show": ".config",
+    "execute_config_validate": ".config",
+    "ExportFormat": ".export",
+    "ExportRequest": ".export",
+    "ExportType": ".export",
+    "execute_export": ".export",
+    "export_constitutional_report": ".export",
+    "export_notes_markdown": ".export",
+    "export_observations_json": ".export",
+    "InvestigationRequest": ".investigate",
+    "InvestigationScope": ".investigate",
+    "InvestigationType": ".investigate",
+    "execute_investigation": ".investigate",
+    "fork_investigation": ".investigate",
+    "new_investigation": ".investigate",
+    "resume_investigation": ".investigate",
+    "ObservationRequest": ".observe",
+    "ObservationType": ".observe",
+    "execute_observation": ".observe",
+    "observe_file_structure": ".observe",
+    "observe_imports": ".observe",
+    "PatternApplyResult": ".pattern",
+    "PatternAddResult": ".pattern",
+    "PatternCreateResult": ".pattern",
+    "PatternListResult": ".pattern",
+    "PatternScanCommandResult": ".pattern",
+    "PatternSearchCommandResult": ".pattern",
+    "PatternShareResult": ".pattern",
+    "execute_pattern_apply": ".pattern",
+    "execute_pattern_add": ".pattern",
+    "execute_pattern_create": ".pattern",
+    "execute_pattern_list": ".pattern",
+    "execute_pattern_search": ".pattern",
+    "execute_pattern_scan": ".pattern",
+    "execute_pattern_share": ".pattern",
+    "PatternName": ".query",
+    "QueryRequest": ".query",
+    "QueryType": ".query",
+    "QuestionName": ".query",
+    "execute_query": ".query",
+    "RepairResult": ".repair",
+    "execute_repair": ".repair",
+    "SearchCommandResult": ".search",
+    "SearchResult": ".search",
+    "SearchResults": ".search",
+    "execute_search": ".search",
+    "TestResult": ".test_cmd",
+    "execute_test": ".test_cmd",
+    "execute_diff": ".watch",
+    "execute_status": ".watch",
+    "execute_watch": ".watch",
+    "execute_team_add": ".team",
+    "execute_team_create": ".team",
+    "execute_team_list": ".team",
+    "execute_team_unlock": ".team",
+    "execute_share_create": ".share",
+    "execute_share_list": ".share",
+    "execute_share_resolve": ".share",
+    "execute_share_revoke": ".share",
+    "execute_comment_add": ".comment",
+    "execute_comment_list": ".comment",
+    "execute_comment_resolve": ".comment",
+    "execute_history": ".history",
+    "execute_graph": ".graph",
+    "execute_recommendations": ".recommendations",
+    "execute_hybrid_search": ".search_semantic",
+    "execute_index": ".search_semantic",
+    "execute_semantic_search": ".search_semantic",
+}
 
 
 class CommandName(Enum):
@@ -178,50 +270,86 @@ class CommandSurface:
     constructors: dict[CommandName, dict[str, Callable]] = field(default_factory=dict)
 
 
-# Build the complete command surface
-_COMMAND_SURFACE = CommandSurface(
-    commands=MappingProxyType(
-        {
-            CommandName.INVESTIGATE: execute_investigation,
-            CommandName.OBSERVE: execute_observation,
-            CommandName.QUERY: execute_query,
-            CommandName.EXPORT: execute_export,
-        }
-    ),
-    request_types=MappingProxyType(
-        {
-            CommandName.INVESTIGATE: InvestigationRequest,
-            CommandName.OBSERVE: ObservationRequest,
-            CommandName.QUERY: QueryRequest,
-            CommandName.EXPORT: ExportRequest,
-        }
-    ),
-    constructors=MappingProxyType(
-        {
-            CommandName.INVESTIGATE: MappingProxyType(
-                {
-                    "new": new_investigation,
-                    "resume": resume_investigation,
-                    "fork": fork_investigation,
-                }
-            ),
-            CommandName.OBSERVE: MappingProxyType(
-                {
-                    "file_structure": observe_file_structure,
-                    "imports": observe_imports,
-                }
-            ),
-            CommandName.QUERY: MappingProxyType({}),  # No convenience constructors
-            CommandName.EXPORT: MappingProxyType(
-                {
-                    "observations_json": export_observations_json,
-                    "notes_markdown": export_notes_markdown,
-                    "constitutional_report": export_constitutional_report,
-                }
-            ),
-        }
-    ),
-)
+_COMMAND_SURFACE: CommandSurface | None = None
+
+
+def _command_surface() -> CommandSurface:
+    """The complete command surface, built (and validated) on first use."""
+    global _COMMAND_SURFACE
+    if _COMMAND_SURFACE is None:
+        _COMMAND_SURFACE = _build_command_surface()
+        # Validate integrity once (except during testing)
+        if "pytest" not in sys.modules and "unittest" not in sys.modules:
+            validate_command_integrity()
+    return _COMMAND_SURFACE
+
+
+def _build_command_surface() -> CommandSurface:
+    from .export import (
+        ExportRequest,
+        execute_export,
+        export_constitutional_report,
+        export_notes_markdown,
+        export_observations_json,
+    )
+    from .investigate import (
+        InvestigationRequest,
+        execute_investigation,
+        fork_investigation,
+        new_investigation,
+        resume_investigation,
+    )
+    from .observe import (
+        ObservationRequest,
+        execute_observation,
+        observe_file_structure,
+        observe_imports,
+    )
+    from .query import QueryRequest, execute_query
+
+    return CommandSurface(
+        commands=MappingProxyType(
+            {
+                CommandName.INVESTIGATE: execute_investigation,
+                CommandName.OBSERVE: execute_observation,
+                CommandName.QUERY: execute_query,
+                CommandName.EXPORT: execute_export,
+            }
+        ),
+        request_types=MappingProxyType(
+            {
+                CommandName.INVESTIGATE: InvestigationRequest,
+                CommandName.OBSERVE: ObservationRequest,
+                CommandName.QUERY: QueryRequest,
+                CommandName.EXPORT: ExportRequest,
+            }
+        ),
+        constructors=MappingProxyType(
+            {
+                CommandName.INVESTIGATE: MappingProxyType(
+                    {
+                        "new": new_investigation,
+                        "resume": resume_investigation,
+                        "fork": fork_investigation,
+                    }
+                ),
+                CommandName.OBSERVE: MappingProxyType(
+                    {
+                        "file_structure": observe_file_structure,
+                        "imports": observe_imports,
+                    }
+                ),
+                CommandName.QUERY: MappingProxyType({}),  # No convenience constructors
+                CommandName.EXPORT: MappingProxyType(
+                    {
+                        "observations_json": export_observations_json,
+                        "notes_markdown": export_notes_markdown,
+                        "constitutional_report": export_constitutional_report,
+                    }
+                ),
+            }
+        ),
+    )
 
 
 def get_command(name: str | CommandName) -> Callable | None:
@@ -246,7 +374,7 @@ def get_command(name: str | CommandName) -> Callable | None:
     else:
         cmd_name = name
 
-    command = _COMMAND_SURFACE.commands.get(cmd_name)
+    command = _command_surface().commands.get(cmd_name)
 
     # Validate command signature
     if command:
@@ -273,7 +401,7 @@ def get_request_type(name: str | CommandName) -> type | None:
     else:
         cmd_name = name
 
-    return _COMMAND_SURFACE.request_types.get(cmd_name)
+    return _command_surface().request_types.get(cmd_name)
 
 
 def get_constructors(name: str | CommandName) -> dict[str, Callable]:
@@ -294,7 +422,7 @@ def get_constructors(name: str | CommandName) -> dict[str, Callable]:
     else:
         cmd_name = name
 
-    return _COMMAND_SURFACE.constructors.get(cmd_name, {}).copy()
+    return _command_surface().constructors.get(cmd_name, {}).copy()
 
 
 def list_commands() -> dict[str, dict[str, Any]]:
@@ -306,15 +434,15 @@ def list_commands() -> dict[str, dict[str, Any]]:
     """
     result = {}
 
-    for cmd_name, cmd_func in _COMMAND_SURFACE.commands.items():
+    for cmd_name, cmd_func in _command_surface().commands.items():
         # Get function signature for documentation
         sig = inspect.signature(cmd_func)
 
         # Get request type
-        request_type = _COMMAND_SURFACE.request_types.get(cmd_name)
+        request_type = _command_surface().request_types.get(cmd_name)
 
         # Get constructors
-        constructors = _COMMAND_SURFACE.constructors.get(cmd_name, {})
+        constructors = _command_surface().constructors.get(cmd_name, {})
 
         result[cmd_name.value] = {
             "function": cmd_func.__name__,
@@ -369,15 +497,15 @@ def validate_command_integrity() -> dict[str, bool]:
 
 def _check_all_commands_exported() -> bool:
     """Check that all command functions are properly exported from their modules."""
-    expected_exports = {
-        "execute_investigation": execute_investigation,
-        "execute_observation": execute_observation,
-        "execute_query": execute_query,
-        "execute_export": execute_export,
-    }
-
-    for _name, func in expected_exports.items():
-        if func is None:
+    expected_exports = (
+        "execute_investigation",
+        "execute_observation",
+        "execute_query",
+        "execute_export",
+    )
+
+    for name in expected_exports:
+        if __getattr__(name) is None:
             return False
 
     return True
@@ -399,7 +527,7 @@ def _check_no_prohibited_imports() -> bool:
 
 def _check_command_signatures() -> bool:
     """Check that all commands have the expected signature."""
-    for cmd_name, cmd_func in _COMMAND_SURFACE.commands.items():
+    for cmd_name, cmd_func in _command_surface().commands.items():
         try:
             _validate_command_signature(cmd_func, cmd_name)
         except ValueError:
@@ -468,7 +596,7 @@ def _check_command_surface_immutable() -> bool:
     """Check that the command surface cannot be modified."""
     try:
         # Try to modify (should fail)
-        _COMMAND_SURFACE.commands["test"] = lambda: None
+        _command_surface().commands["test"] = lambda: None
         return False
     except (TypeError, KeyError):
         # Modification failed as expected
@@ -476,7 +604,7 @@ def _check_command_surface_immutable() -> bool:
 
     try:
         # Try to modify constructors
-        _COMMAND_SURFACE.constructors["test"] = {}
+        _command_surface().constructors["test"] = {}
         return False
     except (TypeError, KeyError):
         pass
@@ -594,14 +722,16 @@ __all__ = [
     "validate_command_integrity",
 ]
 
-# Final validation on import
-if __name__ != "__main__":
-    # When imported, validate integrity (except during testing)
-    try:
-        import sys
 
-        if "pytest" not in sys.modules and "unittest" not in sys.modules:
-            validate_command_integrity()
-    except ImportError:
-        # pytest/unittest not available, validate anyway
-        validate_command_integrity()
+def __getattr__(name: str) -> Any:
+    """Import a public command name from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -276,7 +276,13 @@ def execute_investigation(
             engine = runtime.engine
             if engine:
                 # Register layer interfaces (bridge layer injects into core)
-                engine.register_observation_interface(MinimalObservationInterface(runtime.context))
+                engine.register_observation_interface(
+                    MinimalObservationInterface(
+                        runtime.context,
+                        workers=request.parameters.get("workers"),
+                        incremental=bool(request.parameters.get("incremental")),
+                    )
+                )
                 engine.register_inquiry_interface(MinimalInquiryInterface())
                 engine.register_lens_interface(MinimalLensInterface())
 
@@ -18,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from patterns.collector import PatternCollector
 from patterns.loader import (
+    DEFAULT_PATTERN_TIMEOUT,
     PatternDefinition,
     PatternLoader,
     PatternManager,
@@ -25,6 +26,7 @@ from patterns.loader import (
 )
 from patterns.marketplace import PatternMarketplace
 from patterns.templates import PatternTemplateRegistry
+from storage.pattern_cache import PatternMatchCache
 
 
 @dataclass
@@ -48,6 +50,9 @@ class PatternScanCommandResult:
     matches_found: int
     matches: list[dict[str, Any]] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    timeouts: list[dict[str, Any]] = field(default_factory=list)
+    files_reused: int = 0
+    files_rescanned: int = 0
     scan_time_ms: float = 0.0
     message: str = ""
     error: str | None = None
@@ -184,6 +189,9 @@ class PatternScanCommand:
         output_format: str = "table",
         max_files: int = 10000,
         context_lines: int = 2,
+        processes: int | None = None,
+        pattern_timeout: float | None = DEFAULT_PATTERN_TIMEOUT,
+        storage_root: Path | str | None = None,
     ) -> PatternScanCommandResult:
         """
         Execute pattern scan command.
@@ -195,13 +203,25 @@ class PatternScanCommand:
             glob: File glob pattern
             output_format: Output format (table, json)
             max_files: Maximum files to scan
+            processes: Worker processes (None = threads, 0 = one per CPU)
+            pattern_timeout: Seconds one pattern may spend on one file
+            storage_root: Reuse cached matches of unchanged files from here
 
         Returns:
             PatternScanCommandResult with scan results
         """
         try:
             loader = PatternLoader()
-            scanner = PatternScanner(context_lines=context_lines)
+            scanner = PatternScanner(
+                context_lines=context_lines,
+                processes=processes,
+                pattern_timeout=pattern_timeout,
+                cache=(
+                    PatternMatchCache.for_storage_root(storage_root)
+                    if storage_root is not None
+                    else None
+                ),
+            )
 
             # Load patterns to scan
             if patterns:
@@ -262,6 +282,17 @@ class PatternScanCommand:
                 matches_found=len(result.matches),
                 matches=matches_dict,
                 errors=result.errors,
+                timeouts=[
+                    {
+                        "pattern_id": timeout.pattern_id,
+                        "pattern_name": timeout.pattern_name,
+                        "file": str(timeout.file_path),
+                        "budget_seconds": timeout.budget_seconds,
+                    }
+                    for timeout in result.timeouts
+                ],
+                files_reused=result.files_reused,
+                files_rescanned=result.files_rescanned,
                 scan_time_ms=result.scan_time_ms,
                 message=f"Found {len(result.matches)} matches in {result.files_scanned} files",
             )
@@ -616,11 +647,23 @@ def execute_pattern_scan(
     output_format: str = "table",
     max_files: int = 10000,
     context_lines: int = 2,
+    processes: int | None = None,
+    pattern_timeout: float | None = DEFAULT_PATTERN_TIMEOUT,
+    storage_root: Path | str | None = None,
 ) -> PatternScanCommandResult:
     """Convenience function for pattern scan."""
     cmd = PatternScanCommand()
     return cmd.execute(
-        path, patterns, category, glob, output_format, max_files, context_lines
+        path,
+        patterns,
+        category,
+        glob,
+        output_format,
+        max_files,
+        context_lines,
+        processes,
+        pattern_timeout,
+        storage_root,
     )
 
 
@@ -42,6 +42,8 @@ class RepairCommand:
         repair_storage: bool = True,
         repair_investigations: bool = True,
         verbose: bool = False,
+        quick: bool = False,
+        workers: int | None = None,
     ) -> RepairResult:
         """Execute repair command."""
         target_path = path or Path.cwd()
@@ -88,7 +90,9 @@ class RepairCommand:
         errors = []
 
         if repair_storage:
-            storage_report = self._repair_storage(target_path, verbose)
+            storage_report = self._repair_storage(
+                target_path, verbose, quick=quick, workers=workers
+            )
             validation_report["storage"] = storage_report
             fixed_items += storage_report.get("fixed_count", 0)
             errors.extend(storage_report.get("errors", []))
@@ -111,7 +115,13 @@ class RepairCommand:
             message=f"Repaired {fixed_items} items",
         )
 
-    def _repair_storage(self, path: Path, verbose: bool) -> dict:
+    def _repair_storage(
+        self,
+        path: Path,
+        verbose: bool,
+        quick: bool = False,
+        workers: int | None = None,
+    ) -> dict:
         """Repair storage integrity."""
         report = {"valid": True, "checked": 0, "fixed_count": 0, "errors": []}
 
@@ -119,7 +129,16 @@ class RepairCommand:
         if not storage_dir.exists():
             return report
 
+        # Observations go through the parallel, resumable verifier
+        obs_dir = storage_dir / "observations"
+        if obs_dir.exists():
+            self._verify_observation_store(
+                storage_dir, report, verbose, quick=quick, workers=workers
+            )
+
         for json_file in storage_dir.rglob("*.json"):
+            if json_file.is_relative_to(obs_dir):
+                continue
             report["checked"] += 1
 
             try:
@@ -129,27 +148,80 @@ class RepairCommand:
             except json.JSONDecodeError:
                 report["valid"] = False
                 report["errors"].append(f"Corrupted: {json_file}")
+                self._fix_json(json_file, content, report, verbose)
 
-                if verbose:
-                    print(f"  Repairing: {json_file}")
+        return report
 
-                # Try to fix
+    def _verify_observation_store(
+        self,
+        storage_dir: Path,
+        report: dict,
+        verbose: bool,
+        quick: bool = False,
+        workers: int | None = None,
+    ) -> None:
+        """Verify stored observations, resuming an interrupted run."""
+        from storage.corruption import CorruptionType
+        from storage.verification import StorageVerifier, VerificationTier
+
+        tier = VerificationTier.QUICK if quick else VerificationTier.FULL
+        verifier = StorageVerifier(storage_dir, tier=tier, workers=workers)
+
+        def show_progress(progress) -> None:
+            print(
+                f"  Verified {progress.checked}/{progress.total} "
+                f"({progress.fraction:.0%}), {progress.corrupt} corrupt",
+                end="\r",
+                flush=True,
+            )
+
+        verification = verifier.run(progress=show_progress if verbose else None)
+        if verbose and verification.total:
+            print()
+            if verification.resumed_from:
+                print(f"  Resumed after {verification.resumed_from} checked units")
+
+        report["checked"] += verification.checked
+        report["verification"] = {
+            "tier": verification.tier.value,
+            "checked": verification.checked,
+            "resumed_from": verification.resumed_from,
+            "workers": verification.workers,
+        }
+        for evidence in verification.evidence:
+            report["valid"] = False
+            report["errors"].append(
+                f"Corrupted: {evidence.path} ({evidence.corruption_type.name})"
+            )
+            if evidence.corruption_type == CorruptionType.JSON_PARSE_ERROR:
                 try:
-                    # Common fix: trailing commas
-                    fixed_content = content.replace(",]", "]").replace(",}", "}")
-                    parsed = json.loads(fixed_content)
-
-                    with open(json_file, "w") as f:
-                        json.dump(parsed, f, indent=2)
+                    content = evidence.path.read_text()
+                except OSError:
+                    continue
+                self._fix_json(evidence.path, content, report, verbose)
+
+    def _fix_json(
+        self, json_file: Path, content: str, report: dict, verbose: bool
+    ) -> None:
+        """Try the common fixes on a file that does not parse."""
+        if verbose:
+            print(f"  Repairing: {json_file}")
+
+        # Try to fix
+        try:
+            # Common fix: trailing commas
+            fixed_content = content.replace(",]", "]").replace(",}", "}")
+            parsed = json.loads(fixed_content)
 
-                    report["fixed_count"] += 1
-                    if verbose:
-                        print("    [OK] Fixed")
+            with open(json_file, "w") as f:
+                json.dump(parsed, f, indent=2)
 
-                except Exception as fix_error:
-                    report["errors"].append(f"Cannot fix: {json_file} - {fix_error}")
+            report["fixed_count"] += 1
+            if verbose:
+                print("    [OK] Fixed")
 
-        return report
+        except Exception as fix_error:
+            report["errors"].append(f"Cannot fix: {json_file} - {fix_error}")
 
     def _repair_investigations(self, path: Path, verbose: bool) -> dict:
         """Repair investigation state."""
@@ -235,6 +307,8 @@ def execute_repair(
     repair_storage: bool = True,
     repair_investigations: bool = True,
     verbose: bool = False,
+    quick: bool = False,
+    workers: int | None = None,
 ) -> RepairResult:
     """Convenience function for repair."""
     cmd = RepairCommand()
@@ -246,4 +320,6 @@ def execute_repair(
         repair_storage=repair_storage,
         repair_investigations=repair_investigations,
         verbose=verbose,
+        quick=quick,
+        workers=workers,
     )
@@ -3,6 +3,8 @@ bridge.commands.search - Code search command
 
 This module provides the search command for searching codebase text patterns.
 Uses ripgrep when available (much faster), falls back to Python regex.
+When a trigram index (storage/search_index.py) covers the search path, only
+files that can contain the query's required literals are searched.
 
 Command:
 - search: Search codebase for text patterns
@@ -10,14 +12,31 @@ Command:
 
 from __future__ import annotations
 
+import fnmatch
+import io
 import json
 import re
 import shutil
 import subprocess
+import sys
+import tempfile
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TextIO
+
+from patterns.prefilter import required_literals
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants  # type: ignore[no-redef]
+    import sre_parse  # type: ignore[no-redef]
 
 
 @dataclass
@@ -56,6 +75,131 @@ class SearchCommandResult:
     error: str | None = None
 
 
+MAX_PENDING_FILES_PER_WORKER = 4
+"""Files queued per regex-search worker before the walker waits."""
+
+_NEWLINE = ord("\n")
+_NEWLINE_CATEGORIES = frozenset(
+    {
+        sre_constants.CATEGORY_SPACE,
+        sre_constants.CATEGORY_NOT_DIGIT,
+        sre_constants.CATEGORY_NOT_WORD,
+        sre_constants.CATEGORY_LINEBREAK,
+        sre_constants.CATEGORY_UNI_SPACE,
+        sre_constants.CATEGORY_UNI_NOT_DIGIT,
+        sre_constants.CATEGORY_UNI_NOT_WORD,
+        sre_constants.CATEGORY_UNI_LINEBREAK,
+    }
+)
+_LINE_ASSERTIONS = frozenset(
+    {
+        sre_constants.AT_BEGINNING_STRING,
+        sre_constants.AT_END_STRING,
+        sre_constants.AT_NON_BOUNDARY,
+        sre_constants.AT_UNI_NON_BOUNDARY,
+        sre_constants.AT_LOC_NON_BOUNDARY,
+    }
+)
+
+
+class _TextStream:
+    """Prints results as they arrive, then a summary."""
+
+    def __init__(self, files_with_matches: bool) -> None:
+        self.files_with_matches = files_with_matches
+        self._seen_files: set[Path] = set()
+
+    def write(self, result: SearchResult) -> None:
+        if self.files_with_matches:
+            if result.file_path not in self._seen_files:
+                self._seen_files.add(result.file_path)
+                print(f"{result.file_path}", flush=True)
+            return
+
+        print(f"{result.file_path}:{result.line_number}")
+        print(f"  {result.line_content}")
+
+        if result.context_before:
+            print("  ...")
+            for ctx in result.context_before:
+                print(f"    {ctx}")
+
+        print(f"  > {result.matched_text}")
+
+        if result.context_after:
+            for ctx in result.context_after:
+                print(f"    {ctx}")
+        print(flush=True)
+
+    def close(self, results: SearchResults) -> None:
+        print(
+            f"\nFound {results.total_matches} matches in {results.files_with_matches} files"
+        )
+        print(f"Search time: {results.search_time_ms:.2f}ms")
+
+    def abort(self, error: str) -> None:
+        pass
+
+
+class _JsonStream:
+    """
+    Writes the JSON document incrementally.
+
+    Results are emitted inside ``"results": [...]`` as they arrive; the
+    totals follow the list once the search finishes, so the document has the
+    same keys as before and is valid JSON even when the search is cut short.
+    """
+
+    def __init__(self, query: str, json_file: Path | None) -> None:
+        self.query = query
+        self.json_file = json_file
+        self._handle: TextIO | None = None
+        self._count = 0
+
+    def _open(self) -> TextIO:
+        if self._handle is None:
+            if self.json_file:
+                self.json_file.parent.mkdir(parents=True, exist_ok=True)
+                self._handle = open(self.json_file, "w")
+            else:
+                self._handle = sys.stdout
+            self._handle.write(
+                "{\n" f'  "query": {json.dumps(self.query)},\n' '  "results": ['
+            )
+        return self._handle
+
+    def write(self, result: SearchResult) -> None:
+        handle = self._open()
+        item = json.dumps(_result_to_json(result), indent=2)
+        separator = ",\n" if self._count else "\n"
+        handle.write(separator + "\n".join("    " + line for line in item.splitlines()))
+        handle.flush()
+        self._count += 1
+
+    def close(self, results: SearchResults) -> None:
+        self._finish(
+            {
+                "total_matches": results.total_matches,
+                "files_with_matches": results.files_with_matches,
+                "search_time_ms": results.search_time_ms,
+            }
+        )
+
+    def abort(self, error: str) -> None:
+        if self._handle is not None:
+            self._finish({"error": error})
+
+    def _finish(self, fields: dict) -> None:
+        handle = self._open()
+        handle.write("\n  ]" if self._count else "]")
+        for key, value in fields.items():
+            handle.write(f",\n  {json.dumps(key)}: {json.dumps(value)}")
+        handle.write("\n}\n")
+        handle.flush()
+        if handle is not sys.stdout:
+            handle.close()
+
+
 class SearchCommand:
     """Search command implementation."""
 
@@ -84,10 +228,18 @@ class SearchCommand:
         threads: int | None = None,
         exclude_pattern: str | None = None,
         files_with_matches: bool = False,
+        storage_root: Path | str | None = None,
     ) -> SearchCommandResult:
         """
         Execute search command.
 
+        Results are written (stdout, or ``json_file``) as they are found; the
+        search stops as soon as ``limit`` results have been produced.
+
+        With ``storage_root``, a search index built there for the search path
+        (or an ancestor) is brought up to date and used to skip files that
+        cannot match. Without an index, every file is searched.
+
         Args:
             query: Search pattern (regex)
             path: Directory to search (default: current directory)
@@ -95,12 +247,13 @@ class SearchCommand:
             context: Lines of context around matches
             glob: File glob pattern
             file_type: File type filter
-            limit: Maximum results
+            limit: Maximum results (0 = no limit)
             output_format: Output format (text/json/count)
             json_file: Output JSON to file
             threads: Number of parallel threads
             exclude_pattern: Exclude pattern
             files_with_matches: Show only filenames
+            storage_root: Storage directory holding search indexes
 
         Returns:
             SearchCommandResult with search status and results
@@ -123,9 +276,33 @@ class SearchCommand:
         if threads is not None:
             self.max_workers = threads
 
+        if output_format == "json" or json_file:
+            stream: _TextStream | _JsonStream | None = _JsonStream(query, json_file)
+        elif output_format == "count":
+            stream = None
+        else:
+            stream = _TextStream(files_with_matches)
+        on_result = stream.write if stream is not None else None
+
         try:
+            candidates = (
+                self._indexed_candidates(query, search_path, case_insensitive, storage_root)
+                if storage_root is not None
+                else None
+            )
+
+            if candidates is not None and not candidates:
+                # The index rules out every file
+                results = SearchResults(
+                    query=query,
+                    total_matches=0,
+                    files_with_matches=0,
+                    results=[],
+                    search_time_ms=0,
+                    output_format=output_format,
+                )
             # Check for ripgrep (preferred for performance)
-            if self._check_ripgrep():
+            elif self._check_ripgrep():
                 results = self._search_with_ripgrep(
                     query,
                     search_path,
@@ -136,6 +313,7 @@ class SearchCommand:
                     limit,
                     exclude_pattern,
                     files_with_matches,
+                    on_result,
                 )
             else:
                 results = self._search_with_regex(
@@ -147,6 +325,8 @@ class SearchCommand:
                     limit,
                     exclude_pattern,
                     files_with_matches,
+                    on_result,
+                    candidates,
                 )
 
             search_time_ms = (time.time() - start_time) * 1000
@@ -154,18 +334,10 @@ class SearchCommand:
             results.output_format = output_format
 
             # Output results
-            if output_format == "json" or json_file:
-                output_data = self._to_json(results)
-                if json_file:
-                    json_file.parent.mkdir(parents=True, exist_ok=True)
-                    with open(json_file, "w") as f:
-                        json.dump(output_data, f, indent=2)
-                else:
-                    print(json.dumps(output_data, indent=2))
-            elif output_format == "count":
-                print(results.total_matches)
+            if stream is not None:
+                stream.close(results)
             else:
-                self._print_results(results, files_with_matches)
+                print(results.total_matches)
 
             return SearchCommandResult(
                 success=True,
@@ -174,8 +346,51 @@ class SearchCommand:
             )
 
         except Exception as e:
+            if stream is not None:
+                stream.abort(str(e))
             return SearchCommandResult(success=False, error=f"Search failed: {e}")
 
+    def _indexed_candidates(
+        self,
+        query: str,
+        search_path: Path,
+        case_insensitive: bool,
+        storage_root: Path | str,
+    ) -> set[Path] | None:
+        """
+        Files below ``search_path`` that the search index cannot rule out.
+
+        Returns None (search everything) when no index covers the path, the
+        query has no usable literal, or the index cannot be read.
+        """
+        import sqlite3
+
+        from storage.search_index import TrigramIndex
+
+        try:
+            re.compile(query, re.IGNORECASE if case_insensitive else 0)
+        except re.error:
+            return None  # Reported by the search itself
+        literals = required_literals(query, fold=False)
+        if not literals:
+            return None
+        try:
+            index = TrigramIndex.find(storage_root, search_path)
+            if index is None:
+                return None
+            index.update(search_path)
+            found = index.candidates(literals, search_path)
+        except (OSError, sqlite3.Error):
+            return None
+        if found is None:
+            return None
+
+        # Same path spelling as walking ``search_path`` would produce
+        if search_path.is_file():
+            return {search_path} if found else set()
+        base = search_path.resolve()
+        return {search_path / candidate.relative_to(base) for candidate in found}
+
     def _search_with_ripgrep(
         self,
         query: str,
@@ -187,8 +402,9 @@ class SearchCommand:
         limit: int,
         exclude_pattern: str | None,
         files_with_matches: bool,
+        on_result: Callable[[SearchResult], None] | None = None,
     ) -> SearchResults:
-        """Use ripgrep for fast searching."""
+        """Use ripgrep for fast searching; stops ripgrep once ``limit`` is hit."""
         if files_with_matches:
             cmd = ["rg", "--files-with-matches"]
         else:
@@ -210,8 +426,6 @@ class SearchCommand:
 
         cmd.extend([query, str(path)])
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-
         results = SearchResults(
             query=query,
             total_matches=0,
@@ -221,46 +435,55 @@ class SearchCommand:
             output_format="text",
         )
 
-        if result.returncode not in (0, 1):  # 0 = matches, 1 = no matches
-            error_message = result.stderr.strip() or "ripgrep failed"
-            raise ValueError(error_message)
-
-        if files_with_matches:
-            for line in result.stdout.splitlines():
-                if not line:
-                    continue
-                file_path = Path(line.strip())
-                results.results.append(
-                    SearchResult(
-                        file_path=file_path,
-                        line_number=0,
-                        line_content="",
-                        matched_text="",
-                        context_before=[],
-                        context_after=[],
-                        match_start=0,
-                        match_end=0,
-                    )
-                )
-                if limit and len(results.results) >= limit:
-                    break
-        else:
-            lines_cache: dict[Path, list[str]] = {}
-            for line in result.stdout.splitlines():
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                search_result = self._parse_ripgrep_match(
-                    data, context, lines_cache
-                )
-                if search_result:
-                    results.results.append(search_result)
-                    if limit and len(results.results) >= limit:
+        def accept(search_result: SearchResult) -> bool:
+            results.results.append(search_result)
+            if on_result is not None:
+                on_result(search_result)
+            return bool(limit) and len(results.results) >= limit
+
+        lines_cache: dict[Path, list[str]] = {}
+        limit_reached = False
+        # stderr goes to a file so a chatty ripgrep cannot block on a full pipe
+        with tempfile.TemporaryFile(mode="w+") as stderr, subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=stderr, text=True
+        ) as process:
+            try:
+                for line in process.stdout:
+                    line = line.rstrip("\n")
+                    if not line:
+                        continue
+                    if files_with_matches:
+                        search_result = SearchResult(
+                            file_path=Path(line.strip()),
+                            line_number=0,
+                            line_content="",
+                            matched_text="",
+                            context_before=[],
+                            context_after=[],
+                            match_start=0,
+                            match_end=0,
+                        )
+                    else:
+                        try:
+                            data = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        search_result = self._parse_ripgrep_match(
+                            data, context, lines_cache
+                        )
+                    if search_result and accept(search_result):
+                        limit_reached = True
                         break
+            finally:
+                if process.poll() is None:
+                    process.kill()
+            returncode = process.wait(timeout=300)
+            stderr.seek(0)
+            error_output = stderr.read()
+
+        # 0 = matches, 1 = no matches; a killed ripgrep is our own early stop
+        if not limit_reached and returncode not in (0, 1):
+            raise ValueError(error_output.strip() or "ripgrep failed")
 
         results.total_matches = len(results.results)
         results.files_with_matches = len(set(r.file_path for r in results.results))
@@ -342,38 +565,75 @@ class SearchCommand:
         limit: int,
         exclude_pattern: str | None,
         files_with_matches: bool,
+        on_result: Callable[[SearchResult], None] | None = None,
+        candidates: set[Path] | None = None,
     ) -> SearchResults:
-        """Use Python regex for searching (fallback)."""
+        """
+        Use Python regex for searching (fallback).
+
+        Files are walked lazily and fed to a bounded worker queue; results
+        are taken in walk order, so output is deterministic. Once ``limit``
+        results exist, queued files are cancelled and running workers stop
+        at their next match. With ``candidates`` from the search index, only
+        those files are searched, in path order.
+        """
         # Compile regex
         regex_flags = re.IGNORECASE if case_insensitive else 0
         try:
             pattern = re.compile(query, regex_flags)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
+        buffer_pattern = (
+            re.compile(query, regex_flags | re.MULTILINE)
+            if _buffer_searchable(query, regex_flags)
+            else None
+        )
 
-        # Find files to search
-        files = self._find_files(path, glob, file_type, exclude_pattern)
-
-        # Search in parallel
-        all_results = []
-
+        all_results: list[SearchResult] = []
+        stop = threading.Event()
+
+        def accept(file_results: list[SearchResult]) -> bool:
+            for search_result in file_results:
+                all_results.append(search_result)
+                if on_result is not None:
+                    on_result(search_result)
+                if limit and len(all_results) >= limit:
+                    stop.set()
+                    return True
+            return False
+
+        def take(future: Future) -> list[SearchResult]:
+            try:
+                return future.result()
+            except Exception:
+                return []
+
+        max_pending = max(1, self.max_workers) * MAX_PENDING_FILES_PER_WORKER
+        pending: deque[Future] = deque()
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_file = {
-                executor.submit(
-                    self._search_file, file_path, pattern, files_with_matches
-                ): file_path
-                for file_path in files[: limit * 10]  # Limit files for performance
-            }
-
-            for future in as_completed(future_to_file):
-                try:
-                    file_results = future.result()
-                    all_results.extend(file_results)
-
-                    if len(all_results) >= limit:
+            try:
+                for file_path in self._iter_files(
+                    path, glob, file_type, exclude_pattern, candidates
+                ):
+                    pending.append(
+                        executor.submit(
+                            self._search_file,
+                            file_path,
+                            pattern,
+                            files_with_matches,
+                            buffer_pattern,
+                            stop,
+                            limit,
+                        )
+                    )
+                    if len(pending) >= max_pending and accept(take(pending.popleft())):
                         break
-                except Exception:
-                    pass
+                while pending and not stop.is_set():
+                    accept(take(pending.popleft()))
+            finally:
+                stop.set()
+                for future in pending:
+                    future.cancel()
 
         results = SearchResults(
             query=query,
@@ -384,10 +644,9 @@ class SearchCommand:
             output_format="text",
         )
 
-        trimmed_results = all_results[:limit] if limit else all_results
-        results.results = trimmed_results
-        results.total_matches = len(trimmed_results)
-        results.files_with_matches = len(set(r.file_path for r in trimmed_results))
+        results.results = all_results
+        results.total_matches = len(all_results)
+        results.files_with_matches = len(set(r.file_path for r in all_results))
 
         return results
 
@@ -399,8 +658,17 @@ class SearchCommand:
         exclude_pattern: str | None,
     ) -> list[Path]:
         """Find files to search."""
-        files = []
+        return list(self._iter_files(path, glob, file_type, exclude_pattern))
 
+    def _iter_files(
+        self,
+        path: Path,
+        glob: str | None,
+        file_type: str | None,
+        exclude_pattern: str | None,
+        candidates: set[Path] | None = None,
+    ) -> Iterator[Path]:
+        """Lazily yield files to search, in walk order (or ``candidates``)."""
         # Determine glob pattern
         if glob:
             pattern = glob
@@ -423,115 +691,129 @@ class SearchCommand:
 
         # Find files
         if path.is_file():
-            files = [path]
-        else:
-            for p in path.rglob(pattern):
-                if p.is_file():
-                    # Check exclude pattern
-                    if exclude_pattern and exclude_pattern in str(p):
-                        continue
-                    files.append(p)
-
-        return files
+            if candidates is None or path in candidates:
+                yield path
+            return
+        if candidates is not None and "/" not in pattern:
+            # Same name match as rglob, without walking the tree
+            for p in sorted(candidates):
+                if not fnmatch.fnmatchcase(p.name, pattern):
+                    continue
+                if exclude_pattern and exclude_pattern in str(p):
+                    continue
+                yield p
+            return
+        for p in path.rglob(pattern):
+            if candidates is not None and p not in candidates:
+                continue
+            if p.is_file():
+                # Check exclude pattern
+                if exclude_pattern and exclude_pattern in str(p):
+                    continue
+                yield p
 
     def _search_file(
-        self, file_path: Path, pattern: re.Pattern, files_with_matches: bool
+        self,
+        file_path: Path,
+        pattern: re.Pattern,
+        files_with_matches: bool,
+        buffer_pattern: re.Pattern | None = None,
+        stop: threading.Event | None = None,
+        max_results: int = 0,
     ) -> list[SearchResult]:
-        """Search in a single file."""
-        results = []
+        """
+        Search in a single file.
+
+        The file is read and decoded once. With ``buffer_pattern`` (the query
+        compiled with MULTILINE) the whole buffer is searched for the next
+        candidate and only that line is checked with ``pattern``, so lines
+        without a match are never visited one by one; without it every line
+        is checked. Either way a line matches exactly when ``pattern`` finds
+        it in that line alone, as with a per-line scan.
+        """
+        results: list[SearchResult] = []
 
         try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
-
-            for i, line in enumerate(lines):
-                if pattern.search(line):
-                    if files_with_matches:
-                        return [
-                            SearchResult(
-                                file_path=file_path,
-                                line_number=i + 1,
-                                line_content=line.strip(),
-                                matched_text=pattern.search(line).group()
-                                if pattern.search(line)
-                                else "",
-                                context_before=[],
-                                context_after=[],
-                                match_start=0,
-                                match_end=0,
-                            )
-                        ]
-                    else:
-                        results.append(
-                            self._create_result(file_path, i, lines, pattern)
-                        )
-
-        except (UnicodeDecodeError, PermissionError, OSError):
-            pass
+            text = file_path.read_bytes().decode("utf-8", errors="ignore")
+        except (PermissionError, OSError):
+            return results
+        if "\r" in text:
+            # Same line endings as reading in text mode
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        line_number = 1
+        counted = 0  # offset up to which newlines are counted into line_number
+        for line_start, line in _candidate_lines(text, buffer_pattern):
+            if stop is not None and stop.is_set():
+                break
+            match = pattern.search(line)
+            if not match:
+                continue
+
+            line_number += text.count("\n", counted, line_start)
+            counted = line_start
+            if files_with_matches:
+                return [
+                    SearchResult(
+                        file_path=file_path,
+                        line_number=line_number,
+                        line_content=line.strip(),
+                        matched_text=match.group(),
+                        context_before=[],
+                        context_after=[],
+                        match_start=0,
+                        match_end=0,
+                    )
+                ]
+            results.append(
+                self._create_result(file_path, line_number, text, line_start, line, match)
+            )
+            if max_results and len(results) >= max_results:
+                break
 
         return results
 
     def _create_result(
-        self, file_path: Path, line_idx: int, lines: list[str], pattern: re.Pattern
+        self,
+        file_path: Path,
+        line_number: int,
+        text: str,
+        line_start: int,
+        line: str,
+        match: re.Match,
     ) -> SearchResult:
-        """Create a search result from a match."""
-        line = lines[line_idx]
-        match = pattern.search(line)
-
-        context_before = [
-            lines[i].rstrip()
-            for i in range(max(0, line_idx - self.context_lines), line_idx)
-        ]
-
-        context_after = [
-            lines[i].rstrip()
-            for i in range(
-                line_idx + 1, min(len(lines), line_idx + self.context_lines + 1)
-            )
-        ]
+        """Create a search result from a match on ``line``, found at ``line_start``."""
+        context_before: list[str] = []
+        start = line_start
+        for _ in range(self.context_lines):
+            if start == 0:
+                break
+            previous = text.rfind("\n", 0, start - 1) + 1
+            context_before.append(text[previous:start].rstrip())
+            start = previous
+        context_before.reverse()
+
+        context_after: list[str] = []
+        end = line_start + len(line)
+        for _ in range(self.context_lines):
+            if end >= len(text):
+                break
+            following = text.find("\n", end)
+            following = len(text) if following == -1 else following + 1
+            context_after.append(text[end:following].rstrip())
+            end = following
 
         return SearchResult(
             file_path=file_path,
-            line_number=line_idx + 1,
+            line_number=line_number,
             line_content=line.rstrip(),
-            matched_text=match.group() if match else "",
+            matched_text=match.group(),
             context_before=context_before,
             context_after=context_after,
-            match_start=match.start() if match else 0,
-            match_end=match.end() if match else 0,
+            match_start=match.start(),
+            match_end=match.end(),
         )
 
-    def _print_results(self, results: SearchResults, files_with_matches: bool) -> None:
-        """Print search results."""
-        print(
-            f"\nFound {results.total_matches} matches in {results.files_with_matches} files"
-        )
-        print(f"Search time: {results.search_time_ms:.2f}ms")
-        print()
-
-        if files_with_matches:
-            seen_files = set()
-            for result in results.results:
-                if result.file_path not in seen_files:
-                    print(f"{result.file_path}")
-                    seen_files.add(result.file_path)
-        else:
-            for result in results.results:
-                print(f"{result.file_path}:{result.line_number}")
-                print(f"  {result.line_content}")
-
-                if result.context_before:
-                    print("  ...")
-                    for ctx in result.context_before:
-                        print(f"    {ctx}")
-
-                print(f"  > {result.matched_text}")
-
-                if result.context_after:
-                    for ctx in result.context_after:
-                        print(f"    {ctx}")
-                print()
-
     def _to_json(self, results: SearchResults) -> dict:
         """Convert results to JSON-serializable dict."""
         return {
@@ -539,19 +821,113 @@ class SearchCommand:
             "total_matches": results.total_matches,
             "files_with_matches": results.files_with_matches,
             "search_time_ms": results.search_time_ms,
-            "results": [
-                {
-                    "file": str(r.file_path),
-                    "line": r.line_number,
-                    "content": r.line_content,
-                    "matched_text": r.matched_text,
-                    "context": {"before": r.context_before, "after": r.context_after},
-                }
-                for r in results.results
-            ],
+            "results": [_result_to_json(r) for r in results.results],
         }
 
 
+def _candidate_lines(
+    text: str, buffer_pattern: re.Pattern | None
+) -> Iterator[tuple[int, str]]:
+    """(offset, line) of every line that may match, newline included."""
+    if buffer_pattern is None:
+        offset = 0
+        for line in io.StringIO(text, newline="\n"):
+            yield offset, line
+            offset += len(line)
+        return
+
+    size = len(text)
+    position = 0
+    while position < size:
+        candidate = buffer_pattern.search(text, position)
+        if candidate is None:
+            return
+        line_start = max(text.rfind("\n", position, candidate.start()) + 1, position)
+        if line_start >= size:
+            return
+        line_end = text.find("\n", line_start)
+        line_end = size if line_end == -1 else line_end + 1
+        yield line_start, text[line_start:line_end]
+        position = line_end
+
+
+def _buffer_searchable(query: str, flags: int) -> bool:
+    """
+    Whether a whole-buffer MULTILINE search finds every line-level match.
+
+    True when the query can never match a newline and uses no lookaround,
+    ``\\A``, ``\\Z`` or ``\\B``: every per-line match then lies within its
+    line and sees the same surroundings in the buffer. Otherwise (e.g.
+    ``\\s+$``, which per line may consume the trailing newline) lines are
+    searched one by one.
+    """
+    try:
+        parsed = sre_parse.parse(query, flags)
+    except (re.error, RecursionError):
+        return False
+    dotall = bool(parsed.state.flags & re.DOTALL)
+    return not _may_cross_line(list(parsed), dotall)
+
+
+def _may_cross_line(items: list, dotall: bool) -> bool:
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            if av == _NEWLINE:
+                return True
+        elif op is sre_constants.NOT_LITERAL:
+            if av != _NEWLINE:
+                return True
+        elif op is sre_constants.ANY:
+            if dotall:
+                return True
+        elif op is sre_constants.IN:
+            for item_op, item_av in av:
+                if item_op is sre_constants.NEGATE:
+                    return True
+                if item_op is sre_constants.LITERAL and item_av == _NEWLINE:
+                    return True
+                if item_op is sre_constants.RANGE and item_av[0] <= _NEWLINE <= item_av[1]:
+                    return True
+                if item_op is sre_constants.CATEGORY and item_av in _NEWLINE_CATEGORIES:
+                    return True
+        elif op is sre_constants.AT:
+            if av in _LINE_ASSERTIONS:
+                return True
+        elif op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            inner = (dotall or bool(add_flags & re.DOTALL)) and not del_flags & re.DOTALL
+            if _may_cross_line(list(sub), inner):
+                return True
+        elif op is sre_constants.BRANCH:
+            if any(_may_cross_line(list(branch), dotall) for branch in av[1]):
+                return True
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) or (
+            op is getattr(sre_constants, "POSSESSIVE_REPEAT", None)
+        ):
+            if _may_cross_line(list(av[2]), dotall):
+                return True
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            if _may_cross_line(list(av), dotall):
+                return True
+        elif op is sre_constants.CATEGORY:
+            if av in _NEWLINE_CATEGORIES:
+                return True
+        else:
+            # Lookaround, backreferences, conditionals: not analysed
+            return True
+    return False
+
+
+def _result_to_json(result: SearchResult) -> dict:
+    return {
+        "file": str(result.file_path),
+        "line": result.line_number,
+        "content": result.line_content,
+        "matched_text": result.matched_text,
+        "context": {"before": result.context_before, "after": result.context_after},
+    }
+
+
 # Convenience function for direct execution
 def execute_search(
     query: str,
@@ -566,6 +942,7 @@ def execute_search(
     threads: int | None = None,
     exclude_pattern: str | None = None,
     files_with_matches: bool = False,
+    storage_root: Path | str | None = None,
 ) -> SearchCommandResult:
     """Convenience function for search execution."""
     cmd = SearchCommand()
@@ -582,4 +959,5 @@ def execute_search(
         threads=threads,
         exclude_pattern=exclude_pattern,
         files_with_matches=files_with_matches,
+        storage_root=storage_root,
     )
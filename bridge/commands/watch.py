@@ -2,7 +2,8 @@
 watch.py - Real-time file system watching and diff commands.
 
 Commands:
-    - watch: Monitor directory for changes
+    - watch: Monitor directory for changes; with an investigation, keep its
+      stored observations, dependency graph and pattern matches current
     - diff: Show differences between file versions
     - status: Show current investigation status with changes
 """
@@ -12,27 +13,394 @@ from __future__ import annotations
 import json
 import sys
 import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from observations.eyes.diff_sight import DiffSight, generate_diff_report
-from observations.eyes.watcher import ChangeType, FileSystemWatcher, WatcherConfig
+from observations.eyes.watcher import (
+    ChangeType,
+    FileChange,
+    FileSystemWatcher,
+    WatcherConfig,
+    matches_ignore_pattern,
+)
+from storage.atomic import atomic_write_json_compatible, normalize_json_data
+
+
+@dataclass
+class WatchBatchReport:
+    """What one watch batch changed, and how long each stage took."""
+
+    changes: int
+    reobserved: list[str]
+    removed: list[str]
+    observation_types: list[str]
+    pattern_matches: int
+    pattern_changes: dict[str, int]
+    stage_ms: dict[str, float]
+    save_to_answer_ms: float
+    answer: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class WatchPipeline:
+    """
+    Keep a stored investigation current while files change.
+
+    Each debounced batch re-runs the session's per-file eyes on the changed
+    files only, stores the result as a watch patch (see
+    storage/observation_patch.py), patches the query index in place,
+    rebuilds the dependency graph from the patched index's compact rows,
+    rescans the changed files for pattern matches and, when an ``answer``
+    callback is given, answers the watched question again. Latency is
+    measured from the newest save in the batch to the updated answer.
+
+    Every ``COMPACT_AFTER`` patches, and on ``close()``, the session's
+    patches are folded into one. Pattern matches are saved next to the
+    query index, with each file's mtime, so a restarted pipeline only
+    rescans files that changed in between.
+    """
+
+    # Eyes that observe one file at a time; file_sight summaries of batch
+    # sessions are directory-wide, so those only re-run for new files
+    PER_FILE_TYPES = ("file_sight", "import_sight", "export_sight", "boundary_sight")
+
+    # Watch patches a session may list before they are folded into one
+    COMPACT_AFTER = 16
+
+    def __init__(
+        self,
+        session: dict[str, Any],
+        storage: Any = None,
+        answer: Callable[[dict[str, Any]], str] | None = None,
+        patterns: bool = True,
+        ignore_patterns: list[str] | None = None,
+    ):
+        """
+        Prepare the pipeline and take the initial pattern match state.
+
+        Args:
+            session: Session metadata of the investigation to keep current
+            storage: InvestigationStorage holding it (default ``storage/``)
+            answer: Answers the watched question for the current session
+            patterns: Track pattern matches of the watched files
+            ignore_patterns: Paths never observed or scanned
+        """
+        from inquiry.answers.connection_mapper import ConnectionMapper
+        from observations.interface import MinimalObservationInterface
+        from storage.investigation_storage import STREAM_ID_PREFIX, InvestigationStorage
+
+        self.storage = storage or InvestigationStorage()
+        self.session = dict(session)
+        self.session_id = str(session.get("id") or session.get("session_id"))
+        self.root = Path(str(session.get("path") or "."))
+        self._resolved_root = self.root.resolve()
+        self.answer = answer
+        self.ignore_patterns = list(ignore_patterns or WatcherConfig().ignore_patterns)
+        self.ignore_patterns.append(str(Path(self.storage.base_path).resolve()))
+
+        self._key = self.storage.observation_set_key(self.session)
+        self.index = self.storage.ensure_query_index(self.session)
+        present = set(self.index.types())
+        self.observation_types = [t for t in self.PER_FILE_TYPES if t in present] or [
+            "file_sight",
+            "import_sight",
+            "export_sight",
+        ]
+        observation_ids = self.session.get("observation_ids") or []
+        self._per_file_sight = bool(self.session.get("manifest_id")) or any(
+            str(obs_id).startswith(STREAM_ID_PREFIX) for obs_id in observation_ids
+        )
+        self._graph_types = sorted(ConnectionMapper.OBSERVATION_TYPES or ())
+        self._interface = MinimalObservationInterface(
+            None, storage_root=self.storage.base_path
+        )
+
+        self._scanner = None
+        self._patterns: list[Any] = []
+        self._matches: dict[str, set[tuple[str, int]]] = {}
+        self._scanned_mtimes: dict[str, int | None] = {}
+        if patterns:
+            self._start_pattern_tracking()
+
+    @property
+    def pattern_match_count(self) -> int:
+        return sum(len(found) for found in self._matches.values())
+
+    def process(self, batch: list[FileChange]) -> WatchBatchReport:
+        """Bring the stored investigation up to date with one batch."""
+        stage_ms: dict[str, float] = {}
+        clock = time.perf_counter()
+
+        def lap(stage: str) -> None:
+            nonlocal clock
+            now = time.perf_counter()
+            stage_ms[stage] = round((now - clock) * 1000, 3)
+            clock = now
+
+        changed, created, removed = self._classify(batch)
+
+        # Re-run the per-file eyes on changed code files only
+        files: dict[str, list[dict[str, Any]]] = {}
+        modified_types = [
+            t for t in self.observation_types if t != "file_sight" or self._per_file_sight
+        ]
+        for paths, types in ((changed, modified_types), (created, self.observation_types)):
+            if not paths or not types:
+                continue
+            for path, observations in self._interface.observe_files(
+                [Path(key) for key in paths], types, self.root
+            ):
+                files[str(path)] = observations
+        # Code files that vanished before they could be observed
+        removed |= {key for key in changed | created if key not in files and not Path(key).exists()}
+        # The index gets exactly what storage keeps (dates as ISO strings etc.)
+        files = normalize_json_data(files)
+        lap("observe")
+
+        if files or removed:
+            self.session = self.storage.save_watch_patch(
+                self.session,
+                files,
+                sorted(removed),
+                [change.to_dict() for change in batch],
+            )
+            if len(self.session["patch_ids"]) >= self.COMPACT_AFTER:
+                self.session = self.storage.compact_watch_patches(self.session)
+        lap("store")
 
+        key = self.storage.observation_set_key(self.session)
+        if self.index.is_current(self._key):
+            self.index.patch(files, removed, key)
+        else:
+            # Changed behind our back (e.g. re-investigated): rebuild once
+            self.index = self.storage.ensure_query_index(self.session)
+        self._key = key
+        lap("index")
+
+        if files or removed:
+            from inquiry.answers.dependency_graph import DependencyGraph
+
+            graph = DependencyGraph.from_observations(
+                self.index.observations(self._graph_types, compact=True)
+            )
+            graph.save(self.storage.dependency_graph_path(self.session_id), key)
+        lap("graph")
+
+        pattern_changes = self._rescan_patterns(changed | created, removed)
+        lap("patterns")
+
+        answer = self.answer(self.session) if self.answer is not None else None
+        lap("answer")
+
+        saved = max(change.timestamp for change in batch) if batch else datetime.now(UTC)
+        latency = (datetime.now(UTC) - saved).total_seconds() * 1000
+        return WatchBatchReport(
+            changes=len(batch),
+            reobserved=sorted(files),
+            removed=sorted(removed),
+            observation_types=list(self.observation_types),
+            pattern_matches=self.pattern_match_count,
+            pattern_changes=pattern_changes,
+            stage_ms=stage_ms,
+            save_to_answer_ms=round(latency, 3),
+            answer=answer,
+        )
+
+    def close(self) -> None:
+        """Fold the session's patches into one; the index and graph are re-keyed."""
+        if len(self.session.get("patch_ids") or []) < 2:
+            return
+        self.session = self.storage.compact_watch_patches(self.session)
+        key = self.storage.observation_set_key(self.session)
+        if key == self._key:
+            return
+        if self.index.is_current(self._key):
+            # Compaction does not change the patched content
+            self.index.patch({}, (), key)
+            from inquiry.answers.dependency_graph import DependencyGraph
+
+            graph_path = self.storage.dependency_graph_path(self.session_id)
+            graph = DependencyGraph.load(graph_path, self._key)
+            if graph is not None:
+                graph.save(graph_path, key)
+        self._key = key
+
+    def _classify(self, batch: list[FileChange]) -> tuple[set[str], set[str], set[str]]:
+        """Split a batch into (modified, created, removed) session paths."""
+        changed: set[str] = set()
+        created: set[str] = set()
+        removed: set[str] = set()
+        for change in batch:
+            if change.is_directory:
+                continue
+            if change.old_path is not None:
+                old = self._session_path(change.old_path)
+                if old is not None:
+                    removed.add(old)
+            key = self._session_path(change.path)
+            if key is None:
+                continue
+            if change.change_type == ChangeType.DELETED:
+                removed.add(key)
+            elif change.change_type in (ChangeType.CREATED, ChangeType.MOVED):
+                created.add(key)
+            else:
+                changed.add(key)
+        removed -= changed | created
+        return changed, created, removed
+
+    def _session_path(self, path: Path) -> str | None:
+        """A watched path in the form the session stores it, or None if ignored."""
+        if matches_ignore_pattern(path, self.ignore_patterns):
+            return None
+        try:
+            relative = Path(path).resolve().relative_to(self._resolved_root)
+        except ValueError:
+            try:
+                relative = Path(path).relative_to(self._resolved_root)
+            except ValueError:
+                return None
+        return str(self.root / relative)
+
+    def _start_pattern_tracking(self) -> None:
+        from patterns.loader import PatternManager
+
+        manager = PatternManager(storage_root=self.storage.base_path)
+        self._scanner = manager.scanner
+        self._patterns = manager.list_patterns()
+        files = [
+            path
+            for path in self.root.rglob("*")
+            if path.is_file() and not matches_ignore_pattern(path, self.ignore_patterns)
+        ]
+        saved = self._load_matches()
+        stale = []
+        for path in files:
+            key = str(path)
+            if key in saved and saved[key][0] == _mtime(path):
+                self._scanned_mtimes[key] = saved[key][0]
+                self._matches[key] = saved[key][1]
+            else:
+                stale.append(path)
+        if stale:
+            self._scan(stale)
+        self._save_matches()
+
+    def _rescan_patterns(self, paths: set[str], removed: set[str]) -> dict[str, int]:
+        """Rescan changed files; returns how many matches appeared and cleared."""
+        if self._scanner is None:
+            return {"added": 0, "cleared": 0}
+        before = {path: self._matches.pop(path, set()) for path in paths | removed}
+        for path in before:
+            self._scanned_mtimes.pop(path, None)
+        files = [Path(path) for path in sorted(paths) if Path(path).is_file()]
+        if files:
+            self._scan(files)
+        added = cleared = 0
+        for path, old in before.items():
+            new = self._matches.get(path, set())
+            added += len(new - old)
+            cleared += len(old - new)
+        if before:
+            self._save_matches()
+        return {"added": added, "cleared": cleared}
+
+    def _scan(self, files: list[Path]) -> None:
+        # mtimes are taken first: a file saved mid-scan is rescanned next time
+        for path in files:
+            self._scanned_mtimes[str(path)] = _mtime(path)
+            self._matches[str(path)] = set()
+        for match in self._scanner.scan_files(files, self._patterns).matches:
+            self._matches.setdefault(str(match.file_path), set()).add(
+                (match.pattern_id, match.line_number)
+            )
+
+    def _pattern_ids(self) -> list[str]:
+        return sorted(str(pattern.id) for pattern in self._patterns)
+
+    def _load_matches(self) -> dict[str, tuple[int | None, set[tuple[str, int]]]]:
+        """Saved ``{path: (mtime, matches)}``, empty if the pattern set changed."""
+        try:
+            data = json.loads(
+                self.storage.pattern_matches_path(self.session_id).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("patterns") != self._pattern_ids():
+            return {}
+        saved = {}
+        for path, entry in (data.get("files") or {}).items():
+            try:
+                saved[path] = (
+                    entry["mtime"],
+                    {(str(pattern_id), int(line)) for pattern_id, line in entry["matches"]},
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        return saved
+
+    def _save_matches(self) -> None:
+        path = self.storage.pattern_matches_path(self.session_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json_compatible(
+            path,
+            {
+                "session_id": self.session_id,
+                "patterns": self._pattern_ids(),
+                "files": {
+                    key: {
+                        "mtime": self._scanned_mtimes.get(key),
+                        "matches": sorted(found),
+                    }
+                    for key, found in sorted(self._matches.items())
+                },
+            },
+            indent=None,
+        )
+
+
+def _mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
 
 def watch_command(
     path: str,
     recursive: bool = True,
     duration: int | None = None,
     output_format: str = "text",
+    session: dict[str, Any] | None = None,
+    storage: Any = None,
+    answer: Callable[[dict[str, Any]], str] | None = None,
+    patterns: bool = True,
+    polling: bool = False,
+    debounce_seconds: float | None = None,
 ) -> dict[str, Any]:
     """
     Watch a directory for file system changes.
 
+    With a ``session``, every debounced batch of changes is fed through a
+    WatchPipeline that keeps the stored investigation current, and each
+    batch's latency from save to updated answer is reported.
+
     Args:
         path: Directory path to watch
         recursive: Watch subdirectories
         duration: Watch duration in seconds (None = indefinite)
         output_format: Output format (text, json)
+        session: Session metadata of an investigation to keep current
+        storage: InvestigationStorage holding the session
+        answer: Answers the watched question for the current session
+        patterns: Track pattern matches (session mode)
+        polling: Poll file stats even when watchdog is installed
+        debounce_seconds: Quiet period that closes a batch
 
     Returns:
         Dictionary with watch results
@@ -51,26 +419,8 @@ def watch_command(
             "error": f"Path is not a directory: {watch_path}",
         }
 
-    # Check if watchdog is available
-    try:
-        from observations.eyes.watcher import WATCHDOG_AVAILABLE
-
-        if not WATCHDOG_AVAILABLE:
-            return {
-                "success": False,
-                "error": (
-                    "watchdog library not installed. Install with: pip install watchdog"
-                ),
-            }
-    except ImportError:
-        return {
-            "success": False,
-            "error": (
-                "watchdog library not installed. Install with: pip install watchdog"
-            ),
-        }
-
     changes = []
+    reports: list[WatchBatchReport] = []
 
     def on_change(change):
         """Callback for file system changes."""
@@ -90,36 +440,68 @@ def watch_command(
                 flush=True,
             )
 
-    config = WatcherConfig(recursive=recursive)
-
+    config = WatcherConfig(recursive=recursive, use_polling=polling)
+    if debounce_seconds is not None:
+        config.debounce_seconds = debounce_seconds
+
+    pipeline = None
+    if session is not None:
+        pipeline = WatchPipeline(
+            session,
+            storage=storage,
+            answer=answer,
+            patterns=patterns,
+            ignore_patterns=config.ignore_patterns,
+        )
+        config.ignore_patterns = pipeline.ignore_patterns
+
+    watcher = FileSystemWatcher(watch_path, config, on_change)
+    deadline = time.monotonic() + duration if duration else None
     try:
-        with FileSystemWatcher(watch_path, config, on_change) as watcher:
+        with watcher:
             if output_format == "text":
                 print(
                     f"Watching {watch_path} "
-                    f"({'recursively' if recursive else 'non-recursively'})...",
+                    f"({'recursively' if recursive else 'non-recursively'}, "
+                    f"{watcher.backend})...",
                     file=sys.stderr,
                 )
                 print("Press Ctrl+C to stop", file=sys.stderr)
 
-            if duration:
-                time.sleep(duration)
-            else:
-                # Run indefinitely until interrupted
-                while True:
-                    time.sleep(0.1)
+            while deadline is None or time.monotonic() < deadline:
+                wait = 0.5 if deadline is None else min(0.5, deadline - time.monotonic())
+                batch = watcher.next_batch(max(wait, 0))
+                if not batch or pipeline is None:
+                    continue
+                report = pipeline.process(batch)
+                reports.append(report)
+                if output_format == "text":
+                    _print_batch_report(report)
 
     except KeyboardInterrupt:
         if output_format == "text":
             print("\nStopped watching.", file=sys.stderr)
+    finally:
+        if pipeline is not None:
+            pipeline.close()
 
     result = {
         "success": True,
         "watch_path": str(watch_path),
         "recursive": recursive,
+        "backend": watcher.backend,
         "changes_detected": len(changes),
         "changes": [c.to_dict() for c in changes],
     }
+    if pipeline is not None:
+        latencies = sorted(report.save_to_answer_ms for report in reports)
+        result["session_id"] = pipeline.session_id
+        result["batches"] = [report.to_dict() for report in reports]
+        result["latency_ms"] = {
+            "batches": len(latencies),
+            "median": latencies[len(latencies) // 2] if latencies else None,
+            "max": latencies[-1] if latencies else None,
+        }
 
     if output_format == "json":
         print(json.dumps(result, indent=2))
@@ -129,6 +511,21 @@ def watch_command(
     return result
 
 
+def _print_batch_report(report: WatchBatchReport) -> None:
+    """One line per batch: what was patched and where the time went."""
+    stages = ", ".join(f"{stage} {ms:.1f}" for stage, ms in report.stage_ms.items())
+    print(
+        f"[watch] {report.changes} change(s): re-observed {len(report.reobserved)}, "
+        f"removed {len(report.removed)}; patterns {report.pattern_matches} "
+        f"(+{report.pattern_changes['added']}/-{report.pattern_changes['cleared']}); "
+        f"save->answer {report.save_to_answer_ms:.1f} ms ({stages})",
+        file=sys.stderr,
+        flush=True,
+    )
+    if report.answer is not None:
+        print(report.answer, flush=True)
+
+
 def diff_command(
     old_path: str,
     new_path: str | None = None,
@@ -356,9 +753,10 @@ def execute_watch(
     recursive: bool = True,
     duration: int | None = None,
     format: str = "text",
+    **options: Any,
 ) -> dict[str, Any]:
-    """CLI entry point for watch command."""
-    return watch_command(path, recursive, duration, format)
+    """CLI entry point for watch command (options: see ``watch_command``)."""
+    return watch_command(path, recursive, duration, format, **options)
 
 
 def execute_diff(
@@ -9,10 +9,6 @@ ROLE: Declare the official human entry points and prevent:
 If a human can do something, it must pass through here.
 """
 
-from .api import CodeMarshalAPI, create_http_server
-from .cli import CodeMarshalCLI
-from .cli import main as cli_main
-
 # Public API: These are the only official entry points
 __all__ = [
     # Command Line Interface
@@ -36,6 +32,17 @@ __author__ = "CodeMarshal Team"
 __license__ = "MIT"
 
 
+# Entry points import lazily: running the CLI must not import the API (and
+# with it every command module) just because this package was loaded
+_LAZY_ATTRIBUTES = {
+    "CodeMarshalAPI": (".api", "CodeMarshalAPI"),
+    "create_http_server": (".api", "create_http_server"),
+    "CodeMarshalCLI": (".cli", "CodeMarshalCLI"),
+    "cli_main": (".cli", "main"),
+    "TruthPreservingTUI": (".tui", "TruthPreservingTUI"),
+}
+
+
 def launch_tui(*args, **kwargs):
     """Lazy TUI launcher to avoid importing curses/TUI at package import time."""
     from .tui import launch_tui as _launch_tui
@@ -245,12 +252,16 @@ try:
         description="Desktop GUI: Single-focus, local-only investigation",
     )
 
-    # Register API entry point
-    from .api import CodeMarshalAPI as APIClass
+    # Register API entry point (lazy wrapper)
+    def create_api(*args, **kwargs):
+        """Lazy API constructor to avoid importing every command at package import time."""
+        from .api import CodeMarshalAPI as _CodeMarshalAPI
+
+        return _CodeMarshalAPI(*args, **kwargs)
 
     EntryPointRegistry.register(
         name="api",
-        function=APIClass,
+        function=create_api,
         description="Programmatic API: Strict, schema-based programmatic access",
     )
 
@@ -270,10 +281,13 @@ def __getattr__(name: str):
     """
     if name in _PRIVATE_MODULES:
         raise AttributeError(f"Module '{name}' is private. {_PRIVATE_MODULES[name]}")
-    if name == "TruthPreservingTUI":
-        from .tui import TruthPreservingTUI as _TruthPreservingTUI
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
 
-        return _TruthPreservingTUI
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module_name, __name__), attribute)
+        globals()[name] = value
+        return value
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
@@ -284,7 +298,7 @@ _EXPORTED_SYMBOLS = set(__all__)
 def _validate_exports():
     """Validate that all exported symbols exist and are accessible."""
     # Symbols that are lazy-loaded via __getattr__ and don't exist in globals() at import time
-    LAZY_SYMBOLS = {"TruthPreservingTUI"}
+    LAZY_SYMBOLS = set(_LAZY_ATTRIBUTES)
 
     missing = []
     for symbol in _EXPORTED_SYMBOLS:
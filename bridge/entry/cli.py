@@ -5,40 +5,24 @@ ROLE: Translate command-line invocations into explicit command calls.
 PRINCIPLE: Explicitness over comfort. The CLI is a contract, not a conversation.
 """
 
+from __future__ import annotations
+
 import argparse
 import logging
 import sys
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
-
-from bridge.commands import (
-    ExportFormat,
-    ExportRequest,
-    ExportType,
-    ObservationRequest,
-    ObservationType,
-)
-
-# Only allowed imports per constitutional constraints
-from bridge.commands import execute_investigation as investigate
-from bridge.commands import execute_observation as observe
-from bridge.commands.investigate import (
-    InvestigationRequest,
-    InvestigationScope,
-    InvestigationType,
-)
-from core.engine import Engine
-from core.runtime import ExecutionMode, Runtime, RuntimeConfiguration, create_runtime as create_runtime_func
-
-from inquiry.session.context import QuestionType, SessionContext
-from integrity.adapters.memory_monitor_adapter import create_memory_monitor_adapter
-from lens.navigation.context import FocusType, create_navigation_context
-from lens.navigation.workflow import WorkflowStage
-from lens.views import ViewType
-from storage.investigation_storage import InvestigationStorage
-from storage.atomic import flush_pending_writes, atomic_write_json_compatible
+from typing import TYPE_CHECKING, Any
+
+# Command modules import most of the system; handlers import what they use
+# at dispatch so `--help`, `--version` and light commands start quickly
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from bridge.integration.streaming_export import ExportStats
+    from lens.navigation.workflow import WorkflowStage
+    from storage.investigation_storage import InvestigationStorage
 
 # Type aliases for clarity
 PathStr = str
@@ -107,6 +91,13 @@ EXAMPLES:
             help="Show system diagnostics and exit",
         )
 
+        parser.add_argument(
+            "--profile-startup",
+            action="store_true",
+            help="Run the rest of the command under `python -X importtime` "
+            "and report where startup time goes",
+        )
+
         # Subcommands
         subparsers = parser.add_subparsers(
             dest="command",
@@ -167,6 +158,12 @@ EXAMPLES:
         self._add_share_parser(subparsers)
         self._add_comment_parser(subparsers)
 
+        # editor integration server
+        self._add_serve_parser(subparsers)
+
+        # keep an investigation current while files change
+        self._add_watch_parser(subparsers)
+
         return parser
 
     def _add_investigate_parser(self, subparsers: Any) -> None:
@@ -218,6 +215,19 @@ This collects observations, analyzes patterns, and creates investigation state.
             action="store_true",
             help="Explicitly confirm if investigation scope is large",
         )
+
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Worker processes for per-file observation (0 = one per CPU, default: serial)",
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Reuse cached import/export observations for files unchanged since a "
+            "previous run (file_sight metadata is always re-observed)",
+        )
         
         # Output format
         parser.add_argument(
@@ -284,6 +294,18 @@ Pure data collection with no inference.
             action="store_true",
             help="Persist observations to storage for later querying",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Worker processes for per-file observation (0 = one per CPU, default: serial)",
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Reuse cached import/export observations for files unchanged since a "
+            "previous run (file_sight metadata is always re-observed)",
+        )
 
     def _add_query_parser(self, subparsers: Any) -> None:
         """Add query command parser with explicit arguments."""
@@ -358,7 +380,17 @@ Export preserves truth without alteration.
         parser.add_argument(
             "--format",
             required=True,
-            choices=["json", "markdown", "html", "plain", "csv", "jupyter", "pdf", "svg"],
+            choices=[
+                "json",
+                "jsonl",
+                "markdown",
+                "html",
+                "plain",
+                "csv",
+                "jupyter",
+                "pdf",
+                "svg",
+            ],
             help="Export format (MUST be specified)",
         )
 
@@ -627,6 +659,17 @@ Creates a backup before repairing unless --validate-only is used.
             action="store_true",
             help="Skip investigations repair",
         )
+        parser.add_argument(
+            "--quick",
+            action="store_true",
+            help="Check observation sizes, headers and trailers only (no hashing)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Verification worker processes (default: by storage size)",
+        )
         parser.add_argument(
             "--verbose", action="store_true", help="Show detailed output"
         )
@@ -834,6 +877,11 @@ Supports regex patterns, file filtering, and context display.
             action="store_true",
             help="Show only filenames with matches",
         )
+        parser.add_argument(
+            "--no-index",
+            action="store_true",
+            help="Search every file instead of narrowing with the search index",
+        )
 
     def _add_pattern_parser(self, subparsers: Any) -> None:
         """Add pattern command parser."""
@@ -916,6 +964,23 @@ Commands: list, scan, add, search, apply, create, share
         scan_parser.add_argument(
             "--max-files", type=int, default=10000, help="Maximum files to scan"
         )
+        scan_parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Scan in this many worker processes (0 = one per CPU)",
+        )
+        scan_parser.add_argument(
+            "--pattern-timeout",
+            type=float,
+            default=2.0,
+            help="Seconds one pattern may spend on one file (0 = no limit)",
+        )
+        scan_parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Rescan every file instead of reusing matches of unchanged files",
+        )
 
         # pattern add
         add_parser = pattern_subparsers.add_parser("add", help="Add a custom pattern")
@@ -1604,6 +1669,91 @@ Commands: list, scan, add, search, apply, create, share
             help="Output format",
         )
 
+    def _add_serve_parser(self, subparsers: Any) -> None:
+        """Add serve command parser."""
+        parser = subparsers.add_parser(
+            "serve",
+            help="Serve editor integrations over JSON-RPC",
+            description="""
+Keep one CodeMarshal process warm and answer JSON-RPC 2.0 requests
+(one JSON message per line) from editor integrations.
+            """,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+        )
+        parser.add_argument(
+            "--socket",
+            type=Path,
+            default=None,
+            help="Listen on this Unix socket instead of stdin/stdout",
+        )
+
+    def _add_watch_parser(self, subparsers: Any) -> None:
+        """Add watch command parser."""
+        parser = subparsers.add_parser(
+            "watch",
+            help="Watch files and keep an investigation current",
+            description="""
+Watch a directory for changes. With --session, each debounced batch of
+changes re-observes only the changed files, patches the investigation's
+stored observations, query index, dependency graph and pattern matches,
+and reports the latency from save to updated query answer.
+            """,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+        )
+        parser.add_argument(
+            "path",
+            nargs="?",
+            type=Path,
+            default=None,
+            help="Directory to watch (default: the session's path, else .)",
+        )
+        parser.add_argument(
+            "--session",
+            type=str,
+            default=None,
+            help="Investigation ID to keep current",
+        )
+        parser.add_argument(
+            "--question",
+            type=str,
+            default=None,
+            help="Question to re-answer after every batch (with --session)",
+        )
+        parser.add_argument(
+            "--question-type",
+            choices=["structure", "purpose", "connections", "anomalies", "thinking"],
+            default="connections",
+            help="Type of the watched question (default: connections)",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=None,
+            help="Stop after this many seconds (default: until Ctrl+C)",
+        )
+        parser.add_argument(
+            "--debounce",
+            type=float,
+            default=None,
+            help="Quiet seconds that close a batch (default: 0.5)",
+        )
+        parser.add_argument(
+            "--poll",
+            action="store_true",
+            help="Poll file stats instead of using watchdog events",
+        )
+        parser.add_argument(
+            "--no-patterns",
+            action="store_true",
+            help="Do not track pattern matches",
+        )
+        parser.add_argument(
+            "--output",
+            choices=["text", "json"],
+            default="text",
+            help="Output format (default: text)",
+        )
+
     def run(self, args: list[str] | None = None) -> int:
         """
         Run the CLI with provided arguments.
@@ -1620,6 +1770,12 @@ Commands: list, scan, add, search, apply, create, share
             # argparse already printed help or error
             return 1
 
+        if parsed_args.profile_startup:
+            argv = sys.argv[1:] if args is None else list(args)
+            return self._handle_profile_startup(
+                [arg for arg in argv if arg != "--profile-startup"]
+            )
+
         # Handle version flag before requiring a command
         if parsed_args.version:
             return self._handle_version()
@@ -1684,6 +1840,10 @@ Commands: list, scan, add, search, apply, create, share
                 return self._handle_share(parsed_args)
             elif parsed_args.command == "comment":
                 return self._handle_comment(parsed_args)
+            elif parsed_args.command == "serve":
+                return self._handle_serve(parsed_args)
+            elif parsed_args.command == "watch":
+                return self._handle_watch(parsed_args)
             else:
                 # Should not happen due to argparse validation
                 self._refuse(f"Unknown command: {parsed_args.command}")
@@ -1699,6 +1859,22 @@ Commands: list, scan, add, search, apply, create, share
 
     def _handle_investigate(self, args: argparse.Namespace) -> int:
         """Handle investigate command with explicit validation."""
+        from bridge.commands import execute_investigation as investigate
+        from bridge.commands.investigate import (
+            InvestigationRequest,
+            InvestigationScope,
+            InvestigationType,
+        )
+        from core.engine import Engine
+        from core.runtime import create_runtime as create_runtime_func
+        from inquiry.session.context import QuestionType, SessionContext
+        from integrity.adapters.memory_monitor_adapter import create_memory_monitor_adapter
+        from lens.navigation.context import FocusType, create_navigation_context
+        from lens.navigation.workflow import WorkflowStage
+        from lens.views import ViewType
+        from storage.investigation_storage import InvestigationStorage
+        from storage.atomic import atomic_write_json_compatible, flush_pending_writes
+
         # Validate path exists
         if not args.path.exists():
             self._refuse(f"Path does not exist: {args.path}")
@@ -1782,6 +1958,8 @@ Commands: list, scan, add, search, apply, create, share
                     "intent": args.intent,
                     "name": args.name,
                     "initial_notes": args.notes,
+                    "workers": getattr(args, "workers", None),
+                    "incremental": getattr(args, "incremental", False),
                 },
             )
 
@@ -1792,6 +1970,17 @@ Commands: list, scan, add, search, apply, create, share
                 existing_sessions={},
             )
 
+            # Index the finished session once so later queries skip rehydration.
+            # The engine saves the session under its runtime context's ID, not
+            # the investigation ID reported in raw_result.
+            storage = InvestigationStorage()
+            session_data = storage.load_session_metadata(
+                str(runtime.context.session_id)
+            )
+            if session_data:
+                self._build_query_index(storage, session_data)
+            self._build_search_index(storage, args.path)
+
             if args.output == "json":
                 import json
                 self._safe_print(json.dumps(raw_result, indent=2, ensure_ascii=False, default=str))
@@ -1857,6 +2046,18 @@ Commands: list, scan, add, search, apply, create, share
 
     def _handle_observe(self, args: argparse.Namespace) -> int:
         """Handle observe command with explicit validation."""
+        from bridge.commands import ObservationRequest, ObservationType
+        from bridge.commands import execute_observation as observe
+        from core.engine import Engine
+        from core.runtime import create_runtime as create_runtime_func
+        from inquiry.session.context import QuestionType, SessionContext
+        from integrity.adapters.memory_monitor_adapter import create_memory_monitor_adapter
+        from lens.navigation.context import FocusType, create_navigation_context
+        from lens.navigation.workflow import WorkflowStage
+        from lens.views import ViewType
+        from storage.investigation_storage import InvestigationStorage
+        from storage.atomic import atomic_write_json_compatible, flush_pending_writes
+
         # Validate path exists
         if not args.path.exists():
             self._refuse(f"Path does not exist: {args.path}")
@@ -1903,7 +2104,11 @@ Commands: list, scan, add, search, apply, create, share
             from observations.interface import MinimalObservationInterface
 
             engine.register_observation_interface(
-                MinimalObservationInterface(runtime._context)
+                MinimalObservationInterface(
+                    runtime._context,
+                    workers=getattr(args, "workers", None),
+                    incremental=getattr(args, "incremental", False),
+                )
             )
 
             print("4. Creating context...", file=sys.stderr)
@@ -1973,6 +2178,8 @@ Commands: list, scan, add, search, apply, create, share
                     "follow_symlinks": args.follow_symlinks,
                     "constitutional": getattr(args, "constitutional", False),
                     "include_results": include_results,
+                    "workers": getattr(args, "workers", None),
+                    "incremental": getattr(args, "incremental", False),
                     "boundary_config_path": str(boundary_config_path)
                     if boundary_config_path
                     else None,
@@ -2077,6 +2284,8 @@ Commands: list, scan, add, search, apply, create, share
                                 "manifest_id"
                             )
                         storage.save_session(session_data)
+                        self._build_query_index(storage, session_data)
+                        self._build_search_index(storage, args.path)
                         if len(observation_ids) <= 5:
                             display_ids = observation_ids
                         else:
@@ -2141,6 +2350,8 @@ Commands: list, scan, add, search, apply, create, share
 
     def _handle_query(self, args: argparse.Namespace) -> int:
         """Handle query command with explicit validation."""
+        from storage.investigation_storage import InvestigationStorage
+
         # Validate question type matches question content
         if not self._question_matches_type(args.question, args.question_type):
             self._warn(
@@ -2159,12 +2370,8 @@ Commands: list, scan, add, search, apply, create, share
                 self._refuse(f"Investigation not found: {args.investigation_id}")
                 return 1
 
-            # Load observations for this session
-            observations = self._load_observations(storage, session_data)
-
-            # Generate answer based on question type
-            answer = self._generate_answer(
-                args.question, args.question_type, observations
+            answer, observations = self._answer_question(
+                storage, session_data, args.question, args.question_type
             )
 
             if args.output == "json":
@@ -2204,124 +2411,210 @@ Commands: list, scan, add, search, apply, create, share
             self._refuse(f"Query error: {str(e)}")
             return 1
 
+    def _answer_question(
+        self,
+        storage: InvestigationStorage,
+        session_data: dict,
+        question: str,
+        question_type: str,
+    ) -> tuple[str, list]:
+        """Answer a question about a session; returns (answer, observations read)."""
+        # Persisted artifacts first: a current dependency graph answers
+        # graph-only questions without decoding any observations
+        analyzer_options = self._analyzer_options(storage, session_data, question_type)
+        observations: list = []
+        if self._needs_observations(question, question_type, analyzer_options):
+            # Load only the observations this question's analyzer reads
+            observations = self._load_query_observations(
+                storage, session_data, question_type
+            )
+            if not analyzer_options:
+                analyzer_options = self._analyzer_options(
+                    storage, session_data, question_type, observations
+                )
+
+        # Generate answer based on question type
+        answer = self._generate_answer(
+            question, question_type, observations, analyzer_options
+        )
+        return answer, observations
+
+    def _handle_serve(self, args: argparse.Namespace) -> int:
+        """Handle serve command: run until the client disconnects."""
+        from bridge.entry.server import serve_socket, serve_stdio
+
+        if args.socket is not None:
+            return serve_socket(args.socket)
+        return serve_stdio()
+
+    def _handle_watch(self, args: argparse.Namespace) -> int:
+        """Handle watch command: print changes, or keep a session current."""
+        from bridge.commands.watch import watch_command
+
+        storage = None
+        session_data = None
+        answer = None
+        if args.session:
+            from storage.investigation_storage import InvestigationStorage
+
+            storage = InvestigationStorage()
+            session_data = storage.load_session_metadata(args.session)
+            if session_data is None:
+                session_data = storage.find_session(args.session)
+            if session_data is None:
+                self._refuse(f"Investigation not found: {args.session}")
+                return 1
+            if args.question:
+                question, question_type = args.question, args.question_type
+
+                def answer(session: dict) -> str:
+                    return self._answer_question(
+                        storage, session, question, question_type
+                    )[0]
+
+        elif args.question:
+            self._refuse("--question needs --session")
+            return 1
+
+        path = args.path or Path(
+            str(session_data.get("path") or ".") if session_data else "."
+        )
+        result = watch_command(
+            str(path),
+            duration=args.duration,
+            output_format=args.output,
+            session=session_data,
+            storage=storage,
+            answer=answer,
+            patterns=not args.no_patterns,
+            polling=args.poll,
+            debounce_seconds=args.debounce,
+        )
+        if not result.get("success"):
+            self._refuse(result.get("error", "Watch failed"))
+            return 1
+        return 0
+
     def _load_session_data(
         self, storage: InvestigationStorage, investigation_id: str
     ) -> dict | None:
-        """Load session data from storage."""
-        import json
-        from pathlib import Path
-
-        # Look for session file in storage/sessions/
-        sessions_dir = Path("storage/sessions")
-        if not sessions_dir.exists():
-            return None
-
-        # Try to find session file by investigation_id
-        for session_file in sessions_dir.glob("*.session.json"):
-            try:
-                with open(session_file) as f:
-                    data = json.load(f)
-                    # Check if this is the right session
-                    if data.get("id") == investigation_id:
-                        return data
-                    # Also check by filename pattern (investigation_id format)
-                    if investigation_id in str(session_file):
-                        return data
-            except Exception:
-                continue
+        """Load session data from storage via the session catalog."""
+        # Exact ID, then any session whose file name contains the ID
+        if investigation_id:
+            session = storage.load_session_metadata(investigation_id)
+            if session is None:
+                session = storage.find_session(investigation_id)
+            if session is not None:
+                return session
 
         # If not found, return the most recent session as fallback
         # (This handles cases where investigation_id isn't properly mapped)
-        most_recent = None
-        most_recent_time = 0
-
-        for session_file in sessions_dir.glob("*.session.json"):
-            try:
-                with open(session_file) as f:
-                    data = json.load(f)
-                    # Get timestamp from created_at
-                    created_at = data.get("created_at", "")
-                    if created_at:
-                        # Parse ISO timestamp to compare
-                        try:
-                            from datetime import datetime
-
-                            dt = datetime.fromisoformat(
-                                created_at.replace("Z", "+00:00")
-                            )
-                            timestamp = dt.timestamp()
-                            if timestamp > most_recent_time:
-                                most_recent_time = timestamp
-                                most_recent = data
-                        except Exception:
-                            pass
-            except Exception:
-                continue
-
-        if most_recent:
+        recent = storage.list_sessions(limit=1)
+        if recent:
             self._warn(
                 f"Investigation {investigation_id} not found, using most recent session"
             )
-            return most_recent
+            return recent[0]
 
         return None
 
     def _load_observations(
         self, storage: InvestigationStorage, session_data: dict
     ) -> list:
-        """Load observations for a session."""
-        import json
-        from pathlib import Path
+        """Load observations for a session (see ``_iter_observations``)."""
+        return list(self._iter_observations(storage, session_data))
 
-        observations = []
-        observation_ids = session_data.get("observation_ids", [])
+    def _iter_observations(
+        self, storage: InvestigationStorage, session_data: dict
+    ) -> Iterator[dict]:
+        """Yield observations for a session, one stored payload at a time.
+
+        Observation IDs may name single observation files, streaming
+        manifests, or records packed in segment files; storage resolves all
+        three. A payload that fails to load is skipped and the rest are kept.
 
-        observations_dir = Path("storage/observations")
+        If reading fails after observations were yielded, the error is
+        raised: stopping quietly would hand callers (exports in particular)
+        a truncated session.
+        """
+        observations_dir = storage.base_path / "observations"
         if not observations_dir.exists():
-            return observations
+            return
 
-        for obs_id in observation_ids:
-            # Look for observation file (with .observation.json extension)
-            obs_file = observations_dir / f"{obs_id}.observation.json"
-            if obs_file.exists():
+        if session_data.get("patch_ids"):
+            # Watch patches supersede the observations of changed files
+            yielded = False
+            try:
+                for _source, obs in storage.iter_sourced_observations(session_data):
+                    yielded = True
+                    yield obs
+                return
+            except Exception as e:
+                if yielded:
+                    raise
+                logger.warning(f"Failed to apply watch patches: {e}")
+
+        payloads = storage.iter_observation_payloads(
+            session_data.get("observation_ids", []),
+            session_data.get("manifest_id"),
+        )
+        yielded = False
+        try:
+            for obs_id, data in payloads:
                 try:
-                    with open(obs_file) as f:
-                        data = json.load(f)
-                        # Extract the actual observation data from the nested structure
-                        if "data" in data and isinstance(data["data"], dict):
-                            obs_data = data["data"]
-                            # Check if there are nested observations
-                            if "observations" in obs_data and obs_data["observations"]:
-                                for nested_obs in obs_data["observations"]:
-                                    observations.append(nested_obs)
-                            else:
-                                # Add the main data as a file_sight observation
-                                observations.append(
-                                    {
-                                        "type": "file_sight",
-                                        "result": obs_data,
-                                        "path": obs_data.get("path", ""),
-                                    }
-                                )
-                        elif (
-                            isinstance(data, dict)
-                            and "observations" in data
-                            and isinstance(data["observations"], list)
-                        ):
-                            for nested_obs in data["observations"]:
-                                observations.append(nested_obs)
-                        else:
-                            observations.append(data)
+                    observations = storage.unwrap_observation_payload(data)
                 except Exception as e:
                     logger.warning(f"Failed to load observation {obs_id}: {e}")
                     continue
+                for obs in observations:
+                    yielded = True
+                    yield obs
+        except Exception as e:
+            if yielded:
+                raise
+            logger.warning(f"Failed to load observations: {e}")
 
-        return observations
+    def _load_query_observations(
+        self, storage: InvestigationStorage, session_data: dict, question_type: str
+    ) -> list:
+        """Load a session's observations for a query through its query index.
 
-    def _generate_answer(
-        self, question: str, question_type: str, observations: list
-    ) -> str:
-        """Generate answer using appropriate analyzer."""
+        The index is built once per session and stores observations by type,
+        so analyzers that declare ``OBSERVATION_TYPES`` only load those (and
+        ``COMPACT_OBSERVATIONS`` ones skip payload decoding entirely).
+        Falls back to a full load if the index cannot be used.
+        """
+        analyzer_class = self._analyzer_classes().get(question_type)
+        types = getattr(analyzer_class, "OBSERVATION_TYPES", None)
+        compact = bool(getattr(analyzer_class, "COMPACT_OBSERVATIONS", False))
+        try:
+            index = storage.ensure_query_index(session_data)
+            return index.observations(types, compact=compact)
+        except Exception as e:
+            logger.warning(f"Query index unavailable, loading all observations: {e}")
+            return self._load_observations(storage, session_data)
+
+    def _build_query_index(
+        self, storage: InvestigationStorage, session_data: dict
+    ) -> None:
+        """Build the session's query index now so the first query is fast."""
+        try:
+            storage.ensure_query_index(session_data)
+        except Exception as e:
+            self._warn(f"Query index not built (queries will build it): {e}")
+
+    def _build_search_index(self, storage: InvestigationStorage, path: Path) -> None:
+        """Build or refresh the trigram index `codemarshal search` narrows with."""
+        from storage.search_index import TrigramIndex
+
+        try:
+            TrigramIndex.for_root(storage.base_path, path).update()
+        except Exception as e:
+            self._warn(f"Search index not updated (search reads every file): {e}")
+
+    @staticmethod
+    def _analyzer_classes() -> dict[str, type]:
+        """Map question types to analyzer classes."""
         from inquiry.answers import (
             AnomalyDetector,
             ConnectionMapper,
@@ -2330,8 +2623,7 @@ Commands: list, scan, add, search, apply, create, share
             ThinkingEngine,
         )
 
-        # Map question type to analyzer
-        analyzers = {
+        return {
             "structure": StructureAnalyzer,
             "connections": ConnectionMapper,
             "anomalies": AnomalyDetector,
@@ -2339,18 +2631,79 @@ Commands: list, scan, add, search, apply, create, share
             "thinking": ThinkingEngine,
         }
 
-        analyzer_class = analyzers.get(question_type)
+    def _analyzer_options(
+        self,
+        storage: InvestigationStorage,
+        session_data: dict,
+        question_type: str,
+        observations: list | None = None,
+    ) -> dict:
+        """
+        Extra constructor arguments for the question's analyzer.
+
+        Connection questions get the session's persisted dependency graph.
+        Without ``observations`` only a current sidecar is loaded; with them
+        a missing or stale graph is built and saved, so resolution runs
+        once per session.
+        """
+        if question_type != "connections":
+            return {}
+        try:
+            from inquiry.answers.dependency_graph import DependencyGraph, load_or_build
+
+            session_id = str(session_data.get("id") or session_data.get("session_id"))
+            path = storage.dependency_graph_path(session_id)
+            key = storage.observation_set_key(session_data)
+            if observations is None:
+                graph = DependencyGraph.load(path, key)
+            else:
+                graph = load_or_build(path, key, observations)
+        except Exception as e:
+            logger.warning("Dependency graph unavailable, building per query: %s", e)
+            return {}
+        return {"dependency_graph": graph} if graph is not None else {}
+
+    def _needs_observations(
+        self, question: str, question_type: str, analyzer_options: dict
+    ) -> bool:
+        """Whether the analyzer must read observations for this question."""
+        analyzer_class = self._analyzer_classes().get(question_type)
+        if analyzer_class is None or not hasattr(analyzer_class, "needs_observations"):
+            return True
+        try:
+            return analyzer_class(**analyzer_options).needs_observations(question)
+        except Exception:
+            return True
+
+    def _generate_answer(
+        self,
+        question: str,
+        question_type: str,
+        observations: list,
+        analyzer_options: dict | None = None,
+    ) -> str:
+        """Generate answer using appropriate analyzer."""
+        analyzer_class = self._analyzer_classes().get(question_type)
         if not analyzer_class:
             return f"Unknown question type: {question_type}"
 
         try:
-            analyzer = analyzer_class()
+            analyzer = analyzer_class(**(analyzer_options or {}))
             return analyzer.analyze(observations, question)
         except Exception as e:
             return f"Error generating answer: {str(e)}"
 
     def _handle_export(self, args: argparse.Namespace) -> int:
         """Handle export command with explicit validation."""
+        from bridge.commands import ExportFormat, ExportRequest, ExportType
+        from bridge.integration.streaming_export import get_streaming_exporter
+        from core.runtime import ExecutionMode, Runtime, RuntimeConfiguration
+        from inquiry.session.context import QuestionType, SessionContext
+        from lens.navigation.context import FocusType, create_navigation_context
+        from lens.navigation.workflow import WorkflowStage
+        from lens.views import ViewType
+        from storage.investigation_storage import InvestigationStorage
+
         # Validate output path
         if args.output.exists() and not args.confirm_overwrite:
             self._refuse(
@@ -2417,6 +2770,7 @@ Commands: list, scan, add, search, apply, create, share
 
             format_map = {
                 "json": ExportFormat.JSON,
+                "jsonl": ExportFormat.JSON,
                 "markdown": ExportFormat.MARKDOWN,
                 "html": ExportFormat.HTML,
                 "plain": ExportFormat.PLAINTEXT,
@@ -2449,28 +2803,50 @@ Commands: list, scan, add, search, apply, create, share
                 self._refuse(f"Investigation not found: {args.investigation_id}")
                 return 1
 
-            # Load observations for this session
-            observations = self._load_observations(storage, session_data)
+            output_path = Path(args.output)
+            stats = None
+            if get_streaming_exporter(args.format) is not None:
+                # Observations flow from storage to the file one at a time
+                try:
+                    stats = self._stream_export(
+                        args.format,
+                        output_path,
+                        session_data,
+                        self._iter_observations(storage, session_data),
+                        args.include_notes,
+                        args.include_patterns,
+                    )
+                except Exception as e:
+                    self._refuse(f"Failed to write export file: {str(e)}")
+                    return 1
+            else:
+                # Load observations for this session
+                observations = self._load_observations(storage, session_data)
+
+                # Generate export content
+                export_content = self._generate_export_content(
+                    args.format,
+                    session_data,
+                    observations,
+                    args.include_notes,
+                    args.include_patterns,
+                )
 
-            # Generate export content
-            export_content = self._generate_export_content(
-                args.format,
-                session_data,
-                observations,
-                args.include_notes,
-                args.include_patterns,
-            )
+                # Write to file (temp file + rename, as for streamed exports)
+                from storage.atomic import AtomicWriter
 
-            # Write to file
-            output_path = Path(args.output)
-            try:
-                if isinstance(export_content, bytes):
-                    output_path.write_bytes(export_content)
-                else:
-                    output_path.write_text(export_content, encoding="utf-8")
-            except Exception as e:
-                self._refuse(f"Failed to write export file: {str(e)}")
-                return 1
+                try:
+                    if isinstance(export_content, bytes):
+                        with AtomicWriter(output_path, mode="wb") as handle:
+                            handle.write(export_content)
+                    else:
+                        with AtomicWriter(
+                            output_path, mode="w", encoding="utf-8"
+                        ) as handle:
+                            handle.write(export_content)
+                except Exception as e:
+                    self._refuse(f"Failed to write export file: {str(e)}")
+                    return 1
 
             # Verify file was created
             if not output_path.exists():
@@ -2498,7 +2874,7 @@ Commands: list, scan, add, search, apply, create, share
                     "include_patterns": bool(args.include_patterns),
                 },
             )
-            self._show_export_result(result)
+            self._show_export_result(result, stats)
             return 0
 
         except Exception as e:
@@ -2763,6 +3139,8 @@ Commands: list, scan, add, search, apply, create, share
                 repair_storage=not args.no_storage,
                 repair_investigations=not args.no_investigations,
                 verbose=args.verbose,
+                quick=args.quick,
+                workers=args.workers,
             )
             if result.success:
                 if args.validate_only:
@@ -2906,6 +3284,7 @@ Commands: list, scan, add, search, apply, create, share
                 threads=args.threads,
                 exclude_pattern=args.exclude,
                 files_with_matches=args.files_with_matches,
+                storage_root=None if args.no_index else Path("storage"),
             )
 
             if result.success:
@@ -3542,6 +3921,9 @@ Commands: list, scan, add, search, apply, create, share
                     glob=args.glob,
                     output_format=args.output,
                     max_files=args.max_files,
+                    processes=args.workers,
+                    pattern_timeout=args.pattern_timeout or None,
+                    storage_root=None if args.no_cache else Path("storage"),
                 )
                 if args.output == "json":
                     import json
@@ -3550,10 +3932,13 @@ Commands: list, scan, add, search, apply, create, share
                         "success": result.success,
                         "patterns_scanned": result.patterns_scanned,
                         "files_scanned": result.files_scanned,
+                        "files_reused": result.files_reused,
+                        "files_rescanned": result.files_rescanned,
                         "matches_found": result.matches_found,
                         "scan_time_ms": result.scan_time_ms,
                         "matches": result.matches,
                         "errors": result.errors,
+                        "timeouts": result.timeouts,
                         "error": result.error,
                     }
                     self._safe_print(
@@ -3580,8 +3965,20 @@ Commands: list, scan, add, search, apply, create, share
                     print("=" * 80)
                     print(f"Patterns scanned: {result.patterns_scanned}")
                     print(f"Files scanned: {result.files_scanned}")
+                    if result.files_reused or result.files_rescanned:
+                        print(
+                            f"  Reused from cache: {result.files_reused}, "
+                            f"rescanned: {result.files_rescanned}"
+                        )
                     print(f"Matches found: {result.matches_found}")
                     print(f"Scan time: {result.scan_time_ms:.2f}ms")
+                    if result.timeouts:
+                        print(f"Pattern timeouts: {len(result.timeouts)}")
+                        for timeout in result.timeouts:
+                            self._warn(
+                                f"{timeout['pattern_id']} exceeded "
+                                f"{timeout['budget_seconds']:g}s on {timeout['file']}"
+                            )
 
                     try:
                         from lens.views.pattern_dashboard import PatternDashboardView
@@ -3912,6 +4309,53 @@ Commands: list, scan, add, search, apply, create, share
 
         return 0
 
+    def _handle_profile_startup(self, argv: list[str]) -> int:
+        """Handle --profile-startup: rerun the command with import timing."""
+        import os
+        import re
+        import subprocess
+        import time
+
+        env = dict(os.environ)
+        package_root = str(Path(__file__).resolve().parent.parent.parent)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [package_root, env.get("PYTHONPATH")])
+        )
+        command = [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "from bridge.entry.cli import main; main()",
+            *argv,
+        ]
+        started = time.perf_counter()
+        completed = subprocess.run(
+            command, capture_output=True, text=True, env=env, check=False
+        )
+        wall_ms = (time.perf_counter() - started) * 1000
+
+        line_pattern = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S.*)$")
+        imports = []
+        top_level_us = 0
+        for line in completed.stderr.splitlines():
+            match = line_pattern.match(line)
+            if not match:
+                continue
+            self_us, cumulative_us = int(match.group(1)), int(match.group(2))
+            imports.append((self_us, cumulative_us, match.group(4)))
+            if not match.group(3):
+                top_level_us += cumulative_us
+
+        print(f"Startup profile: codemarshal {' '.join(argv)}".rstrip())
+        print(f"  Wall time: {wall_ms:.1f} ms (exit code {completed.returncode})")
+        print(f"  Imports: {len(imports)} modules, {top_level_us / 1000:.1f} ms")
+        print()
+        print("import time: self [us] | cumulative | imported package")
+        for self_us, cumulative_us, name in sorted(imports, reverse=True)[:30]:
+            print(f"import time: {self_us:>9} | {cumulative_us:>10} | {name}")
+        return completed.returncode
+
     def _handle_info(self) -> int:
         """Handle --info flag."""
         import platform
@@ -3953,11 +4397,22 @@ Commands: list, scan, add, search, apply, create, share
             storage_dir = Path("storage")
             if storage_dir.exists():
                 session_count = len(list(storage_dir.glob("sessions/*.session.json")))
+                from storage.segment_store import count_records
+
                 obs_count = len(
                     list(storage_dir.glob("observations/*.observation.json"))
-                )
+                ) + count_records(storage_dir / "observations" / "segments")
                 print(f"  Sessions: {session_count}")
                 print(f"  Observations: {obs_count}")
+
+                from storage.search_index import TrigramIndex
+
+                for index in TrigramIndex.list_indexes(storage_dir):
+                    print(
+                        f"  Search Index: {index['root']} - {index['files']} files, "
+                        f"{index['trigrams']} trigrams, {index['segments']} segments, "
+                        f"{index['size_bytes'] / (1024 * 1024):.1f} MiB"
+                    )
             else:
                 print("  Storage directory not initialized")
         except Exception as e:
@@ -3994,6 +4449,14 @@ Commands: list, scan, add, search, apply, create, share
             return self._generate_plaintext_export(
                 session_data, observations, include_notes, include_patterns
             )
+        if normalized_format in ["jsonl", "csv"]:
+            return self._render_streaming_export(
+                normalized_format,
+                session_data,
+                observations,
+                include_notes,
+                include_patterns,
+            )
         if normalized_format == "jupyter":
             return self._generate_jupyter_export(
                 session_data, observations, include_notes, include_patterns
@@ -4071,27 +4534,9 @@ Commands: list, scan, add, search, apply, create, share
         include_patterns: bool,
     ) -> str:
         """Generate JSON export."""
-        import json
-        from datetime import datetime
-
-        export_data = {
-            "export_metadata": {
-                "version": "1.0",
-                "exported_at": datetime.now().isoformat(),
-                "format": "json",
-                "tool": "CodeMarshal",
-            },
-            "investigation": session_data,
-            "observations": observations,
-        }
-
-        if include_notes:
-            export_data["notes"] = session_data.get("notes", [])
-
-        if include_patterns:
-            export_data["patterns"] = session_data.get("patterns", [])
-
-        return json.dumps(export_data, indent=2, default=str)
+        return self._render_streaming_export(
+            "json", session_data, observations, include_notes, include_patterns
+        )
 
     def _generate_markdown_export(
         self,
@@ -4101,92 +4546,10 @@ Commands: list, scan, add, search, apply, create, share
         include_patterns: bool,
     ) -> str:
         """Generate Markdown export."""
-        from datetime import datetime
-
-        lines = [
-            "# CodeMarshal Investigation Report",
-            "",
-            f"**Exported:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "**Format:** Markdown",
-            "",
-            "---",
-            "",
-            "## Investigation Metadata",
-            "",
-            f"- **ID:** {session_data.get('id', 'Unknown')}",
-            f"- **Path:** {session_data.get('path', 'Unknown')}",
-            f"- **State:** {session_data.get('state', 'Unknown')}",
-            f"- **Created:** {session_data.get('created_at', 'Unknown')}",
-            "",
-            "---",
-            "",
-        ]
-
-        # Add observations summary
-        lines.extend(
-            [
-                "## Observations Summary",
-                "",
-                f"Total Observations: {len(observations)}",
-                "",
-            ]
-        )
-
-        # Group observations by type
-        obs_by_type = {}
-        for obs in observations:
-            obs_type = obs.get("type", "unknown")
-            if obs_type not in obs_by_type:
-                obs_by_type[obs_type] = []
-            obs_by_type[obs_type].append(obs)
-
-        for obs_type, obs_list in obs_by_type.items():
-            lines.extend(
-                [
-                    f"### {obs_type.title()}",
-                    "",
-                    f"Count: {len(obs_list)}",
-                    "",
-                ]
-            )
-
-        if include_notes and session_data.get("notes"):
-            lines.extend(
-                [
-                    "",
-                    "---",
-                    "",
-                    "## Notes",
-                    "",
-                ]
-            )
-            for note in session_data["notes"]:
-                lines.append(f"- {note}")
-
-        if include_patterns and session_data.get("patterns"):
-            lines.extend(
-                [
-                    "",
-                    "---",
-                    "",
-                    "## Patterns",
-                    "",
-                ]
-            )
-            for pattern in session_data["patterns"]:
-                lines.append(f"- {pattern}")
-
-        lines.extend(
-            [
-                "",
-                "---",
-                "",
-                "*Generated by CodeMarshal - Truth-Preserving Investigation*",
-            ]
+        return self._render_streaming_export(
+            "markdown", session_data, observations, include_notes, include_patterns
         )
 
-        return "\n".join(lines)
-
     def _generate_html_export(
         self,
         session_data: dict,
@@ -4195,88 +4558,9 @@ Commands: list, scan, add, search, apply, create, share
         include_patterns: bool,
     ) -> str:
         """Generate HTML export."""
-        from datetime import datetime
-
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>CodeMarshal Investigation Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; background: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 30px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        h1 {{ color: #333; border-bottom: 2px solid #007acc; padding-bottom: 10px; }}
-        h2 {{ color: #555; margin-top: 30px; }}
-        h3 {{ color: #666; }}
-        .metadata {{ background: #f9f9f9; padding: 15px; border-left: 4px solid #007acc; margin: 20px 0; }}
-        .observation {{ background: #fff; border: 1px solid #ddd; padding: 10px; margin: 10px 0; border-radius: 4px; }}
-        .footer {{ margin-top: 40px; padding-top: 20px; border-top: 1px solid #ddd; color: #999; font-size: 0.9em; }}
-        table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-        th, td {{ padding: 10px; text-align: left; border-bottom: 1px solid #ddd; }}
-        th {{ background: #f5f5f5; font-weight: bold; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>CodeMarshal Investigation Report</h1>
-        <div class="metadata">
-            <p><strong>Exported:</strong> {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-            <p><strong>Format:</strong> HTML</p>
-            <p><strong>Investigation ID:</strong> {session_data.get("id", "Unknown")}</p>
-        </div>
-        <h2>Investigation Details</h2>
-        <table>
-            <tr><th>Property</th><th>Value</th></tr>
-            <tr><td>ID</td><td>{session_data.get("id", "Unknown")}</td></tr>
-            <tr><td>Path</td><td>{session_data.get("path", "Unknown")}</td></tr>
-            <tr><td>State</td><td>{session_data.get("state", "Unknown")}</td></tr>
-            <tr><td>Created</td><td>{session_data.get("created_at", "Unknown")}</td></tr>
-        </table>
-        <h2>Observations</h2>
-        <p>Total Observations: {len(observations)}</p>
-"""
-
-        # Group observations by type
-        obs_by_type = {}
-        for obs in observations:
-            obs_type = obs.get("type", "unknown")
-            if obs_type not in obs_by_type:
-                obs_by_type[obs_type] = []
-            obs_by_type[obs_type].append(obs)
-
-        for obs_type, obs_list in obs_by_type.items():
-            html += f"""
-        <h3>{obs_type.title()}</h3>
-        <p>Count: {len(obs_list)}</p>
-"""
-
-        if include_notes and session_data.get("notes"):
-            html += """
-        <h2>Notes</h2>
-        <ul>
-"""
-            for note in session_data["notes"]:
-                html += f"            <li>{note}</li>\n"
-            html += "        </ul>\n"
-
-        if include_patterns and session_data.get("patterns"):
-            html += """
-        <h2>Patterns</h2>
-        <ul>
-"""
-            for pattern in session_data["patterns"]:
-                html += f"            <li>{pattern}</li>\n"
-            html += "        </ul>\n"
-
-        html += """
-        <div class="footer">
-            <p>Generated by CodeMarshal - Truth-Preserving Investigation</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
-
-        return html
+        return self._render_streaming_export(
+            "html", session_data, observations, include_notes, include_patterns
+        )
 
     def _generate_plaintext_export(
         self,
@@ -4286,85 +4570,56 @@ Commands: list, scan, add, search, apply, create, share
         include_patterns: bool,
     ) -> str:
         """Generate Plain text export."""
-        from datetime import datetime
-
-        lines = [
-            "=" * 70,
-            "CODEMARSHAL INVESTIGATION REPORT",
-            "=" * 70,
-            "",
-            f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "Format: Plain Text",
-            "",
-            "-" * 70,
-            "INVESTIGATION DETAILS",
-            "-" * 70,
-            "",
-            f"ID:       {session_data.get('id', 'Unknown')}",
-            f"Path:     {session_data.get('path', 'Unknown')}",
-            f"State:    {session_data.get('state', 'Unknown')}",
-            f"Created:  {session_data.get('created_at', 'Unknown')}",
-            "",
-            "-" * 70,
-            "OBSERVATIONS SUMMARY",
-            "-" * 70,
-            "",
-            f"Total Observations: {len(observations)}",
-            "",
-        ]
+        return self._render_streaming_export(
+            "plain", session_data, observations, include_notes, include_patterns
+        )
 
-        # Group observations by type
-        obs_by_type = {}
-        for obs in observations:
-            obs_type = obs.get("type", "unknown")
-            if obs_type not in obs_by_type:
-                obs_by_type[obs_type] = []
-            obs_by_type[obs_type].append(obs)
-
-        for obs_type, obs_list in obs_by_type.items():
-            lines.extend(
-                [
-                    f"{obs_type.title()}:",
-                    f"  Count: {len(obs_list)}",
-                    "",
-                ]
-            )
+    def _render_streaming_export(
+        self,
+        format_type: str,
+        session_data: dict,
+        observations: Iterable[dict],
+        include_notes: bool,
+        include_patterns: bool,
+    ) -> str:
+        """Render a streaming export format into a string."""
+        import io
 
-        if include_notes and session_data.get("notes"):
-            lines.extend(
-                [
-                    "-" * 70,
-                    "NOTES",
-                    "-" * 70,
-                    "",
-                ]
-            )
-            for note in session_data["notes"]:
-                lines.append(f"- {note}")
-            lines.append("")
-
-        if include_patterns and session_data.get("patterns"):
-            lines.extend(
-                [
-                    "-" * 70,
-                    "PATTERNS",
-                    "-" * 70,
-                    "",
-                ]
-            )
-            for pattern in session_data["patterns"]:
-                lines.append(f"- {pattern}")
-            lines.append("")
+        from bridge.integration.streaming_export import get_streaming_exporter
 
-        lines.extend(
-            [
-                "=" * 70,
-                "Generated by CodeMarshal - Truth-Preserving Investigation",
-                "=" * 70,
-            ]
+        buffer = io.StringIO()
+        get_streaming_exporter(format_type).write(
+            buffer, session_data, observations, include_notes, include_patterns
         )
+        return buffer.getvalue()
+
+    def _stream_export(
+        self,
+        format_type: str,
+        output_path: Path,
+        session_data: dict,
+        observations: Iterable[dict],
+        include_notes: bool,
+        include_patterns: bool,
+    ) -> ExportStats:
+        """Stream an export format to ``output_path``.
 
-        return "\n".join(lines)
+        The export is written to a temporary file next to ``output_path`` and
+        moved into place only once it is complete; on failure the temporary
+        file is removed and an existing ``output_path`` is left untouched.
+        """
+        from bridge.integration.streaming_export import get_streaming_exporter
+        from storage.atomic import AtomicWriter
+
+        exporter = get_streaming_exporter(format_type)
+        # csv writes its own line endings
+        newline = "" if exporter.format_name == "csv" else None
+        with AtomicWriter(
+            output_path, mode="w", encoding="utf-8", newline=newline
+        ) as handle:
+            return exporter.write(
+                handle, session_data, observations, include_notes, include_patterns
+            )
 
     # Validation helpers
     def _looks_like_project(self, path: Path) -> bool:
@@ -4577,13 +4832,25 @@ Commands: list, scan, add, search, apply, create, share
 
         self._safe_print("=" * 80)
 
-    def _show_export_result(self, result: Any) -> None:
+    def _show_export_result(
+        self, result: Any, stats: ExportStats | None = None
+    ) -> None:
         """Show export result in explicit format."""
         self._safe_print("EXPORT COMPLETE")
         self._safe_print("=" * 80)
         self._safe_print(f"Export ID:      {getattr(result, 'export_id', 'unknown')}")
         self._safe_print(f"Format:         {getattr(result, 'format', 'unknown')}")
         self._safe_print(f"Output:         {getattr(result, 'path', 'unknown')}")
+        if stats is not None:
+            self._safe_print(
+                f"Observations:   {stats.observations} "
+                f"({stats.bytes_written / (1024 * 1024):.1f} MiB "
+                f"in {stats.elapsed_seconds:.2f}s)"
+            )
+            self._safe_print(
+                f"Throughput:     {stats.observations_per_second:.0f} obs/s, "
+                f"{stats.mib_per_second:.1f} MiB/s"
+            )
         if getattr(result, "error_message", None):
             self._safe_print(f"Error:          {result.error_message}")
 
@@ -4631,6 +4898,8 @@ Commands: list, scan, add, search, apply, create, share
         This allows CLI queries to bypass rigid stage progression while
         maintaining constitutional compliance.
         """
+        from lens.navigation.workflow import WorkflowStage
+
         question_to_stage = {
             "structure": WorkflowStage.ORIENTATION,
             "purpose": WorkflowStage.EXAMINATION,
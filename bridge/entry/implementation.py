@@ -13,11 +13,32 @@ from typing import Any
 
 from core.engine import ObservationInterface
 from observations.eyes import EyeRegistry
+from observations.record.anchors import Anchor
 from observations.record.utils import create_snapshot
 
 logger = logging.getLogger(__name__)
 
 
+def _previous_anchors(storage_path: Path, directory_path: Path) -> list[Anchor]:
+    """Anchors of the newest saved snapshot of ``directory_path``, if any."""
+    source_path = str(Path(directory_path).absolute())
+    snapshots = sorted(
+        storage_path.glob("*.json"), key=lambda path: path.stat().st_mtime, reverse=True
+    )
+    for snapshot_file in snapshots:
+        try:
+            data = json.loads(snapshot_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if (data.get("metadata") or {}).get("source_path") != source_path:
+            continue
+        try:
+            return [Anchor.from_dict(anchor) for anchor in data.get("anchors") or []]
+        except (KeyError, TypeError, ValueError):
+            return []
+    return []
+
+
 class StandardObservationInterface(ObservationInterface):
     """
     Standard implementation of the Observation Layer interface.
@@ -44,18 +65,21 @@ class StandardObservationInterface(ObservationInterface):
             # Note: This returns a CompositeObservation
             composite = registry.observe_with_all(directory_path)
 
-            # Create snapshot for persistence
+            # Default path: .codemarshal/witness/snapshots/
+            # In a real implementation, this would come from config
+            storage_path = Path(".codemarshal/witness/snapshots")
+            storage_path.mkdir(parents=True, exist_ok=True)
+
+            # Create snapshot for persistence; files unchanged since the
+            # last snapshot of this directory keep their anchors
             snapshot = create_snapshot(
                 composite=composite,
                 name=f"observation_{datetime.datetime.now().isoformat()}",
                 description="Automated observation via CLI",
+                previous=_previous_anchors(storage_path, directory_path),
             )
 
             # Save snapshot
-            # Default path: .codemarshal/witness/snapshots/
-            # In a real implementation, this would come from config
-            storage_path = Path(".codemarshal/witness/snapshots")
-            storage_path.mkdir(parents=True, exist_ok=True)
             snapshot_file = storage_path / f"{snapshot.metadata.snapshot_id}.json"
 
             # Helper for JSON serialization
@@ -0,0 +1,494 @@
+"""
+server.py — Long-running JSON-RPC server for editor integrations.
+
+ROLE: Answer editor requests from one warm CodeMarshal process.
+PRINCIPLE: Same commands, same output. The server runs the CLI contract
+in-process; it adds no capability the CLI does not have.
+
+Protocol:
+    JSON-RPC 2.0, one JSON message per line, over stdio (default) or a
+    Unix socket (``codemarshal serve --socket PATH``).
+
+    run              {"args": [...]} -> {"stdout", "stderr", "exit_code"}
+    investigate      {"path", "scope", "intent", ...}      -> parsed JSON output
+    query            {"investigation_id", "question", "question_type", ...}
+    search           {"query", "path"?, ...}
+    patterns.list    {...}
+    patterns.scan    {"path"?, ...}
+    shutdown         stop accepting requests (result null)
+    exit             notification, ends the connection
+    $/cancelRequest  notification {"id"}: a queued request never runs; a
+                     running one is answered at once with -32800 and its
+                     late result is dropped, but it keeps running
+
+    Extra keys of the command methods become CLI options
+    (``{"max_files": 10}`` -> ``--max-files=10``, ``true`` -> bare flag,
+    lists repeat the option).
+
+What stays warm:
+    Imports and the argument parser, decoded query observations and loaded
+    dependency graphs (keyed on the session's observation set, so a new
+    investigation invalidates them), and the OS page cache of the search and
+    query indexes.
+
+Limitations:
+    - Requests run one at a time, in arrival order. Cancelling a running
+      request does not stop it: the requests queued behind it still wait
+      for it to finish.
+    - Command output written directly to file descriptor 1 by native code or
+      child processes is sent to stderr in stdio mode, never to the channel.
+    - ``investigate`` still builds a fresh Runtime per call: a Runtime is
+      bound to one investigation root.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TextIO
+
+from bridge.entry.cli import CodeMarshalCLI
+
+logger = logging.getLogger(__name__)
+
+JSONRPC_VERSION = "2.0"
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+COMMAND_FAILED = -32000
+REQUEST_CANCELLED = -32800
+
+WARM_SESSIONS = 8
+"""Query results kept decoded per (session, question type)."""
+
+# method -> (CLI words, positional parameters, required parameters)
+_COMMANDS: dict[str, tuple[list[str], tuple[str, ...], tuple[str, ...]]] = {
+    "investigate": (["investigate"], ("path",), ("path", "scope", "intent")),
+    "query": (
+        ["query"],
+        ("investigation_id",),
+        ("investigation_id", "question", "question_type"),
+    ),
+    "search": (["search"], ("query", "path"), ("query",)),
+    "patterns.list": (["patterns", "list"], (), ()),
+    "patterns.scan": (["patterns", "scan"], ("path",), ()),
+}
+
+
+class RPCError(Exception):
+    """A JSON-RPC error response."""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+    def to_dict(self) -> dict[str, Any]:
+        error: dict[str, Any] = {"code": self.code, "message": self.message}
+        if self.data is not None:
+            error["data"] = self.data
+        return error
+
+
+class WarmCLI(CodeMarshalCLI):
+    """CLI that keeps decoded query inputs between requests."""
+
+    def __init__(self, warm_sessions: int = WARM_SESSIONS):
+        super().__init__()
+        self._warm_sessions = warm_sessions
+        self._warm: OrderedDict[tuple, Any] = OrderedDict()
+        self._warm_lock = threading.Lock()
+
+    def _load_query_observations(self, storage, session_data, question_type):
+        key = ("observations", *self._session_key(storage, session_data, question_type))
+        cached = self._get_warm(key)
+        if cached is None:
+            cached = super()._load_query_observations(storage, session_data, question_type)
+            self._put_warm(key, cached)
+        return cached
+
+    def _analyzer_options(self, storage, session_data, question_type, observations=None):
+        key = ("options", *self._session_key(storage, session_data, question_type))
+        cached = self._get_warm(key)
+        if cached is None:
+            cached = super()._analyzer_options(
+                storage, session_data, question_type, observations
+            )
+            if cached:  # An empty result may be built on the next call
+                self._put_warm(key, cached)
+        return cached
+
+    @staticmethod
+    def _session_key(storage, session_data, question_type) -> tuple:
+        return (
+            str(Path(storage.base_path).resolve()),
+            str(session_data.get("id") or session_data.get("session_id")),
+            question_type,
+            storage.observation_set_key(session_data),
+        )
+
+    def _get_warm(self, key: tuple) -> Any:
+        with self._warm_lock:
+            value = self._warm.get(key)
+            if value is not None:
+                self._warm.move_to_end(key)
+            return value
+
+    def _put_warm(self, key: tuple, value: Any) -> None:
+        with self._warm_lock:
+            self._warm[key] = value
+            # Two entries (observations, options) per session and question type
+            while len(self._warm) > 2 * self._warm_sessions:
+                self._warm.popitem(last=False)
+
+
+class _OutputRouter(io.TextIOBase):
+    """
+    ``sys.stdout``/``sys.stderr`` stand-in while serving.
+
+    Writes from a thread that is capturing go to that thread's buffer; all
+    other writes go to ``fallback`` (the real stderr), so nothing reaches the
+    RPC channel by accident.
+    """
+
+    def __init__(self, fallback: TextIO, local: threading.local, slot: str):
+        self._fallback = fallback
+        self._local = local
+        self._slot = slot
+
+    def _target(self) -> TextIO:
+        return getattr(self._local, self._slot, None) or self._fallback
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+
+_capture = threading.local()
+
+
+@contextmanager
+def _routed_output() -> Iterator[None]:
+    """Install the output routers for the duration of serving."""
+    if isinstance(sys.stdout, _OutputRouter):
+        yield  # Already serving (another socket connection)
+        return
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = _OutputRouter(stderr, _capture, "stdout")
+    sys.stderr = _OutputRouter(stderr, _capture, "stderr")
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+
+@contextmanager
+def _captured() -> Iterator[tuple[io.StringIO, io.StringIO]]:
+    """Capture this thread's stdout and stderr writes."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    _capture.stdout, _capture.stderr = stdout, stderr
+    try:
+        yield stdout, stderr
+    finally:
+        _capture.stdout = _capture.stderr = None
+
+
+def command_args(method: str, params: dict[str, Any]) -> list[str]:
+    """CLI arguments for a command method (``--output=json`` appended)."""
+    words, positional, required = _COMMANDS[method]
+    missing = [name for name in required if params.get(name) in (None, "")]
+    if missing:
+        raise RPCError(INVALID_PARAMS, f"Missing parameters: {', '.join(missing)}")
+
+    options: list[str] = []
+    for name, value in params.items():
+        if name in positional or name == "output" or value is None or value is False:
+            continue
+        flag = "--" + name.replace("_", "-")
+        if value is True:
+            options.append(flag)
+        elif isinstance(value, list):
+            options.extend(f"{flag}={item}" for item in value)
+        elif isinstance(value, (str, int, float)):
+            options.append(f"{flag}={value}")
+        else:
+            raise RPCError(INVALID_PARAMS, f"Unsupported value for {name!r}")
+    arguments = [str(params[name]) for name in positional if params.get(name) is not None]
+    # "--" keeps a positional such as a search pattern from reading as an option
+    return [*words, *options, "--output=json", "--", *arguments]
+
+
+class _Connection:
+    """One client: its writer and its requests still in flight."""
+
+    def __init__(self, writer: TextIO):
+        self.writer = writer
+        self.pending: dict[Any, Future] = {}
+        self.lock = threading.Lock()
+        self.shutting_down = False
+        self._write_lock = threading.Lock()
+
+    def send(self, message: dict[str, Any]) -> None:
+        line = json.dumps(message, ensure_ascii=False, default=str)
+        with self._write_lock:
+            try:
+                self.writer.write(line + "\n")
+                self.writer.flush()
+            except (OSError, ValueError):
+                pass  # Client went away; its requests finish unanswered
+
+
+class CodeMarshalServer:
+    """
+    JSON-RPC dispatcher around one warm CLI instance.
+
+    Usage:
+        server = CodeMarshalServer()
+        server.serve(reader, writer)  # until EOF or "exit"
+    """
+
+    def __init__(self, cli: CodeMarshalCLI | None = None):
+        self.cli = cli or WarmCLI()
+        # One worker: CLI handlers share storage and were written for one caller
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="codemarshal-rpc"
+        )
+        self._methods: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "run": self._run,
+            **{method: self._command(method) for method in _COMMANDS},
+        }
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def serve(self, reader: TextIO, writer: TextIO) -> None:
+        """Serve one connection until EOF or an ``exit`` notification."""
+        connection = _Connection(writer)
+        with _routed_output():
+            try:
+                while True:
+                    line = reader.readline()
+                    if not line:
+                        break
+                    if not line.strip():
+                        continue
+                    try:
+                        message = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        connection.send(
+                            _error(None, RPCError(PARSE_ERROR, f"Parse error: {e}"))
+                        )
+                        continue
+                    if self._dispatch(message, connection) == "exit":
+                        break
+            finally:
+                for request_id in list(connection.pending):
+                    self._cancel(request_id, connection)
+
+    def close(self) -> None:
+        """Stop the worker; queued requests are dropped."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _dispatch(self, message: Any, connection: _Connection) -> str | None:
+        send = connection.send
+        if not isinstance(message, dict):
+            send(_error(None, RPCError(INVALID_REQUEST, "Invalid request")))
+            return None
+        request_id = message.get("id")
+        notification = "id" not in message
+        method = message.get("method")
+        params = message.get("params", {})
+        if message.get("jsonrpc") != JSONRPC_VERSION or not isinstance(method, str):
+            if not notification:
+                send(_error(request_id, RPCError(INVALID_REQUEST, "Invalid request")))
+            return None
+        if params is None:
+            params = {}
+        if not isinstance(params, dict):
+            if not notification:
+                send(_error(request_id, RPCError(INVALID_PARAMS, "params must be an object")))
+            return None
+
+        if method == "exit":
+            return "exit"
+        if method == "$/cancelRequest":
+            self._cancel(params.get("id"), connection)
+            return None
+        if method == "shutdown":
+            connection.shutting_down = True
+            if not notification:
+                send({"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": None})
+            return None
+
+        handler = self._methods.get(method)
+        if handler is None or connection.shutting_down:
+            if not notification:
+                error = (
+                    RPCError(METHOD_NOT_FOUND, f"Method not found: {method}")
+                    if handler is None
+                    else RPCError(INVALID_REQUEST, "Server is shutting down")
+                )
+                send(_error(request_id, error))
+            return None
+
+        with connection.lock:
+            future = self._executor.submit(handler, params)
+            if not notification:
+                connection.pending[request_id] = future
+        if not notification:
+            future.add_done_callback(
+                lambda done: self._complete(request_id, done, connection)
+            )
+        return None
+
+    def _complete(self, request_id: Any, future: Future, connection: _Connection) -> None:
+        send = connection.send
+        with connection.lock:
+            if connection.pending.get(request_id) is not future:
+                return  # Cancelled and already answered
+            del connection.pending[request_id]
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            send({"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": future.result()})
+        elif isinstance(error, RPCError):
+            send(_error(request_id, error))
+        else:
+            logger.error("Request %r failed: %s", request_id, error)
+            send(_error(request_id, RPCError(INTERNAL_ERROR, f"Internal error: {error}")))
+
+    def _cancel(self, request_id: Any, connection: _Connection) -> None:
+        """
+        Answer a pending request with -32800.
+
+        A queued request is removed from the queue. A running one cannot be
+        interrupted; it finishes on the worker and its result is dropped.
+        """
+        with connection.lock:
+            future = connection.pending.pop(request_id, None)
+        if future is None:
+            return  # Finished already, or never existed
+        future.cancel()  # No effect once the request is running
+        connection.send(_error(request_id, RPCError(REQUEST_CANCELLED, "Request cancelled")))
+
+    # ------------------------------------------------------------------
+    # Methods
+    # ------------------------------------------------------------------
+
+    def _run(self, params: dict[str, Any]) -> dict[str, Any]:
+        args = params.get("args")
+        if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+            raise RPCError(INVALID_PARAMS, "args must be a list of strings")
+        if args and args[0] == "serve":
+            raise RPCError(INVALID_PARAMS, "Cannot serve from inside the server")
+        with _captured() as (stdout, stderr):
+            try:
+                exit_code = self.cli.run(args)
+            except SystemExit as e:  # A handler calling sys.exit()
+                exit_code = e.code if isinstance(e.code, int) else 1
+        return {
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "exit_code": exit_code,
+        }
+
+    def _command(self, method: str) -> Callable[[dict[str, Any]], Any]:
+        def handler(params: dict[str, Any]) -> Any:
+            run = self._run({"args": command_args(method, params)})
+            try:
+                payload = json.loads(run["stdout"])
+            except json.JSONDecodeError:
+                payload = None
+            # A non-zero exit with JSON output is a result (``patterns scan``
+            # exits 1 when it finds matches); no JSON at all is a failure
+            if payload is None:
+                message = run["stderr"].strip() or f"{method} failed"
+                raise RPCError(COMMAND_FAILED, message, run)
+            return payload
+
+        return handler
+
+
+def _error(request_id: Any, error: RPCError) -> dict[str, Any]:
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "error": error.to_dict()}
+
+
+def serve_stdio() -> int:
+    """Serve over stdin/stdout."""
+    # Own a private copy of fd 1 for the channel and point fd 1 at stderr:
+    # output of child processes and native code can then never corrupt it
+    sys.stdout.flush()
+    channel = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8", newline="\n")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    reader = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    server = CodeMarshalServer()
+    try:
+        server.serve(reader, channel)
+    finally:
+        server.close()
+        channel.close()
+    return 0
+
+
+def serve_socket(path: Path) -> int:
+    """Serve each connection to a Unix socket at ``path`` until interrupted."""
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix sockets are not available on this platform")
+    path = Path(path)
+    if path.exists():
+        path.unlink()
+    server = CodeMarshalServer()
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(path))
+    listener.listen()
+
+    def handle(connection: socket.socket) -> None:
+        with connection:
+            reader = connection.makefile("r", encoding="utf-8", newline="\n")
+            writer = connection.makefile("w", encoding="utf-8", newline="\n")
+            server.serve(reader, writer)
+
+    try:
+        with _routed_output():
+            while True:
+                connection, _ = listener.accept()
+                threading.Thread(target=handle, args=(connection,), daemon=True).start()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        server.close()
+        path.unlink(missing_ok=True)
+    return 0
@@ -696,29 +696,13 @@ class TruthPreservingTUI:
             # Use the CLI's query functionality
             cli = CodeMarshalCLI()
 
-            # Load session and observations
-            storage = cli._load_session_data(cli, None, self.context.investigation_id)
-            if not storage:
-                # Try to find any session
-                from storage.investigation_storage import InvestigationStorage
-
-                store = InvestigationStorage()
-                sessions_dir = Path("storage/sessions")
-                if sessions_dir.exists():
-                    for session_file in sessions_dir.glob("*.session.json"):
-                        import json
-
-                        with open(session_file) as f:
-                            data = json.load(f)
-                            if data.get("id"):
-                                self.context.investigation_id = data.get("id")
-                                break
-
-            # Get observations
+            # Load session and observations (most recent session as fallback)
             from storage.investigation_storage import InvestigationStorage
 
             store = InvestigationStorage()
             session_data = cli._load_session_data(store, self.context.investigation_id)
+            if session_data and not self.context.investigation_id:
+                self.context.investigation_id = session_data.get("id")
 
             if session_data:
                 observations = cli._load_observations(store, session_data)
@@ -5,13 +5,16 @@ This module defines how truth leaves the system without mutation.
 Every export format must be explicit about what it loses.
 """
 
+import csv
+import io
 import json
 import textwrap
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from inquiry.notebook.entries import NoteEntry
 from observations.record.anchors import Anchor
@@ -75,6 +78,30 @@ class BaseExporter:
         """Export truth in this format. Must include limitations metadata."""
         raise NotImplementedError("Export method must be implemented")
 
+    def write(
+        self,
+        handle: TextIO,
+        snapshot: Snapshot | None = None,
+        anchors: list[Anchor] | None = None,
+        notebook_entries: list[NoteEntry] | None = None,
+        integrity_hashes: list[IntegrityRoot] | None = None,
+    ) -> None:
+        """Write the export to an open text handle, one piece at a time."""
+        for chunk in self._iter_chunks(
+            snapshot, anchors, notebook_entries, integrity_hashes
+        ):
+            handle.write(chunk)
+
+    def _iter_chunks(
+        self,
+        snapshot: Snapshot | None,
+        anchors: list[Anchor] | None,
+        notebook_entries: list[NoteEntry] | None,
+        integrity_hashes: list[IntegrityRoot] | None,
+    ) -> Iterator[str]:
+        """Pieces of the export, in order. Defaults to the whole export."""
+        yield self.export(snapshot, anchors, notebook_entries, integrity_hashes)
+
     def prepare_export(self) -> str:
         """Prepare export and return export ID."""
         # In real implementation, this would set up the export pipeline
@@ -134,7 +161,17 @@ class JSONExporter(BaseExporter):
         integrity_hashes: list[IntegrityRoot] | None = None,
     ) -> str:
         """Export as JSON with explicit structure preservation."""
+        return "".join(
+            self._iter_chunks(snapshot, anchors, notebook_entries, integrity_hashes)
+        )
 
+    def _iter_chunks(
+        self,
+        snapshot: Snapshot | None,
+        anchors: list[Anchor] | None,
+        notebook_entries: list[NoteEntry] | None,
+        integrity_hashes: list[IntegrityRoot] | None,
+    ) -> Iterator[str]:
         metadata = self._create_metadata(
             snapshot_version=snapshot.version if snapshot else None,
             export_scope="full" if snapshot else "partial",
@@ -170,9 +207,10 @@ class JSONExporter(BaseExporter):
             ]
 
         # Export with readable formatting and sorted keys for determinism
-        return json.dumps(
-            export_data, indent=2, sort_keys=True, default=self._json_serializer
+        encoder = json.JSONEncoder(
+            indent=2, sort_keys=True, default=self._json_serializer
         )
+        yield from encoder.iterencode(export_data)
 
     def _serialize_snapshot(self, snapshot: Snapshot) -> dict[str, Any]:
         """Convert snapshot to JSON-serializable format."""
@@ -261,120 +299,136 @@ class MarkdownExporter(BaseExporter):
         integrity_hashes: list[IntegrityRoot] | None = None,
     ) -> str:
         """Export as Markdown with clear section organization."""
+        return "".join(
+            self._iter_chunks(snapshot, anchors, notebook_entries, integrity_hashes)
+        )
 
-        lines: list[str] = []
+    def _iter_chunks(
+        self,
+        snapshot: Snapshot | None,
+        anchors: list[Anchor] | None,
+        notebook_entries: list[NoteEntry] | None,
+        integrity_hashes: list[IntegrityRoot] | None,
+    ) -> Iterator[str]:
+        return _joined_lines(
+            self._iter_lines(snapshot, anchors, notebook_entries, integrity_hashes)
+        )
+
+    def _iter_lines(
+        self,
+        snapshot: Snapshot | None,
+        anchors: list[Anchor] | None,
+        notebook_entries: list[NoteEntry] | None,
+        integrity_hashes: list[IntegrityRoot] | None,
+    ) -> Iterator[str]:
 
         # Header
-        lines.append("# CodeMarshal Investigation Export")
-        lines.append(f"*Format: {self.format_type.value}*")
-        lines.append(
-            f"*Exported: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')}*"
-        )
-        lines.append("")
+        yield ("# CodeMarshal Investigation Export")
+        yield (f"*Format: {self.format_type.value}*")
+        yield (f"*Exported: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')}*")
+        yield ("")
 
         # Limitations Warning
-        lines.append("## ⚠️ Export Limitations")
-        lines.append("")
-        lines.append("**This is a flattened representation of truth.**")
-        lines.append("")
-        lines.append("### Context Loss")
+        yield ("## ⚠️ Export Limitations")
+        yield ("")
+        yield ("**This is a flattened representation of truth.**")
+        yield ("")
+        yield ("### Context Loss")
         for loss in self.limitations.context_loss:
-            lines.append(f"- {loss}")
-        lines.append("")
-        lines.append("### Structure Loss")
+            yield (f"- {loss}")
+        yield ("")
+        yield ("### Structure Loss")
         for loss in self.limitations.structure_loss:
-            lines.append(f"- {loss}")
-        lines.append("")
-        lines.append("### Cannot Express")
+            yield (f"- {loss}")
+        yield ("")
+        yield ("### Cannot Express")
         for cannot_express in self.limitations.cannot_express:
-            lines.append(f"- {cannot_express}")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+            yield (f"- {cannot_express}")
+        yield ("")
+        yield ("---")
+        yield ("")
 
         # Snapshot Information
         if snapshot:
-            lines.append("## 📸 Snapshot")
-            lines.append("")
-            lines.append(f"- **ID**: `{snapshot.id}`")
-            lines.append(f"- **Version**: `{snapshot.version}`")
+            yield ("## 📸 Snapshot")
+            yield ("")
+            yield (f"- **ID**: `{snapshot.id}`")
+            yield (f"- **Version**: `{snapshot.version}`")
             if hasattr(snapshot, "created_at"):
-                lines.append(
+                yield (
                     f"- **Created**: {snapshot.created_at.strftime('%Y-%m-%d %H:%M:%S')}"
                 )
             if hasattr(snapshot, "path"):
-                lines.append(f"- **Path**: `{snapshot.path}`")
+                yield (f"- **Path**: `{snapshot.path}`")
             if hasattr(snapshot, "observation_count"):
-                lines.append(f"- **Observations**: {snapshot.observation_count}")
-            lines.append("")
+                yield (f"- **Observations**: {snapshot.observation_count}")
+            yield ("")
 
         # Anchors
         if anchors:
-            lines.append("## 🔗 Anchors")
-            lines.append("")
+            yield ("## 🔗 Anchors")
+            yield ("")
             for i, anchor in enumerate(anchors, 1):
-                lines.append(f"### Anchor {i}: {anchor.type}")
-                lines.append(f"- **Location**: `{anchor.location}`")
-                lines.append(f"- **Identifier**: `{anchor.identifier}`")
+                yield (f"### Anchor {i}: {anchor.type}")
+                yield (f"- **Location**: `{anchor.location}`")
+                yield (f"- **Identifier**: `{anchor.identifier}`")
                 if hasattr(anchor, "context") and anchor.context:
-                    lines.append(f"- **Context**: {anchor.context}")
-                lines.append("")
+                    yield (f"- **Context**: {anchor.context}")
+                yield ("")
 
         # Notebook Entries
         if notebook_entries:
-            lines.append("## 📓 Investigation Notes")
-            lines.append("")
-            lines.append("*Notes are anchored to observations and preserve thinking.*")
-            lines.append("")
+            yield ("## 📓 Investigation Notes")
+            yield ("")
+            yield ("*Notes are anchored to observations and preserve thinking.*")
+            yield ("")
 
             for entry in notebook_entries:
-                lines.append(
+                yield (
                     f"### Note: {getattr(entry, 'created_at', None).strftime('%Y-%m-%d %H:%M') if getattr(entry, 'created_at', None) else 'Unknown'}"
                 )
-                lines.append(f"**Anchor**: `{getattr(entry, 'anchor_id', None)}`")
-                lines.append("")
+                yield (f"**Anchor**: `{getattr(entry, 'anchor_id', None)}`")
+                yield ("")
                 # Preserve newlines in content
                 for line in getattr(entry, "content", "").split("\n"):
                     if line.strip():
-                        lines.append(f"{line}")
+                        yield (f"{line}")
                     else:
-                        lines.append("")
-                lines.append("")
+                        yield ("")
+                yield ("")
                 if getattr(entry, "tags", None):
-                    lines.append(
+                    yield (
                         f"**Tags**: {', '.join(f'`{tag}`' for tag in getattr(entry, 'tags', []))}"
                     )
-                    lines.append("")
-                lines.append("---")
-                lines.append("")
+                    yield ("")
+                yield ("---")
+                yield ("")
 
         # Integrity Information
         if integrity_hashes:
-            lines.append("## 🔒 Integrity Verification")
-            lines.append("")
-            lines.append("Use these hashes to verify export integrity:")
-            lines.append("")
+            yield ("## 🔒 Integrity Verification")
+            yield ("")
+            yield ("Use these hashes to verify export integrity:")
+            yield ("")
             for hash_obj in integrity_hashes:
-                lines.append("### Snapshot Integrity Root")
-                lines.append(
+                yield ("### Snapshot Integrity Root")
+                yield (
                     f"- **Algorithm**: {hash_obj.algorithm.value if hasattr(hash_obj.algorithm, 'value') else hash_obj.algorithm}"
                 )
-                lines.append(f"- **Root Hash**: `{hash_obj.root_hash}`")
-                lines.append(f"- **Metadata Hash**: `{hash_obj.metadata_hash}`")
-                lines.append(f"- **Payload Hash**: `{hash_obj.payload_hash}`")
+                yield (f"- **Root Hash**: `{hash_obj.root_hash}`")
+                yield (f"- **Metadata Hash**: `{hash_obj.metadata_hash}`")
+                yield (f"- **Payload Hash**: `{hash_obj.payload_hash}`")
                 if getattr(hash_obj, "anchors_hash", None):
-                    lines.append(f"- **Anchors Hash**: `{hash_obj.anchors_hash}`")
-                lines.append("")
+                    yield (f"- **Anchors Hash**: `{hash_obj.anchors_hash}`")
+                yield ("")
 
         # Footer
-        lines.append("---")
-        lines.append("")
-        lines.append(
+        yield ("---")
+        yield ("")
+        yield (
             "*Export generated by CodeMarshal Truth-Preserving Investigation System*"
         )
-        lines.append("*Constitutional Article 19: Backward Truth Compatibility*")
-
-        return "\n".join(lines)
+        yield ("*Constitutional Article 19: Backward Truth Compatibility*")
 
 
 class PlainTextExporter(BaseExporter):
@@ -411,110 +465,126 @@ class PlainTextExporter(BaseExporter):
         integrity_hashes: list[IntegrityRoot] | None = None,
     ) -> str:
         """Export as plain text with minimal formatting."""
+        return "".join(
+            self._iter_chunks(snapshot, anchors, notebook_entries, integrity_hashes)
+        )
+
+    def _iter_chunks(
+        self,
+        snapshot: Snapshot | None,
+        anchors: list[Anchor] | None,
+        notebook_entries: list[NoteEntry] | None,
+        integrity_hashes: list[IntegrityRoot] | None,
+    ) -> Iterator[str]:
+        return _joined_lines(
+            self._iter_lines(snapshot, anchors, notebook_entries, integrity_hashes)
+        )
 
-        lines: list[str] = []
+    def _iter_lines(
+        self,
+        snapshot: Snapshot | None,
+        anchors: list[Anchor] | None,
+        notebook_entries: list[NoteEntry] | None,
+        integrity_hashes: list[IntegrityRoot] | None,
+    ) -> Iterator[str]:
 
         # Header with explicit limitation warning
-        lines.append("=" * 70)
-        lines.append("CODEMARSHAL INVESTIGATION EXPORT - PLAIN TEXT FORMAT")
-        lines.append("=" * 70)
-        lines.append("")
-        lines.append("WARNING: This export format has significant limitations.")
-        lines.append("All formatting, structure, and metadata are flattened to text.")
-        lines.append("Use only for human reading, not programmatic analysis.")
-        lines.append("")
-        lines.append(f"Exported: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        lines.append("Format: Plain Text (maximum compatibility, minimum structure)")
-        lines.append("")
-        lines.append("-" * 70)
-        lines.append("")
+        yield ("=" * 70)
+        yield ("CODEMARSHAL INVESTIGATION EXPORT - PLAIN TEXT FORMAT")
+        yield ("=" * 70)
+        yield ("")
+        yield ("WARNING: This export format has significant limitations.")
+        yield ("All formatting, structure, and metadata are flattened to text.")
+        yield ("Use only for human reading, not programmatic analysis.")
+        yield ("")
+        yield (f"Exported: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')}")
+        yield ("Format: Plain Text (maximum compatibility, minimum structure)")
+        yield ("")
+        yield ("-" * 70)
+        yield ("")
 
         # Snapshot Information
         if snapshot:
-            lines.append("SNAPSHOT")
-            lines.append("")
-            lines.append(f"  ID: {snapshot.id}")
-            lines.append(f"  Version: {snapshot.version}")
+            yield ("SNAPSHOT")
+            yield ("")
+            yield (f"  ID: {snapshot.id}")
+            yield (f"  Version: {snapshot.version}")
             if hasattr(snapshot, "created_at"):
-                lines.append(
+                yield (
                     f"  Created: {snapshot.created_at.strftime('%Y-%m-%d %H:%M:%S')}"
                 )
             if hasattr(snapshot, "path"):
-                lines.append(f"  Path: {snapshot.path}")
+                yield (f"  Path: {snapshot.path}")
             if hasattr(snapshot, "observation_count"):
-                lines.append(f"  Observations: {snapshot.observation_count}")
-            lines.append("")
-            lines.append("-" * 50)
-            lines.append("")
+                yield (f"  Observations: {snapshot.observation_count}")
+            yield ("")
+            yield ("-" * 50)
+            yield ("")
 
         # Anchors
         if anchors:
-            lines.append("ANCHORS (Stable Reference Points)")
-            lines.append("")
+            yield ("ANCHORS (Stable Reference Points)")
+            yield ("")
             for anchor in anchors:
-                lines.append(f"  Type: {anchor.type}")
-                lines.append(f"  Location: {anchor.location}")
-                lines.append(f"  Identifier: {anchor.identifier}")
+                yield (f"  Type: {anchor.type}")
+                yield (f"  Location: {anchor.location}")
+                yield (f"  Identifier: {anchor.identifier}")
                 if hasattr(anchor, "context") and anchor.context:
-                    lines.append(f"  Context: {anchor.context}")
-                lines.append("")
-            lines.append("-" * 50)
-            lines.append("")
+                    yield (f"  Context: {anchor.context}")
+                yield ("")
+            yield ("-" * 50)
+            yield ("")
 
         # Notebook Entries
         if notebook_entries:
-            lines.append("INVESTIGATION NOTES")
-            lines.append("")
-            lines.append("  Notes preserve human thinking anchored to observations.")
-            lines.append("")
+            yield ("INVESTIGATION NOTES")
+            yield ("")
+            yield ("  Notes preserve human thinking anchored to observations.")
+            yield ("")
 
             for entry in notebook_entries:
-                lines.append(
-                    f"  Note from {entry.created_at.strftime('%Y-%m-%d %H:%M')}"
-                )
-                lines.append(f"  Anchor: {entry.anchor_id}")
-                lines.append("")
+                yield (f"  Note from {entry.created_at.strftime('%Y-%m-%d %H:%M')}")
+                yield (f"  Anchor: {entry.anchor_id}")
+                yield ("")
                 # Indent and wrap content
                 wrapped = textwrap.fill(
                     entry.content, width=65, initial_indent="  ", subsequent_indent="  "
                 )
-                lines.append(wrapped)
-                lines.append("")
+                yield (wrapped)
+                yield ("")
                 if hasattr(entry, "tags") and entry.tags:
-                    lines.append(f"  Tags: {', '.join(entry.tags)}")
-                    lines.append("")
-                lines.append("  ---")
-                lines.append("")
+                    yield (f"  Tags: {', '.join(entry.tags)}")
+                    yield ("")
+                yield ("  ---")
+                yield ("")
 
-            lines.append("-" * 50)
-            lines.append("")
+            yield ("-" * 50)
+            yield ("")
 
         # Integrity Information
         if integrity_hashes:
-            lines.append("INTEGRITY VERIFICATION")
-            lines.append("")
-            lines.append("  Use these values to verify export integrity:")
-            lines.append("")
+            yield ("INTEGRITY VERIFICATION")
+            yield ("")
+            yield ("  Use these values to verify export integrity:")
+            yield ("")
             for hash_obj in integrity_hashes:
-                lines.append("  Snapshot Integrity Root")
-                lines.append(
+                yield ("  Snapshot Integrity Root")
+                yield (
                     f"  Algorithm: {hash_obj.algorithm.value if hasattr(hash_obj.algorithm, 'value') else hash_obj.algorithm}"
                 )
-                lines.append(f"  Root Hash: {hash_obj.root_hash}")
-                lines.append(f"  Metadata Hash: {hash_obj.metadata_hash}")
-                lines.append(f"  Payload Hash: {hash_obj.payload_hash}")
+                yield (f"  Root Hash: {hash_obj.root_hash}")
+                yield (f"  Metadata Hash: {hash_obj.metadata_hash}")
+                yield (f"  Payload Hash: {hash_obj.payload_hash}")
                 if getattr(hash_obj, "anchors_hash", None):
-                    lines.append(f"  Anchors Hash: {hash_obj.anchors_hash}")
-                lines.append("")
+                    yield (f"  Anchors Hash: {hash_obj.anchors_hash}")
+                yield ("")
 
         # Footer
-        lines.append("=" * 70)
-        lines.append("End of CodeMarshal Export")
-        lines.append("Truth preserved, context flattened.")
-        lines.append("Constitutional Article 19: Backward Truth Compatibility")
-        lines.append("=" * 70)
-
-        return "\n".join(lines)
+        yield ("=" * 70)
+        yield ("End of CodeMarshal Export")
+        yield ("Truth preserved, context flattened.")
+        yield ("Constitutional Article 19: Backward Truth Compatibility")
+        yield ("=" * 70)
 
 
 class HTMLExporter(BaseExporter):
@@ -549,186 +619,190 @@ class HTMLExporter(BaseExporter):
         integrity_hashes: list[IntegrityRoot] | None = None,
     ) -> str:
         """Export as HTML with interactive navigation."""
+        return "".join(
+            self._iter_chunks(snapshot, anchors, notebook_entries, integrity_hashes)
+        )
 
-        html_parts = []
+    def _iter_chunks(
+        self,
+        snapshot: Snapshot | None,
+        anchors: list[Anchor] | None,
+        notebook_entries: list[NoteEntry] | None,
+        integrity_hashes: list[IntegrityRoot] | None,
+    ) -> Iterator[str]:
+        return _joined_lines(
+            self._iter_lines(snapshot, anchors, notebook_entries, integrity_hashes)
+        )
+
+    def _iter_lines(
+        self,
+        snapshot: Snapshot | None,
+        anchors: list[Anchor] | None,
+        notebook_entries: list[NoteEntry] | None,
+        integrity_hashes: list[IntegrityRoot] | None,
+    ) -> Iterator[str]:
 
         # HTML Header
-        html_parts.append("<!DOCTYPE html>")
-        html_parts.append("<html lang='en'>")
-        html_parts.append("<head>")
-        html_parts.append("  <meta charset='UTF-8'>")
-        html_parts.append(
+        yield ("<!DOCTYPE html>")
+        yield ("<html lang='en'>")
+        yield ("<head>")
+        yield ("  <meta charset='UTF-8'>")
+        yield (
             "  <meta name='viewport' content='width=device-width, initial-scale=1.0'>"
         )
-        html_parts.append("  <title>CodeMarshal Investigation Report</title>")
-        html_parts.append("  <style>")
-        html_parts.append(
+        yield ("  <title>CodeMarshal Investigation Report</title>")
+        yield ("  <style>")
+        yield (
             "    body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; max-width: 1200px; margin: 0 auto; padding: 20px; background: #f5f5f5; }"
         )
-        html_parts.append(
+        yield (
             "    .container { background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }"
         )
-        html_parts.append(
+        yield (
             "    h1 { color: #333; border-bottom: 3px solid #007acc; padding-bottom: 10px; }"
         )
-        html_parts.append("    h2 { color: #555; margin-top: 30px; }")
-        html_parts.append("    h3 { color: #666; }")
-        html_parts.append(
+        yield ("    h2 { color: #555; margin-top: 30px; }")
+        yield ("    h3 { color: #666; }")
+        yield (
             "    .metadata { background: #f8f9fa; padding: 15px; border-left: 4px solid #007acc; margin: 20px 0; }"
         )
-        html_parts.append(
+        yield (
             "    .anchor { background: #fff3cd; padding: 10px; margin: 10px 0; border-radius: 4px; border-left: 4px solid #ffc107; }"
         )
-        html_parts.append(
+        yield (
             "    .note { background: #d1ecf1; padding: 10px; margin: 10px 0; border-radius: 4px; border-left: 4px solid #17a2b8; }"
         )
-        html_parts.append(
+        yield (
             "    .hash { background: #f8f9fa; padding: 10px; margin: 10px 0; border-radius: 4px; font-family: monospace; font-size: 0.9em; }"
         )
-        html_parts.append(
+        yield (
             "    .limitations { background: #fff3cd; padding: 15px; margin: 20px 0; border-radius: 4px; border: 1px solid #ffc107; }"
         )
-        html_parts.append(
+        yield (
             "    code { background: #f4f4f4; padding: 2px 6px; border-radius: 3px; font-family: 'Courier New', monospace; }"
         )
-        html_parts.append(
+        yield (
             "    pre { background: #f8f9fa; padding: 15px; border-radius: 4px; overflow-x: auto; }"
         )
-        html_parts.append(
-            "    table { width: 100%; border-collapse: collapse; margin: 20px 0; }"
-        )
-        html_parts.append(
+        yield ("    table { width: 100%; border-collapse: collapse; margin: 20px 0; }")
+        yield (
             "    th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }"
         )
-        html_parts.append("    th { background: #f8f9fa; font-weight: 600; }")
-        html_parts.append(
+        yield ("    th { background: #f8f9fa; font-weight: 600; }")
+        yield (
             "    .footer { margin-top: 40px; padding-top: 20px; border-top: 1px solid #ddd; color: #666; font-size: 0.9em; }"
         )
-        html_parts.append("  </style>")
-        html_parts.append("</head>")
-        html_parts.append("<body>")
-        html_parts.append("<div class='container'>")
+        yield ("  </style>")
+        yield ("</head>")
+        yield ("<body>")
+        yield ("<div class='container'>")
 
         # Header
-        html_parts.append("<h1>🔍 CodeMarshal Investigation Report</h1>")
+        yield ("<h1>🔍 CodeMarshal Investigation Report</h1>")
 
         # Metadata
         metadata = self._create_metadata(
             snapshot_version=getattr(snapshot, "version", None) if snapshot else None,
             export_scope="html",
         )
-        html_parts.append("<div class='metadata'>")
-        html_parts.append(
-            f"  <p><strong>Exported:</strong> {metadata['exported_at']}</p>"
-        )
-        html_parts.append("  <p><strong>Format:</strong> HTML</p>")
-        html_parts.append(
-            f"  <p><strong>Version:</strong> {metadata['codemarshal_version']}</p>"
-        )
-        html_parts.append("</div>")
+        yield ("<div class='metadata'>")
+        yield (f"  <p><strong>Exported:</strong> {metadata['exported_at']}</p>")
+        yield ("  <p><strong>Format:</strong> HTML</p>")
+        yield (f"  <p><strong>Version:</strong> {metadata['codemarshal_version']}</p>")
+        yield ("</div>")
 
         # Limitations Warning
-        html_parts.append("<div class='limitations'>")
-        html_parts.append("  <h3>⚠️ Export Limitations</h3>")
-        html_parts.append(
+        yield ("<div class='limitations'>")
+        yield ("  <h3>⚠️ Export Limitations</h3>")
+        yield (
             "  <p><strong>Context Loss:</strong> "
             + "; ".join(self.limitations.context_loss)
             + "</p>"
         )
-        html_parts.append(
+        yield (
             "  <p><strong>Structure Loss:</strong> "
             + "; ".join(self.limitations.structure_loss)
             + "</p>"
         )
-        html_parts.append("</div>")
+        yield ("</div>")
 
         # Snapshot Section
         if snapshot:
-            html_parts.append("<h2>📊 Snapshot</h2>")
-            html_parts.append("<table>")
-            html_parts.append("<tr><th>Property</th><th>Value</th></tr>")
+            yield ("<h2>📊 Snapshot</h2>")
+            yield ("<table>")
+            yield ("<tr><th>Property</th><th>Value</th></tr>")
             if hasattr(snapshot, "id"):
-                html_parts.append(
-                    f"<tr><td>ID</td><td><code>{snapshot.id}</code></td></tr>"
-                )
+                yield (f"<tr><td>ID</td><td><code>{snapshot.id}</code></td></tr>")
             if hasattr(snapshot, "version"):
-                html_parts.append(
-                    f"<tr><td>Version</td><td>{snapshot.version}</td></tr>"
-                )
+                yield (f"<tr><td>Version</td><td>{snapshot.version}</td></tr>")
             if hasattr(snapshot, "path"):
-                html_parts.append(f"<tr><td>Path</td><td>{snapshot.path}</td></tr>")
+                yield (f"<tr><td>Path</td><td>{snapshot.path}</td></tr>")
             if hasattr(snapshot, "observation_count"):
-                html_parts.append(
+                yield (
                     f"<tr><td>Observations</td><td>{snapshot.observation_count}</td></tr>"
                 )
-            html_parts.append("</table>")
+            yield ("</table>")
 
         # Anchors Section
         if anchors:
-            html_parts.append("<h2>⚓ Anchors</h2>")
+            yield ("<h2>⚓ Anchors</h2>")
             for i, anchor in enumerate(anchors, 1):
-                html_parts.append("<div class='anchor'>")
-                html_parts.append(f"  <h3>Anchor {i}</h3>")
+                yield ("<div class='anchor'>")
+                yield (f"  <h3>Anchor {i}</h3>")
                 if hasattr(anchor, "type"):
-                    html_parts.append(f"  <p><strong>Type:</strong> {anchor.type}</p>")
+                    yield (f"  <p><strong>Type:</strong> {anchor.type}</p>")
                 if hasattr(anchor, "location"):
-                    html_parts.append(
+                    yield (
                         f"  <p><strong>Location:</strong> <code>{anchor.location}</code></p>"
                     )
                 if hasattr(anchor, "context"):
-                    html_parts.append(
-                        f"  <p><strong>Context:</strong> {anchor.context}</p>"
-                    )
-                html_parts.append("</div>")
+                    yield (f"  <p><strong>Context:</strong> {anchor.context}</p>")
+                yield ("</div>")
 
         # Notebook Entries Section
         if notebook_entries:
-            html_parts.append("<h2>📝 Notebook Entries</h2>")
+            yield ("<h2>📝 Notebook Entries</h2>")
             for i, entry in enumerate(notebook_entries, 1):
-                html_parts.append("<div class='note'>")
-                html_parts.append(f"  <h3>Entry {i}</h3>")
+                yield ("<div class='note'>")
+                yield (f"  <h3>Entry {i}</h3>")
                 if hasattr(entry, "content"):
-                    html_parts.append(f"  <p>{entry.content}</p>")
+                    yield (f"  <p>{entry.content}</p>")
                 if hasattr(entry, "timestamp"):
-                    html_parts.append(
-                        f"  <p><small>Timestamp: {entry.timestamp}</small></p>"
-                    )
-                html_parts.append("</div>")
+                    yield (f"  <p><small>Timestamp: {entry.timestamp}</small></p>")
+                yield ("</div>")
 
         # Integrity Section
         if integrity_hashes:
-            html_parts.append("<h2>🔒 Integrity Verification</h2>")
+            yield ("<h2>🔒 Integrity Verification</h2>")
             for hash_obj in integrity_hashes:
-                html_parts.append("<div class='hash'>")
-                html_parts.append(
+                yield ("<div class='hash'>")
+                yield (
                     f"  <p><strong>Algorithm:</strong> {hash_obj.algorithm.value if hasattr(hash_obj.algorithm, 'value') else hash_obj.algorithm}</p>"
                 )
-                html_parts.append(
+                yield (
                     f"  <p><strong>Root Hash:</strong> <code>{hash_obj.root_hash}</code></p>"
                 )
-                html_parts.append(
+                yield (
                     f"  <p><strong>Metadata Hash:</strong> <code>{hash_obj.metadata_hash}</code></p>"
                 )
-                html_parts.append(
+                yield (
                     f"  <p><strong>Payload Hash:</strong> <code>{hash_obj.payload_hash}</code></p>"
                 )
-                html_parts.append("</div>")
+                yield ("</div>")
 
         # Footer
-        html_parts.append("<div class='footer'>")
-        html_parts.append(
+        yield ("<div class='footer'>")
+        yield (
             "  <p>Generated by CodeMarshal Truth-Preserving Investigation System</p>"
         )
-        html_parts.append(
+        yield (
             "  <p><em>Constitutional Article 19: Backward Truth Compatibility</em></p>"
         )
-        html_parts.append("</div>")
-
-        html_parts.append("</div>")
-        html_parts.append("</body>")
-        html_parts.append("</html>")
+        yield ("</div>")
 
-        return "\n".join(html_parts)
+        yield ("</div>")
+        yield ("</body>")
+        yield ("</html>")
 
 
 class CSVExporter(BaseExporter):
@@ -765,12 +839,33 @@ class CSVExporter(BaseExporter):
         integrity_hashes: list[IntegrityRoot] | None = None,
     ) -> str:
         """Export as CSV format."""
-        import csv
-        import io
-
         output = io.StringIO()
-        writer = csv.writer(output)
+        self._write_rows(
+            csv.writer(output), snapshot, anchors, notebook_entries, integrity_hashes
+        )
+        return output.getvalue()
+
+    def write(
+        self,
+        handle: TextIO,
+        snapshot: Snapshot | None = None,
+        anchors: list[Anchor] | None = None,
+        notebook_entries: list[NoteEntry] | None = None,
+        integrity_hashes: list[IntegrityRoot] | None = None,
+    ) -> None:
+        """Write CSV rows straight to an open text handle."""
+        self._write_rows(
+            csv.writer(handle), snapshot, anchors, notebook_entries, integrity_hashes
+        )
 
+    def _write_rows(
+        self,
+        writer: Any,
+        snapshot: Snapshot | None,
+        anchors: list[Anchor] | None,
+        notebook_entries: list[NoteEntry] | None,
+        integrity_hashes: list[IntegrityRoot] | None,
+    ) -> None:
         # Header with metadata
         writer.writerow(["CodeMarshal Investigation Export"])
         writer.writerow(["Format", "CSV"])
@@ -833,7 +928,15 @@ class CSVExporter(BaseExporter):
                     ]
                 )
 
-        return output.getvalue()
+
+def _joined_lines(lines: Iterable[str]) -> Iterator[str]:
+    """``"\n".join(lines)``, as a stream of pieces."""
+    first = True
+    for line in lines:
+        if not first:
+            yield "\n"
+        yield line
+        first = False
 
 
 # Registry of available exporters
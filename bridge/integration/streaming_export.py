@@ -0,0 +1,453 @@
+"""
+Streaming exporters for investigation data.
+
+Each exporter takes an observation iterator and writes to an open text
+handle while it reads, so peak memory depends on the largest single
+observation, not on how many there are. Summary formats (Markdown, HTML,
+plain text) only keep per-type counts. Every export returns the counts,
+bytes and time it took.
+
+Formats:
+    json       The CLI's JSON document, with the observations array streamed
+    jsonl      One compact JSON observation per line
+    csv        type, file, line, module rows; imports get one row per statement
+    markdown   Investigation report with per-type counts
+    html       The same report as HTML
+    plain      The same report as plain text
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, TextIO
+
+# One encoder per layout; json.dumps builds a new one per call
+_INDENTED_JSON = json.JSONEncoder(indent=2, default=str).encode
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+
+@dataclass
+class ExportStats:
+    """What one streaming export wrote, and how fast."""
+
+    format: str
+    observations: int = 0
+    bytes_written: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def observations_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.observations / self.elapsed_seconds
+
+    @property
+    def mib_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bytes_written / (1024 * 1024) / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format": self.format,
+            "observations": self.observations,
+            "bytes_written": self.bytes_written,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "observations_per_second": round(self.observations_per_second, 1),
+            "mib_per_second": round(self.mib_per_second, 2),
+        }
+
+
+class _CountingWriter:
+    """Text handle wrapper that counts the UTF-8 bytes written through it."""
+
+    def __init__(self, handle: TextIO, stats: ExportStats):
+        self._handle = handle
+        self._stats = stats
+
+    def write(self, text: str) -> int:
+        # isascii() is O(1); only non-ASCII text pays for an encode
+        self._stats.bytes_written += (
+            len(text) if text.isascii() else len(text.encode("utf-8"))
+        )
+        return self._handle.write(text)
+
+
+class StreamingExporter:
+    """Base class: counts observations and bytes around ``_write``."""
+
+    format_name = ""
+
+    def write(
+        self,
+        handle: TextIO,
+        session_data: dict[str, Any],
+        observations: Iterable[dict[str, Any]],
+        include_notes: bool = False,
+        include_patterns: bool = False,
+    ) -> ExportStats:
+        """Write the export to ``handle``, reading ``observations`` once."""
+        stats = ExportStats(format=self.format_name)
+        started = time.perf_counter()
+        self._write(
+            _CountingWriter(handle, stats),
+            session_data,
+            self._counted(observations, stats),
+            include_notes,
+            include_patterns,
+        )
+        stats.elapsed_seconds = time.perf_counter() - started
+        return stats
+
+    def _write(
+        self,
+        out: _CountingWriter,
+        session_data: dict[str, Any],
+        observations: Iterator[dict[str, Any]],
+        include_notes: bool,
+        include_patterns: bool,
+    ) -> None:
+        raise NotImplementedError("Streaming exporters must implement _write")
+
+    @staticmethod
+    def _counted(
+        observations: Iterable[dict[str, Any]], stats: ExportStats
+    ) -> Iterator[dict[str, Any]]:
+        for observation in observations:
+            stats.observations += 1
+            yield observation
+
+
+class JSONStreamingExporter(StreamingExporter):
+    """
+    The JSON document ``json.dumps(export, indent=2)`` would produce.
+
+    The document is written in pieces: metadata and investigation first,
+    then each observation, then notes and patterns.
+    """
+
+    format_name = "json"
+
+    def _write(self, out, session_data, observations, include_notes, include_patterns):
+        head = _INDENTED_JSON(
+            {
+                "export_metadata": {
+                    "version": "1.0",
+                    "exported_at": datetime.now().isoformat(),
+                    "format": "json",
+                    "tool": "CodeMarshal",
+                },
+                "investigation": session_data,
+            }
+        )
+        # Reopen the object after "investigation"
+        out.write(head[:-2])
+        out.write(',\n  "observations": [')
+
+        first = True
+        for observation in observations:
+            out.write("\n    " if first else ",\n    ")
+            out.write(_INDENTED_JSON(observation).replace("\n", "\n    "))
+            first = False
+        out.write("]" if first else "\n  ]")
+
+        tail: list[tuple[str, Any]] = []
+        if include_notes:
+            tail.append(("notes", session_data.get("notes", [])))
+        if include_patterns:
+            tail.append(("patterns", session_data.get("patterns", [])))
+        for key, value in tail:
+            out.write(f',\n  "{key}": ')
+            out.write(_INDENTED_JSON(value).replace("\n", "\n  "))
+        out.write("\n}")
+
+
+class JSONLinesStreamingExporter(StreamingExporter):
+    """One observation per line, compact JSON."""
+
+    format_name = "jsonl"
+
+    def _write(self, out, session_data, observations, include_notes, include_patterns):
+        for observation in observations:
+            out.write(_COMPACT_JSON(observation))
+            out.write("\n")
+
+
+class CSVStreamingExporter(StreamingExporter):
+    """Observation rows; an import observation gets one row per statement."""
+
+    format_name = "csv"
+
+    def _write(self, out, session_data, observations, include_notes, include_patterns):
+        writer = csv.writer(out)
+        writer.writerow(["type", "file", "line", "module"])
+        for obs in observations:
+            obs_type = obs.get("type", "unknown")
+            if obs_type == "import_sight":
+                for stmt in obs.get("statements", []):
+                    writer.writerow(
+                        [
+                            "import",
+                            obs.get("file", ""),
+                            stmt.get("line_number", ""),
+                            stmt.get("module", ""),
+                        ]
+                    )
+            else:
+                writer.writerow([obs_type, obs.get("file", ""), "", ""])
+
+
+def _count_types(observations: Iterable[dict[str, Any]]) -> Counter[str]:
+    """Observation counts per type, in order of first appearance."""
+    return Counter(obs.get("type", "unknown") for obs in observations)
+
+
+class MarkdownStreamingExporter(StreamingExporter):
+    """Investigation report with per-type observation counts."""
+
+    format_name = "markdown"
+
+    def _write(self, out, session_data, observations, include_notes, include_patterns):
+        by_type = _count_types(observations)
+        lines = iter(
+            self._lines(session_data, by_type, include_notes, include_patterns)
+        )
+        out.write(next(lines))
+        for line in lines:
+            out.write("\n")
+            out.write(line)
+
+    def _lines(
+        self,
+        session_data: dict[str, Any],
+        by_type: Counter[str],
+        include_notes: bool,
+        include_patterns: bool,
+    ) -> Iterator[str]:
+        yield from [
+            "# CodeMarshal Investigation Report",
+            "",
+            f"**Exported:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "**Format:** Markdown",
+            "",
+            "---",
+            "",
+            "## Investigation Metadata",
+            "",
+            f"- **ID:** {session_data.get('id', 'Unknown')}",
+            f"- **Path:** {session_data.get('path', 'Unknown')}",
+            f"- **State:** {session_data.get('state', 'Unknown')}",
+            f"- **Created:** {session_data.get('created_at', 'Unknown')}",
+            "",
+            "---",
+            "",
+            "## Observations Summary",
+            "",
+            f"Total Observations: {by_type.total()}",
+            "",
+        ]
+
+        for obs_type, count in by_type.items():
+            yield from [f"### {obs_type.title()}", "", f"Count: {count}", ""]
+
+        if include_notes and session_data.get("notes"):
+            yield from ["", "---", "", "## Notes", ""]
+            for note in session_data["notes"]:
+                yield f"- {note}"
+
+        if include_patterns and session_data.get("patterns"):
+            yield from ["", "---", "", "## Patterns", ""]
+            for pattern in session_data["patterns"]:
+                yield f"- {pattern}"
+
+        yield from [
+            "",
+            "---",
+            "",
+            "*Generated by CodeMarshal - Truth-Preserving Investigation*",
+        ]
+
+
+class HTMLStreamingExporter(StreamingExporter):
+    """The Markdown report's content as a standalone HTML page."""
+
+    format_name = "html"
+
+    def _write(self, out, session_data, observations, include_notes, include_patterns):
+        by_type = _count_types(observations)
+
+        out.write(f"""<!DOCTYPE html>
+<html>
+<head>
+    <title>CodeMarshal Investigation Report</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 40px; background: #f5f5f5; }}
+        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 30px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
+        h1 {{ color: #333; border-bottom: 2px solid #007acc; padding-bottom: 10px; }}
+        h2 {{ color: #555; margin-top: 30px; }}
+        h3 {{ color: #666; }}
+        .metadata {{ background: #f9f9f9; padding: 15px; border-left: 4px solid #007acc; margin: 20px 0; }}
+        .observation {{ background: #fff; border: 1px solid #ddd; padding: 10px; margin: 10px 0; border-radius: 4px; }}
+        .footer {{ margin-top: 40px; padding-top: 20px; border-top: 1px solid #ddd; color: #999; font-size: 0.9em; }}
+        table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
+        th, td {{ padding: 10px; text-align: left; border-bottom: 1px solid #ddd; }}
+        th {{ background: #f5f5f5; font-weight: bold; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>CodeMarshal Investigation Report</h1>
+        <div class="metadata">
+            <p><strong>Exported:</strong> {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
+            <p><strong>Format:</strong> HTML</p>
+            <p><strong>Investigation ID:</strong> {session_data.get("id", "Unknown")}</p>
+        </div>
+        <h2>Investigation Details</h2>
+        <table>
+            <tr><th>Property</th><th>Value</th></tr>
+            <tr><td>ID</td><td>{session_data.get("id", "Unknown")}</td></tr>
+            <tr><td>Path</td><td>{session_data.get("path", "Unknown")}</td></tr>
+            <tr><td>State</td><td>{session_data.get("state", "Unknown")}</td></tr>
+            <tr><td>Created</td><td>{session_data.get("created_at", "Unknown")}</td></tr>
+        </table>
+        <h2>Observations</h2>
+        <p>Total Observations: {by_type.total()}</p>
+""")  # noqa: E501
+
+        for obs_type, count in by_type.items():
+            out.write(f"""
+        <h3>{obs_type.title()}</h3>
+        <p>Count: {count}</p>
+""")
+
+        for title, key, wanted in (
+            ("Notes", "notes", include_notes),
+            ("Patterns", "patterns", include_patterns),
+        ):
+            if wanted and session_data.get(key):
+                out.write(f"""
+        <h2>{title}</h2>
+        <ul>
+""")
+                for item in session_data[key]:
+                    out.write(f"            <li>{item}</li>\n")
+                out.write("        </ul>\n")
+
+        out.write("""
+        <div class="footer">
+            <p>Generated by CodeMarshal - Truth-Preserving Investigation</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+
+class PlainTextStreamingExporter(StreamingExporter):
+    """The Markdown report's content as plain text."""
+
+    format_name = "plain"
+
+    def _write(self, out, session_data, observations, include_notes, include_patterns):
+        by_type = _count_types(observations)
+        lines = iter(
+            self._lines(session_data, by_type, include_notes, include_patterns)
+        )
+        out.write(next(lines))
+        for line in lines:
+            out.write("\n")
+            out.write(line)
+
+    def _lines(
+        self,
+        session_data: dict[str, Any],
+        by_type: Counter[str],
+        include_notes: bool,
+        include_patterns: bool,
+    ) -> Iterator[str]:
+        yield from [
+            "=" * 70,
+            "CODEMARSHAL INVESTIGATION REPORT",
+            "=" * 70,
+            "",
+            f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "Format: Plain Text",
+            "",
+            "-" * 70,
+            "INVESTIGATION DETAILS",
+            "-" * 70,
+            "",
+            f"ID:       {session_data.get('id', 'Unknown')}",
+            f"Path:     {session_data.get('path', 'Unknown')}",
+            f"State:    {session_data.get('state', 'Unknown')}",
+            f"Created:  {session_data.get('created_at', 'Unknown')}",
+            "",
+            "-" * 70,
+            "OBSERVATIONS SUMMARY",
+            "-" * 70,
+            "",
+            f"Total Observations: {by_type.total()}",
+            "",
+        ]
+
+        for obs_type, count in by_type.items():
+            yield from [f"{obs_type.title()}:", f"  Count: {count}", ""]
+
+        if include_notes and session_data.get("notes"):
+            yield from ["-" * 70, "NOTES", "-" * 70, ""]
+            for note in session_data["notes"]:
+                yield f"- {note}"
+            yield ""
+
+        if include_patterns and session_data.get("patterns"):
+            yield from ["-" * 70, "PATTERNS", "-" * 70, ""]
+            for pattern in session_data["patterns"]:
+                yield f"- {pattern}"
+            yield ""
+
+        yield from [
+            "=" * 70,
+            "Generated by CodeMarshal - Truth-Preserving Investigation",
+            "=" * 70,
+        ]
+
+
+_STREAMING_EXPORTERS: dict[str, type[StreamingExporter]] = {
+    "json": JSONStreamingExporter,
+    "jsonl": JSONLinesStreamingExporter,
+    "csv": CSVStreamingExporter,
+    "markdown": MarkdownStreamingExporter,
+    "html": HTMLStreamingExporter,
+    "plain": PlainTextStreamingExporter,
+    "plaintext": PlainTextStreamingExporter,
+}
+
+
+def get_streaming_exporter(format_name: str) -> StreamingExporter | None:
+    """Streaming exporter for a format name, or None if it has none."""
+    exporter_class = _STREAMING_EXPORTERS.get(format_name.strip().lower())
+    return exporter_class() if exporter_class is not None else None
+
+
+def streaming_formats() -> list[str]:
+    return sorted(_STREAMING_EXPORTERS)
+
+
+__all__ = [
+    "ExportStats",
+    "StreamingExporter",
+    "JSONStreamingExporter",
+    "JSONLinesStreamingExporter",
+    "CSVStreamingExporter",
+    "MarkdownStreamingExporter",
+    "HTMLStreamingExporter",
+    "PlainTextStreamingExporter",
+    "get_streaming_exporter",
+    "streaming_formats",
+]
@@ -33,6 +33,8 @@ from typing import Any
 
 import numpy as np
 
+from storage.embedding_storage import normalize_rows, top_k_cosine
+
 # Try to import sentence-transformers
 try:
     from sentence_transformers import SentenceTransformer
@@ -179,6 +181,39 @@ class CodePreprocessor:
         return signatures
 
 
+@dataclass(frozen=True)
+class ChunkMatrix:
+    """
+    Indexed chunks stacked into one pre-normalized float32 matrix.
+
+    Build it once per index and pass it to ``SemanticSearchEngine.search``
+    for every query until the index changes.
+    """
+
+    entries: tuple[tuple[Path, str, int], ...]  # (file_path, chunk_id, start_line)
+    matrix: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        indexed_files: list[tuple[Path, list[tuple[str, np.ndarray, int]]]],
+    ) -> ChunkMatrix:
+        """Stack and normalize the chunk embeddings of ``indexed_files``."""
+        entries: list[tuple[Path, str, int]] = []
+        vectors: list[np.ndarray] = []
+        for file_path, file_chunks in indexed_files:
+            for chunk_id, embedding, start_line in file_chunks:
+                entries.append((file_path, chunk_id, start_line))
+                vectors.append(embedding)
+
+        if not vectors:
+            return cls(entries=(), matrix=np.zeros((0, 0), dtype=np.float32))
+        return cls(entries=tuple(entries), matrix=normalize_rows(np.vstack(vectors)))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
 class SemanticSearchEngine:
     """
     Semantic code search using local embeddings.
@@ -281,18 +316,28 @@ class SemanticSearchEngine:
     def search(
         self,
         query: str,
-        indexed_files: list[tuple[Path, list[tuple[str, np.ndarray, int]]]],
+        indexed_files: ChunkMatrix
+        | list[tuple[Path, list[tuple[str, np.ndarray, int]]]],
     ) -> list[SearchResult]:
         """
         Search for semantically similar code.
 
         Args:
             query: Search query (natural language or code)
-            indexed_files: List of (file_path, embeddings) from index_file
+            indexed_files: A ChunkMatrix, or a list of (file_path, embeddings)
+                from index_file (stacked for this query only)
 
         Returns:
             List of SearchResult sorted by similarity score
         """
+        chunks = (
+            indexed_files
+            if isinstance(indexed_files, ChunkMatrix)
+            else ChunkMatrix.build(indexed_files)
+        )
+        if not chunks:
+            return []
+
         # Encode query
         model = self._load_model()
         query_embedding = model.encode(
@@ -300,34 +345,26 @@ class SemanticSearchEngine:
             convert_to_numpy=True,
         )[0]
 
-        # Normalize query embedding
-        query_embedding = query_embedding / np.linalg.norm(query_embedding)
-
-        # Compute similarities
+        # One matrix-vector product scores every chunk
         results = []
-        for file_path, file_chunks in indexed_files:
-            for chunk_id, embedding, start_line in file_chunks:
-                # Normalize embedding
-                embedding_norm = embedding / np.linalg.norm(embedding)
-
-                # Cosine similarity
-                similarity = np.dot(query_embedding, embedding_norm)
-
-                if similarity >= self.config.similarity_threshold:
-                    results.append(
-                        SearchResult(
-                            path=file_path,
-                            content=self._get_chunk_content(file_path, start_line),
-                            score=float(similarity),
-                            line_number=start_line,
-                            context=f"chunk:{chunk_id}",
-                        )
-                    )
-
-        # Sort by score (descending)
-        results.sort(key=lambda x: x.score, reverse=True)
+        for row, similarity in top_k_cosine(
+            chunks.matrix,
+            query_embedding,
+            self.config.top_k,
+            self.config.similarity_threshold,
+        ):
+            file_path, chunk_id, start_line = chunks.entries[row]
+            results.append(
+                SearchResult(
+                    path=file_path,
+                    content=self._get_chunk_content(file_path, start_line),
+                    score=similarity,
+                    line_number=start_line,
+                    context=f"chunk:{chunk_id}",
+                )
+            )
 
-        return results[: self.config.top_k]
+        return results
 
     def search_directory(
         self,
@@ -366,14 +403,15 @@ class SemanticSearchEngine:
     def find_similar(
         self,
         code_snippet: str,
-        indexed_files: list[tuple[Path, list[tuple[str, np.ndarray, int]]]],
+        indexed_files: ChunkMatrix
+        | list[tuple[Path, list[tuple[str, np.ndarray, int]]]],
     ) -> list[SearchResult]:
         """
         Find code similar to a given snippet.
 
         Args:
             code_snippet: Code to find similar matches for
-            indexed_files: Indexed files to search
+            indexed_files: Indexed files (or their ChunkMatrix) to search
 
         Returns:
             List of similar code snippets
@@ -57,6 +57,7 @@ from inquiry.answers import (
     StructureAnalyzer,
     ThinkingEngine,
 )
+from inquiry.answers.dependency_graph import DependencyGraph, load_or_build
 from inquiry.interface import MinimalInquiryInterface
 from inquiry.session.context import QuestionType, SessionContext
 from lens.interface import MinimalLensInterface
@@ -352,17 +353,11 @@ class RuntimeFacade:
 
         observations: list[dict[str, Any]] = []
         observation_ids = list(session.get("observation_ids", []) or [])
-        observations_dir = self._storage_root / "observations"
-
-        for obs_id in observation_ids:
-            obs_file = observations_dir / f"{obs_id}.observation.json"
-            if not obs_file.exists():
-                continue
-            try:
-                payload = json.loads(obs_file.read_text(encoding="utf-8"))
-            except Exception:
-                continue
 
+        # Resolves observation files, streaming manifests and segment records
+        for _obs_id, payload in self._storage.iter_observation_payloads(
+            observation_ids, session.get("manifest_id")
+        ):
             if isinstance(payload, dict) and isinstance(payload.get("data"), dict):
                 data_payload = payload["data"]
                 nested = data_payload.get("observations")
@@ -387,6 +382,27 @@ class RuntimeFacade:
 
         return observations
 
+    def _dependency_graph_for_session(
+        self, session_id: str, observations: list[dict[str, Any]] | None = None
+    ) -> DependencyGraph | None:
+        """
+        Persisted dependency graph for the session.
+
+        Without ``observations`` only a current sidecar is returned; with
+        them a missing or stale graph is built and saved.
+        """
+        session = self._storage.load_session_metadata(session_id)
+        if not session:
+            return None
+        path = self._storage.dependency_graph_path(session_id)
+        key = self._storage.observation_set_key(session)
+        try:
+            if observations is None:
+                return DependencyGraph.load(path, key)
+            return load_or_build(path, key, observations)
+        except (OSError, ValueError):
+            return None
+
     def run_investigation(
         self,
         path: Path | str,
@@ -659,9 +675,24 @@ class RuntimeFacade:
         self._check_cancel(cancel_event)
         self._emit_progress(progress_callback, 2, 3, "Building answer from observations")
 
-        observations = self.load_observations_for_session(active_session_id)
         analyzer_cls = self._analyzer_for_question(question_type)
-        analyzer = analyzer_cls()
+        if analyzer_cls is ConnectionMapper:
+            # A current persisted graph answers graph-only questions without
+            # decoding the session's observations
+            graph = self._dependency_graph_for_session(active_session_id)
+            observations: list[dict[str, Any]] = []
+            if graph is None or ConnectionMapper(dependency_graph=graph).needs_observations(
+                question
+            ):
+                observations = self.load_observations_for_session(active_session_id)
+                if graph is None:
+                    graph = self._dependency_graph_for_session(
+                        active_session_id, observations
+                    )
+            analyzer = ConnectionMapper(dependency_graph=graph)
+        else:
+            observations = self.load_observations_for_session(active_session_id)
+            analyzer = analyzer_cls()
         answer = analyzer.analyze(observations, question)
 
         query_id = str(command_result.get("query_id") or f"query_{uuid.uuid4().hex[:8]}")
@@ -28,6 +28,8 @@ This module IS NOT:
 ALLOWED IMPORTS:
 - pathlib.Path (path manipulation)
 - typing modules (type hints)
+- inquiry.answers.dependency_graph (resolved CSR dependency graph)
+- observations.cycles (shared strongly connected components engine)
 - No external graph libraries (maintains zero dependencies)
 
 PROHIBITED IMPORTS:
@@ -45,15 +47,17 @@ QUESTION TYPES HANDLED:
 
 ALGORITHMS IMPLEMENTED:
 1. Simple substring matching for dependency extraction
-2. Depth-First Search (DFS) for cycle detection
-3. Graph adjacency list representation
+2. Iterative Tarjan SCC for cycle detection (observations/cycles.py)
+3. Integer-ID CSR graph (see dependency_graph.py)
 4. Multi-pass statistics accumulation
 
 PERFORMANCE NOTES:
 - Cycle detection is O(V + E) where V = files, E = imports
-- Graph building is O(n) where n = observations
+- Graph building is O(n) where n = observations, with each distinct
+  module string resolved once
 - Memory usage is O(V + E) for graph storage
-- No caching (processes fresh each time)
+- A graph persisted next to the session can be passed in, so impact,
+  centrality and cycle questions skip resolution entirely
 
 OUTPUT FORMAT:
 - ASCII-formatted text
@@ -63,10 +67,13 @@ OUTPUT FORMAT:
 - Statistical summaries
 """
 
-from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
+from observations.cycles import find_cyclic_components
+
+from .dependency_graph import DependencyGraph
+
 
 class ConnectionMapper:
     """
@@ -83,9 +90,11 @@ class ConnectionMapper:
     4. Graph summarization: Overall dependency statistics
 
     GRAPH REPRESENTATION:
-    This class builds dependency graphs using adjacency lists (dictionaries
-    mapping source to sets of targets). This is memory-efficient and allows
-    O(1) edge lookup while maintaining O(V + E) space complexity.
+    Impact, centrality and cycle questions run on a DependencyGraph: files
+    get integer IDs and edges live in CSR arrays (offsets + targets), with
+    a precomputed reverse adjacency for dependent lookups. The graph is
+    either passed in (e.g. loaded from the session's sidecar) or built
+    from the observations on demand.
 
     LIMITATION DECLARATIONS:
     This mapper explicitly cannot:
@@ -97,22 +106,20 @@ class ConnectionMapper:
     - Resolve relative imports without context
 
     CYCLE DETECTION ALGORITHM:
-    Uses Depth-First Search (DFS) with three color states:
-    - White: Unvisited
-    - Gray: Currently being processed (in recursion stack)
-    - Black: Finished processing
-
-    A cycle is detected when we encounter a gray node (back edge).
+    Uses Tarjan's strongly connected components with an explicit stack
+    (no recursion). Every component with more than one file, or a file
+    that imports itself, is a circular dependency; a bounded set of
+    representative cycles is shown for each.
 
     PERFORMANCE CHARACTERISTICS:
     - Graph Building: O(n) where n = number of observations
-    - Cycle Detection: O(V + E) standard DFS complexity
+    - Cycle Detection: O(V + E) iterative Tarjan SCC
     - Dependency Lookup: O(1) with adjacency list
     - Memory: O(V + E) for graph storage
 
     THREAD SAFETY:
-    Stateless class - safe for concurrent use. Each analyze() call
-    builds independent graph structures.
+    Safe for concurrent use. An injected graph is immutable; otherwise
+    each analyze() call builds independent graph structures.
 
     EXAMPLES:
         >>> mapper = ConnectionMapper()
@@ -130,6 +137,12 @@ class ConnectionMapper:
           • os
     """
 
+    OBSERVATION_TYPES: frozenset[str] | None = frozenset({"import_sight", "file_sight"})
+    """Observation types this analyzer reads (lets callers load only these)."""
+
+    COMPACT_OBSERVATIONS: bool = True
+    """Only import module/names and file_sight path listings are read."""
+
     # Class constants for formatting and limits
     _SECTION_SEPARATOR_LENGTH: int = 60
     """Length of ASCII separator lines in output."""
@@ -138,7 +151,10 @@ class ConnectionMapper:
     """Maximum number of dependents to list (prevents output spam)."""
 
     _MAX_CYCLES_DISPLAY: int = 20
-    """Maximum number of circular dependency cycles to display."""
+    """Maximum number of circular dependency components to display."""
+
+    _MAX_CYCLES_PER_COMPONENT: int = 3
+    """Representative cycles shown per circular dependency component."""
 
     _HIGH_COUPLING_THRESHOLD: int = 20
     """Number of imports considered "high coupling" for warnings."""
@@ -152,22 +168,26 @@ class ConnectionMapper:
     _IMPACT_MAX_DEPTH: int = 3
     """Maximum depth for impact surface traversal."""
 
-    def __init__(self) -> None:
+    _GRAPH_ROUTES: frozenset[str] = frozenset({"impact", "centrality", "circular"})
+    """Question routes answered from the dependency graph alone."""
+
+    def __init__(self, dependency_graph: DependencyGraph | None = None) -> None:
         """
         Initialize the ConnectionMapper.
 
-        This analyzer is stateless and requires no initialization
-        parameters. The constructor exists for:
-        1. Factory pattern compatibility
-        2. Future stateful extensions
-        3. Consistent API across all analyzers
-
-        The mapper builds fresh graph structures for each analyze()
-        call, ensuring no data leakage between investigations.
+        Args:
+            dependency_graph: Optional prebuilt graph for the same
+                observations (e.g. loaded from the session's sidecar).
+                Without it the mapper builds a fresh graph per analyze()
+                call, ensuring no data leakage between investigations.
         """
-        # No state initialization needed
-        # Reserved for future extensions
-        pass
+        self._dependency_graph = dependency_graph
+
+    def _graph_for(self, observations: list[dict[str, Any]]) -> DependencyGraph:
+        """Return the injected graph, or build one from the observations."""
+        if self._dependency_graph is not None:
+            return self._dependency_graph
+        return DependencyGraph.from_observations(observations)
 
     def analyze(self, observations: list[dict[str, Any]], question: str) -> str:
         """
@@ -219,13 +239,9 @@ class ConnectionMapper:
             >>> mapper.analyze(obs, "What depends on b?")
             'Modules that depend on 'b': 1\n...'
         """
-        # Normalize question for case-insensitive matching
-        question_lower = question.lower()
-
-        # Route based on question keywords
-        # Check more specific patterns first
+        route = self._route(question)
 
-        if "depend" in question_lower and "what depend" in question_lower:
+        if route == "dependents":
             # Question asks what depends on a target
             # Examples:
             # - "What depends on core.engine?"
@@ -237,7 +253,7 @@ class ConnectionMapper:
             else:
                 return "Could not determine target module from question."
 
-        elif "import" in question_lower and "what" in question_lower:
+        elif route == "imports":
             # Question asks what something imports
             # Examples:
             # - "What does main.py import?"
@@ -250,15 +266,15 @@ class ConnectionMapper:
                 # No specific target, show summary of all imports
                 return self._get_all_imports_summary(observations)
 
-        elif "impact" in question_lower or "surface" in question_lower:
+        elif route == "impact":
             # Question asks about impact surface of changes
             return self._analyze_impact_surface(observations, question)
 
-        elif "centrality" in question_lower or "central" in question_lower:
+        elif route == "centrality":
             # Question asks for centrality metrics
             return self._calculate_centrality(observations)
 
-        elif "circular" in question_lower:
+        elif route == "circular":
             # Question asks about circular dependencies
             # Examples:
             # - "Show circular dependencies"
@@ -274,6 +290,34 @@ class ConnectionMapper:
             # - "Describe the dependency graph"
             return self._get_dependency_graph_summary(observations)
 
+    @staticmethod
+    def _route(question: str) -> str:
+        """Classify a question by keyword (more specific patterns first)."""
+        question_lower = question.lower()
+        if "depend" in question_lower and "what depend" in question_lower:
+            return "dependents"
+        if "import" in question_lower and "what" in question_lower:
+            return "imports"
+        if "impact" in question_lower or "surface" in question_lower:
+            return "impact"
+        if "centrality" in question_lower or "central" in question_lower:
+            return "centrality"
+        if "circular" in question_lower:
+            return "circular"
+        return "summary"
+
+    def needs_observations(self, question: str) -> bool:
+        """
+        Whether answering ``question`` reads raw observations.
+
+        Impact, centrality and circular questions are answered from the
+        dependency graph alone, so with an injected graph callers may pass
+        an empty observation list and skip loading the session entirely.
+        """
+        if self._dependency_graph is None:
+            return True
+        return self._route(question) not in self._GRAPH_ROUTES
+
     def _extract_target_module(self, question: str) -> str | None:
         """
         Extract module name from question text.
@@ -591,21 +635,15 @@ class ConnectionMapper:
         if not target:
             return "Could not determine target module for impact analysis."
 
-        reverse_map, alias_to_files, _, all_files = self._build_reverse_dependency_map(
-            observations
-        )
-        if not reverse_map and not all_files:
+        graph = self._graph_for(observations)
+        if graph.file_count == 0:
             return "Impact surface not available: no import observations found."
 
-        target_files: set[str] = set()
-        target_files.update(self._resolve_import_targets(target, alias_to_files))
-
-        if target in alias_to_files:
-            target_files.update(alias_to_files[target])
+        target_ids: set[int] = graph.resolve(target)
 
-        if not target_files:
+        if not target_ids:
             target_lower = target.lower()
-            for file_path in all_files:
+            for node, file_path in enumerate(graph.files):
                 name = Path(file_path).name
                 name_lower = name.lower()
                 if (
@@ -613,27 +651,18 @@ class ConnectionMapper:
                     or target_lower == name_lower
                     or target_lower == name_lower.replace(".py", "")
                 ):
-                    target_files.add(file_path)
+                    target_ids.add(node)
 
-        if not target_files:
+        if not target_ids:
             return f"Impact surface not available: target '{target}' not found."
 
-        visited: set[str] = set(target_files)
-        frontier: set[str] = set(target_files)
-        impact_by_depth: dict[int, list[str]] = {}
-
-        for depth in range(1, self._IMPACT_MAX_DEPTH + 1):
-            next_frontier: set[str] = set()
-            for node in frontier:
-                for dependent in reverse_map.get(node, set()):
-                    if dependent not in visited:
-                        next_frontier.add(dependent)
-                        visited.add(dependent)
-            impact_by_depth[depth] = sorted(next_frontier)
-            frontier = next_frontier
-
-            if not frontier:
-                break
+        target_files = {graph.nodes[node] for node in target_ids}
+        impact_by_depth: dict[int, list[str]] = {
+            depth: sorted(graph.nodes[node] for node in layer)
+            for depth, layer in enumerate(
+                graph.impact_layers(target_ids, self._IMPACT_MAX_DEPTH), 1
+            )
+        }
 
         if all(len(values) == 0 for values in impact_by_depth.values()):
             return f"No dependents found for target: {target}"
@@ -670,42 +699,18 @@ class ConnectionMapper:
         """
         Calculate simple module centrality using internal import edges.
         """
-        reverse_map, alias_to_files, graph, all_files = self._build_reverse_dependency_map(
-            observations
-        )
-        if not graph and not all_files:
+        graph = self._graph_for(observations)
+        if graph.file_count == 0:
             return "Centrality metrics not available: no import observations found."
 
-        internal_edges: dict[str, set[str]] = defaultdict(set)
-        for source, imports in graph.items():
-            for module in imports:
-                if not module or module.startswith("."):
-                    continue
-                targets = self._resolve_import_targets(module, alias_to_files)
-                for target in targets:
-                    if target != source:
-                        internal_edges[source].add(target)
-
-        in_degree: dict[str, int] = defaultdict(int)
-        out_degree: dict[str, int] = defaultdict(int)
-        edge_count = 0
-
-        for source, targets in internal_edges.items():
-            out_degree[source] += len(targets)
-            edge_count += len(targets)
-            for target in targets:
-                in_degree[target] += 1
-
-        all_nodes = set(all_files)
-        if not all_nodes:
-            all_nodes = set(graph.keys())
+        all_nodes = graph.files
+        edge_count = graph.internal_edge_count
 
         centrality: list[tuple[str, int, int, int]] = []
-        for node in all_nodes:
-            inbound = in_degree.get(node, 0)
-            outbound = out_degree.get(node, 0)
-            total = inbound + outbound
-            centrality.append((node, total, inbound, outbound))
+        for node, path in enumerate(all_nodes):
+            inbound = graph.in_degree(node)
+            outbound = graph.out_degree(node)
+            centrality.append((path, inbound + outbound, inbound, outbound))
 
         centrality.sort(key=lambda item: (item[1], item[2], item[3]), reverse=True)
 
@@ -744,28 +749,26 @@ class ConnectionMapper:
 
     def _find_circular_dependencies(self, observations: list[dict[str, Any]]) -> str:
         """
-        Detect circular import dependencies using DFS.
-
-        This method builds a dependency graph from observations and
-        performs cycle detection using Depth-First Search (DFS).
+        Detect circular import dependencies as strongly connected components.
 
         ALGORITHM:
-        1. Build adjacency list graph from import observations
-        2. Initialize DFS tracking (visited, recursion stack)
-        3. For each unvisited node:
-           a. Mark as visiting (gray)
-           b. Visit all neighbors
-           c. If neighbor is gray, cycle detected
-           d. Mark as visited (black)
-        4. Report all found cycles
+        1. Take the resolved dependency graph (CSR, integer node IDs)
+        2. Run iterative Tarjan SCC (observations/cycles.py) over it
+        3. Keep components with more than one file, or a self-import
+        4. Extract a few representative elementary cycles per component
+           (shortest cycle through successive members)
+        5. Report components largest first, with their sizes
 
         COMPLEXITY:
-        - Time: O(V + E) standard DFS
-        - Space: O(V) for recursion stack and tracking
+        - Time: O(V + E) for the components, plus a bounded number of
+          in-component BFS passes for the representative cycles
+        - Space: O(V) explicit stack (no recursion, no path copies)
 
         LIMITATION:
         This only detects direct import cycles. Runtime import cycles
         (e.g., inside function calls) cannot be detected statically.
+        A component lists every module involved, but only a bounded sample
+        of its (possibly exponentially many) elementary cycles is shown.
 
         Args:
             observations: List of observations to analyze.
@@ -774,82 +777,48 @@ class ConnectionMapper:
             str: Formatted list of circular dependencies or message
                 indicating no cycles found.
         """
-        # Build dependency graph as adjacency list
-        _, alias_to_files, _, _ = self._build_reverse_dependency_map(observations)
-        graph: dict[str, set[str]] = {}
-
-        for obs in observations:
-            if obs.get("type") == "import_sight":
-                file_path = obs.get("file", "")
-                statements = obs.get("statements", [])
-
-                if file_path not in graph:
-                    graph[file_path] = set()
-
-                for stmt in statements:
-                    if isinstance(stmt, dict):
-                        module = stmt.get("module", "")
-                        if module:
-                            targets = self._resolve_import_targets(
-                                module, alias_to_files
-                            )
-                            if targets:
-                                for target in targets:
-                                    graph[file_path].add(target)
-                            else:
-                                # Fallback to path-like entry without extension
-                                graph[file_path].add(module.replace(".", "/"))
-
-        # Find cycles using DFS
-        cycles: list[list[str]] = []
-        visited: set[str] = set()
-        rec_stack: set[str] = set()
-
-        def dfs(node: str, path: list[str]) -> None:
-            """Depth-first search helper for cycle detection."""
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    dfs(neighbor, path + [neighbor])
-                elif neighbor in rec_stack:
-                    # Found a cycle
-                    cycle_start = path.index(neighbor) if neighbor in path else 0
-                    cycle = path[cycle_start:] + [neighbor]
-                    if cycle not in cycles:
-                        cycles.append(cycle)
-
-            rec_stack.remove(node)
-
-        # Run DFS from all unvisited nodes
-        for node in graph:
-            if node not in visited:
-                dfs(node, [node])
+        graph = self._graph_for(observations)
+
+        # Only observed files have outgoing edges, so cycles stay among them
+        components = find_cyclic_components(
+            nodes=range(graph.file_count),
+            successors=graph.successors,
+            max_cycles=self._MAX_CYCLES_PER_COMPONENT,
+            sort_key=int,
+        )
 
         # Handle case: no cycles found
-        if not cycles:
+        if not components:
             return "No circular dependencies detected."
 
+        involved = sum(component.size for component in components)
+
         # Build formatted output
         lines: list[str] = [
-            f"Circular Dependencies Found: {len(cycles)}",
+            f"Circular Dependencies Found: {len(components)} "
+            f"component(s), {involved} module(s) involved",
             "=" * self._SECTION_SEPARATOR_LENGTH,
         ]
 
-        # Show each cycle with arrow notation
-        for i, cycle in enumerate(cycles[: self._MAX_CYCLES_DISPLAY], 1):
-            lines.append(f"\nCycle {i}:")
-            for j, node in enumerate(cycle):
-                if j < len(cycle) - 1:
-                    lines.append(f"  {node} →")
-                else:
-                    lines.append(f"  {node}")
+        for i, component in enumerate(components[: self._MAX_CYCLES_DISPLAY], 1):
+            lines.append(f"\nComponent {i}: {component.size} module(s)")
+            for node in component.nodes[: self._MAX_DEPENDENTS_DISPLAY]:
+                lines.append(f"  • {graph.nodes[node]}")
+            if component.size > self._MAX_DEPENDENTS_DISPLAY:
+                remaining = component.size - self._MAX_DEPENDENTS_DISPLAY
+                lines.append(f"  ... and {remaining} more")
+
+            # Show each representative cycle with arrow notation
+            for j, cycle in enumerate(component.cycles, 1):
+                lines.append(f"  Cycle {i}.{j}:")
+                for k, node in enumerate(cycle):
+                    arrow = " →" if k < len(cycle) - 1 else ""
+                    lines.append(f"    {graph.nodes[node]}{arrow}")
 
         # Note if truncated
-        if len(cycles) > self._MAX_CYCLES_DISPLAY:
-            remaining = len(cycles) - self._MAX_CYCLES_DISPLAY
-            lines.append(f"\n... and {remaining} more cycles")
+        if len(components) > self._MAX_CYCLES_DISPLAY:
+            remaining = len(components) - self._MAX_CYCLES_DISPLAY
+            lines.append(f"\n... and {remaining} more components")
 
         return "\n".join(lines)
 
@@ -922,167 +891,6 @@ class ConnectionMapper:
 
         return "\n".join(lines)
 
-    def _build_dependency_graph(
-        self, observations: list[dict[str, Any]]
-    ) -> dict[str, set[str]]:
-        """
-        Build a dependency graph from observations.
-
-        Helper method that constructs an adjacency list representation
-        of the dependency graph for reuse by multiple analysis methods.
-
-        Args:
-            observations: List of observations to process.
-
-        Returns:
-            Dict mapping source files to sets of target modules.
-
-        Note: Used internally for impact and centrality analysis.
-        """
-        graph: dict[str, set[str]] = {}
-
-        for obs in observations:
-            if obs.get("type") == "import_sight":
-                file_path = obs.get("file", "")
-                statements = obs.get("statements", [])
-
-                if file_path not in graph:
-                    graph[file_path] = set()
-
-                for stmt in statements:
-                    if isinstance(stmt, dict):
-                        module = stmt.get("module", "")
-                        if module:
-                            graph[file_path].add(module)
-
-        return graph
-
-    def _build_reverse_dependency_map(
-        self, observations: list[dict[str, Any]]
-    ) -> tuple[dict[str, set[str]], dict[str, set[str]], dict[str, set[str]], set[str]]:
-        """
-        Build a reverse dependency map keyed by target file.
-
-        Returns:
-            reverse_map: target file -> set of dependent files
-            alias_to_files: alias string -> set of file paths
-            graph: forward dependency graph (file -> imported modules)
-            all_files: set of observed file paths
-        """
-        graph = self._build_dependency_graph(observations)
-        all_files: set[str] = set(graph.keys())
-
-        for obs in observations:
-            if obs.get("type") == "file_sight":
-                result = obs.get("result", {})
-                modules = result.get("modules", []) or result.get("files", [])
-                for module in modules:
-                    path = ""
-                    if isinstance(module, dict):
-                        path = module.get("path") or module.get("file_path") or ""
-                    elif isinstance(module, str):
-                        path = module
-                    if path:
-                        all_files.add(path)
-
-        alias_to_files: dict[str, set[str]] = defaultdict(set)
-        for file_path in all_files:
-            for alias in self._module_aliases_for_file(file_path):
-                alias_to_files[alias].add(file_path)
-
-        reverse_map: dict[str, set[str]] = defaultdict(set)
-        for source, imports in graph.items():
-            for module in imports:
-                if not module or module.startswith("."):
-                    continue
-                targets = self._resolve_import_targets(module, alias_to_files)
-                for target in targets:
-                    if target != source:
-                        reverse_map[target].add(source)
-
-        return reverse_map, alias_to_files, graph, all_files
-
-    def _module_aliases_for_file(self, file_path: str) -> set[str]:
-        """
-        Generate alias strings for a file path to aid module resolution.
-        """
-        aliases: set[str] = set()
-        if not file_path:
-            return aliases
-
-        normalized = file_path.replace("\\", "/").strip()
-        if normalized:
-            aliases.add(normalized)
-
-        name = Path(normalized).name
-        if name:
-            aliases.add(name)
-            for ext in (".py", ".js", ".jsx", ".ts", ".tsx", ".java", ".go"):
-                if name.endswith(ext):
-                    aliases.add(name[: -len(ext)])
-                    break
-
-        for ext in (".py", ".js", ".jsx", ".ts", ".tsx", ".java", ".go"):
-            if normalized.endswith(ext):
-                no_ext = normalized[: -len(ext)]
-                aliases.add(no_ext)
-                aliases.add(no_ext.replace("/", "."))
-                break
-
-        parts = [p for p in Path(normalized).parts if p not in ("/", "\\") and ":" not in p]
-        if parts:
-            normalized_parts = [p[:-3] if p.endswith(".py") else p for p in parts]
-            aliases.add(".".join(normalized_parts))
-            if len(normalized_parts) >= 2:
-                aliases.add(".".join(normalized_parts[-2:]))
-
-        normalized_aliases: set[str] = set()
-        for alias in aliases:
-            if alias:
-                normalized_aliases.add(alias)
-                normalized_aliases.add(alias.lower())
-
-        return normalized_aliases
-
-    def _resolve_import_targets(
-        self, module: str, alias_to_files: dict[str, set[str]]
-    ) -> set[str]:
-        """
-        Resolve an imported module string to observed file paths.
-        """
-        targets: set[str] = set()
-        module = (module or "").strip()
-        if not module:
-            return targets
-
-        module_lower = module.lower()
-
-        if module in alias_to_files:
-            targets.update(alias_to_files[module])
-        if module_lower in alias_to_files:
-            targets.update(alias_to_files[module_lower])
-
-        base = module.split(".")[-1].split("/")[-1]
-        if base in alias_to_files:
-            targets.update(alias_to_files[base])
-        if base.lower() in alias_to_files:
-            targets.update(alias_to_files[base.lower()])
-
-        path_like = module.replace(".", "/")
-        if path_like in alias_to_files:
-            targets.update(alias_to_files[path_like])
-        if path_like.lower() in alias_to_files:
-            targets.update(alias_to_files[path_like.lower()])
-
-        if not path_like.endswith(".py"):
-            path_like_py = f"{path_like}.py"
-            if path_like_py in alias_to_files:
-                targets.update(alias_to_files[path_like_py])
-            if path_like_py.lower() in alias_to_files:
-                targets.update(alias_to_files[path_like_py.lower()])
-
-        return targets
-
     def _extract_impact_target(self, question: str) -> str | None:
         """
         Extract a target from impact-oriented questions.
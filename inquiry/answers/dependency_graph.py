@@ -0,0 +1,507 @@
+"""
+inquiry/answers/dependency_graph.py
+
+Resolved file-level dependency graph in compact CSR form
+=======================================================
+
+ConnectionMapper used to rebuild its adjacency maps from raw observation
+dicts, recompute module aliases for every file and re-resolve every import
+on each question. This module resolves imports to observed files once and
+stores the result as integer-ID adjacency arrays (compressed sparse rows)
+that can be persisted next to a session and reloaded without touching the
+observations again.
+
+CONSTITUTIONAL ARTICLES ENFORCED:
+- Article 1: Truth Preservation (edges are only observed, resolved imports)
+- Article 9: Immutable Observations (a derived, rebuildable view)
+- Article 13: Deterministic (node IDs follow sorted file paths)
+
+GRAPH LAYOUT:
+- nodes: observed files (sorted) followed by unresolved import targets
+  (``module.replace(".", "/")``), which only appear in ``imports``
+- imports: every import edge as used for cycle reporting, including
+  self-imports and unresolved targets
+- internal: file -> file edges between distinct observed files, skipping
+  relative imports (what impact and centrality consider)
+- reverse: transpose of ``internal`` (target -> dependents)
+- aliases: module alias -> file IDs, used to resolve question targets
+
+Each adjacency is a pair ``(offsets, targets)`` of ``array`` objects:
+the successors of node ``i`` are ``targets[offsets[i]:offsets[i + 1]]``.
+
+FILE FORMAT:
+    MAGIC | u32 header length | header JSON | section bytes ...
+
+The header records the format, the observation-set key the graph was built
+from, node counts, byte order and the offset/length of every section.
+Loading is a handful of ``array.frombytes`` calls; alias names are decoded
+only when a question needs them.
+
+ALLOWED IMPORTS:
+- Standard library only (no graph libraries, no numpy)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+GRAPH_FORMAT = "1"
+_MAGIC = b"CMDGRAPH"
+_HEADER_LEN = struct.Struct("<I")
+_SOURCE_EXTENSIONS = (".py", ".js", ".jsx", ".ts", ".tsx", ".java", ".go")
+
+Adjacency = tuple[array, array]
+
+
+def module_aliases_for_file(file_path: str) -> set[str]:
+    """
+    Generate alias strings for a file path to aid module resolution.
+    """
+    aliases: set[str] = set()
+    if not file_path:
+        return aliases
+
+    normalized = file_path.replace("\\", "/").strip()
+    if normalized:
+        aliases.add(normalized)
+
+    path = Path(normalized)
+    name = path.name
+    if name:
+        aliases.add(name)
+        for ext in _SOURCE_EXTENSIONS:
+            if name.endswith(ext):
+                aliases.add(name[: -len(ext)])
+                break
+
+    for ext in _SOURCE_EXTENSIONS:
+        if normalized.endswith(ext):
+            no_ext = normalized[: -len(ext)]
+            aliases.add(no_ext)
+            aliases.add(no_ext.replace("/", "."))
+            break
+
+    parts = [p for p in path.parts if p not in ("/", "\\") and ":" not in p]
+    if parts:
+        normalized_parts = [p[:-3] if p.endswith(".py") else p for p in parts]
+        aliases.add(".".join(normalized_parts))
+        if len(normalized_parts) >= 2:
+            aliases.add(".".join(normalized_parts[-2:]))
+
+    normalized_aliases: set[str] = set()
+    for alias in aliases:
+        if alias:
+            normalized_aliases.add(alias)
+            normalized_aliases.add(alias.lower())
+
+    return normalized_aliases
+
+
+def resolution_keys(module: str) -> list[str]:
+    """Alias keys an imported module string may be known under."""
+    module = (module or "").strip()
+    if not module:
+        return []
+    base = module.split(".")[-1].split("/")[-1]
+    path_like = module.replace(".", "/")
+    keys = [module, base, path_like]
+    if not path_like.endswith(".py"):
+        keys.append(f"{path_like}.py")
+    return [variant for key in keys for variant in (key, key.lower())]
+
+
+class DependencyGraph:
+    """
+    Immutable file-level dependency graph with integer node IDs.
+
+    Build it with ``from_observations`` or restore a persisted copy with
+    ``load``; every query afterwards works on the CSR arrays.
+    """
+
+    def __init__(
+        self,
+        nodes: list[str],
+        file_count: int,
+        imports: Adjacency,
+        internal: Adjacency,
+        reverse: Adjacency,
+        alias_index: Any = None,
+        alias_loader: Any = None,
+    ) -> None:
+        self.nodes = nodes
+        self.file_count = file_count
+        self.imports = imports
+        self.internal = internal
+        self.reverse = reverse
+        self._alias_index = alias_index
+        self._alias_loader = alias_loader
+        self._node_ids: dict[str, int] | None = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_observations(cls, observations: Iterable[dict[str, Any]]) -> DependencyGraph:
+        """Resolve import_sight/file_sight observations into a graph."""
+        imports_by_file: dict[str, set[str]] = {}
+        listed: set[str] = set()
+
+        for obs in observations:
+            obs_type = obs.get("type")
+            if obs_type == "import_sight":
+                modules = imports_by_file.setdefault(obs.get("file", ""), set())
+                for stmt in obs.get("statements", []):
+                    if isinstance(stmt, dict):
+                        module = stmt.get("module", "")
+                        if module:
+                            modules.add(module)
+            elif obs_type == "file_sight":
+                result = obs.get("result", {})
+                entries = result.get("modules", []) or result.get("files", [])
+                for entry in entries:
+                    path = ""
+                    if isinstance(entry, dict):
+                        path = entry.get("path") or entry.get("file_path") or ""
+                    elif isinstance(entry, str):
+                        path = entry
+                    if path:
+                        listed.add(path)
+
+        files = sorted((set(imports_by_file) | listed) - {""})
+        node_ids = {path: idx for idx, path in enumerate(files)}
+
+        alias_index: dict[str, list[int]] = {}
+        for idx, path in enumerate(files):
+            for alias in module_aliases_for_file(path):
+                alias_index.setdefault(alias, []).append(idx)
+
+        resolved: dict[str, list[int]] = {}
+
+        def resolve(module: str) -> list[int]:
+            ids = resolved.get(module)
+            if ids is None:
+                found: set[int] = set()
+                for key in resolution_keys(module):
+                    found.update(alias_index.get(key, ()))
+                ids = resolved[module] = sorted(found)
+            return ids
+
+        nodes = list(files)
+        import_edges: list[list[int]] = [[] for _ in files]
+        internal_edges: list[list[int]] = [[] for _ in files]
+        for path, modules in imports_by_file.items():
+            if not path:
+                continue
+            source = node_ids[path]
+            cycle_targets: set[int] = set()
+            internal_targets: set[int] = set()
+            for module in modules:
+                targets = resolve(module)
+                if targets:
+                    cycle_targets.update(targets)
+                    if not module.startswith("."):
+                        internal_targets.update(t for t in targets if t != source)
+                    continue
+                # Unresolved: path-like pseudo node, as reported in cycles
+                pseudo = module.replace(".", "/")
+                pseudo_id = node_ids.get(pseudo)
+                if pseudo_id is None:
+                    pseudo_id = node_ids[pseudo] = len(nodes)
+                    nodes.append(pseudo)
+                    import_edges.append([])
+                cycle_targets.add(pseudo_id)
+            import_edges[source] = sorted(cycle_targets)
+            internal_edges[source] = sorted(internal_targets)
+
+        internal = _to_csr(internal_edges, len(files))
+        graph = cls(
+            nodes=nodes,
+            file_count=len(files),
+            imports=_to_csr(import_edges, len(nodes)),
+            internal=internal,
+            reverse=_transpose(internal, len(files)),
+            alias_index=alias_index,
+        )
+        graph._node_ids = node_ids
+        return graph
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def files(self) -> list[str]:
+        """Observed file paths (node IDs ``0 .. file_count - 1``)."""
+        return self.nodes[: self.file_count]
+
+    def node_id(self, path: str) -> int | None:
+        if self._node_ids is None:
+            self._node_ids = {path: idx for idx, path in enumerate(self.nodes)}
+        return self._node_ids.get(path)
+
+    def successors(self, node: int, adjacency: Adjacency | None = None) -> array:
+        offsets, targets = adjacency if adjacency is not None else self.imports
+        return targets[offsets[node] : offsets[node + 1]]
+
+    def dependents(self, node: int) -> array:
+        """Files that import ``node`` (internal edges only)."""
+        return self.successors(node, self.reverse)
+
+    def in_degree(self, node: int) -> int:
+        offsets = self.reverse[0]
+        return offsets[node + 1] - offsets[node]
+
+    def out_degree(self, node: int) -> int:
+        offsets = self.internal[0]
+        return offsets[node + 1] - offsets[node]
+
+    @property
+    def internal_edge_count(self) -> int:
+        return len(self.internal[1])
+
+    @property
+    def alias_index(self) -> Any:
+        """Alias -> file IDs (a dict when built, a sorted table when loaded)."""
+        if self._alias_index is None:
+            loader, self._alias_loader = self._alias_loader, None
+            self._alias_index = loader() if loader is not None else {}
+        return self._alias_index
+
+    def resolve(self, module: str) -> set[int]:
+        """File IDs an imported module string resolves to."""
+        aliases = self.alias_index
+        found: set[int] = set()
+        for key in resolution_keys(module):
+            found.update(aliases.get(key, ()))
+        return found
+
+    def impact_layers(self, sources: Iterable[int], max_depth: int) -> list[list[int]]:
+        """Breadth-first dependents of ``sources``, one list per depth."""
+        offsets, targets = self.reverse
+        visited = set(sources)
+        frontier = list(visited)
+        layers: list[list[int]] = []
+        for _ in range(max_depth):
+            next_frontier: list[int] = []
+            for node in frontier:
+                for dependent in targets[offsets[node] : offsets[node + 1]]:
+                    if dependent not in visited:
+                        visited.add(dependent)
+                        next_frontier.append(dependent)
+            layers.append(next_frontier)
+            frontier = next_frontier
+            if not frontier:
+                break
+        return layers
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path | str, key: str) -> None:
+        """Write the graph to ``path`` atomically (temp file + rename)."""
+        alias_names = sorted(self.alias_index)
+        alias_csr = _to_csr([self.alias_index[name] for name in alias_names], len(alias_names))
+        sections: list[tuple[str, bytes, str | None]] = [
+            ("nodes", "\0".join(self.nodes).encode("utf-8"), None),
+            ("imports.offsets", self.imports[0].tobytes(), self.imports[0].typecode),
+            ("imports.targets", self.imports[1].tobytes(), self.imports[1].typecode),
+            ("internal.offsets", self.internal[0].tobytes(), self.internal[0].typecode),
+            ("internal.targets", self.internal[1].tobytes(), self.internal[1].typecode),
+            ("reverse.offsets", self.reverse[0].tobytes(), self.reverse[0].typecode),
+            ("reverse.targets", self.reverse[1].tobytes(), self.reverse[1].typecode),
+            ("aliases.names", "\0".join(alias_names).encode("utf-8"), None),
+            ("aliases.offsets", alias_csr[0].tobytes(), alias_csr[0].typecode),
+            ("aliases.targets", alias_csr[1].tobytes(), alias_csr[1].typecode),
+        ]
+
+        layout: dict[str, list[Any]] = {}
+        offset = 0
+        for name, data, typecode in sections:
+            layout[name] = [offset, len(data), typecode]
+            offset += len(data)
+        header = json.dumps(
+            {
+                "format": GRAPH_FORMAT,
+                "key": key,
+                "byteorder": sys.byteorder,
+                "nodes": len(self.nodes),
+                "files": self.file_count,
+                "aliases": len(alias_names),
+                "sections": layout,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(_MAGIC)
+                handle.write(_HEADER_LEN.pack(len(header)))
+                handle.write(header)
+                for _, data, _ in sections:
+                    handle.write(data)
+            os.replace(temp_name, path)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load(cls, path: Path | str, key: str | None = None) -> DependencyGraph | None:
+        """
+        Load a persisted graph, or None if missing, corrupt or built from a
+        different observation set than ``key``.
+        """
+        try:
+            blob = Path(path).read_bytes()
+        except OSError:
+            return None
+        if not blob.startswith(_MAGIC):
+            return None
+        try:
+            start = len(_MAGIC) + _HEADER_LEN.size
+            (header_len,) = _HEADER_LEN.unpack_from(blob, len(_MAGIC))
+            header = json.loads(blob[start : start + header_len])
+            if header.get("format") != GRAPH_FORMAT:
+                return None
+            if key is not None and header.get("key") != key:
+                return None
+            base = start + header_len
+            layout = header["sections"]
+            swap = header.get("byteorder") != sys.byteorder
+
+            def raw(name: str) -> bytes:
+                offset, length, _ = layout[name]
+                if base + offset + length > len(blob):
+                    raise ValueError(f"truncated section {name}")
+                return blob[base + offset : base + offset + length]
+
+            def numbers(name: str) -> array:
+                values = array(layout[name][2])
+                values.frombytes(raw(name))
+                if swap:
+                    values.byteswap()
+                return values
+
+            def split(name: str) -> list[str]:
+                data = raw(name)
+                return data.decode("utf-8").split("\0") if data else []
+
+            nodes = split("nodes")
+            if len(nodes) != header["nodes"]:
+                return None
+            imports = (numbers("imports.offsets"), numbers("imports.targets"))
+            internal = (numbers("internal.offsets"), numbers("internal.targets"))
+            reverse = (numbers("reverse.offsets"), numbers("reverse.targets"))
+            alias_csr = (numbers("aliases.offsets"), numbers("aliases.targets"))
+            alias_names = raw("aliases.names")
+        except (KeyError, ValueError, TypeError, struct.error):
+            return None
+
+        def load_aliases() -> _AliasTable:
+            names = alias_names.decode("utf-8").split("\0") if alias_names else []
+            return _AliasTable(names, alias_csr)
+
+        return cls(
+            nodes=nodes,
+            file_count=int(header["files"]),
+            imports=imports,
+            internal=internal,
+            reverse=reverse,
+            alias_loader=load_aliases,
+        )
+
+
+class _AliasTable:
+    """
+    Read-only alias -> file IDs mapping over the persisted sorted name list.
+
+    Lookups bisect the names instead of materializing a dict with one list
+    per alias, which would dominate load time on large graphs.
+    """
+
+    def __init__(self, names: list[str], csr: Adjacency) -> None:
+        self._names = names
+        self._offsets, self._targets = csr
+
+    def get(self, alias: str, default: Any = None) -> Any:
+        idx = bisect_left(self._names, alias)
+        if idx == len(self._names) or self._names[idx] != alias:
+            return default
+        return self._targets[self._offsets[idx] : self._offsets[idx + 1]].tolist()
+
+    def __contains__(self, alias: object) -> bool:
+        return isinstance(alias, str) and self.get(alias) is not None
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __getitem__(self, alias: str) -> list[int]:
+        ids = self.get(alias)
+        if ids is None:
+            raise KeyError(alias)
+        return ids
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+def load_or_build(
+    path: Path | str, key: str, observations: Iterable[dict[str, Any]]
+) -> DependencyGraph:
+    """
+    Load the graph persisted at ``path`` for observation set ``key``, or
+    build it from ``observations`` and persist it for the next question.
+    """
+    graph = DependencyGraph.load(path, key)
+    if graph is not None:
+        return graph
+    graph = DependencyGraph.from_observations(observations)
+    try:
+        graph.save(path, key)
+    except OSError:
+        # Read-only storage: answer from the in-memory graph
+        pass
+    return graph
+
+
+def _to_csr(rows: list[list[int]], node_count: int) -> Adjacency:
+    offsets = array("q", [0])
+    targets = array("I")
+    for row in rows[:node_count]:
+        targets.extend(row)
+        offsets.append(len(targets))
+    while len(offsets) < node_count + 1:
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+def _transpose(adjacency: Adjacency, node_count: int) -> Adjacency:
+    offsets, targets = adjacency
+    rows: list[list[int]] = [[] for _ in range(node_count)]
+    for source in range(node_count):
+        for target in targets[offsets[source] : offsets[source + 1]]:
+            rows[target].append(source)
+    return _to_csr(rows, node_count)
+
+
+__all__ = [
+    "DependencyGraph",
+    "load_or_build",
+    "module_aliases_for_file",
+]
@@ -122,6 +122,9 @@ class StructureAnalyzer:
         ...
     """
 
+    OBSERVATION_TYPES: frozenset[str] | None = None
+    """Observation types this analyzer reads; None = all (summaries count every type)."""
+
     # Class-level constants for formatting
     _SECTION_SEPARATOR_LENGTH: int = 50
     """Length of ASCII separator lines in output."""
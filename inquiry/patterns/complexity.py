@@ -15,6 +15,7 @@ from typing import Any
 
 # Import from observations layer (allowed per architecture)
 from observations.eyes.export_sight import ExportSight
+from observations.eyes.parse_cache import parse_source
 from observations.record.snapshot import CodeSnapshot
 
 
@@ -190,7 +191,7 @@ class ComplexityCalculator:
             FileComplexity object if successful, None if parsing failed.
         """
         try:
-            tree = ast.parse(source_code, filename=str(file_path))
+            tree = parse_source(source_code, file_path)
             visitor = ASTComplexityVisitor()
             visitor.visit(tree)
             return visitor.get_complexity_metrics(file_path)
@@ -368,7 +369,7 @@ def calculate_complexity_pattern(
 
         try:
             # Parse and analyze
-            tree = ast.parse(source_code, filename=str(file_path))
+            tree = parse_source(source_code, file_path)
             visitor = ASTComplexityVisitor()
             visitor.visit(tree)
 
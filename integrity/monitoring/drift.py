@@ -12,8 +12,6 @@ Constitutional Constraints:
     Article 19: Backward Truth Compatibility - New versions must not invalidate previous observations
 """
 
-import hashlib
-import json
 import threading
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -27,6 +25,17 @@ from typing import Any
 from core.context import RuntimeContext
 
 # Observations imports
+from observations.record.digests import (
+    DigestTable,
+    build_digest_table,
+    build_observations_digest_table,
+    diff_digest_tables,
+    find_snapshots_by_input_hash,
+    iter_keyed_observations,
+    load_digest_table,
+    observation_digest,
+    snapshot_input_hash,
+)
 from observations.record.utils import load_snapshot
 from storage.atomic import atomic_write_json_compatible
 
@@ -194,7 +203,7 @@ class DriftMonitor:
 
         # Cache for performance
         self._snapshot_cache: dict[str, dict[str, Any]] = {}
-        self._hash_cache: dict[str, str] = {}
+        self._digest_cache: dict[str, DigestTable] = {}
 
     def _generate_detection_id(self) -> str:
         """Generate unique detection ID."""
@@ -202,6 +211,13 @@ class DriftMonitor:
             self._detection_id_counter += 1
             return f"DRIFT-{self.context.investigation_id}-{self._detection_id_counter:08d}"
 
+    def _snapshot_path(self, version: str) -> Path | None:
+        """Path of the snapshot file for a version, if it exists."""
+        for path in get_snapshot_paths(self.context.investigation_id):
+            if path.stem == version:
+                return path
+        return None
+
     def _load_snapshot(self, version: str) -> dict[str, Any] | None:
         """
         Load snapshot with caching.
@@ -216,17 +232,16 @@ class DriftMonitor:
             return self._snapshot_cache[version]
 
         try:
-            snapshot_paths = get_snapshot_paths(self.context.investigation_id)
-            for path in snapshot_paths:
-                if path.stem == version:
-                    snapshot_obj = load_snapshot(path)
-                    snapshot_dict = (
-                        snapshot_obj.to_dict()
-                        if hasattr(snapshot_obj, "to_dict")
-                        else snapshot_obj
-                    )
-                    self._snapshot_cache[version] = snapshot_dict
-                    return snapshot_dict
+            path = self._snapshot_path(version)
+            if path is not None:
+                snapshot_obj = load_snapshot(path)
+                snapshot_dict = (
+                    snapshot_obj.to_dict()
+                    if hasattr(snapshot_obj, "to_dict")
+                    else snapshot_obj
+                )
+                self._snapshot_cache[version] = snapshot_dict
+                return snapshot_dict
         except Exception as e:
             # Record failure but don't crash
             self.record_drift(
@@ -240,6 +255,30 @@ class DriftMonitor:
 
         return None
 
+    def _load_digest_table(self, version: str) -> DigestTable | None:
+        """
+        Load a snapshot's per-observation digest table with caching.
+
+        Snapshots saved before digest tables existed are digested in memory
+        from the full snapshot instead.
+        """
+        if version in self._digest_cache:
+            return self._digest_cache[version]
+
+        path = self._snapshot_path(version)
+        if path is None:
+            return None
+
+        table = load_digest_table(path)
+        if table is None:
+            snapshot = self._load_snapshot(version)
+            if snapshot is None:
+                return None
+            table = build_digest_table(snapshot)
+
+        self._digest_cache[version] = table
+        return table
+
     def _compute_observation_hash(self, observation: dict[str, Any]) -> str:
         """
         Compute deterministic hash of observation.
@@ -250,26 +289,7 @@ class DriftMonitor:
         Returns:
             SHA-256 hash as hex string
         """
-        # Create cache key from observation ID and content
-        cache_key = (
-            f"{observation.get('id', '')}:{json.dumps(observation, sort_keys=True)}"
-        )
-
-        if cache_key in self._hash_cache:
-            return self._hash_cache[cache_key]
-
-        # Use the system's integrity hash function
-        try:
-            from observations.record.integrity import compute_dict_hash
-
-            obs_hash = compute_dict_hash(observation)
-        except Exception:
-            # Fallback: compute hash locally
-            content = json.dumps(observation, sort_keys=True).encode("utf-8")
-            obs_hash = hashlib.sha256(content).hexdigest()
-
-        self._hash_cache[cache_key] = obs_hash
-        return obs_hash
+        return observation_digest(observation)
 
     def record_drift(
         self,
@@ -348,17 +368,21 @@ class DriftMonitor:
         Returns:
             List of drift detections found
         """
-        snap1 = self._load_snapshot(version1)
-        snap2 = self._load_snapshot(version2)
-
-        if not snap1 or not snap2:
-            return []
-
         detections = []
 
         if method == DriftDetectionMethod.HASH_COMPARISON:
-            detections.extend(self._compare_by_hash(snap1, snap2, version1, version2))
+            table1 = self._load_digest_table(version1)
+            table2 = self._load_digest_table(version2)
+            if table1 is None or table2 is None:
+                return []
+            detections.extend(
+                self._compare_by_digest(table1, table2, version1, version2)
+            )
         elif method == DriftDetectionMethod.CONTENT_COMPARISON:
+            snap1 = self._load_snapshot(version1)
+            snap2 = self._load_snapshot(version2)
+            if not snap1 or not snap2:
+                return []
             detections.extend(
                 self._compare_by_content(snap1, snap2, version1, version2)
             )
@@ -384,16 +408,44 @@ class DriftMonitor:
 
         Highest certainty method for detecting exact changes.
         """
-        detections = []
+        return self._compare_by_digest(
+            build_digest_table(snap1),
+            build_digest_table(snap2),
+            version1,
+            version2,
+            bodies=(snap1, snap2),
+        )
 
-        # Extract observations
-        obs1 = {o.get("id"): o for o in snap1.get("observations", []) if o.get("id")}
-        obs2 = {o.get("id"): o for o in snap2.get("observations", []) if o.get("id")}
+    def _compare_by_digest(
+        self,
+        table1: DigestTable,
+        table2: DigestTable,
+        version1: str,
+        version2: str,
+        bodies: tuple[dict[str, Any], dict[str, Any]] | None = None,
+    ) -> list[DriftDetection]:
+        """
+        Compare snapshots by a sorted merge of their digest tables.
 
-        all_ids = set(obs1.keys()) | set(obs2.keys())
+        Full observation bodies are read only when some observation
+        changed, and only for the changed keys.
+        """
+        detections = []
+        changes = list(diff_digest_tables(table1, table2))
+
+        changed_keys = {key for key, hash1, hash2 in changes if hash1 and hash2}
+        observations1: dict[str, Any] = {}
+        observations2: dict[str, Any] = {}
+        if changed_keys:
+            snap1, snap2 = bodies or (
+                self._load_snapshot(version1) or {},
+                self._load_snapshot(version2) or {},
+            )
+            observations1 = _observations_for_keys(snap1, changed_keys)
+            observations2 = _observations_for_keys(snap2, changed_keys)
 
-        for obs_id in all_ids:
-            if obs_id in obs1 and obs_id not in obs2:
+        for obs_id, hash1, hash2 in changes:
+            if hash2 is None:
                 # Observation removed
                 detections.append(
                     self.record_drift(
@@ -413,7 +465,7 @@ class DriftMonitor:
                     )
                 )
 
-            elif obs_id not in obs1 and obs_id in obs2:
+            elif hash1 is None:
                 # Observation added
                 detections.append(
                     self.record_drift(
@@ -434,36 +486,33 @@ class DriftMonitor:
                 )
 
             else:
-                # Observation in both - compare hashes
-                hash1 = self._compute_observation_hash(obs1[obs_id])
-                hash2 = self._compute_observation_hash(obs2[obs_id])
-
-                if hash1 != hash2:
-                    # Observation changed
-                    detections.append(
-                        self.record_drift(
-                            drift_type=DriftType.OBSERVATION_CHANGED,
-                            severity=DriftSeverity.MAJOR,
-                            method=DriftDetectionMethod.HASH_COMPARISON,
-                            certainty=1.0,
-                            description=f"Observation {obs_id} changed between snapshots",
-                            observation_id=obs_id,
-                            snapshot_version1=version1,
-                            snapshot_version2=version2,
-                            evidence={
-                                "observation_id": obs_id,
-                                "hash1": hash1,
-                                "hash2": hash2,
-                                "content_diff": self._compute_content_diff(
-                                    obs1[obs_id], obs2[obs_id]
-                                ),
-                            },
-                        )
+                # Observation in both with different digests
+                evidence: dict[str, Any] = {
+                    "observation_id": obs_id,
+                    "hash1": hash1,
+                    "hash2": hash2,
+                }
+                obs1 = observations1.get(obs_id)
+                obs2 = observations2.get(obs_id)
+                if isinstance(obs1, dict) and isinstance(obs2, dict):
+                    evidence["content_diff"] = self._compute_content_diff(obs1, obs2)
+                detections.append(
+                    self.record_drift(
+                        drift_type=DriftType.OBSERVATION_CHANGED,
+                        severity=DriftSeverity.MAJOR,
+                        method=DriftDetectionMethod.HASH_COMPARISON,
+                        certainty=1.0,
+                        description=f"Observation {obs_id} changed between snapshots",
+                        observation_id=obs_id,
+                        snapshot_version1=version1,
+                        snapshot_version2=version2,
+                        evidence=evidence,
                     )
+                )
 
         # Check for reproducibility failure
-        if snap1.get("input_hash") and snap2.get("input_hash"):
-            if snap1["input_hash"] == snap2["input_hash"] and detections:
+        if table1.input_hash and table2.input_hash:
+            if table1.input_hash == table2.input_hash and detections:
                 # Same input produced different observations!
                 detections.append(
                     self.record_drift(
@@ -475,7 +524,7 @@ class DriftMonitor:
                         snapshot_version1=version1,
                         snapshot_version2=version2,
                         evidence={
-                            "input_hash": snap1["input_hash"],
+                            "input_hash": table1.input_hash,
                             "change_count": len(detections),
                         },
                     )
@@ -593,43 +642,42 @@ class DriftMonitor:
 
         # Find historical snapshots with same input hash
         try:
-            snapshot_paths = get_snapshot_paths(self.context.investigation_id)
+            matches = self._snapshots_for_input(input_hash)
+            # Keyed and normalized the same way as the saved snapshots
+            current = build_observations_digest_table(current_observations, input_hash)
 
-            for path in snapshot_paths:
+            for path in matches:
                 try:
-                    snapshot_obj = load_snapshot(path)
-                    snapshot = (
-                        snapshot_obj.to_dict()
-                        if hasattr(snapshot_obj, "to_dict")
-                        else snapshot_obj
-                    )
-                    if snapshot.get("input_hash") == input_hash:
-                        # Found matching historical snapshot
-                        historical_obs = {
-                            o.get("id"): o for o in snapshot.get("observations", [])
-                        }
-                        current_obs = {o.get("id"): o for o in current_observations}
-
-                        # Compare observation sets
-                        if historical_obs != current_obs:
-                            detections.append(
-                                self.record_drift(
-                                    drift_type=DriftType.REPRODUCIBILITY_FAILED,
-                                    severity=DriftSeverity.CRITICAL,
-                                    method=DriftDetectionMethod.HASH_COMPARISON,
-                                    certainty=0.95,
-                                    description="Reproducibility failure: same input produced different observations",
-                                    snapshot_version1=path.stem,
-                                    snapshot_version2="current",
-                                    evidence={
-                                        "input_hash": input_hash,
-                                        "historical_count": len(historical_obs),
-                                        "current_count": len(current_obs),
-                                        "matching_snapshot": path.stem,
-                                    },
-                                )
+                    historical = load_digest_table(path)
+                    if historical is None:
+                        historical = build_digest_table(load_snapshot(path).to_dict())
+
+                    # Compare observation sets digest by digest
+                    changes = list(diff_digest_tables(historical, current))
+                    if changes:
+                        detections.append(
+                            self.record_drift(
+                                drift_type=DriftType.REPRODUCIBILITY_FAILED,
+                                severity=DriftSeverity.CRITICAL,
+                                method=DriftDetectionMethod.HASH_COMPARISON,
+                                certainty=0.95,
+                                description=(
+                                    "Reproducibility failure: same input "
+                                    "produced different observations"
+                                ),
+                                snapshot_version1=path.stem,
+                                snapshot_version2="current",
+                                evidence={
+                                    "input_hash": input_hash,
+                                    "historical_count": len(historical),
+                                    "current_count": len(current),
+                                    "matching_snapshot": path.stem,
+                                    "changed_count": len(changes),
+                                    "changed_ids": [key for key, _, _ in changes[:20]],
+                                },
                             )
-                        break
+                        )
+                    break
                 except Exception:
                     continue
         except Exception as e:
@@ -647,6 +695,32 @@ class DriftMonitor:
 
         return detections
 
+    def _snapshots_for_input(self, input_hash: str) -> list[Path]:
+        """
+        Snapshots taken from ``input_hash``, via each directory's input index.
+
+        Directories saved before the index existed are scanned, reading
+        digest tables where present and full snapshots otherwise.
+        """
+        snapshot_paths = get_snapshot_paths(self.context.investigation_id)
+        matches: list[Path] = []
+        for directory in sorted({path.parent for path in snapshot_paths}):
+            indexed = find_snapshots_by_input_hash(directory, input_hash)
+            if indexed is not None:
+                matches.extend(indexed)
+                continue
+            for path in snapshot_paths:
+                if path.parent != directory:
+                    continue
+                table = load_digest_table(path)
+                if table is not None:
+                    path_input_hash = table.input_hash
+                else:
+                    path_input_hash = snapshot_input_hash(load_snapshot(path).to_dict())
+                if path_input_hash == input_hash:
+                    matches.append(path)
+        return matches
+
     def detect_anchor_shift(self) -> list[DriftDetection]:
         """
         Detect shifts in stable reference points (anchors).
@@ -886,11 +960,22 @@ class DriftMonitor:
             count = len(self._detections)
             self._detections.clear()
             self._snapshot_cache.clear()
-            self._hash_cache.clear()
+            self._digest_cache.clear()
 
         return count
 
 
+def _observations_for_keys(
+    snapshot: dict[str, Any], keys: set[str]
+) -> dict[str, Any]:
+    """Bodies of the observations with the given digest-table keys."""
+    return {
+        key: observation
+        for key, observation in iter_keyed_observations(snapshot)
+        if key in keys
+    }
+
+
 # Global drift monitor instance (thread-safe singleton pattern)
 _DRIFT_MONITOR: DriftMonitor | None = None
 _MONITOR_LOCK: threading.RLock = threading.RLock()
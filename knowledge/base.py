@@ -11,7 +11,7 @@ from knowledge.history import HistoryService
 from knowledge.knowledge_graph import KnowledgeGraphService
 from knowledge.recommendations import RecommendationService
 from storage.atomic import atomic_write_json_compatible
-from storage.knowledge_storage import KnowledgeStorage
+from storage.knowledge_storage import open_knowledge_storage
 
 
 class KnowledgeBase:
@@ -23,7 +23,7 @@ class KnowledgeBase:
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.trends_path = self.base_path / "pattern_trends.json"
         self.similarity_path = self.base_path / "similarity_index.json"
-        self.storage = KnowledgeStorage(storage_root=self.storage_root)
+        self.storage = open_knowledge_storage(self.storage_root)
         self.history_service = HistoryService(storage=self.storage)
         self.graph_service = KnowledgeGraphService(storage=self.storage)
         self.recommendation_service = RecommendationService(storage=self.storage)
@@ -192,26 +192,10 @@ class KnowledgeBase:
 
     def find_similar_codebases(self, investigation_id: str) -> list[dict[str, Any]]:
         """Compute Jaccard similarity from stored pattern references."""
-        sessions_dir = self.storage_root / "sessions"
-        if not sessions_dir.exists():
+        sessions = self.storage.session_pattern_sets()
+        if not sessions and not (self.storage_root / "sessions").exists():
             return []
-
-        target_patterns: set[str] = set()
-        sessions: dict[str, set[str]] = {}
-
-        for session_file in sessions_dir.glob("*.session.json"):
-            try:
-                data = json.loads(session_file.read_text(encoding="utf-8"))
-            except (OSError, json.JSONDecodeError):
-                continue
-
-            session_id = data.get("id")
-            pattern_ids = set(data.get("pattern_ids", []) or [])
-            if not session_id:
-                continue
-            sessions[str(session_id)] = pattern_ids
-            if str(session_id) == investigation_id:
-                target_patterns = pattern_ids
+        target_patterns = sessions.get(investigation_id, set())
 
         results: list[dict[str, Any]] = []
         for session_id, pattern_ids in sessions.items():
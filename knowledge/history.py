@@ -10,7 +10,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from storage.knowledge_storage import KnowledgeStorage
+from storage.knowledge_storage import KnowledgeStorage, open_knowledge_storage
 
 
 class HistoryService:
@@ -21,7 +21,7 @@ class HistoryService:
         storage: KnowledgeStorage | None = None,
         storage_root: Path | str | None = None,
     ) -> None:
-        self.storage = storage or KnowledgeStorage(storage_root=storage_root)
+        self.storage = storage or open_knowledge_storage(storage_root)
 
     def record_event(
         self,
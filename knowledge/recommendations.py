@@ -11,7 +11,7 @@ from typing import Any
 
 from knowledge.history import HistoryService
 from knowledge.knowledge_graph import KnowledgeGraphService
-from storage.knowledge_storage import KnowledgeStorage
+from storage.knowledge_storage import KnowledgeStorage, open_knowledge_storage
 
 
 class RecommendationService:
@@ -22,7 +22,7 @@ class RecommendationService:
         storage: KnowledgeStorage | None = None,
         storage_root: Path | str | None = None,
     ) -> None:
-        self.storage = storage or KnowledgeStorage(storage_root=storage_root)
+        self.storage = storage or open_knowledge_storage(storage_root)
         self.history = HistoryService(storage=self.storage)
         self.graph = KnowledgeGraphService(storage=self.storage)
 
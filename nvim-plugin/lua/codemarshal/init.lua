@@ -3,6 +3,8 @@ local M = {}
 local defaults = {
   cli_path = "codemarshal",
   lint_on_save = true,
+  use_server = true,
+  server_timeout_ms = 60000,
 }
 
 local namespace = vim.api.nvim_create_namespace("codemarshal")
@@ -14,8 +16,112 @@ local function normalize_path(path)
   return path
 end
 
-local function run_command(args)
-  local cmd = table.concat(args, " ")
+-- One warm `codemarshal serve` process answering JSON-RPC, one message per line
+local server = {
+  job = nil,
+  next_id = 0,
+  partial = "",
+  responses = {},
+  answered = false,
+  unavailable = false,
+}
+
+local function on_server_stdout(_, data)
+  -- data[1] continues the previous chunk's last (partial) line
+  data[1] = server.partial .. data[1]
+  server.partial = table.remove(data)
+  for _, line in ipairs(data) do
+    if line ~= "" then
+      local ok, message = pcall(vim.json.decode, line)
+      if ok and type(message) == "table" then
+        server.answered = true
+        if message.id ~= nil then
+          server.responses[message.id] = message
+        end
+      end
+    end
+  end
+end
+
+local function start_server(cli_path)
+  if server.job then
+    return server.job
+  end
+  server.answered = false
+  local job = vim.fn.jobstart({ cli_path, "serve" }, {
+    cwd = vim.fn.getcwd(),
+    on_stdout = on_server_stdout,
+    on_exit = function()
+      server.job = nil
+      server.partial = ""
+    end,
+  })
+  if job <= 0 then
+    server.unavailable = true
+    return nil
+  end
+  server.job = job
+  return job
+end
+
+local function stop_server()
+  if server.job then
+    vim.fn.chansend(server.job, vim.json.encode({ jsonrpc = "2.0", method = "exit" }) .. "\n")
+    vim.fn.jobstop(server.job)
+    server.job = nil
+  end
+end
+
+-- Returns the response, or nil and why: "unreachable" (nothing reached the
+-- server), "timeout" or "stopped" (the request may still have run)
+local function server_request(config, method, params)
+  local job = start_server(config.cli_path)
+  if not job then
+    return nil, "unreachable"
+  end
+  server.next_id = server.next_id + 1
+  local id = server.next_id
+  vim.fn.chansend(
+    job,
+    vim.json.encode({ jsonrpc = "2.0", id = id, method = method, params = params }) .. "\n"
+  )
+  vim.wait(config.server_timeout_ms, function()
+    return server.responses[id] ~= nil or server.job == nil
+  end, 10)
+  local response = server.responses[id]
+  server.responses[id] = nil
+  if not response then
+    if server.job then
+      vim.fn.chansend(
+        server.job,
+        vim.json.encode({ jsonrpc = "2.0", method = "$/cancelRequest", params = { id = id } }) .. "\n"
+      )
+      return nil, "timeout"
+    elseif not server.answered then
+      -- Exited before any answer: a CLI without `serve`
+      server.unavailable = true
+      return nil, "unreachable"
+    end
+    return nil, "stopped"
+  end
+  return response
+end
+
+local function run_command(config, args)
+  if config.use_server and not server.unavailable then
+    local response, failure = server_request(config, "run", { args = args })
+    if response and response.result then
+      return response.result.stdout, response.result.exit_code
+    end
+    -- Only a request that never reached the server is re-run by spawning
+    -- the CLI; otherwise the command could run twice
+    if failure ~= "unreachable" then
+      local message = failure or (response.error and response.error.message) or "request failed"
+      vim.notify("CodeMarshal server: " .. message, vim.log.levels.WARN)
+      return "", 1
+    end
+  end
+  local cmd = table.concat(vim.list_extend({ config.cli_path }, args), " ")
   local output = vim.fn.system(cmd)
   return output, vim.v.shell_error
 end
@@ -42,8 +148,7 @@ local function apply_diagnostics(bufnr, matches)
 end
 
 local function scan_file(config, file_path)
-  local output, code = run_command({
-    config.cli_path,
+  local output, code = run_command(config, {
     "pattern",
     "scan",
     file_path,
@@ -76,8 +181,7 @@ local function show_patterns(config)
     vim.notify("CodeMarshal: no file selected", vim.log.levels.WARN)
     return
   end
-  local output, _ = run_command({
-    config.cli_path,
+  local output, _ = run_command(config, {
     "pattern",
     "scan",
     file_path,
@@ -119,8 +223,7 @@ function M.setup(opts)
       vim.notify("CodeMarshal: no target selected", vim.log.levels.WARN)
       return
     end
-    run_command({
-      config.cli_path,
+    run_command(config, {
       "investigate",
       target,
       "--scope=module",
@@ -135,6 +238,8 @@ function M.setup(opts)
   vim.keymap.set("n", "<leader>ci", ":CodeMarshalInvestigate<CR>")
   vim.keymap.set("n", "<leader>cp", ":CodeMarshalPatterns<CR>")
 
+  vim.api.nvim_create_autocmd("VimLeavePre", { callback = stop_server })
+
   if config.lint_on_save then
     vim.api.nvim_create_autocmd("BufWritePost", {
       pattern = { "*.py", "*.js", "*.ts", "*.java", "*.go" },
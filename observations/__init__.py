@@ -214,6 +214,7 @@ class ObservationSystem:
         description: str = "",
         include_eyes: list[str] | None = None,
         exclude_eyes: list[str] | None = None,
+        previous: Snapshot | None = None,
     ) -> Snapshot:
         """
         Create an immutable snapshot of observations.
@@ -224,6 +225,8 @@ class ObservationSystem:
             description: Description of what this snapshot captures
             include_eyes: Specific eyes to include (None for all)
             exclude_eyes: Eyes to exclude
+            previous: Earlier snapshot of the target, whose anchors are
+                reused for unchanged files
 
         Returns:
             Snapshot containing all observations
@@ -247,6 +250,7 @@ class ObservationSystem:
             composite=composite,
             name=name or f"snapshot_{path.name}",
             description=description,
+            previous=previous,
         )
 
     def _select_eye_for_target(self, target: Path) -> str:
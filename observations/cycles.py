@@ -0,0 +1,203 @@
+"""
+cycles.py - Strongly connected components for dependency graphs.
+
+Purpose:
+    Shared, non-recursive cycle detection for every dependency graph the
+    system observes (BoundarySight module graphs, ConnectionMapper file
+    graphs). Recursive DFS with per-step path copies hit the interpreter's
+    recursion limit on deep import chains and went quadratic on large ones.
+
+Algorithm:
+    Tarjan's strongly connected components with an explicit work stack:
+    O(V + E) time, O(V) extra space, no recursion. A component is cyclic
+    when it has more than one node or a self-loop. For each cyclic
+    component a bounded number of representative elementary cycles is
+    extracted by breadth-first search inside the component, starting only
+    from members no earlier cycle covered, so at most that many searches
+    run and reporting stays linear for a fixed bound.
+
+Rules:
+    1. Only reports cycles that exist in the given edges
+    2. Deterministic: components and cycles follow node order
+    3. Works on any hashable node type (paths, module names, integer IDs)
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import TypeVar
+
+Node = TypeVar("Node", bound=Hashable)
+
+DEFAULT_CYCLES_PER_COMPONENT = 3
+
+
+@dataclass(frozen=True)
+class CyclicComponent:
+    """One strongly connected component that contains at least one cycle."""
+
+    nodes: tuple  # Members in traversal-independent (sorted) order
+    cycles: tuple  # Representative cycles; each closes on its first node
+
+    @property
+    def size(self) -> int:
+        return len(self.nodes)
+
+
+def strongly_connected_components(
+    nodes: Iterable[Node], successors: Callable[[Node], Iterable[Node]]
+) -> list[list[Node]]:
+    """
+    Iterative Tarjan SCC.
+
+    Args:
+        nodes: Roots to start from; nodes only reachable through
+            ``successors`` are visited too
+        successors: Returns the outgoing neighbours of a node
+
+    Returns:
+        Components in reverse topological order (sinks first)
+    """
+    index: dict[Node, int] = {}
+    lowlink: dict[Node, int] = {}
+    on_stack: set[Node] = set()
+    stack: list[Node] = []
+    components: list[list[Node]] = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors(root)))]
+
+        while work:
+            node, neighbours = work[-1]
+            descended = False
+            for neighbour in neighbours:
+                if neighbour not in index:
+                    index[neighbour] = lowlink[neighbour] = len(index)
+                    stack.append(neighbour)
+                    on_stack.add(neighbour)
+                    work.append((neighbour, iter(successors(neighbour))))
+                    descended = True
+                    break
+                if neighbour in on_stack and index[neighbour] < lowlink[node]:
+                    lowlink[node] = index[neighbour]
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlink[node] < lowlink[parent]:
+                    lowlink[parent] = lowlink[node]
+            if lowlink[node] == index[node]:
+                component: list[Node] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+def find_cyclic_components(
+    adjacency: Mapping[Node, Iterable[Node]] | None = None,
+    *,
+    nodes: Iterable[Node] | None = None,
+    successors: Callable[[Node], Iterable[Node]] | None = None,
+    max_cycles: int = DEFAULT_CYCLES_PER_COMPONENT,
+    sort_key: Callable[[Node], object] | None = None,
+) -> list[CyclicComponent]:
+    """
+    Report every cyclic component with up to ``max_cycles`` elementary cycles.
+
+    Pass either an ``adjacency`` mapping or ``nodes`` + ``successors``.
+    Components are ordered by size (largest first), then by first member.
+    """
+    if adjacency is not None:
+        nodes = adjacency.keys()
+
+        def successors(node: Node) -> Iterable[Node]:
+            return adjacency.get(node, ())
+
+    if nodes is None or successors is None:
+        raise ValueError("find_cyclic_components needs adjacency or nodes + successors")
+
+    order = sort_key or _default_sort_key
+    found: list[CyclicComponent] = []
+    for component in strongly_connected_components(nodes, successors):
+        members = sorted(component, key=order)
+        if len(members) == 1:
+            only = members[0]
+            if only not in successors(only):
+                continue
+            cycles: tuple = ((only, only),)
+        else:
+            cycles = _representative_cycles(members, successors, max_cycles)
+        found.append(CyclicComponent(nodes=tuple(members), cycles=cycles))
+
+    found.sort(key=lambda comp: (-comp.size, order(comp.nodes[0])))
+    return found
+
+
+def _representative_cycles(
+    members: list[Node],
+    successors: Callable[[Node], Iterable[Node]],
+    max_cycles: int,
+) -> tuple:
+    """
+    Shortest cycle through successive uncovered members, bounded.
+
+    A BFS only starts from a member that no earlier cycle passed through,
+    so every search yields a new cycle and at most ``max_cycles`` searches
+    run per component.
+    """
+    inside = set(members)
+    covered: set[Node] = set()
+    cycles: list[tuple] = []
+
+    for start in members:
+        if len(cycles) >= max_cycles:
+            break
+        if start in covered:
+            continue
+        cycle = _shortest_cycle_through(start, inside, successors)
+        if cycle is None:
+            continue
+        covered.update(cycle)
+        cycles.append(cycle)
+
+    return tuple(cycles)
+
+
+def _shortest_cycle_through(
+    start: Node, inside: set[Node], successors: Callable[[Node], Iterable[Node]]
+) -> tuple | None:
+    """BFS from ``start`` back to itself, staying inside the component."""
+    parents: dict[Node, Node] = {}
+    queue: deque[Node] = deque([start])
+    while queue:
+        node = queue.popleft()
+        for neighbour in successors(node):
+            if neighbour == start:
+                path = [node]
+                while path[-1] != start:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                return (*path, start)
+            if neighbour in inside and neighbour not in parents:
+                parents[neighbour] = node
+                queue.append(neighbour)
+    return None
+
+
+def _default_sort_key(node: object) -> tuple:
+    return (type(node).__name__, node)
@@ -89,6 +89,7 @@ from .javascript_sight import (
     JSImportStatement,
 )
 from .language_detector import LanguageDetection, LanguageDetector
+from .parse_cache import ParseCache, parse_cache_scope
 
 
 @dataclass(frozen=True)
@@ -597,6 +598,9 @@ __all__ = [
     # Language detection
     "LanguageDetector",
     "LanguageDetection",
+    # Shared parse cache
+    "ParseCache",
+    "parse_cache_scope",
     # File sight types
     "DirectoryTree",
     "FileMetadata",
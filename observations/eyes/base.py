@@ -27,6 +27,8 @@ from typing import (
     runtime_checkable,
 )
 
+from .parse_cache import parse_source, read_source_text, source_digest
+
 
 def _make_immutable(obj: Any) -> Any:
     """Recursively convert mutable objects to immutable equivalents."""
@@ -434,9 +436,11 @@ class AbstractEye(abc.ABC):
         # Create input hash
         try:
             if target.is_file():
-                # Hash file content
-                content = target.read_bytes()
-                input_hash = hashlib.sha256(content).hexdigest()
+                # Hash file content (reuses the run's cached read when active)
+                input_hash = source_digest(target)
+                if input_hash is None:
+                    content = target.read_bytes()
+                    input_hash = hashlib.sha256(content).hexdigest()
             elif target.is_dir():
                 # Hash directory structure (simplified)
                 dir_info = f"{target.resolve()}|{target.stat().st_mtime}"
@@ -462,6 +466,23 @@ class AbstractEye(abc.ABC):
             environment_fingerprint=env_hash,
         )
 
+    def _read_source(self, target: Path) -> str:
+        """
+        Read a source file as UTF-8 text.
+
+        Draws from the run's shared parse cache when one is active, so eyes
+        observing the same file share a single read.
+        """
+        return read_source_text(target)
+
+    def _parse_source(self, content: str, source_file: Path) -> Any:
+        """
+        Parse Python source into an AST, sharing one parse per run.
+
+        The returned tree may be shared with other eyes; treat it as read-only.
+        """
+        return parse_source(content, source_file)
+
     def _observe_with_timing(self, target: Path) -> ObservationResult:
         """
         Wrapper around observe() that adds timing and provenance.
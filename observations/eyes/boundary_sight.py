@@ -13,12 +13,13 @@ Rules:
 
 import fnmatch
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import Enum, auto
 from pathlib import Path
 from typing import Any
 
+from ..cycles import find_cyclic_components
 from .base import AbstractEye, ObservationResult
 from .import_sight import ImportObservation, ImportSight, ImportStatement
 
@@ -327,8 +328,8 @@ class BoundarySight(AbstractEye):
 
         # Walk directory tree
         for path in root.rglob("*.py"):
-            # Skip hidden directories and files
-            if any(part.startswith(".") for part in path.parts):
+            # Skip hidden directories and files below the root
+            if any(part.startswith(".") for part in path.relative_to(root).parts):
                 continue
             # Skip __pycache__ and similar
             if "__pycache__" in str(path):
@@ -607,49 +608,34 @@ class BoundarySight(AbstractEye):
         # Detect circular dependencies
         circular_deps = self._find_circular_dependencies(adjacency)
 
-        # Mark circular dependencies in crossings
-        for source, target in circular_deps:
-            source_boundary = module_boundaries.get(source, "UNKNOWN")
-            target_boundary = module_boundaries.get(target, "UNKNOWN")
-
-            # Find and update corresponding crossing
-            for crossing in crossings:
-                if (
-                    crossing.source_module == source
-                    and crossing.target_module == target
-                ):
-                    crossing.severity = BoundarySeverity.CIRCULAR
+        # Mark crossings that are part of a circular dependency
+        circular_edges = set(circular_deps)
+        crossings = [
+            replace(crossing, severity=BoundarySeverity.CIRCULAR)
+            if (crossing.source_module, crossing.target_module) in circular_edges
+            else crossing
+            for crossing in crossings
+        ]
 
         return crossings, circular_deps
 
     def _find_circular_dependencies(
         self, adjacency: dict[str, set[str]]
     ) -> list[tuple[str, str]]:
-        """Find circular dependencies using DFS."""
-        circular: list[tuple[str, str]] = []
-        visited: set[str] = set()
-        recursion_stack: set[str] = set()
-
-        def dfs(node: str, path: list[str]):
-            visited.add(node)
-            recursion_stack.add(node)
-
-            for neighbor in adjacency.get(node, set()):
-                if neighbor in recursion_stack:
-                    # Found a cycle
-                    # Find the edge that closes the cycle
-                    if path:
-                        circular.append((path[-1], neighbor))
-                elif neighbor not in visited:
-                    dfs(neighbor, path + [node])
-
-            recursion_stack.remove(node)
-
-        for node in adjacency.keys():
-            if node not in visited:
-                dfs(node, [])
+        """
+        Find dependency edges that lie on a cycle.
 
-        return circular
+        Uses the shared iterative SCC engine: an edge is circular when both
+        ends are in the same cyclic component. Returned in sorted order.
+        """
+        circular: list[tuple[str, str]] = []
+        for component in find_cyclic_components(adjacency):
+            members = set(component.nodes)
+            for source in component.nodes:
+                for target in sorted(adjacency.get(source, ())):
+                    if target in members:
+                        circular.append((source, target))
+        return sorted(circular)
 
     def _calculate_confidence(
         self, observation: BoundaryObservation, file_count: int
@@ -239,7 +239,7 @@ class ExportSight(AbstractEye):
         timestamp = datetime.now(UTC)
 
         try:
-            content = target.read_text(encoding="utf-8")
+            content = self._read_source(target)
             file_hash = self._compute_hash(content)
 
             # Parse and extract exports
@@ -300,7 +300,7 @@ class ExportSight(AbstractEye):
         errors: list[str] = []
 
         try:
-            tree = ast.parse(content, filename=str(module_path))
+            tree = self._parse_source(content, module_path)
 
             # First pass: find __all__ and top-level definitions
             for node in ast.walk(tree):
@@ -113,7 +113,7 @@ class GoSight(AbstractEye):
         timestamp = datetime.now(UTC)
 
         try:
-            content = target.read_text(encoding="utf-8")
+            content = self._read_source(target)
         except UnicodeDecodeError:
             return ObservationResult(
                 source=str(target),
@@ -124,7 +124,7 @@ class ImportSight(AbstractEye):
         timestamp = datetime.now(UTC)
 
         try:
-            content = target.read_text(encoding="utf-8")
+            content = self._read_source(target)
             file_hash = self._compute_hash(content)
 
             # Parse and extract imports
@@ -179,7 +179,7 @@ class ImportSight(AbstractEye):
         errors: list[str] = []
 
         try:
-            tree = ast.parse(content, filename=str(source_file))
+            tree = self._parse_source(content, source_file)
 
             for node in ast.walk(tree):
                 if isinstance(node, ast.Import):
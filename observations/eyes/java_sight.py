@@ -99,7 +99,7 @@ class JavaSight(AbstractEye):
         timestamp = datetime.now(UTC)
 
         try:
-            content = target.read_text(encoding="utf-8")
+            content = self._read_source(target)
         except UnicodeDecodeError:
             return ObservationResult(
                 source=str(target),
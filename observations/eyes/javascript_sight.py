@@ -142,7 +142,7 @@ class JavaScriptSight(AbstractEye):
         timestamp = datetime.now(UTC)
 
         try:
-            content = target.read_text(encoding="utf-8")
+            content = self._read_source(target)
         except UnicodeDecodeError:
             return ObservationResult(
                 source=str(target),
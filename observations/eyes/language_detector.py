@@ -11,6 +11,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from .parse_cache import read_source_text
+
 
 @dataclass(frozen=True)
 class LanguageDetection:
@@ -81,7 +83,7 @@ class LanguageDetector:
 
         extension = path.suffix.lower()
         try:
-            content = path.read_text(encoding="utf-8")
+            content = read_source_text(path)
         except Exception:
             content = ""
 
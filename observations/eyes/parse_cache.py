@@ -0,0 +1,292 @@
+"""
+parse_cache.py - Shared per-run source and AST cache for eyes
+
+Purpose:
+Several eyes look at the same Python file during one observation run
+(ImportSight, ExportSight, BoundarySight via its nested ImportSight, the
+language detector, complexity metrics). Without sharing, each of them reads
+the file and runs ``ast.parse`` again. This module lets them share one read
+and one parse per file for the duration of a run.
+
+Design:
+- Source entries are keyed by path and validated by (mtime_ns, size); a file
+  whose stat changed is re-read.
+- Parsed trees are keyed by the SHA-256 of the decoded text, so a touched but
+  unchanged file (or two identical files) reuse the same tree.
+- Both layers are bounded LRUs. Hit/miss counters are exposed via ``stats()``.
+- The cache is only consulted while a ``parse_cache_scope`` is active. Outside
+  a scope, eyes read and parse directly, exactly as before.
+
+Cached trees are shared between eyes and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+DEFAULT_MAX_SOURCES = 512
+DEFAULT_MAX_SOURCE_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_TREES = 256
+
+
+@dataclass
+class SourceEntry:
+    """One file's raw bytes and decoded text, pinned to a stat signature."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    data: bytes
+    digest: str
+    text: str | None = None
+    decode_error: UnicodeDecodeError | None = None
+    _text_digest: str | None = field(default=None, repr=False)
+
+    @property
+    def text_digest(self) -> str:
+        """SHA-256 of the decoded text (the AST cache key)."""
+        if self._text_digest is None:
+            self._text_digest = _text_digest(self.text or "")
+        return self._text_digest
+
+
+def _text_digest(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode like ``Path.read_text(encoding="utf-8")`` (universal newlines)."""
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class ParseCache:
+    """
+    Bounded LRU cache of file sources and parsed Python trees.
+
+    Not thread-safe; each process (and each observation run) gets its own.
+    """
+
+    def __init__(
+        self,
+        max_sources: int = DEFAULT_MAX_SOURCES,
+        max_source_bytes: int = DEFAULT_MAX_SOURCE_BYTES,
+        max_trees: int = DEFAULT_MAX_TREES,
+    ):
+        self.max_sources = max(1, int(max_sources))
+        self.max_source_bytes = max(1, int(max_source_bytes))
+        self.max_trees = max(1, int(max_trees))
+
+        self._sources: OrderedDict[str, SourceEntry] = OrderedDict()
+        self._source_bytes = 0
+        self._trees: OrderedDict[str, ast.AST | SyntaxError] = OrderedDict()
+
+        self.source_hits = 0
+        self.source_misses = 0
+        self.tree_hits = 0
+        self.tree_misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
+
+    def get_source(self, path: Path) -> SourceEntry:
+        """Return the source entry for ``path``, reading it if stale or absent."""
+        stat = path.stat()
+        key = str(path)
+        entry = self._sources.get(key)
+        if (
+            entry is not None
+            and entry.mtime_ns == stat.st_mtime_ns
+            and entry.size == stat.st_size
+        ):
+            self._sources.move_to_end(key)
+            self.source_hits += 1
+            return entry
+
+        self.source_misses += 1
+        data = path.read_bytes()
+        entry = SourceEntry(
+            path=path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            data=data,
+            digest=hashlib.sha256(data).hexdigest(),
+        )
+        try:
+            entry.text = _decode_text(data)
+        except UnicodeDecodeError as e:
+            entry.decode_error = e
+
+        self._store_source(key, entry)
+        return entry
+
+    def read_text(self, path: Path) -> str:
+        """Cached equivalent of ``path.read_text(encoding="utf-8")``."""
+        entry = self.get_source(path)
+        if entry.decode_error is not None:
+            raise entry.decode_error
+        return entry.text or ""
+
+    def _store_source(self, key: str, entry: SourceEntry) -> None:
+        previous = self._sources.pop(key, None)
+        if previous is not None:
+            self._source_bytes -= len(previous.data)
+
+        # Files larger than the whole budget are served but never retained
+        if len(entry.data) > self.max_source_bytes:
+            return
+
+        self._sources[key] = entry
+        self._source_bytes += len(entry.data)
+        while self._sources and (
+            len(self._sources) > self.max_sources
+            or self._source_bytes > self.max_source_bytes
+        ):
+            _, evicted = self._sources.popitem(last=False)
+            self._source_bytes -= len(evicted.data)
+            self.evictions += 1
+
+    # ------------------------------------------------------------------
+    # Trees
+    # ------------------------------------------------------------------
+
+    def parse(self, content: str, path: Path | str = "<unknown>") -> ast.AST:
+        """
+        Cached equivalent of ``ast.parse(content, filename=str(path))``.
+
+        Syntax errors are cached too and re-raised on every lookup.
+        """
+        key = _text_digest(content)
+        cached = self._trees.get(key)
+        if cached is not None:
+            self._trees.move_to_end(key)
+            self.tree_hits += 1
+        else:
+            self.tree_misses += 1
+            try:
+                cached = ast.parse(content, filename=str(path))
+            except SyntaxError as e:
+                cached = e
+            self._trees[key] = cached
+            while len(self._trees) > self.max_trees:
+                self._trees.popitem(last=False)
+                self.evictions += 1
+
+        if isinstance(cached, SyntaxError):
+            raise cached
+        return cached
+
+    # ------------------------------------------------------------------
+    # Housekeeping
+    # ------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """Drop all cached entries (counters are kept)."""
+        self._sources.clear()
+        self._trees.clear()
+        self._source_bytes = 0
+
+    def counters(self) -> dict[str, int]:
+        """Raw hit/miss counters (summable across worker processes)."""
+        return {
+            "source_hits": self.source_hits,
+            "source_misses": self.source_misses,
+            "parse_hits": self.tree_hits,
+            "parse_misses": self.tree_misses,
+            "evictions": self.evictions,
+        }
+
+    def stats(self, extra: Mapping[str, int] | None = None) -> dict[str, Any]:
+        """
+        Hit/miss counters and current occupancy.
+
+        ``extra`` adds counters gathered elsewhere (e.g. worker processes).
+        """
+        counters = self.counters()
+        for key in counters:
+            counters[key] += int((extra or {}).get(key, 0))
+        source_total = counters["source_hits"] + counters["source_misses"]
+        parse_total = counters["parse_hits"] + counters["parse_misses"]
+        return {
+            **counters,
+            "source_hit_rate": (
+                counters["source_hits"] / source_total if source_total else 0.0
+            ),
+            "parse_hit_rate": (
+                counters["parse_hits"] / parse_total if parse_total else 0.0
+            ),
+            "cached_sources": len(self._sources),
+            "cached_source_bytes": self._source_bytes,
+            "cached_trees": len(self._trees),
+        }
+
+
+_active_cache: ContextVar[ParseCache | None] = ContextVar(
+    "codemarshal_parse_cache", default=None
+)
+
+
+def get_active_parse_cache() -> ParseCache | None:
+    """Return the cache for the current observation run, if any."""
+    return _active_cache.get()
+
+
+def activate_parse_cache(cache: ParseCache | None) -> None:
+    """Make ``cache`` the active cache for the rest of this context (workers)."""
+    _active_cache.set(cache)
+
+
+@contextmanager
+def parse_cache_scope(cache: ParseCache | None = None) -> Iterator[ParseCache]:
+    """
+    Activate a parse cache for the duration of an observation run.
+
+    Nested scopes without an explicit cache reuse the enclosing one.
+    """
+    active = _active_cache.get()
+    if cache is None and active is not None:
+        yield active
+        return
+
+    cache = cache or ParseCache()
+    token = _active_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
+
+
+def read_source_text(path: Path) -> str:
+    """Read a file as UTF-8 text, through the active cache when present."""
+    cache = _active_cache.get()
+    if cache is None:
+        return path.read_text(encoding="utf-8")
+    return cache.read_text(path)
+
+
+def parse_source(content: str, path: Path | str = "<unknown>") -> ast.AST:
+    """Parse Python source, through the active cache when present."""
+    cache = _active_cache.get()
+    if cache is None:
+        return ast.parse(content, filename=str(path))
+    return cache.parse(content, path)
+
+
+def source_digest(path: Path) -> str | None:
+    """SHA-256 of a file's bytes from the active cache, or None without one."""
+    cache = _active_cache.get()
+    if cache is None:
+        return None
+    return cache.get_source(path).digest
@@ -38,12 +38,14 @@ from observations.eyes.base import AbstractEye, ObservationResult
 try:
     from core.search.semantic_search import (
         SENTENCE_TRANSFORMERS_AVAILABLE,
+        ChunkMatrix,
         CodePreprocessor,
         SemanticSearchConfig,
         SemanticSearchEngine,
     )
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
+    ChunkMatrix = None
     CodePreprocessor = None
     SemanticSearchConfig = None
     SemanticSearchEngine = None
@@ -108,6 +110,8 @@ class SemanticSight(AbstractEye):
             CodePreprocessor() if CodePreprocessor is not None else None
         )
         self._indexed_files: dict[Path, SemanticIndex] = {}
+        # Normalized embeddings of every indexed chunk; rebuilt on change
+        self._chunk_matrix: ChunkMatrix | None = None
 
         if (
             SENTENCE_TRANSFORMERS_AVAILABLE
@@ -204,6 +208,7 @@ class SemanticSight(AbstractEye):
         )
 
         self._indexed_files[file_path] = index
+        self._chunk_matrix = None
         return index
 
     def _index_directory(self, directory: Path) -> list[SemanticIndex]:
@@ -243,16 +248,7 @@ class SemanticSight(AbstractEye):
         if not self._engine or not self._indexed_files:
             return []
 
-        # Prepare indexed files for search
-        indexed_data = []
-        for file_path, index in self._indexed_files.items():
-            chunks = [
-                (f"{file_path}:{line}", emb, line) for line, _, emb in index.chunks
-            ]
-            indexed_data.append((file_path, chunks))
-
-        # Perform search
-        results = self._engine.search(query, indexed_data)
+        results = self._engine.search(query, self._search_matrix())
 
         # Convert to dicts
         return [r.to_dict() for r in results[:top_k]]
@@ -275,20 +271,27 @@ class SemanticSight(AbstractEye):
         if not self._engine or not self._indexed_files:
             return []
 
-        # Prepare indexed files
-        indexed_data = [
-            (
-                file_path,
-                [(f"{file_path}:{line}", emb, line) for line, _, emb in index.chunks],
-            )
-            for file_path, index in self._indexed_files.items()
-        ]
-
-        # Find similar
-        results = self._engine.find_similar(code_snippet, indexed_data)
+        results = self._engine.find_similar(code_snippet, self._search_matrix())
 
         return [r.to_dict() for r in results[:top_k]]
 
+    def _search_matrix(self) -> ChunkMatrix:
+        """Stack the indexed chunks once; reused until the index changes."""
+        if self._chunk_matrix is None:
+            self._chunk_matrix = ChunkMatrix.build(
+                [
+                    (
+                        file_path,
+                        [
+                            (f"{file_path}:{line}", emb, line)
+                            for line, _, emb in index.chunks
+                        ],
+                    )
+                    for file_path, index in self._indexed_files.items()
+                ]
+            )
+        return self._chunk_matrix
+
     def get_indexed_files(self) -> list[Path]:
         """Get list of indexed files."""
         return list(self._indexed_files.keys())
@@ -311,6 +314,7 @@ class SemanticSight(AbstractEye):
     def clear_index(self) -> None:
         """Clear all indexed data."""
         self._indexed_files.clear()
+        self._chunk_matrix = None
         if self._engine:
             self._engine.clear_cache()
 
@@ -11,19 +11,28 @@ Constitutional Basis:
     - Article 15: Checkpoints (each change is a checkpoint)
 
 Architecture:
-    - Uses watchdog library for cross-platform file system events
-    - Debounces rapid changes to avoid noise
+    - Uses watchdog library for cross-platform file system events, or a
+      stat-polling thread when watchdog is missing (or polling is requested)
+    - Debounces rapid changes to avoid noise and coalesces them per path
+      into batches (created then deleted cancels out, and so on)
+    - Batches are delivered to ``on_batch``, and to ``next_batch`` /
+      ``batches`` for blocking, non-blocking and asyncio consumers; past
+      ``max_queued_batches`` undrained batches, the oldest are merged, so
+      a watcher nobody drains stays bounded
     - Supports recursive directory watching
     - Configurable ignore patterns
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import os
 import threading
 import time
-from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import Enum, auto
 from pathlib import Path
@@ -92,6 +101,9 @@ class WatcherConfig:
     ignore_patterns: list[str] = field(default_factory=list)
     debounce_seconds: float = 0.5
     follow_symlinks: bool = False
+    use_polling: bool = False  # Polling is also used without watchdog
+    poll_interval: float = 0.25
+    max_queued_batches: int = 64  # Older undrained batches are merged
 
     def __post_init__(self):
         # Default ignore patterns
@@ -123,6 +135,7 @@ class FileSystemWatcher(FileSystemEventHandler if WATCHDOG_AVAILABLE else object
     - Recursive directory watching
     - Ignore pattern support
     - Thread-safe change queue
+    - Coalesced change batches (callback, queue and async iterator)
     """
 
     def __init__(
@@ -130,6 +143,7 @@ class FileSystemWatcher(FileSystemEventHandler if WATCHDOG_AVAILABLE else object
         watch_path: Path,
         config: WatcherConfig | None = None,
         on_change: Callable[[FileChange], None] | None = None,
+        on_batch: Callable[[list[FileChange]], None] | None = None,
     ):
         """
         Initialize file system watcher.
@@ -138,16 +152,21 @@ class FileSystemWatcher(FileSystemEventHandler if WATCHDOG_AVAILABLE else object
             watch_path: Directory to watch
             config: Watcher configuration
             on_change: Callback for change events
+            on_batch: Callback for each debounced batch of coalesced changes
         """
-        if not WATCHDOG_AVAILABLE:
-            raise ImportError(
-                "watchdog library required for file system watching. "
-                "Install with: pip install watchdog"
-            )
-
         self.watch_path = Path(watch_path).resolve()
         self.config = config or WatcherConfig()
         self.on_change = on_change
+        self.on_batch = on_batch
+        self.backend = (
+            "watchdog"
+            if WATCHDOG_AVAILABLE and not self.config.use_polling
+            else "polling"
+        )
+
+        # Debounced batches for next_batch()/batches()
+        self._batches: deque[list[FileChange]] = deque()
+        self._batch_ready = threading.Condition()
 
         # Thread-safe change tracking
         self._changes: list[FileChange] = []
@@ -158,8 +177,10 @@ class FileSystemWatcher(FileSystemEventHandler if WATCHDOG_AVAILABLE else object
         self._pending_lock = threading.Lock()
         self._debounce_timer: threading.Timer | None = None
 
-        # Watchdog observer
+        # Watchdog observer, or the polling thread
         self._observer: Observer | None = None
+        self._poller: threading.Thread | None = None
+        self._stop_polling = threading.Event()
         self._running = False
 
     def start(self) -> None:
@@ -167,11 +188,23 @@ class FileSystemWatcher(FileSystemEventHandler if WATCHDOG_AVAILABLE else object
         if self._running:
             return
 
-        self._observer = Observer()
-        self._observer.schedule(
-            self, str(self.watch_path), recursive=self.config.recursive
-        )
-        self._observer.start()
+        if self.backend == "watchdog":
+            self._observer = Observer()
+            self._observer.schedule(
+                self, str(self.watch_path), recursive=self.config.recursive
+            )
+            self._observer.start()
+        else:
+            self._stop_polling.clear()
+            # Baseline taken before start() returns, so later saves are seen
+            snapshot = self._snapshot()
+            self._poller = threading.Thread(
+                target=self._poll_loop,
+                args=(snapshot,),
+                name="codemarshal-watch-poll",
+                daemon=True,
+            )
+            self._poller.start()
         self._running = True
 
     def stop(self) -> None:
@@ -189,6 +222,42 @@ class FileSystemWatcher(FileSystemEventHandler if WATCHDOG_AVAILABLE else object
             self._observer.join()
             self._observer = None
 
+        if self._poller:
+            self._stop_polling.set()
+            self._poller.join()
+            self._poller = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the watcher is started."""
+        return self._running
+
+    def next_batch(self, timeout: float | None = None) -> list[FileChange] | None:
+        """
+        Next debounced batch of coalesced changes.
+
+        Args:
+            timeout: Seconds to wait (0 = don't wait, None = wait forever)
+
+        Returns:
+            The batch, or None if none arrived in time
+        """
+        with self._batch_ready:
+            if timeout is None or timeout > 0:
+                self._batch_ready.wait_for(lambda: self._batches, timeout)
+            return self._batches.popleft() if self._batches else None
+
+    async def batches(self, poll_seconds: float = 0.1) -> AsyncIterator[list[FileChange]]:
+        """
+        Yield batches to an asyncio consumer until the watcher stops.
+
+        Waiting happens in a worker thread, so the event loop is never blocked.
+        """
+        while self._running or self._batches:
+            batch = await asyncio.to_thread(self.next_batch, poll_seconds)
+            if batch:
+                yield batch
+
     def get_changes(self, since: datetime | None = None) -> list[FileChange]:
         """
         Get recorded changes.
@@ -276,7 +345,6 @@ class FileSystemWatcher(FileSystemEventHandler if WATCHDOG_AVAILABLE else object
 
     def _should_ignore(self, path: str) -> bool:
         """Check if path should be ignored based on patterns."""
-        path_str = str(path)
         path_obj = Path(path)
 
         # Check depth if configured
@@ -288,19 +356,16 @@ class FileSystemWatcher(FileSystemEventHandler if WATCHDOG_AVAILABLE else object
             except ValueError:
                 pass
 
-        # Check ignore patterns
-        for pattern in self.config.ignore_patterns:
-            if pattern in path_str:
-                return True
-            if path_obj.match(pattern):
-                return True
-
-        return False
+        return matches_ignore_pattern(path, self.config.ignore_patterns)
 
     def _queue_change(self, change: FileChange) -> None:
-        """Queue a change with debouncing."""
+        """Queue a change with debouncing, coalesced with pending ones."""
         with self._pending_lock:
-            self._pending_changes[change.path] = change
+            merged = _coalesce(self._pending_changes.get(change.path), change)
+            if merged is None:
+                self._pending_changes.pop(change.path, None)
+            else:
+                self._pending_changes[change.path] = merged
 
         # Reset debounce timer
         if self._debounce_timer:
@@ -317,6 +382,9 @@ class FileSystemWatcher(FileSystemEventHandler if WATCHDOG_AVAILABLE else object
             changes = list(self._pending_changes.values())
             self._pending_changes.clear()
 
+        if not changes:
+            return
+
         with self._changes_lock:
             self._changes.extend(changes)
 
@@ -329,6 +397,79 @@ class FileSystemWatcher(FileSystemEventHandler if WATCHDOG_AVAILABLE else object
                     # Don't let callback errors break the watcher
                     pass
 
+        self._enqueue_batch(changes)
+        if self.on_batch:
+            try:
+                self.on_batch(changes)
+            except Exception:
+                pass
+
+    def _enqueue_batch(self, changes: list[FileChange]) -> None:
+        """Queue a batch for next_batch(); merge the oldest two when full."""
+        with self._batch_ready:
+            if len(self._batches) >= max(self.config.max_queued_batches, 1):
+                oldest = self._batches.popleft()
+                if self._batches:
+                    self._batches[0] = _merge_batches(oldest, self._batches[0])
+                    self._batches.append(changes)
+                else:
+                    self._batches.append(_merge_batches(oldest, changes))
+            else:
+                self._batches.append(changes)
+            self._batch_ready.notify_all()
+
+    def _snapshot(self) -> dict[Path, tuple[int, int]]:
+        """(mtime_ns, size) of every watched, non-ignored file."""
+        snapshot: dict[Path, tuple[int, int]] = {}
+        root = str(self.watch_path)
+        for dirpath, dirnames, filenames in os.walk(
+            root, followlinks=self.config.follow_symlinks
+        ):
+            if not self.config.recursive and dirpath != root:
+                dirnames[:] = []
+                continue
+            dirnames[:] = [
+                name
+                for name in dirnames
+                if not self._should_ignore(os.path.join(dirpath, name))
+            ]
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                if self._should_ignore(path):
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[Path(path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _poll_loop(self, previous: dict[Path, tuple[int, int]]) -> None:
+        """Polling backend: diff stat snapshots and queue what changed."""
+        while not self._stop_polling.wait(self.config.poll_interval):
+            current = self._snapshot()
+            for path, state in current.items():
+                before = previous.get(path)
+                if before == state:
+                    continue
+                # The file's mtime is when it was saved, not when we looked
+                change = FileChange(
+                    path=path,
+                    change_type=ChangeType.CREATED if before is None else ChangeType.MODIFIED,
+                    timestamp=datetime.fromtimestamp(state[0] / 1e9, UTC),
+                    file_hash=self._calculate_file_hash(str(path)),
+                )
+                self._queue_change(change)
+            for path in previous.keys() - current.keys():
+                self._queue_change(
+                    FileChange(
+                        path=path,
+                        change_type=ChangeType.DELETED,
+                        timestamp=datetime.now(UTC),
+                    )
+                )
+            previous = current
+
     def _calculate_file_hash(self, filepath: str) -> str | None:
         """Calculate hash of file contents."""
         try:
@@ -351,6 +492,54 @@ class FileSystemWatcher(FileSystemEventHandler if WATCHDOG_AVAILABLE else object
         self.stop()
 
 
+def matches_ignore_pattern(path: str | Path, patterns: list[str]) -> bool:
+    """True if a path contains or matches (glob) any ignore pattern."""
+    path_str = str(path)
+    path_obj = Path(path)
+    for pattern in patterns:
+        if pattern in path_str:
+            return True
+        if path_obj.match(pattern):
+            return True
+    return False
+
+
+def _coalesce(previous: FileChange | None, change: FileChange) -> FileChange | None:
+    """
+    Merge a new change to a path into its pending one.
+
+    The result keeps the newest timestamp and hash; None means the two cancel
+    out (a file created and deleted within one debounce window).
+    """
+    if previous is None:
+        return change
+    before, after = previous.change_type, change.change_type
+    if before == ChangeType.CREATED and after == ChangeType.DELETED:
+        return None
+    if before == ChangeType.CREATED or (
+        before == ChangeType.MOVED and after == ChangeType.MODIFIED
+    ):
+        # Still new (or still moved) - just with newer content
+        return replace(change, change_type=before, old_path=previous.old_path)
+    if before == ChangeType.DELETED and after == ChangeType.CREATED:
+        return replace(change, change_type=ChangeType.MODIFIED)
+    return change
+
+
+def _merge_batches(
+    first: list[FileChange], second: list[FileChange]
+) -> list[FileChange]:
+    """One batch with the changes of two consecutive ones, coalesced per path."""
+    merged = {change.path: change for change in first}
+    for change in second:
+        combined = _coalesce(merged.get(change.path), change)
+        if combined is None:
+            merged.pop(change.path, None)
+        else:
+            merged[change.path] = combined
+    return list(merged.values())
+
+
 def create_watcher(
     watch_path: Path,
     recursive: bool = True,
@@ -3,7 +3,12 @@ Concrete implementation of ObservationInterface for engine coordination.
 """
 
 import datetime
+import hashlib
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import asdict, is_dataclass
+from enum import Enum
 from pathlib import Path, PurePath
 from typing import Any
 
@@ -24,6 +29,8 @@ from .eyes.go_sight import GoSight
 from .eyes.java_sight import JavaSight
 from .eyes.javascript_sight import JavaScriptSight
 from .eyes.language_detector import LanguageDetector
+from .eyes.parse_cache import get_active_parse_cache, parse_cache_scope
+from .parallel import ParallelObservationPool, resolve_worker_count
 
 
 # ...
@@ -31,6 +38,8 @@ def _coerce_for_json(value: Any) -> Any:
     """Convert payloads to JSON-compatible structures."""
     if isinstance(value, (Path, PurePath)):
         return str(value)
+    if isinstance(value, Enum):
+        return value.name
     if is_dataclass(value):
         return _coerce_for_json(asdict(value))
     if isinstance(value, dict):
@@ -45,10 +54,35 @@ def _coerce_for_json(value: Any) -> Any:
 class MinimalObservationInterface(ObservationInterface):
     """Minimal implementation of ObservationInterface to enable engine execution."""
 
-    def __init__(self, context: RuntimeContext):
-        """Initialize the observation interface."""
+    def __init__(
+        self,
+        context: RuntimeContext,
+        workers: int | str | None = None,
+        incremental: bool = False,
+        storage_root: Path | str = "storage",
+    ):
+        """Initialize the observation interface.
+
+        Args:
+            context: Runtime context for this investigation
+            workers: Default worker process count for per-file observation
+                (None/1 = serial, 0 or "auto" = one per CPU). A ``workers``
+                request parameter overrides it.
+            incremental: Reuse cached import/export observations for files
+                whose content is unchanged since a previous run. An
+                ``incremental`` request parameter overrides it.
+            storage_root: Storage root holding the observation cache
+        """
         self._context = context
         self._last_request = None
+        self._workers = workers
+        self._incremental = incremental
+        self._storage_root = storage_root
+        self._observation_cache = None
+        self._worker_counters: Counter[str] = Counter()
+        # Configured eyes per (observation type, root); worker processes keep
+        # theirs for their lifetime so config is read once per worker
+        self._configured_eyes: dict[tuple[str, str], Any] = {}
         # Initialize boundary checker with Agent Nexus boundaries
         self._boundary_checker = BoundaryViolationChecker(
             create_agent_nexus_boundaries()
@@ -98,6 +132,11 @@ class MinimalObservationInterface(ObservationInterface):
 
     def coordinate(self, request: CoordinationRequest) -> CoordinationResult:
         """Handle observation coordination requests."""
+        # One shared source/AST cache for every eye in this request
+        with parse_cache_scope(), self._observation_cache_scope(request.parameters):
+            return self._coordinate_impl(request)
+
+    def _coordinate_impl(self, request: CoordinationRequest) -> CoordinationResult:
         start_time = datetime.datetime.now()
 
         try:
@@ -281,6 +320,8 @@ class MinimalObservationInterface(ObservationInterface):
                 "boundary_crossings": boundary_crossings,
                 "summary": f"Observation of {request.target_path} completed",
             }
+            if self._observation_cache is not None:
+                data["observation_cache"] = self._observation_cache.stats()
 
             end_time = datetime.datetime.now()
             execution_time = int((end_time - start_time).total_seconds() * 1000)
@@ -315,11 +356,60 @@ class MinimalObservationInterface(ObservationInterface):
     ) -> dict[str, Any]:
         """Observe a directory with all configured observation types.
 
+        All eyes share one per-run source/AST cache; its hit/miss counters are
+        reported under ``parse_cache``. In incremental mode, reuse of cached
+        observations is reported under ``observation_cache``. Counters from
+        worker processes are included in both.
+
         Args:
             directory_path: Directory to observe
             streaming: If True, write observations incrementally (for large-scale)
             session_id: Session ID for streaming mode
         """
+        self._worker_counters = Counter()
+        with parse_cache_scope() as parse_cache, self._observation_cache_scope() as cache:
+            data = self._observe_directory_impl(directory_path, streaming, session_id)
+            data["parse_cache"] = parse_cache.stats(self._worker_counters)
+            if cache is not None:
+                cache_stats = cache.stats(self._worker_counters)
+                data["observation_cache"] = cache_stats
+                print(
+                    f"[CACHE] Reused {cache_stats['reused']} cached observations, "
+                    f"re-observed {cache_stats['reobserved']}",
+                    flush=True,
+                )
+        return data
+
+    def observe_files(
+        self,
+        files: list[Path],
+        observation_types: list[str],
+        directory_path: Path,
+    ) -> list[tuple[Path, list[dict[str, Any]]]]:
+        """Observe only the given files, as streaming observation does per file.
+
+        Used by watch mode to re-run the session's eyes on changed files.
+        Results are in ``files`` order; unsupported files get no entry.
+
+        Args:
+            files: Files to observe
+            observation_types: Observation types to run on each file
+            directory_path: Investigation root (configures boundary_sight)
+        """
+        exts = self._supported_extensions or {".py"}
+        code_files = [path for path in files if path.suffix.lower() in exts]
+        with parse_cache_scope(), self._observation_cache_scope():
+            return [
+                (path, self._observe_single_file(path, observation_types, directory_path))
+                for path in code_files
+            ]
+
+    def _observe_directory_impl(
+        self,
+        directory_path: Path,
+        streaming: bool,
+        session_id: str | None,
+    ) -> dict[str, Any]:
         # Get memory monitor
         memory_monitor = get_memory_monitor(self._context)
 
@@ -356,19 +446,79 @@ class MinimalObservationInterface(ObservationInterface):
         observations = []
         boundary_crossings = []
 
+        with self._observation_pool(self._resolve_workers()) as pool:
+            self._observe_directory_batch(
+                directory_path,
+                observation_types,
+                observations,
+                boundary_crossings,
+                memory_monitor,
+                file_count,
+                pool,
+            )
+
+        # Get memory status for reporting
+        memory_status = memory_monitor.get_memory_status()
+
+        # Return observation data with memory info
+        return {
+            "path": str(directory_path),
+            "file_count": len(self._iter_code_files(directory_path)),
+            "directory_count": len(
+                [d for d in directory_path.rglob("*") if d.is_dir()]
+            ),
+            "total_items": len(list(directory_path.rglob("*"))),
+            "observations": observations,
+            "boundary_crossings": boundary_crossings,
+            "memory_usage": memory_status,
+            "status": "observed",
+        }
+
+    def _observe_directory_batch(
+        self,
+        directory_path: Path,
+        observation_types: list[str],
+        observations: list[dict[str, Any]],
+        boundary_crossings: list[dict[str, Any]],
+        memory_monitor,
+        file_count: int,
+        pool: ParallelObservationPool | None,
+    ) -> None:
+        """
+        Run every observation type over a directory in batch mode.
+
+        Import/export sight run file-major (every type for a file before the
+        next file) so both eyes reuse the same cached source and AST; results
+        are still reported type by type.
+        """
+        import_export_types = [
+            obs_type
+            for obs_type in observation_types
+            if obs_type in {"import_sight", "export_sight"}
+        ]
+        import_export_results: dict[str, Any] = {}
+        import_export_error: str | None = None
+        if import_export_types:
+            try:
+                code_files = self._iter_code_files(directory_path)
+                import_export_results = self._observe_import_export_by_file(
+                    code_files, import_export_types, memory_monitor, pool
+                )
+                file_count += len(code_files) * len(import_export_types)
+            except Exception as e:
+                import_export_error = str(e)
+
         for obs_type in observation_types:
             try:
-                if obs_type in {"import_sight", "export_sight"}:
-                    code_files = self._iter_code_files(directory_path)
-                    self._observe_import_export_files(
-                        code_files,
-                        obs_type,
-                        observations,
-                        boundary_crossings=boundary_crossings,
-                        check_boundaries=(obs_type == "import_sight"),
-                        memory_monitor=memory_monitor,
-                    )
-                    file_count += len(code_files)
+                if obs_type in import_export_types:
+                    if import_export_error is not None:
+                        observations.append(
+                            {"type": obs_type, "error": import_export_error}
+                        )
+                        continue
+                    type_observations, type_crossings = import_export_results[obs_type]
+                    observations.extend(type_observations)
+                    boundary_crossings.extend(type_crossings)
                     continue
 
                 # Get appropriate eye
@@ -428,6 +578,7 @@ class MinimalObservationInterface(ObservationInterface):
                             observations,
                             boundary_crossings,
                             memory_monitor,
+                            pool=pool,
                         )
                     else:
                         # Normal observation
@@ -552,22 +703,116 @@ class MinimalObservationInterface(ObservationInterface):
                 # Log error but continue with other observations
                 observations.append({"type": obs_type, "error": str(e)})
 
-        # Get memory status for reporting
-        memory_status = memory_monitor.get_memory_status()
+    def _resolve_workers(self) -> int:
+        """Worker count for this request (request parameter wins over default)."""
+        workers = self._workers
+        if self._last_request is not None:
+            workers = self._last_request.parameters.get("workers", workers)
+        try:
+            return resolve_worker_count(workers)
+        except (TypeError, ValueError):
+            return 1
 
-        # Return observation data with memory info
-        return {
-            "path": str(directory_path),
-            "file_count": len(self._iter_code_files(directory_path)),
-            "directory_count": len(
-                [d for d in directory_path.rglob("*") if d.is_dir()]
-            ),
-            "total_items": len(list(directory_path.rglob("*"))),
-            "observations": observations,
-            "boundary_crossings": boundary_crossings,
-            "memory_usage": memory_status,
-            "status": "observed",
-        }
+    @contextmanager
+    def _observation_pool(self, workers: int) -> Iterator[ParallelObservationPool | None]:
+        """
+        Yield a process pool for per-file work, or None for serial mode.
+
+        Falls back to serial observation if worker processes cannot be started
+        (e.g. restricted sandboxes without multiprocessing support).
+        """
+        if workers <= 1:
+            yield None
+            return
+
+        try:
+            pool = ParallelObservationPool(
+                self._context, workers, worker_options=self._worker_options()
+            )
+        except (OSError, NotImplementedError, ImportError) as e:
+            print(
+                f"[WARNING] Parallel observation unavailable ({e}); running serially",
+                flush=True,
+            )
+            yield None
+            return
+
+        print(f"[PARALLEL] Observing with {pool.workers} worker processes", flush=True)
+        try:
+            with pool:
+                yield pool
+        finally:
+            self._worker_counters.update(pool.counters)
+
+    def _worker_options(self) -> dict[str, Any]:
+        """Settings each worker process needs to observe like this one."""
+        options: dict[str, Any] = {}
+        if self._observation_cache is not None:
+            options["observation_cache_dir"] = str(self._observation_cache.cache_dir)
+        return options
+
+    def _configure_worker(self, options: dict[str, Any]) -> None:
+        """Apply ``_worker_options`` inside a worker process."""
+        cache_dir = options.get("observation_cache_dir")
+        if cache_dir:
+            from storage.observation_cache import ObservationCache
+
+            self._observation_cache = ObservationCache(cache_dir)
+
+    def _counter_snapshot(self) -> dict[str, int]:
+        """Current parse/observation cache counters (reported by workers)."""
+        counters: dict[str, int] = {}
+        parse_cache = get_active_parse_cache()
+        if parse_cache is not None:
+            counters.update(parse_cache.counters())
+        if self._observation_cache is not None:
+            counters.update(self._observation_cache.counters())
+        return counters
+
+    @contextmanager
+    def _observation_cache_scope(self, parameters: dict[str, Any] | None = None):
+        """
+        Open the persistent observation cache for one run (incremental mode).
+
+        Yields None when incremental observation is off. Nested scopes reuse
+        the enclosing cache so counters cover the whole request.
+        """
+        if self._observation_cache is not None:
+            yield self._observation_cache
+            return
+
+        if parameters is None and self._last_request is not None:
+            parameters = self._last_request.parameters
+        parameters = parameters or {}
+        if not parameters.get("incremental", self._incremental):
+            yield None
+            return
+
+        from storage.observation_cache import ObservationCache
+
+        self._observation_cache = ObservationCache.for_storage_root(
+            parameters.get("storage_root") or self._storage_root
+        )
+        try:
+            yield self._observation_cache
+        finally:
+            self._observation_cache = None
+
+    def _map_files(
+        self,
+        pool: ParallelObservationPool | None,
+        method_name: str,
+        files: list[Path],
+        *args: Any,
+    ) -> Iterator[tuple[Path, Any]]:
+        """Apply a per-file method to files in order, serially or via the pool."""
+        if pool is not None:
+            yield from pool.map_ordered(method_name, files, *args)
+            return
+
+        method = getattr(self, method_name)
+        for file_path in files:
+            yield file_path, method(file_path, *args)
 
     def _iter_code_files(self, directory_path: Path) -> list[Path]:
         """Return deterministic list of supported code files."""
@@ -694,6 +939,68 @@ class MinimalObservationInterface(ObservationInterface):
         observations: list[dict[str, Any]],
         boundary_crossings: list[dict[str, Any]] | None = None,
         check_boundaries: bool = False,
+    ) -> None:
+        cache = self._observation_cache
+        if cache is None:
+            self._observe_import_export_uncached(
+                file_path, obs_type, observations, boundary_crossings, check_boundaries
+            )
+            return
+
+        eye = self._get_language_specific_eye(
+            obs_type, self._language_for_file(file_path)
+        )
+        if not eye:
+            return
+
+        # Import and export results of one eye share a record, so the variant
+        # carries the observation type as well as the boundary setting
+        key = (
+            eye.name,
+            eye.version,
+            self._content_digest(file_path),
+            str(file_path),
+        )
+        variant = f"{obs_type}|boundaries={int(bool(check_boundaries))}"
+        entry = cache.get(*key, variant=variant)
+        if entry is None:
+            fresh_observations: list[dict[str, Any]] = []
+            fresh_crossings: list[dict[str, Any]] = []
+            self._observe_import_export_uncached(
+                file_path,
+                obs_type,
+                fresh_observations,
+                fresh_crossings,
+                check_boundaries,
+            )
+            entry = cache.put(
+                *key,
+                {
+                    "observations": fresh_observations,
+                    "boundary_crossings": fresh_crossings,
+                },
+                variant=variant,
+            )
+
+        observations.extend(entry.get("observations", []))
+        if boundary_crossings is not None:
+            boundary_crossings.extend(entry.get("boundary_crossings", []))
+
+    @staticmethod
+    def _content_digest(file_path: Path) -> str:
+        """SHA-256 of a file's bytes, shared with the parse cache when active."""
+        parse_cache = get_active_parse_cache()
+        if parse_cache is not None:
+            return parse_cache.get_source(file_path).digest
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+    def _observe_import_export_uncached(
+        self,
+        file_path: Path,
+        obs_type: str,
+        observations: list[dict[str, Any]],
+        boundary_crossings: list[dict[str, Any]] | None = None,
+        check_boundaries: bool = False,
     ) -> None:
         language = self._language_for_file(file_path)
         eye = self._get_language_specific_eye(obs_type, language)
@@ -749,6 +1056,24 @@ class MinimalObservationInterface(ObservationInterface):
                 }
             )
 
+    def _observe_import_export_single(
+        self, file_path: Path, obs_type: str, check_boundaries: bool
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Observe one file for import/export sight; never raises."""
+        file_observations: list[dict[str, Any]] = []
+        file_crossings: list[dict[str, Any]] = []
+        try:
+            self._observe_import_export_file(
+                file_path,
+                obs_type,
+                file_observations,
+                boundary_crossings=file_crossings,
+                check_boundaries=check_boundaries,
+            )
+        except Exception as exc:
+            file_observations.append({"type": obs_type, "error": str(exc)})
+        return file_observations, file_crossings
+
     def _observe_import_export_files(
         self,
         files: list[Path],
@@ -757,22 +1082,63 @@ class MinimalObservationInterface(ObservationInterface):
         boundary_crossings: list[dict[str, Any]] | None = None,
         check_boundaries: bool = False,
         memory_monitor: Any | None = None,
+        pool: ParallelObservationPool | None = None,
     ) -> None:
-        for idx, file_path in enumerate(files, start=1):
-            try:
-                self._observe_import_export_file(
-                    file_path,
-                    obs_type,
-                    observations,
-                    boundary_crossings=boundary_crossings,
-                    check_boundaries=check_boundaries,
-                )
-            except Exception as exc:
-                observations.append({"type": obs_type, "error": str(exc)})
+        results = self._map_files(
+            pool, "_observe_import_export_single", files, obs_type, check_boundaries
+        )
+        for idx, (_file_path, (file_observations, file_crossings)) in enumerate(
+            results, start=1
+        ):
+            observations.extend(file_observations)
+            if boundary_crossings is not None:
+                boundary_crossings.extend(file_crossings)
+
+            if memory_monitor and idx % 100 == 0:
+                memory_monitor.track_files(100)
+
+    def _observe_import_export_types(
+        self, file_path: Path, obs_types: list[str]
+    ) -> list[tuple[list[dict[str, Any]], list[dict[str, Any]]]]:
+        """Observe one file with every import/export type, in ``obs_types`` order."""
+        return [
+            self._observe_import_export_single(
+                file_path, obs_type, obs_type == "import_sight"
+            )
+            for obs_type in obs_types
+        ]
+
+    def _observe_import_export_by_file(
+        self,
+        files: list[Path],
+        obs_types: list[str],
+        memory_monitor: Any | None = None,
+        pool: ParallelObservationPool | None = None,
+    ) -> dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]]]]:
+        """
+        Observe files file-major and regroup the results per observation type.
+
+        Returns observation type -> (observations, boundary_crossings), each in
+        file order, matching what ``_observe_import_export_files`` would give.
+        """
+        grouped: dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]]]] = {
+            obs_type: ([], []) for obs_type in obs_types
+        }
+        results = self._map_files(
+            pool, "_observe_import_export_types", files, obs_types
+        )
+        for idx, (_file_path, per_type) in enumerate(results, start=1):
+            for obs_type, (file_observations, file_crossings) in zip(
+                obs_types, per_type
+            ):
+                grouped[obs_type][0].extend(file_observations)
+                grouped[obs_type][1].extend(file_crossings)
 
             if memory_monitor and idx % 100 == 0:
                 memory_monitor.track_files(100)
 
+        return grouped
+
     def _observe_chunked(
         self,
         eye,
@@ -781,6 +1147,7 @@ class MinimalObservationInterface(ObservationInterface):
         observations: list[dict],
         boundary_crossings: list[dict],
         memory_monitor,
+        pool: ParallelObservationPool | None = None,
     ) -> None:
         """Observe directory in chunks to manage memory usage."""
         chunk_size = 1000  # Process 1000 files at a time
@@ -792,71 +1159,33 @@ class MinimalObservationInterface(ObservationInterface):
         for i in range(0, len(all_files), chunk_size):
             chunk_files = all_files[i : i + chunk_size]
 
-            # Process chunk
-            for file_path in chunk_files:
-                try:
-                    result = eye.observe(file_path)
-
-                    # Extract data similar to main method
-                    if hasattr(result, "raw_payload") and result.raw_payload:
-                        if hasattr(result.raw_payload, "statements"):
-                            observations.append(
-                                {
-                                    "type": obs_type,
-                                    "statements": [
-                                        stmt.__dict__
-                                        for stmt in result.raw_payload.statements
-                                    ],
-                                }
-                            )
-                        elif hasattr(result.raw_payload, "crossings"):
-                            observations.append(
-                                {
-                                    "type": obs_type,
-                                    "crossings": [
-                                        cross.__dict__
-                                        for cross in result.raw_payload.crossings
-                                    ],
-                                }
-                            )
-                            for cross in result.raw_payload.crossings:
-                                boundary_crossings.append(
-                                    {
-                                        "source": cross.source_module,
-                                        "target": cross.target_module,
-                                        "file": str(cross.source_module) + ".py",
-                                        "line": cross.line_number,
-                                        "violation": "cross_lobe_import",
-                                    }
-                                )
-                        elif hasattr(result.raw_payload, "modules"):
-                            observations.append(
-                                {
-                                    "type": obs_type,
-                                    "result": result.raw_payload.__dict__,
-                                }
-                            )
-                        else:
-                            observations.append(
-                                {
-                                    "type": obs_type,
-                                    "result": _coerce_for_json(result.raw_payload),
-                                }
-                            )
+            # Process chunk (workers rebuild the configured eye themselves)
+            if pool is None:
+                results = (
+                    (
+                        file_path,
+                        self._observe_eye_file(
+                            file_path, obs_type, directory_path, eye
+                        ),
+                    )
+                    for file_path in chunk_files
+                )
+            else:
+                results = pool.map_ordered(
+                    "_observe_eye_file", chunk_files, obs_type, directory_path
+                )
 
-                    files_processed += 1
+            for _file_path, (entries, crossings, processed) in results:
+                observations.extend(entries)
+                boundary_crossings.extend(crossings)
+                if not processed:
+                    continue
 
-                    # Track memory every 100 files in chunk mode
-                    if files_processed % 100 == 0:
-                        memory_monitor.track_files(100)
+                files_processed += 1
 
-                except Exception as e:
-                    observations.append(
-                        {
-                            "type": obs_type,
-                            "error": f"Error processing {file_path}: {str(e)}",
-                        }
-                    )
+                # Track memory every 100 files in chunk mode
+                if files_processed % 100 == 0:
+                    memory_monitor.track_files(100)
 
             # Force garbage collection after each chunk
             import gc
@@ -871,6 +1200,81 @@ class MinimalObservationInterface(ObservationInterface):
                 )
                 break
 
+    def _observe_eye_file(
+        self,
+        file_path: Path,
+        obs_type: str,
+        directory_path: Path,
+        eye=None,
+    ) -> tuple[list[dict], list[dict], bool]:
+        """
+        Observe one file with a single eye for chunked mode.
+
+        Returns (observations, boundary_crossings, processed). Errors are
+        recorded as an observation entry with processed=False.
+        """
+        entries: list[dict] = []
+        crossings: list[dict] = []
+        try:
+            if eye is None:
+                eye = self._get_configured_eye(obs_type, directory_path)
+            result = eye.observe(file_path)
+
+            # Extract data similar to main method
+            if hasattr(result, "raw_payload") and result.raw_payload:
+                if hasattr(result.raw_payload, "statements"):
+                    entries.append(
+                        {
+                            "type": obs_type,
+                            "statements": [
+                                stmt.__dict__ for stmt in result.raw_payload.statements
+                            ],
+                        }
+                    )
+                elif hasattr(result.raw_payload, "crossings"):
+                    entries.append(
+                        {
+                            "type": obs_type,
+                            "crossings": [
+                                cross.__dict__ for cross in result.raw_payload.crossings
+                            ],
+                        }
+                    )
+                    for cross in result.raw_payload.crossings:
+                        crossings.append(
+                            {
+                                "source": cross.source_module,
+                                "target": cross.target_module,
+                                "file": str(cross.source_module) + ".py",
+                                "line": cross.line_number,
+                                "violation": "cross_lobe_import",
+                            }
+                        )
+                elif hasattr(result.raw_payload, "modules"):
+                    entries.append(
+                        {
+                            "type": obs_type,
+                            "result": result.raw_payload.__dict__,
+                        }
+                    )
+                else:
+                    entries.append(
+                        {
+                            "type": obs_type,
+                            "result": _coerce_for_json(result.raw_payload),
+                        }
+                    )
+        except Exception as e:
+            entries.append(
+                {
+                    "type": obs_type,
+                    "error": f"Error processing {file_path}: {str(e)}",
+                }
+            )
+            return entries, crossings, False
+
+        return entries, crossings, True
+
     def _observe_directory_streaming(
         self,
         directory_path: Path,
@@ -927,104 +1331,46 @@ class MinimalObservationInterface(ObservationInterface):
                 flush=True,
             )
 
-            for idx in range(start_index, len(all_files)):
-                file_path = all_files[idx]
-                file_observations = []
-
-                for obs_type in observation_types:
-                    try:
-                        if obs_type in {"import_sight", "export_sight"}:
-                            self._observe_import_export_file(
-                                file_path,
-                                obs_type,
-                                file_observations,
-                                boundary_crossings=None,
-                                check_boundaries=False,
-                            )
-                            continue
-
-                        # Get appropriate eye
-                        eye = self._get_configured_eye(obs_type, directory_path)
-
-                        if eye:
-                            result = eye.observe(file_path)
-
-                            # Extract observation data
-                            if hasattr(result, "raw_payload") and result.raw_payload:
-                                if hasattr(result.raw_payload, "statements"):
-                                    # ImportSight
-                                    file_observations.append(
-                                        {
-                                            "type": obs_type,
-                                            "statements": [
-                                                stmt.__dict__
-                                                for stmt in result.raw_payload.statements
-                                            ],
-                                        }
-                                    )
-                                elif hasattr(result.raw_payload, "crossings"):
-                                    # BoundarySight
-                                    file_observations.append(
-                                        {
-                                            "type": obs_type,
-                                            "crossings": [
-                                                cross.__dict__
-                                                for cross in result.raw_payload.crossings
-                                            ],
-                                        }
-                                    )
-                                elif hasattr(result.raw_payload, "modules"):
-                                    # FileSight
-                                    file_observations.append(
-                                        {
-                                            "type": obs_type,
-                                            "result": result.raw_payload.__dict__,
-                                        }
-                                    )
-                                else:
-                                    file_observations.append(
-                                        {
-                                            "type": obs_type,
-                                            "result": _coerce_for_json(
-                                                result.raw_payload
-                                            ),
-                                        }
-                                    )
-                            else:
-                                file_observations.append(
-                                    {
-                                        "type": obs_type,
-                                        "result": result.__dict__
-                                        if hasattr(result, "__dict__")
-                                        else str(result),
-                                    }
-                                )
-                    except Exception as e:
-                        file_observations.append({"type": obs_type, "error": str(e)})
+            remaining_files = all_files[start_index:]
+            workers = self._resolve_workers()
 
-                # Write this file's observations atomically (Article 9 + 15)
-                stream.write_file_observation(str(file_path), file_observations)
+            with self._observation_pool(workers) as pool:
+                results = self._map_files(
+                    pool,
+                    "_observe_single_file",
+                    remaining_files,
+                    observation_types,
+                    directory_path,
+                )
 
-                # Track memory every 100 files
-                if (idx + 1) % 100 == 0:
-                    memory_monitor.track_files(100)
-                    progress = stream.get_progress()
+                # Results arrive in sorted order even when produced in parallel,
+                # so writes, IDs and the resume manifest stay deterministic.
+                for idx, (file_path, file_observations) in enumerate(
+                    results, start=start_index
+                ):
+                    # Write this file's observations atomically (Article 9 + 15)
+                    stream.write_file_observation(str(file_path), file_observations)
 
-                    # Honest progress reporting (Article 8)
-                    print(
-                        f"[PROGRESS] {idx + 1}/{len(all_files)} files, "
-                        f"{progress.get('observations_written', 0)} observations written, "
-                        f"{memory_monitor.get_memory_status()['current_rss_mb']:.1f}MB",
-                        flush=True,
-                    )
+                    # Track memory every 100 files
+                    if (idx + 1) % 100 == 0:
+                        memory_monitor.track_files(100)
+                        progress = stream.get_progress()
 
-                    # Check for memory warnings
-                    if memory_monitor.should_chunk():
+                        # Honest progress reporting (Article 8)
                         print(
-                            "[WARNING] Memory pressure detected, continuing with streaming...",
+                            f"[PROGRESS] {idx + 1}/{len(all_files)} files, "
+                            f"{progress.get('observations_written', 0)} observations written, "
+                            f"{memory_monitor.get_memory_status()['current_rss_mb']:.1f}MB",
                             flush=True,
                         )
 
+                        # Check for memory warnings
+                        if memory_monitor.should_chunk():
+                            print(
+                                "[WARNING] Memory pressure detected, continuing with streaming...",
+                                flush=True,
+                            )
+
             # Get final progress
             final_progress = stream.get_progress()
             memory_status = memory_monitor.get_memory_status()
@@ -1048,8 +1394,99 @@ class MinimalObservationInterface(ObservationInterface):
                 "status": "observed",
             }
 
+    def _observe_single_file(
+        self,
+        file_path: Path,
+        observation_types: list[str],
+        directory_path: Path,
+    ) -> list[dict[str, Any]]:
+        """Run every requested observation type against one file."""
+        file_observations = []
+
+        for obs_type in observation_types:
+            try:
+                if obs_type in {"import_sight", "export_sight"}:
+                    self._observe_import_export_file(
+                        file_path,
+                        obs_type,
+                        file_observations,
+                        boundary_crossings=None,
+                        check_boundaries=False,
+                    )
+                    continue
+
+                # Get appropriate eye
+                eye = self._get_configured_eye(obs_type, directory_path)
+
+                if eye:
+                    result = eye.observe(file_path)
+
+                    # Extract observation data
+                    if hasattr(result, "raw_payload") and result.raw_payload:
+                        if hasattr(result.raw_payload, "statements"):
+                            # ImportSight
+                            file_observations.append(
+                                {
+                                    "type": obs_type,
+                                    "statements": [
+                                        stmt.__dict__
+                                        for stmt in result.raw_payload.statements
+                                    ],
+                                }
+                            )
+                        elif hasattr(result.raw_payload, "crossings"):
+                            # BoundarySight
+                            file_observations.append(
+                                {
+                                    "type": obs_type,
+                                    "crossings": [
+                                        cross.__dict__
+                                        for cross in result.raw_payload.crossings
+                                    ],
+                                }
+                            )
+                        elif hasattr(result.raw_payload, "modules"):
+                            # FileSight
+                            file_observations.append(
+                                {
+                                    "type": obs_type,
+                                    "result": result.raw_payload.__dict__,
+                                }
+                            )
+                        else:
+                            file_observations.append(
+                                {
+                                    "type": obs_type,
+                                    "result": _coerce_for_json(
+                                        result.raw_payload
+                                    ),
+                                }
+                            )
+                    else:
+                        file_observations.append(
+                            {
+                                "type": obs_type,
+                                "result": result.__dict__
+                                if hasattr(result, "__dict__")
+                                else str(result),
+                            }
+                        )
+            except Exception as e:
+                file_observations.append({"type": obs_type, "error": str(e)})
+
+        return file_observations
+
     def _get_configured_eye(self, obs_type: str, directory_path: Path):
-        """Get configured eye instance for observation type."""
+        """Get configured eye instance for observation type (cached per root)."""
+        key = (obs_type, str(directory_path))
+        if key not in self._configured_eyes:
+            self._configured_eyes[key] = self._build_configured_eye(
+                obs_type, directory_path
+            )
+        return self._configured_eyes[key]
+
+    def _build_configured_eye(self, obs_type: str, directory_path: Path):
+        """Create the eye for an observation type, applying any config."""
         eye = get_eye(obs_type)
 
         # Configure boundary_sight with Agent Nexus rules
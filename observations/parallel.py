@@ -0,0 +1,156 @@
+"""
+parallel.py - Process-pool fan-out for per-file observation.
+
+Purpose:
+Spread per-file eye execution across worker processes while handing results
+back in the caller's (sorted) file order. Ordering is what keeps observation
+IDs deterministic (Article 13), so results are always yielded in submission
+order, never in completion order.
+
+Each worker process builds its own MinimalObservationInterface and parse
+cache once and reuses them for every batch it receives. Eyes are never shared
+across processes.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter, deque
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+# Worker-local interface, created once per process by _init_worker
+_WORKER_INTERFACE: Any = None
+
+DEFAULT_BATCH_SIZE = 16
+MAX_PENDING_BATCHES_PER_WORKER = 4
+
+
+def resolve_worker_count(workers: Any) -> int:
+    """
+    Normalize a requested worker count.
+
+    ``None`` and ``1`` mean serial observation. ``0``, ``"auto"`` and negative
+    values mean one worker per CPU.
+    """
+    if workers is None:
+        return 1
+    if isinstance(workers, str):
+        if workers.strip().lower() == "auto":
+            return max(1, os.cpu_count() or 1)
+        workers = int(workers)
+    workers = int(workers)
+    if workers <= 0:
+        return max(1, os.cpu_count() or 1)
+    return workers
+
+
+def _init_worker(context: Any, options: Mapping[str, Any] | None = None) -> None:
+    """Build the per-process observation interface."""
+    global _WORKER_INTERFACE
+    from .eyes.parse_cache import ParseCache, activate_parse_cache
+    from .interface import MinimalObservationInterface
+
+    _WORKER_INTERFACE = MinimalObservationInterface(context)
+    _WORKER_INTERFACE._configure_worker(dict(options or {}))
+    # Eyes in this worker share one source/AST cache for the pool's lifetime
+    activate_parse_cache(ParseCache())
+
+
+def _run_batch(
+    method_name: str, paths: list[str], args: tuple
+) -> tuple[list[Any], dict[str, int]]:
+    """
+    Run one interface method for every path in a batch, in order.
+
+    Also returns how much the worker's counters (parse cache, observation
+    cache) moved during the batch, so the parent can report run totals.
+    """
+    method = getattr(_WORKER_INTERFACE, method_name)
+    before = _WORKER_INTERFACE._counter_snapshot()
+    results = [method(Path(path), *args) for path in paths]
+    after = _WORKER_INTERFACE._counter_snapshot()
+    return results, {key: value - before.get(key, 0) for key, value in after.items()}
+
+
+class ParallelObservationPool:
+    """
+    Ordered process pool for per-file observation work.
+
+    Usage:
+        with ParallelObservationPool(context, workers=8) as pool:
+            for path, result in pool.map_ordered("_observe_single_file", files, types, root):
+                ...
+
+    At most ``workers * MAX_PENDING_BATCHES_PER_WORKER`` batches are in flight
+    at once, so memory stays bounded even when the consumer (e.g. the streaming
+    writer) is slower than the workers.
+
+    ``worker_options`` is handed to each worker interface's
+    ``_configure_worker``. Counters reported by the workers are summed into
+    ``counters``.
+    """
+
+    def __init__(
+        self,
+        context: Any,
+        workers: int,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        worker_options: Mapping[str, Any] | None = None,
+    ):
+        self.workers = max(1, int(workers))
+        self.batch_size = max(1, int(batch_size))
+        self._max_pending = self.workers * MAX_PENDING_BATCHES_PER_WORKER
+        self.counters: Counter[str] = Counter()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(context, dict(worker_options or {})),
+        )
+
+    def __enter__(self) -> ParallelObservationPool:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.shutdown(cancel=exc_type is not None)
+        return False
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+
+    def map_ordered(
+        self, method_name: str, files: Sequence[Path], *args: Any
+    ) -> Iterator[tuple[Path, Any]]:
+        """
+        Yield ``(file_path, result)`` for every file, in the order given.
+
+        ``method_name`` names a MinimalObservationInterface method taking
+        ``(file_path, *args)``. It must handle its own per-file errors; an
+        exception escaping it aborts the whole map.
+        """
+        pending: deque[tuple[Sequence[Path], Future]] = deque()
+
+        for start in range(0, len(files), self.batch_size):
+            batch = files[start : start + self.batch_size]
+            future = self._executor.submit(
+                _run_batch, method_name, [str(path) for path in batch], args
+            )
+            pending.append((batch, future))
+
+            if len(pending) >= self._max_pending:
+                yield from self._drain_one(pending)
+
+        while pending:
+            yield from self._drain_one(pending)
+
+    def _drain_one(
+        self,
+        pending: deque[tuple[Sequence[Path], Future]],
+    ) -> Iterator[tuple[Path, Any]]:
+        batch, future = pending.popleft()
+        results, counters = future.result()
+        self.counters.update(counters)
+        yield from zip(batch, results, strict=True)
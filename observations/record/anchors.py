@@ -11,14 +11,24 @@ This module defines stable identifiers:
 - Structural hashes (how something is organized)
 - Semantic-neutral fingerprints (identity without location)
 
+Snapshots are anchored by SnapshotAnchorStage, which hashes every file the
+snapshot's observations mention on a thread pool and reuses the previous
+snapshot's anchor for files whose (size, mtime, inode) are unchanged.
+
 Production principle: Anchors turn snapshots into a chain of custody.
 """
 
 import hashlib
 import json
+import mmap
+import os
 import re
+import stat
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import StrEnum
 from pathlib import Path
@@ -310,6 +320,50 @@ class Anchor:
         return "\n".join(lines)
 
 
+# ============================================================================
+# FILE HASHING
+# ============================================================================
+
+# Files at least this large are hashed through mmap; smaller ones are read
+# whole, or through one reused buffer of LARGE_READ_SIZE bytes
+MMAP_THRESHOLD = 4 * 1024 * 1024
+LARGE_READ_SIZE = 1024 * 1024
+
+
+def hash_file_content(
+    path: str | Path, algorithm: str = "sha256", chunk_size: int = LARGE_READ_SIZE
+) -> str:
+    """
+    Hash a file's bytes with large reads.
+
+    hashlib releases the GIL while it digests large buffers, so this scales
+    across threads.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    hasher = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    hasher.update(mapped)
+                return hasher.hexdigest()
+            except (OSError, ValueError):
+                f.seek(0)  # Not mappable; fall back to buffered reads
+        elif size < chunk_size:
+            # Most source files: one read, no buffer to allocate
+            hasher.update(f.read())
+            return hasher.hexdigest()
+
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while read := f.readinto(buffer):
+            hasher.update(view[:read])
+    return hasher.hexdigest()
+
+
 # ============================================================================
 # ANCHOR GENERATORS
 # ============================================================================
@@ -333,7 +387,7 @@ class AnchorGenerator(ABC):
 class FileContentAnchorGenerator(AnchorGenerator):
     """Generate anchors based on full file content hash."""
 
-    def __init__(self, algorithm: str = "sha256", chunk_size: int = 8192):
+    def __init__(self, algorithm: str = "sha256", chunk_size: int = LARGE_READ_SIZE):
         self._algorithm = algorithm
         self._chunk_size = chunk_size
 
@@ -349,17 +403,13 @@ class FileContentAnchorGenerator(AnchorGenerator):
             raise ValueError(f"Path is not a file: {path}")
 
         # Compute hash
-        hasher = hashlib.new(self._algorithm)
-
         try:
-            with open(path_obj, "rb") as f:
-                while chunk := f.read(self._chunk_size):
-                    hasher.update(chunk)
+            content_hash = hash_file_content(
+                path_obj, self._algorithm, self._chunk_size
+            )
         except OSError as e:
             raise ValueError(f"Cannot read file {path}: {e}") from e
 
-        content_hash = hasher.hexdigest()
-
         # Create identifier
         identifier = f"file:{self._algorithm}:{content_hash}"
 
@@ -444,10 +494,7 @@ class LineHashMerkleAnchorGenerator(AnchorGenerator):
                 pass
 
         # Also compute full content hash as auxiliary fingerprint
-        full_content_hasher = hashlib.new(self._algorithm)
-        with open(path_obj, "rb") as f:
-            while chunk := f.read(8192):
-                full_content_hasher.update(chunk)
+        full_content_hash = hash_file_content(path_obj, self._algorithm)
 
         return Anchor(
             identifier=identifier,
@@ -464,7 +511,7 @@ class LineHashMerkleAnchorGenerator(AnchorGenerator):
                     "line_count": len(lines),
                 },
             ),
-            auxiliary_fingerprints={"full_content": full_content_hasher.hexdigest()},
+            auxiliary_fingerprints={"full_content": full_content_hash},
         )
 
     def _build_merkle_tree(self, hashes: list[str]) -> str:
@@ -753,8 +800,9 @@ class PythonASTAnchorGenerator(AnchorGenerator):
 
         elif isinstance(node, ast.Str):
             # Replace string literals with placeholder
+            # ast.Str matches every str Constant on 3.8+; nodes carry no parent
             if self._ignore_docstrings and isinstance(
-                node.parent, getattr(ast, "Expr", type(None))
+                getattr(node, "parent", None), getattr(ast, "Expr", type(None))
             ):
                 # This might be a docstring
                 return ast.Pass()  # Placeholder
@@ -1004,7 +1052,10 @@ class AnchorFactory:
 
     @classmethod
     def create_anchors_for_snapshot(
-        cls, snapshot: "Snapshot", method: ContentFingerprintMethod | None = None
+        cls,
+        snapshot: "Snapshot",
+        method: ContentFingerprintMethod | None = None,
+        previous: "AnchorSet | Iterable[Anchor] | None" = None,
     ) -> list[Anchor]:
         """
         Create anchors for all files in a snapshot.
@@ -1012,21 +1063,13 @@ class AnchorFactory:
         Args:
             snapshot: Snapshot to create anchors for
             method: Fingerprint method to use (default: based on type)
+            previous: Anchors of an earlier snapshot; unchanged files reuse them
 
         Returns:
             List of anchors
         """
-        anchors: list[Anchor] = []
-        Path(snapshot.source_path)
-
-        # We need to extract file paths from snapshot observations
-        # For now, this is a placeholder - will be implemented when we have
-        # observation data structure
-
-        # TODO: Extract file paths from snapshot observations
-        # This will depend on the observation structure
-
-        return anchors
+        stage = SnapshotAnchorStage(method=method, previous=previous)
+        return stage.generate(snapshot).to_list()
 
 
 # ============================================================================
@@ -1209,6 +1252,227 @@ class AnchorComparison:
         return "\n".join(lines)
 
 
+# ============================================================================
+# SNAPSHOT ANCHOR STAGE
+# ============================================================================
+
+# Observation keys that name a single file, and keys that list files
+_PATH_KEYS = ("file", "file_path", "path", "source_file")
+_LISTING_KEYS = ("files", "modules")
+
+# Files per pool task, and tasks in flight per worker; bounds memory while
+# results stream back in order
+ANCHOR_BATCH_SIZE = 64
+MAX_PENDING_ANCHORS_PER_WORKER = 4
+
+
+def observed_file_paths(snapshot: "Snapshot") -> list[Path]:
+    """
+    Every file path the snapshot's observations mention, sorted.
+
+    Relative paths are resolved against the nearest ``root_path`` of the
+    observation, else the snapshot's source path. Paths are not checked
+    against the filesystem here.
+    """
+    source_root = Path(snapshot.source_path)
+    paths: dict[str, Path] = {}
+    for group in snapshot.payload.groups:
+        for observation in group.observations:
+            for path in _observation_paths(observation, source_root):
+                paths.setdefault(str(path), path)
+    return [paths[key] for key in sorted(paths)]
+
+
+def _observation_paths(observation: Any, root: Path) -> Iterator[Path]:
+    stack: list[tuple[Any, Path]] = [(observation, root)]
+    while stack:
+        node, base = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        node_root = node.get("root_path")
+        if isinstance(node_root, str) and node_root:
+            base = _resolve_path(node_root, base)
+
+        for key in _PATH_KEYS:
+            value = node.get(key)
+            if isinstance(value, str) and value:
+                yield _resolve_path(value, base)
+
+        for key in _LISTING_KEYS:
+            entries = node.get(key)
+            if not isinstance(entries, (list, tuple)):
+                continue
+            for entry in entries:
+                if isinstance(entry, str) and entry:
+                    yield _resolve_path(entry, base)
+                elif isinstance(entry, dict):
+                    stack.append((entry, base))
+                elif (
+                    isinstance(entry, (list, tuple))
+                    and entry
+                    and isinstance(entry[0], str)
+                ):
+                    # file_sight listings are (relative path, metadata) pairs
+                    yield _resolve_path(entry[0], base)
+
+        result = node.get("result")
+        if isinstance(result, dict):
+            stack.append((result, base))
+
+
+def _resolve_path(value: str, base: Path) -> Path:
+    path = Path(value)
+    return Path(os.path.normpath(path if path.is_absolute() else base / path))
+
+
+def file_stamp(stat_result: os.stat_result) -> list[int]:
+    """The (size, mtime, inode) triple that decides whether an anchor is reused."""
+    return [stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino]
+
+
+@dataclass
+class AnchorStageStats:
+    """Counters for one anchor generation run."""
+
+    files: int = 0
+    hashed: int = 0
+    reused: int = 0
+    skipped: int = 0  # Missing, not a regular file, or unreadable
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "files": self.files,
+            "hashed": self.hashed,
+            "reused": self.reused,
+            "skipped": self.skipped,
+        }
+
+
+class SnapshotAnchorStage:
+    """
+    Anchor generation for whole snapshots.
+
+    Files are anchored on a thread pool (content hashing releases the GIL)
+    and anchors stream back in path order through ``iter_anchors``. Each
+    generated anchor records the file's (size, mtime, inode) under
+    ``metadata.parameters["file_stat"]``; when a previous snapshot's anchor
+    for the same path, method and stamp exists it is reused without reading
+    the file.
+
+    ``method=None`` picks the per-type default (AST hashes for Python
+    modules). Those methods are pure Python and gain little from threads;
+    FULL_CONTENT_SHA256 is the one that scales to very large trees.
+    """
+
+    def __init__(
+        self,
+        method: ContentFingerprintMethod | None = (
+            ContentFingerprintMethod.FULL_CONTENT_SHA256
+        ),
+        workers: int | None = None,
+        previous: "AnchorSet | Iterable[Anchor] | None" = None,
+    ):
+        self.method = method
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        previous_anchors = (
+            previous.anchors if isinstance(previous, AnchorSet) else previous or ()
+        )
+        self._previous: dict[str, Anchor] = {
+            anchor.original_path: anchor
+            for anchor in previous_anchors
+            if anchor.original_path
+        }
+        self.stats = AnchorStageStats()
+
+    def generate(self, snapshot: "Snapshot") -> "AnchorSet":
+        """Anchor every file the snapshot's observations mention."""
+        paths = observed_file_paths(snapshot)
+        return AnchorSet.from_list(
+            list(self.iter_anchors(paths, base_path=snapshot.source_path))
+        )
+
+    def iter_anchors(
+        self, paths: Iterable[str | Path], base_path: str | Path | None = None
+    ) -> Iterator[Anchor]:
+        """
+        Yield one anchor per readable regular file, in the order given.
+
+        Paths go to the pool in batches of ``ANCHOR_BATCH_SIZE``, and at most
+        ``workers * MAX_PENDING_ANCHORS_PER_WORKER`` batches are in flight, so
+        a large tree streams without holding every result.
+        """
+        if self.workers <= 1:
+            for path in paths:
+                yield from self._collect([self._anchor_for(Path(path), base_path)])
+            return
+
+        max_pending = self.workers * MAX_PENDING_ANCHORS_PER_WORKER
+        pending: deque[Future[list[tuple[Anchor | None, bool]]]] = deque()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            batch: list[Path] = []
+            for path in paths:
+                batch.append(Path(path))
+                if len(batch) < ANCHOR_BATCH_SIZE:
+                    continue
+                pending.append(executor.submit(self._anchor_batch, batch, base_path))
+                batch = []
+                if len(pending) >= max_pending:
+                    yield from self._collect(pending.popleft().result())
+            if batch:
+                pending.append(executor.submit(self._anchor_batch, batch, base_path))
+            while pending:
+                yield from self._collect(pending.popleft().result())
+
+    def _collect(self, results: list[tuple[Anchor | None, bool]]) -> Iterator[Anchor]:
+        for anchor, reused in results:
+            self.stats.files += 1
+            if anchor is None:
+                self.stats.skipped += 1
+            elif reused:
+                self.stats.reused += 1
+                yield anchor
+            else:
+                self.stats.hashed += 1
+                yield anchor
+
+    def _anchor_batch(
+        self, paths: list[Path], base_path: str | Path | None
+    ) -> list[tuple[Anchor | None, bool]]:
+        return [self._anchor_for(path, base_path) for path in paths]
+
+    def _anchor_for(
+        self, path: Path, base_path: str | Path | None
+    ) -> tuple[Anchor | None, bool]:
+        """``(anchor, reused)``; ``(None, False)`` when the file can't be anchored."""
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return None, False
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None, False
+
+        stamp = file_stamp(stat_result)
+        method = self.method or ContentFingerprintMethod.default_for_type(
+            AnchorType.from_path(path)
+        )
+        previous = self._previous.get(str(path.absolute()))
+        if (
+            previous is not None
+            and previous.fingerprint_method == method
+            and previous.metadata.parameters.get("file_stat") == stamp
+        ):
+            return previous, True
+
+        kwargs = {"base_path": base_path} if base_path is not None else {}
+        try:
+            anchor = AnchorFactory.get_generator(method).generate(path, **kwargs)
+        except (OSError, ValueError):
+            return None, False
+        parameters = {**anchor.metadata.parameters, "file_stat": stamp}
+        metadata = replace(anchor.metadata, parameters=parameters)
+        return replace(anchor, metadata=metadata), False
+
+
 # ============================================================================
 # PUBLIC API
 # ============================================================================
@@ -1274,21 +1538,28 @@ def verify_anchor_consistency(anchor: Anchor) -> tuple[bool, str | None]:
         return False, f"Verification error: {str(e)}"
 
 
-def compute_anchors_for_snapshot(snapshot: "Snapshot") -> list[Anchor]:
+def compute_anchors_for_snapshot(
+    snapshot: "Snapshot",
+    previous: "AnchorSet | Iterable[Anchor] | None" = None,
+    workers: int | None = None,
+) -> list[Anchor]:
     """
     Compute anchors for all files in a snapshot.
 
-    This is the main function to call after creating a snapshot.
+    This is the main function to call after creating a snapshot. Files are
+    content-hashed in parallel; pass the previous snapshot's anchors to
+    reuse those whose files are unchanged.
 
     Args:
         snapshot: Snapshot to compute anchors for
+        previous: Anchors of an earlier snapshot of the same tree
+        workers: Hashing threads (default: based on CPU count)
 
     Returns:
         List of anchors for the snapshot
     """
-    # TODO: Implement based on snapshot observation data
-    # For now, return empty list
-    return []
+    stage = SnapshotAnchorStage(previous=previous, workers=workers)
+    return stage.generate(snapshot).to_list()
 
 
 # ============================================================================
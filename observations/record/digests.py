@@ -0,0 +1,356 @@
+"""
+observations/record/digests.py
+
+Per-observation digest tables and the input-hash index for saved snapshots.
+
+When a snapshot is saved, a digest table is written next to it. The table
+lists every observation's key and the SHA-256 of its canonical JSON, sorted
+by key. The snapshot's input hash is also recorded in a per-directory
+index. Drift comparison then becomes a sorted merge of two tables, and
+finding earlier snapshots of the same input is one index lookup. Neither
+needs to load a snapshot.
+
+Layout (next to ``<snapshots_dir>/<stem>.json``):
+    <snapshots_dir>/digests/<stem>.json
+        {"format": 1, "snapshot_id": ..., "input_hash": ...,
+         "entries": [[key, digest], ...]}
+    <snapshots_dir>/digests/input_index.json
+        {"format": 1, "inputs": {input_hash: [stem, ...]}}
+
+    The sidecars live in a subdirectory so that ``*.json`` globs over the
+    snapshots directory still only see snapshots.
+
+Production principle: A digest is a promise about content. Only the bodies
+whose promises differ need to be opened.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+DIGESTS_DIRNAME = "digests"
+INPUT_INDEX_NAME = "input_index.json"
+DIGEST_TABLE_FORMAT = 1
+
+# Observation fields that identify an observation when it has no "id"
+_PATH_KEYS = ("file", "file_path", "path")
+
+# One encoder for every observation; json.dumps builds a new one per call
+_CANONICAL_JSON = json.JSONEncoder(separators=(",", ":"), sort_keys=True).encode
+
+
+# ============================================================================
+# DIGEST TABLES
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class DigestTable:
+    """Sorted ``(key, digest)`` pairs for one snapshot's observations."""
+
+    entries: tuple[tuple[str, str], ...]
+    snapshot_id: str | None = None
+    input_hash: str | None = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format": DIGEST_TABLE_FORMAT,
+            "snapshot_id": self.snapshot_id,
+            "input_hash": self.input_hash,
+            "entries": [list(entry) for entry in self.entries],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DigestTable":
+        if data.get("format") != DIGEST_TABLE_FORMAT:
+            raise ValueError(f"Unsupported digest table format: {data.get('format')}")
+        entries = tuple((str(key), str(digest)) for key, digest in data["entries"])
+        if any(a[0] >= b[0] for a, b in zip(entries, entries[1:], strict=False)):
+            raise ValueError("Digest table entries are not sorted by key")
+        return cls(
+            entries=entries,
+            snapshot_id=data.get("snapshot_id"),
+            input_hash=data.get("input_hash"),
+        )
+
+
+def observation_digest(observation: Any) -> str:
+    """SHA-256 of an observation's canonical JSON (same as compute_dict_hash)."""
+    return hashlib.sha256(_CANONICAL_JSON(observation).encode("utf-8")).hexdigest()
+
+
+def observation_key(observation: Any, eye_name: str, position: int) -> str:
+    """
+    Stable key for an observation across snapshots.
+
+    The observation's own ``id`` if it has one, else its eye and file,
+    else its eye and position within the eye's observations.
+    """
+    if isinstance(observation, dict):
+        observation_id = observation.get("id")
+        if observation_id:
+            return str(observation_id)
+        for field_name in _PATH_KEYS:
+            value = observation.get(field_name)
+            if isinstance(value, str) and value:
+                return f"{eye_name}:{value}"
+    return f"{eye_name}#{position}"
+
+
+def iter_keyed_observations(
+    snapshot_dict: dict[str, Any],
+) -> Iterator[tuple[str, Any]]:
+    """
+    ``(key, observation)`` for every observation of a snapshot dictionary.
+
+    Reads both the payload form (``payload.groups[].observations``) and a
+    flat ``observations`` list. Keys that collide get a ``#n`` suffix in
+    order of appearance.
+    """
+    seen: dict[str, int] = {}
+
+    def unique(key: str) -> str:
+        count = seen.get(key, 0) + 1
+        seen[key] = count
+        return key if count == 1 else f"{key}#{count}"
+
+    groups = (snapshot_dict.get("payload") or {}).get("groups") or []
+    for group in groups:
+        eye_name = str(group.get("eye_name") or "unknown")
+        for position, observation in enumerate(group.get("observations") or []):
+            yield unique(observation_key(observation, eye_name, position)), observation
+
+    # Flat observations are positioned within their eye, as in a group
+    positions: dict[str, int] = {}
+    for observation in snapshot_dict.get("observations") or []:
+        eye_name = observation_eye(observation)
+        position = positions.get(eye_name, 0)
+        positions[eye_name] = position + 1
+        yield unique(observation_key(observation, eye_name, position)), observation
+
+
+def observation_eye(observation: Any) -> str:
+    """The eye a flat observation came from: its ``type``, else "observation"."""
+    if isinstance(observation, dict) and observation.get("type"):
+        return str(observation["type"])
+    return "observation"
+
+
+def snapshot_input_hash(snapshot_dict: dict[str, Any]) -> str | None:
+    """
+    Hash of what a snapshot observed.
+
+    This is an explicit ``input_hash`` if the snapshot has one. Otherwise
+    it is derived from the anchors' paths and content fingerprints, the
+    eyes used and the CodeMarshal version. A snapshot without anchors has
+    no input hash.
+    """
+    explicit = snapshot_dict.get("input_hash")
+    if explicit:
+        return str(explicit)
+
+    anchors = snapshot_dict.get("anchors")
+    if not anchors:
+        return None
+    metadata = snapshot_dict.get("metadata") or {}
+    inputs = {
+        "anchors": sorted(
+            [
+                anchor.get("relative_path") or anchor.get("original_path") or "",
+                anchor.get("content_fingerprint") or "",
+            ]
+            for anchor in anchors
+        ),
+        "eyes_used": sorted(metadata.get("eyes_used") or []),
+        "codemarshal_version": metadata.get("codemarshal_version"),
+    }
+    return observation_digest(inputs)
+
+
+def build_digest_table(snapshot_dict: dict[str, Any]) -> DigestTable:
+    """Digest every observation of a snapshot dictionary."""
+    entries = sorted(
+        (key, observation_digest(observation))
+        for key, observation in iter_keyed_observations(snapshot_dict)
+    )
+    metadata = snapshot_dict.get("metadata") or {}
+    return DigestTable(
+        entries=tuple(entries),
+        snapshot_id=metadata.get("snapshot_id"),
+        input_hash=snapshot_input_hash(snapshot_dict),
+    )
+
+
+def build_observations_digest_table(
+    observations: list[Any], input_hash: str | None = None
+) -> DigestTable:
+    """
+    Digest a flat observation list the way a saved snapshot is digested.
+
+    Observations are grouped by eye and normalized as snapshot observation
+    groups are, so an unchanged observation gets the same key and digest
+    as in a snapshot recorded from the same eyes.
+    """
+    from observations.record.snapshot import ObservationCategory, ObservationGroup
+
+    by_eye: dict[str, list[Any]] = {}
+    for observation in observations:
+        by_eye.setdefault(observation_eye(observation), []).append(observation)
+    groups = [
+        ObservationGroup.from_eye_results(
+            ObservationCategory.CONTENT, eye_name, eye_observations
+        ).to_dict()
+        for eye_name, eye_observations in by_eye.items()
+    ]
+    table = build_digest_table({"payload": {"groups": groups}})
+    return DigestTable(entries=table.entries, input_hash=input_hash)
+
+
+def diff_digest_tables(
+    old: DigestTable, new: DigestTable
+) -> Iterator[tuple[str, str | None, str | None]]:
+    """
+    Sorted merge of two tables.
+
+    Yields ``(key, old_digest, new_digest)`` for every key that was
+    removed (new is None), added (old is None) or changed. Keys with equal
+    digests are skipped.
+    """
+    old_entries, new_entries = old.entries, new.entries
+    i = j = 0
+    while i < len(old_entries) and j < len(new_entries):
+        old_key, old_digest = old_entries[i]
+        new_key, new_digest = new_entries[j]
+        if old_key == new_key:
+            if old_digest != new_digest:
+                yield old_key, old_digest, new_digest
+            i += 1
+            j += 1
+        elif old_key < new_key:
+            yield old_key, old_digest, None
+            i += 1
+        else:
+            yield new_key, None, new_digest
+            j += 1
+    for old_key, old_digest in old_entries[i:]:
+        yield old_key, old_digest, None
+    for new_key, new_digest in new_entries[j:]:
+        yield new_key, None, new_digest
+
+
+# ============================================================================
+# SIDECAR STORAGE
+# ============================================================================
+
+
+def digest_table_path(snapshot_path: str | Path) -> Path:
+    snapshot_path = Path(snapshot_path)
+    return snapshot_path.parent / DIGESTS_DIRNAME / f"{snapshot_path.stem}.json"
+
+
+def input_index_path(snapshots_dir: str | Path) -> Path:
+    return Path(snapshots_dir) / DIGESTS_DIRNAME / INPUT_INDEX_NAME
+
+
+def save_digest_table(table: DigestTable, snapshot_path: str | Path) -> Path:
+    from storage.atomic import atomic_write_json_compatible
+
+    path = digest_table_path(snapshot_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_json_compatible(path, table.to_dict(), indent=None)
+    return path
+
+
+def load_digest_table(snapshot_path: str | Path) -> DigestTable | None:
+    """The snapshot's saved table, or None if it has none or it is unreadable."""
+    path = digest_table_path(snapshot_path)
+    try:
+        return DigestTable.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def index_input_hash(
+    snapshots_dir: str | Path, input_hash: str, snapshot_stem: str
+) -> None:
+    """Record that ``snapshot_stem`` was taken from ``input_hash``."""
+    from storage.atomic import atomic_write_json_compatible
+
+    path = input_index_path(snapshots_dir)
+    index = _read_input_index(path) or {}
+    stems = index.setdefault(input_hash, [])
+    if snapshot_stem in stems:
+        return
+    stems.append(snapshot_stem)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_json_compatible(
+        path, {"format": DIGEST_TABLE_FORMAT, "inputs": index}, indent=None
+    )
+
+
+def find_snapshots_by_input_hash(
+    snapshots_dir: str | Path, input_hash: str
+) -> list[Path] | None:
+    """
+    Snapshots in ``snapshots_dir`` taken from ``input_hash``, oldest first.
+
+    Returns None when the directory has no index, so callers can tell
+    "no match" from "never indexed".
+    """
+    index = _read_input_index(input_index_path(snapshots_dir))
+    if index is None:
+        return None
+    return [
+        Path(snapshots_dir) / f"{stem}.json"
+        for stem in index.get(input_hash, [])
+        if (Path(snapshots_dir) / f"{stem}.json").exists()
+    ]
+
+
+def _read_input_index(path: Path) -> dict[str, list[str]] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    inputs = data.get("inputs") if isinstance(data, dict) else None
+    if not isinstance(inputs, dict):
+        return None
+    return {str(key): list(stems) for key, stems in inputs.items()}
+
+
+def record_snapshot_digests(
+    snapshot_dict: dict[str, Any], snapshot_path: str | Path
+) -> DigestTable:
+    """Write the digest table and index entry for a just-saved snapshot."""
+    snapshot_path = Path(snapshot_path)
+    table = build_digest_table(snapshot_dict)
+    save_digest_table(table, snapshot_path)
+    if table.input_hash:
+        index_input_hash(snapshot_path.parent, table.input_hash, snapshot_path.stem)
+    return table
+
+
+__all__ = [
+    "DigestTable",
+    "observation_digest",
+    "observation_key",
+    "iter_keyed_observations",
+    "observation_eye",
+    "snapshot_input_hash",
+    "build_digest_table",
+    "build_observations_digest_table",
+    "diff_digest_tables",
+    "digest_table_path",
+    "input_index_path",
+    "save_digest_table",
+    "load_digest_table",
+    "index_input_hash",
+    "find_snapshots_by_input_hash",
+    "record_snapshot_digests",
+]
@@ -5,7 +5,8 @@ Tamper alarm system for snapshots.
 
 This module provides:
 - Canonical hashing rules
-- Hash tree / Merkle-style root computation
+- Hash tree / Merkle-style root computation (flat level arrays, inclusion
+  proofs, single-leaf updates, compact binary form)
 - Integrity verification functions
 
 Production principle: Corruption that is detected is survivable.
@@ -14,9 +15,11 @@ Corruption that is hidden becomes institutionalized.
 This module must be boring, strict, and merciless.
 """
 
+import base64
 import hashlib
 import json
-from collections.abc import Callable
+import struct
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
@@ -58,6 +61,12 @@ class HashAlgorithm(StrEnum):
         else:
             raise ValueError(f"Unsupported hash algorithm: {self}")
 
+    @property
+    def constructor(self) -> Callable[..., Any]:
+        """hashlib constructor for this algorithm, e.g. ``hashlib.sha256``."""
+        constructor: Callable[..., Any] = getattr(hashlib, self.value)
+        return constructor
+
     @property
     def digest_size(self) -> int:
         """Size of the hash digest in bytes."""
@@ -300,7 +309,26 @@ class HashTreeNode:
 
 
 class HashTree:
-    """Merkle tree for efficient integrity verification of large datasets."""
+    """
+    Merkle tree for efficient integrity verification of large datasets.
+
+    The tree is stored as flat levels rather than linked nodes: level 0 holds
+    the leaf digests and each level above holds the digests of adjacent pairs
+    below it, an odd last node being paired with itself. Every level is one
+    ``bytearray`` of raw digests, so a tree over 100k items is a few MB of
+    contiguous memory, every internal hash is computed exactly once, and
+    nothing recurses.
+
+    The pairing rule is the one the linked-node tree used, so root hashes are
+    unchanged. Proofs are the sibling digests from leaf to root; the leaf
+    index alone says which side each sibling is on.
+    """
+
+    # Binary form: magic, format version, algorithm, leaf count, root, leaves
+    MAGIC = b"CMMT"
+    FORMAT_VERSION = 1
+    ENCODING = "merkle-levels-v1"
+    _HEADER = struct.Struct(">4sBBQ")
 
     def __init__(
         self,
@@ -318,46 +346,162 @@ class HashTree:
         """
         self.algorithm = algorithm
         self.hash_func = hash_func or compute_dict_hash
+        self._digest_size = algorithm.digest_size
+        self._new = algorithm.constructor
 
-        if not items:
-            self.root = None
-            self.leaf_count = 0
-            return
-
-        # Create leaf nodes
-        leaves = []
+        leaves = bytearray()
         for item in items:
-            item_hash = self.hash_func(item, self.algorithm)
-            leaf = HashTreeNode.create_leaf(item_hash, self.algorithm)
-            leaves.append(leaf)
-
-        self.leaf_count = len(leaves)
-        self.root = self._build_tree(leaves)
-
-    def _build_tree(self, nodes: list[HashTreeNode]) -> HashTreeNode:
-        """Recursively build tree from nodes."""
-        if len(nodes) == 1:
-            return nodes[0]
-
-        # Pair nodes and combine
-        paired = []
-        for i in range(0, len(nodes), 2):
-            if i + 1 < len(nodes):
-                paired.append(
-                    HashTreeNode.create_internal(nodes[i], nodes[i + 1], self.algorithm)
-                )
+            leaves += bytes.fromhex(self.hash_func(item, self.algorithm))
+        self._build(leaves)
+
+    @classmethod
+    def from_digests(
+        cls,
+        digests: Iterable[bytes | str],
+        algorithm: HashAlgorithm = HashAlgorithm.default(),
+        hash_func: Callable[[Any, HashAlgorithm], str] | None = None,
+    ) -> "HashTree":
+        """Build a tree from precomputed leaf digests (bytes or hex strings)."""
+        tree = cls([], algorithm, hash_func)
+        leaves = bytearray()
+        for digest in digests:
+            leaves += tree._as_digest(digest)
+        tree._build(leaves)
+        return tree
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def _build(self, leaves: bytearray) -> None:
+        """Compute every level above ``leaves``."""
+        self.levels: list[bytearray] = [leaves]
+        while len(self.levels[-1]) > self._digest_size:
+            self.levels.append(self._parent_level(self.levels[-1]))
+
+    def _parent_level(self, level: bytearray) -> bytearray:
+        size = self._digest_size
+        new = self._new
+        count = len(level) // size
+        view = memoryview(level)
+        parents = bytearray()
+        paired_end = (count // 2) * 2 * size
+        for offset in range(0, paired_end, 2 * size):
+            parents += new(view[offset : offset + 2 * size]).digest()
+        if count % 2:
+            last = bytes(view[paired_end : paired_end + size])
+            parents += new(last + last).digest()
+        view.release()
+        return parents
+
+    def _node(self, level: int, index: int) -> bytes:
+        size = self._digest_size
+        return bytes(self.levels[level][index * size : (index + 1) * size])
+
+    def _as_digest(self, value: bytes | str) -> bytes:
+        digest = bytes.fromhex(value) if isinstance(value, str) else bytes(value)
+        if len(digest) != self._digest_size:
+            raise ValueError(
+                f"Hash length mismatch for algorithm {self.algorithm}: "
+                f"expected {self._digest_size} bytes, got {len(digest)}"
+            )
+        return digest
+
+    def _item_digest(self, item: Any) -> bytes:
+        return bytes.fromhex(self.hash_func(item, self.algorithm))
+
+    def _rehash_path(self, index: int) -> None:
+        """Recompute the ancestors of leaf ``index`` after it changed."""
+        size = self._digest_size
+        level = 0
+        while len(self.levels[level]) > size:
+            if level + 1 == len(self.levels):
+                self.levels.append(bytearray())
+            parent = index // 2
+            left = self._node(level, parent * 2)
+            if parent * 2 + 1 < len(self.levels[level]) // size:
+                right = self._node(level, parent * 2 + 1)
             else:
-                # Odd number of nodes: duplicate last node
-                paired.append(
-                    HashTreeNode.create_internal(nodes[i], nodes[i], self.algorithm)
-                )
+                right = left
+            digest = self._new(left + right).digest()
+            above = self.levels[level + 1]
+            if parent * size == len(above):
+                above += digest
+            else:
+                above[parent * size : (parent + 1) * size] = digest
+            index = parent
+            level += 1
+
+    # ------------------------------------------------------------------
+    # Incremental changes
+    # ------------------------------------------------------------------
+
+    def append(self, item: Any) -> int:
+        """Add one item as the last leaf; returns its index. O(log n)."""
+        return self.append_digest(self._item_digest(item))
+
+    def append_digest(self, digest: bytes | str) -> int:
+        """Add one precomputed leaf digest; returns its index. O(log n)."""
+        index = self.leaf_count
+        self.levels[0] += self._as_digest(digest)
+        self._rehash_path(index)
+        return index
+
+    def update(self, index: int, item: Any) -> None:
+        """Replace the item at ``index``. O(log n)."""
+        self.update_digest(index, self._item_digest(item))
+
+    def update_digest(self, index: int, digest: bytes | str) -> None:
+        """Replace the leaf digest at ``index``. O(log n)."""
+        if index < 0 or index >= self.leaf_count:
+            raise IndexError(f"Leaf index {index} out of range")
+        size = self._digest_size
+        self.levels[0][index * size : (index + 1) * size] = self._as_digest(digest)
+        self._rehash_path(index)
 
-        return self._build_tree(paired)
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def leaf_count(self) -> int:
+        return len(self.levels[0]) // self._digest_size
+
+    def __len__(self) -> int:
+        return self.leaf_count
+
+    @property
+    def root_digest(self) -> bytes | None:
+        """Root of the tree as raw bytes."""
+        if not self.levels[0]:
+            return None
+        return bytes(self.levels[-1])
 
     @property
     def root_hash(self) -> str | None:
         """Get the root hash of the tree."""
-        return self.root.hash_value if self.root else None
+        root = self.root_digest
+        return root.hex() if root is not None else None
+
+    def leaf_hash(self, index: int) -> str:
+        """Hex digest of the leaf at ``index``."""
+        if index < 0 or index >= self.leaf_count:
+            raise IndexError(f"Leaf index {index} out of range")
+        return self._node(0, index).hex()
+
+    def proof(self, index: int) -> list[bytes]:
+        """Sibling digests from leaf ``index`` up to the root. O(log n)."""
+        if index < 0 or index >= self.leaf_count:
+            raise IndexError(f"Leaf index {index} out of range")
+        size = self._digest_size
+        siblings = []
+        for level in range(len(self.levels) - 1):
+            sibling = index ^ 1
+            if sibling >= len(self.levels[level]) // size:
+                sibling = index  # Odd last node is paired with itself
+            siblings.append(self._node(level, sibling))
+            index //= 2
+        return siblings
 
     def verify_item(self, item: Any, index: int) -> tuple[bool, list[str] | None]:
         """
@@ -368,59 +512,22 @@ class HashTree:
             index: Index of item in original list
 
         Returns:
-            Tuple of (is_valid: bool, proof_path: Optional[List[str]])
+            Tuple of (is_valid: bool, proof_path: Optional[List[str]]), the
+            proof being sibling hashes from leaf to root
         """
-        if self.root is None:
-            return False, None
-
         if index < 0 or index >= self.leaf_count:
             return False, None
 
-        # Compute item hash
         item_hash = self.hash_func(item, self.algorithm)
-
-        # Navigate tree to build proof
-        proof = []
-        node = self.root
-        leaf_index = index
-        leaf_count = self.leaf_count
-
-        while node.left is not None and node.right is not None:
-            # Determine which side our leaf is on
-            # At each level, half the leaves are on each side
-            half = (leaf_count + 1) // 2  # Ceiling division
-
-            if leaf_index < half:
-                # Leaf is in left subtree
-                proof.append(("right", node.right.hash_value))
-                node = node.left
-                leaf_count = half
-            else:
-                # Leaf is in right subtree
-                proof.append(("left", node.left.hash_value))
-                node = node.right
-                leaf_index -= half
-                leaf_count = leaf_count - half
-
-        # At leaf: verify hash
-        if node.hash_value != item_hash:
+        if item_hash != self.leaf_hash(index):
             return False, None
 
-        # Reconstruct from proof
-        current_hash = item_hash
-        for side, sibling_hash in reversed(proof):
-            if side == "left":
-                current_hash = combine_hashes(
-                    sibling_hash, current_hash, self.algorithm
-                )
-            else:
-                current_hash = combine_hashes(
-                    current_hash, sibling_hash, self.algorithm
-                )
-
-        return current_hash == self.root_hash, [h for _, h in proof]
+        proof = [sibling.hex() for sibling in self.proof(index)]
+        return self.verify_proof(item_hash, index, proof), proof
 
-    def verify_proof(self, item_hash: str, index: int, proof: list[str]) -> bool:
+    def verify_proof(
+        self, item_hash: bytes | str, index: int, proof: list[bytes] | list[str]
+    ) -> bool:
         """
         Verify a Merkle proof.
 
@@ -432,56 +539,176 @@ class HashTree:
         Returns:
             True if proof is valid
         """
-        if self.root is None:
+        root = self.root_digest
+        if root is None or index >= self.leaf_count:
             return False
+        return verify_inclusion(item_hash, index, proof, root, self.algorithm)
 
-        current_hash = item_hash
-        leaf_index = index
-        leaf_count = self.leaf_count
+    def verify_tree(self) -> bool:
+        """Verify the entire tree structure by recomputing it from the leaves."""
+        leaves = self.levels[0]
+        if len(leaves) % self._digest_size:
+            return False
+        rebuilt = HashTree([], self.algorithm)
+        rebuilt._build(bytearray(leaves))
+        return rebuilt.levels == self.levels
 
-        for sibling_hash in proof:
-            # Determine if sibling is left or right based on index
-            half = (leaf_count + 1) // 2
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
 
-            if leaf_index < half:
-                # Sibling is on the right
-                current_hash = combine_hashes(
-                    current_hash, sibling_hash, self.algorithm
-                )
-                leaf_count = half
-            else:
-                # Sibling is on the left
-                current_hash = combine_hashes(
-                    sibling_hash, current_hash, self.algorithm
-                )
-                leaf_index -= half
-                leaf_count = leaf_count - half
+    def to_bytes(self) -> bytes:
+        """
+        Compact binary form: header, root digest, then the leaf digests.
 
-        return current_hash == self.root_hash
+        Internal levels are not stored; ``from_bytes`` recomputes them and
+        rejects the data if they do not reproduce the stored root.
+        """
+        header = self._HEADER.pack(
+            self.MAGIC,
+            self.FORMAT_VERSION,
+            list(HashAlgorithm).index(self.algorithm),
+            self.leaf_count,
+        )
+        root = self.root_digest or b"\x00" * self._digest_size
+        return header + root + bytes(self.levels[0])
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert tree to serializable dictionary."""
-        return {
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        hash_func: Callable[[Any, HashAlgorithm], str] | None = None,
+    ) -> "HashTree":
+        """Load a tree written by ``to_bytes``; raises ValueError if corrupt."""
+        header_size = cls._HEADER.size
+        if len(data) < header_size:
+            raise ValueError("Hash tree data is truncated")
+        magic, version, algorithm_code, leaf_count = cls._HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError("Not a hash tree (bad magic)")
+        if version != cls.FORMAT_VERSION:
+            raise ValueError(f"Unsupported hash tree format version: {version}")
+        algorithms = list(HashAlgorithm)
+        if algorithm_code >= len(algorithms):
+            raise ValueError(f"Unsupported hash algorithm code: {algorithm_code}")
+        algorithm = algorithms[algorithm_code]
+
+        size = algorithm.digest_size
+        expected = header_size + size + leaf_count * size
+        if len(data) != expected:
+            raise ValueError(
+                f"Hash tree size mismatch: expected {expected} bytes, got {len(data)}"
+            )
+        stored_root = bytes(data[header_size : header_size + size])
+
+        tree = cls([], algorithm, hash_func)
+        tree._build(bytearray(data[header_size + size :]))
+        if leaf_count and tree.root_digest != stored_root:
+            raise ValueError("Hash tree root doesn't match its leaves")
+        return tree
+
+    def to_dict(self, include_leaves: bool = True) -> dict[str, Any]:
+        """
+        Convert tree to serializable dictionary.
+
+        With ``include_leaves`` the binary form is embedded (base64) so the
+        tree can be reloaded; without it only the root and size are kept.
+        """
+        result: dict[str, Any] = {
             "algorithm": self.algorithm.value,
+            "encoding": self.ENCODING,
             "leaf_count": self.leaf_count,
-            "root": self.root.to_dict() if self.root else None,
+            "root_hash": self.root_hash,
         }
+        if include_leaves:
+            result["tree"] = base64.b64encode(self.to_bytes()).decode("ascii")
+        return result
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "HashTree":
-        """Create tree from dictionary."""
-        tree = cls([], HashAlgorithm(data["algorithm"]))
-        tree.leaf_count = data["leaf_count"]
-        if data["root"]:
-            tree.root = HashTreeNode.from_dict(data["root"])
+        """
+        Create tree from dictionary.
+
+        Accepts both the current form and the nested node form written by
+        earlier versions (``{"root": {"hash", "left", "right"}}``).
+        """
+        if "tree" in data:
+            return cls.from_bytes(base64.b64decode(data["tree"]))
+        if data.get("encoding") == cls.ENCODING:
+            raise ValueError("Hash tree dictionary has no leaves")
+
+        algorithm = HashAlgorithm(data["algorithm"])
+        leaf_count = data["leaf_count"]
+        leaves = _legacy_leaves(data.get("root"))[:leaf_count]
+        tree = cls.from_digests(leaves, algorithm)
+        if tree.leaf_count != leaf_count:
+            raise ValueError("Hash tree has fewer leaves than its leaf_count")
+        root = data.get("root")
+        if root and tree.root_hash != root["hash"]:
+            raise ValueError("Hash tree root doesn't match its leaves")
         return tree
 
-    def verify_tree(self) -> bool:
-        """Verify the entire tree structure."""
-        if self.root is None:
-            return self.leaf_count == 0
 
-        return self.root.verify()
+def _legacy_leaves(root: dict[str, Any] | None) -> list[str]:
+    """Leaf hashes of a nested-node tree, left to right, without recursion.
+
+    Odd levels were padded by duplicating their last node, so padding only
+    ever appears after the real leaves.
+    """
+    leaves: list[str] = []
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        if "left" in node and "right" in node:
+            stack.append(node["right"])
+            stack.append(node["left"])
+        else:
+            leaves.append(node["hash"])
+    return leaves
+
+
+def verify_inclusion(
+    item_hash: bytes | str,
+    index: int,
+    proof: list[bytes] | list[str],
+    root: bytes | str,
+    algorithm: HashAlgorithm = HashAlgorithm.default(),
+) -> bool:
+    """
+    Check a ``HashTree`` inclusion proof without the tree.
+
+    Args:
+        item_hash: Leaf digest (bytes or hex)
+        index: Leaf index
+        proof: Sibling digests from leaf to root, as returned by ``HashTree.proof``
+        root: Expected root digest (bytes or hex)
+        algorithm: Hash algorithm of the tree
+
+    Returns:
+        True if the proof leads from the leaf to the root
+
+    An odd last leaf is paired with itself, so its proof also verifies at
+    the index just past the end; callers that know the leaf count should
+    check ``index < leaf_count`` (``HashTree.verify_proof`` does).
+    """
+    if index < 0:
+        return False
+    try:
+        current = bytes.fromhex(item_hash) if isinstance(item_hash, str) else item_hash
+        expected = bytes.fromhex(root) if isinstance(root, str) else root
+        new = algorithm.constructor
+        for sibling in proof:
+            sibling_bytes = (
+                bytes.fromhex(sibling) if isinstance(sibling, str) else sibling
+            )
+            if index % 2:
+                current = new(sibling_bytes + current).digest()
+            else:
+                current = new(current + sibling_bytes).digest()
+            index //= 2
+    except ValueError:
+        return False
+    return index == 0 and current == expected
 
 
 # ============================================================================
@@ -657,7 +884,7 @@ def compute_snapshot_integrity(snapshot: "Snapshot") -> IntegrityRoot:
     algorithm = HashAlgorithm.default()
 
     metadata_hash = compute_dict_hash(metadata, algorithm)
-    payload_hash = compute_dict_hash(payload, algorithm)
+    payload_hash, observation_digests = _payload_digests(payload, algorithm)
     anchors_hash = compute_list_hash(anchors, algorithm) if anchors else None
 
     # Compute root hash
@@ -669,17 +896,10 @@ def compute_snapshot_integrity(snapshot: "Snapshot") -> IntegrityRoot:
         # Just metadata + payload
         root_hash = combine_hashes(metadata_hash, payload_hash, algorithm)
 
-    # Build hash tree for detailed verification
-    components = [
-        {"type": "metadata", "data": metadata},
-        {"type": "payload", "data": payload},
-    ]
-
-    if anchors:
-        components.append({"type": "anchors", "data": anchors})
-
-    hash_tree_obj = HashTree(components, algorithm)
-    hash_tree_dict = hash_tree_obj.to_dict()
+    # Per-observation tree for detailed verification; only its root is kept,
+    # snapshot_observation_tree() rebuilds it when proofs are needed
+    observation_tree = HashTree.from_digests(observation_digests, algorithm)
+    hash_tree_dict = observation_tree.to_dict(include_leaves=False)
 
     return IntegrityRoot(
         root_hash=root_hash,
@@ -728,7 +948,7 @@ def verify_snapshot_integrity(snapshot: "Snapshot") -> tuple[bool, str | None]:
         algorithm = integrity_root.algorithm
 
         metadata_hash = compute_dict_hash(metadata, algorithm)
-        payload_hash = compute_dict_hash(payload, algorithm)
+        payload_hash, observation_digests = _payload_digests(payload, algorithm)
         anchors_hash = compute_list_hash(anchors, algorithm) if anchors else None
 
         # Compare hashes
@@ -754,12 +974,92 @@ def verify_snapshot_integrity(snapshot: "Snapshot") -> tuple[bool, str | None]:
         if expected_root != integrity_root.root_hash:
             return False, "Root hash mismatch"
 
+        # Observation tree (roots computed before it existed have none)
+        hash_tree = integrity_root.hash_tree or {}
+        if hash_tree.get("encoding") == HashTree.ENCODING:
+            observation_tree = HashTree.from_digests(observation_digests, algorithm)
+            recorded = (hash_tree.get("leaf_count"), hash_tree.get("root_hash"))
+            if (observation_tree.leaf_count, observation_tree.root_hash) != recorded:
+                return False, "Observation tree mismatch"
+
         return True, None
 
     except Exception as e:
         return False, f"Verification error: {str(e)}"
 
 
+def snapshot_observation_tree(snapshot: "Snapshot") -> HashTree:
+    """
+    Per-observation hash tree of a snapshot's payload.
+
+    Leaves are the canonical hashes of the observations in canonical
+    payload order; its root is the one recorded in ``IntegrityRoot.hash_tree``.
+    Use it to produce inclusion proofs for single observations.
+    """
+    payload = snapshot.to_dict(canonical=True)["payload"]
+    algorithm = (
+        snapshot.integrity_root.algorithm
+        if snapshot.integrity_root is not None
+        else HashAlgorithm.default()
+    )
+    _payload_hash, observation_digests = _payload_digests(payload, algorithm)
+    return HashTree.from_digests(observation_digests, algorithm)
+
+
+def _payload_digests(
+    payload: dict[str, Any], algorithm: HashAlgorithm
+) -> tuple[str, list[bytes]]:
+    """
+    ``compute_dict_hash(payload)`` and one digest per observation, in one pass.
+
+    The payload's canonical JSON is fed to the hasher piece by piece (each
+    observation serialized once and hashed on its own as well), so the full
+    document is never held as a single string.
+    """
+    hasher = algorithm.create_hasher()
+    new = algorithm.constructor
+    digests: list[bytes] = []
+
+    def emit(text: str) -> None:
+        hasher.update(text.encode("utf-8"))
+
+    # One encoder for every piece; json.dumps builds a new one per call
+    dumps = json.JSONEncoder(separators=(",", ":"), sort_keys=True).encode
+
+    def emit_object(
+        obj: dict[str, Any], streamed_key: str, stream: Callable[[Any], None]
+    ) -> None:
+        emit("{")
+        for position, (key, value) in enumerate(sorted(obj.items())):
+            if position:
+                emit(",")
+            emit(dumps(key) + ":")
+            if key == streamed_key and isinstance(value, list):
+                emit("[")
+                for item_position, item in enumerate(value):
+                    if item_position:
+                        emit(",")
+                    stream(item)
+                emit("]")
+            else:
+                emit(dumps(value))
+        emit("}")
+
+    def emit_observation(observation: Any) -> None:
+        encoded = dumps(observation).encode("utf-8")
+        hasher.update(encoded)
+        digests.append(new(encoded).digest())
+
+    def emit_group(group: Any) -> None:
+        if isinstance(group, dict):
+            emit_object(group, "observations", emit_observation)
+        else:
+            emit(dumps(group))
+
+    emit_object(payload, "groups", emit_group)
+    return hasher.hexdigest(), digests
+
+
 def verify_snapshot_against_root(
     snapshot: "Snapshot", expected_root: IntegrityRoot
 ) -> tuple[bool, str | None]:
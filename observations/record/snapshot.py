@@ -884,16 +884,22 @@ def load_snapshot(path: str | Path | None = None) -> Snapshot:
 def save_snapshot(snapshot: Snapshot, path: str | Path | None = None) -> Path:
     """Save a snapshot to a JSON file.
 
-    If path is None, writes to ./snapshots/<snapshot_id>.json.
+    If path is None, writes to ./snapshots/<snapshot_id>.json. The
+    snapshot's per-observation digest table and input-hash index entry are
+    written alongside it (see observations.record.digests).
     """
+    from observations.record.digests import record_snapshot_digests
+
     if path is None:
         snapshots_dir = Path.cwd() / "snapshots"
         snapshots_dir.mkdir(parents=True, exist_ok=True)
         path = snapshots_dir / f"{snapshot.snapshot_id}.json"
 
     path_obj = Path(path)
-    json_text = snapshot.to_json(indent=2)
+    snapshot_dict = snapshot.to_dict()
+    json_text = json.dumps(snapshot_dict, indent=2, sort_keys=True)
     path_obj.write_text(json_text, encoding="utf-8")
+    record_snapshot_digests(snapshot_dict, path_obj)
     return path_obj
 
 
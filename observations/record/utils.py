@@ -1,6 +1,8 @@
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+from observations.record.anchors import Anchor, AnchorSet, compute_anchors_for_snapshot
 from observations.record.snapshot import (
     ObservationCategory,
     ObservationGroup,
@@ -10,15 +12,20 @@ from observations.record.snapshot import (
 
 
 def create_snapshot(
-    composite: Any, name: str | None = None, description: str = ""
+    composite: Any,
+    name: str | None = None,
+    description: str = "",
+    previous: Snapshot | AnchorSet | Iterable[Anchor] | None = None,
 ) -> Snapshot:
     """
-    Create a snapshot from a CompositeObservation.
+    Create an anchored snapshot from a CompositeObservation.
 
     Args:
         composite: CompositeObservation objects
         name: Name for the snapshot
         description: Description
+        previous: Earlier snapshot of the same tree (or its anchors); files
+            that have not changed since reuse its anchors
 
     Returns:
         Snapshot
@@ -81,11 +88,14 @@ def create_snapshot(
         # Just use 0 as we don't have start/end in composite usually
         pass
 
-    return Snapshot.create(
+    snapshot = Snapshot.create(
         source_path=str(composite.target),
         observation_groups=groups,
         recording_duration=duration,
     )
+    if isinstance(previous, Snapshot):
+        previous = previous.anchors
+    return snapshot.with_anchors(compute_anchors_for_snapshot(snapshot, previous))
 
 
 def load_snapshot(path: str | Path) -> Snapshot:
@@ -4,38 +4,76 @@ Pattern detection package.
 Provides pattern loading, scanning, and engine utilities.
 """
 
-from patterns.engine import FixSuggestion, PatternEngine, StatisticalAnomaly
-from patterns.collector import (
-    CurationDecision,
-    PatternCollector,
-    PatternSubmission,
-    ValidationReport,
-)
-from patterns.loader import (
-    PatternDefinition,
-    PatternLoader,
-    PatternManager,
-    PatternMatch,
-    PatternScanner,
-    PatternScanResult,
-    load_patterns,
-    scan_patterns,
-)
-from patterns.marketplace import (
-    MarketplacePattern,
-    MarketplaceQuery,
-    MarketplaceSearchResult,
-    PatternMarketplace,
-    PatternPackage,
-    PatternRatingSummary,
-    PatternReview,
-)
-from patterns.templates import (
-    PatternTemplate,
-    PatternTemplateRegistry,
-    TemplateField,
-    TemplateInstance,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from patterns.engine import FixSuggestion, PatternEngine, StatisticalAnomaly
+    from patterns.collector import (
+        CurationDecision,
+        PatternCollector,
+        PatternSubmission,
+        ValidationReport,
+    )
+    from patterns.loader import (
+        PatternDefinition,
+        PatternLoader,
+        PatternManager,
+        PatternMatch,
+        PatternScanner,
+        PatternScanResult,
+        load_patterns,
+        scan_patterns,
+    )
+    from patterns.marketplace import (
+        MarketplacePattern,
+        MarketplaceQuery,
+        MarketplaceSearchResult,
+        PatternMarketplace,
+        PatternPackage,
+        PatternRatingSummary,
+        PatternReview,
+    )
+    from patterns.templates import (
+        PatternTemplate,
+        PatternTemplateRegistry,
+        TemplateField,
+        TemplateInstance,
+    )
+
+# Public name -> defining module, imported on first access (PEP 562):
+# `patterns.prefilter` users such as `codemarshal search` must not load
+# the engine, marketplace and YAML loader with the package.
+_EXPORTS: dict[str, str] = {
+    "FixSuggestion": "patterns.engine",
+    "PatternEngine": "patterns.engine",
+    "StatisticalAnomaly": "patterns.engine",
+    "CurationDecision": "patterns.collector",
+    "PatternCollector": "patterns.collector",
+    "PatternSubmission": "patterns.collector",
+    "ValidationReport": "patterns.collector",
+    "PatternDefinition": "patterns.loader",
+    "PatternLoader": "patterns.loader",
+    "PatternManager": "patterns.loader",
+    "PatternMatch": "patterns.loader",
+    "PatternScanner": "patterns.loader",
+    "PatternScanResult": "patterns.loader",
+    "load_patterns": "patterns.loader",
+    "scan_patterns": "patterns.loader",
+    "MarketplacePattern": "patterns.marketplace",
+    "MarketplaceQuery": "patterns.marketplace",
+    "MarketplaceSearchResult": "patterns.marketplace",
+    "PatternMarketplace": "patterns.marketplace",
+    "PatternPackage": "patterns.marketplace",
+    "PatternRatingSummary": "patterns.marketplace",
+    "PatternReview": "patterns.marketplace",
+    "PatternTemplate": "patterns.templates",
+    "PatternTemplateRegistry": "patterns.templates",
+    "TemplateField": "patterns.templates",
+    "TemplateInstance": "patterns.templates",
+}
 
 __all__ = [
     "FixSuggestion",
@@ -65,3 +103,16 @@ __all__ = [
     "TemplateInstance",
     "PatternTemplateRegistry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
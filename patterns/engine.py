@@ -22,6 +22,7 @@ from patterns.loader import (
 )
 from patterns.marketplace import PatternMarketplace
 from patterns.templates import PatternTemplateRegistry
+from storage.pattern_cache import PatternMatchCache
 
 
 @dataclass(frozen=True)
@@ -115,18 +116,30 @@ class PatternEngine:
         patterns_dir: Path | None = None,
         context_lines: int = 2,
         max_workers: int = 4,
+        storage_root: Path | str | None = None,
     ) -> None:
         self.loader = PatternLoader(patterns_dir)
         self.context_lines = context_lines
         self.max_workers = max_workers
+        # Repeated scans (e.g. outlier tracking) reuse matches of unchanged files
+        self.match_cache = (
+            PatternMatchCache.for_storage_root(storage_root)
+            if storage_root is not None
+            else None
+        )
+
+    def _scanner(self) -> PatternScanner:
+        return PatternScanner(
+            max_workers=self.max_workers,
+            context_lines=self.context_lines,
+            cache=self.match_cache,
+        )
 
     def detect_with_context(
         self, file_path: Path, pattern: PatternDefinition
     ) -> list[PatternMatch]:
         """Detect a pattern with surrounding code context."""
-        scanner = PatternScanner(
-            max_workers=self.max_workers, context_lines=self.context_lines
-        )
+        scanner = self._scanner()
         result = scanner.scan(file_path, [pattern], max_files=1)
         if not result.success:
             return []
@@ -147,9 +160,7 @@ class PatternEngine:
         if not patterns:
             return []
 
-        scanner = PatternScanner(
-            max_workers=self.max_workers, context_lines=self.context_lines
-        )
+        scanner = self._scanner()
         result = scanner.scan(codebase, patterns, glob, max_files)
         if not result.success or not result.matches:
             return []
@@ -250,10 +261,7 @@ class PatternEngine:
             }
 
         selected_pattern_id = str(install_result.get("pattern_id") or pattern_ref)
-        scanner = PatternScanner(
-            max_workers=self.max_workers,
-            context_lines=self.context_lines,
-        )
+        scanner = self._scanner()
         patterns = [
             item
             for item in self.loader.load_all_patterns()
@@ -7,13 +7,49 @@ Supports both built-in patterns and user-defined patterns.
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import signal
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
 
+from patterns.prefilter import CompiledPattern, CompiledPatternSet
+from storage.pattern_cache import PatternMatchCache
+
+_LANGUAGE_BY_EXTENSION = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".java": "java",
+    ".go": "go",
+    ".rs": "rust",
+    ".cpp": "cpp",
+    ".c": "c",
+    ".h": "c",
+    ".rb": "ruby",
+}
+
+DEFAULT_PATTERN_TIMEOUT = 2.0  # seconds per pattern per file
+DEFAULT_SCAN_BATCH_SIZE = 32  # files per process-pool task
+MAX_PENDING_BATCHES_PER_WORKER = 4
+
+# Worker-local scanner state, created once per process by _init_scan_worker
+_WORKER_SCANNER: PatternScanner | None = None
+_WORKER_PATTERNS: CompiledPatternSet | None = None
+
 
 @dataclass
 class PatternMatch:
@@ -60,6 +96,16 @@ class PatternDefinition:
             raise ValueError(f"Invalid regex pattern '{self.id}': {e}")
 
 
+@dataclass
+class PatternTimeout:
+    """A pattern that exceeded its time budget on one file."""
+
+    pattern_id: str
+    pattern_name: str
+    file_path: Path
+    budget_seconds: float
+
+
 @dataclass
 class PatternScanResult:
     """Result of pattern scan."""
@@ -70,6 +116,9 @@ class PatternScanResult:
     matches: list[PatternMatch]
     errors: list[str] = field(default_factory=list)
     scan_time_ms: float = 0.0
+    timeouts: list[PatternTimeout] = field(default_factory=list)
+    files_reused: int = 0  # served entirely from the match cache
+    files_rescanned: int = 0  # read and matched (cache enabled only)
 
 
 class PatternLoader:
@@ -170,11 +219,45 @@ class PatternLoader:
 
 
 class PatternScanner:
-    """Scan files for pattern matches."""
-
-    def __init__(self, max_workers: int = 4, context_lines: int = 0):
+    """
+    Scan files for pattern matches.
+
+    Modes:
+        - Threads (default): ``max_workers`` threads; cheap to start, but the
+          regex work is serialized by the GIL. ``max_workers=1`` scans inline.
+        - Processes (``processes`` set, ``0`` = one per CPU): files are sent
+          to a process pool in batches of ``batch_size`` and results are
+          collected as batches finish, in file order.
+
+    ``pattern_timeout`` bounds each pattern on each file. A pattern that runs
+    past it (e.g. catastrophic backtracking on a generated file) is recorded
+    in ``PatternScanResult.timeouts`` and its matches for that file are
+    dropped. The budget is enforced with ``SIGALRM``, so it applies where
+    patterns run on a main thread: in process workers and inline scans on
+    POSIX systems. Thread-pool scans are not interrupted.
+
+    With a ``cache``, files whose content (SHA-256) and patterns are unchanged
+    since an earlier scan return their stored matches without being decoded
+    or matched again; only new or edited patterns are run on them.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        context_lines: int = 0,
+        processes: int | None = None,
+        pattern_timeout: float | None = DEFAULT_PATTERN_TIMEOUT,
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+        cache: PatternMatchCache | None = None,
+    ):
         self.max_workers = max_workers
         self.context_lines = context_lines
+        if processes is not None and processes <= 0:
+            processes = os.cpu_count() or 1
+        self.processes = processes
+        self.pattern_timeout = pattern_timeout
+        self.batch_size = max(1, int(batch_size))
+        self.cache = cache
 
     def scan(
         self,
@@ -215,22 +298,74 @@ class PatternScanner:
             files = list(path.rglob(glob))[:max_files]
             files = [f for f in files if f.is_file()]
 
-        # Scan files in parallel
-        all_matches = []
-        errors = []
+        return self.scan_files(files, patterns, start_time)
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_file = {
-                executor.submit(self._scan_file, file_path, patterns): file_path
-                for file_path in files
-            }
+    def scan_files(
+        self,
+        files: list[Path],
+        patterns: list[PatternDefinition],
+        start_time: float | None = None,
+    ) -> PatternScanResult:
+        """
+        Scan exactly the given files (watch mode rescans only changed ones).
 
-            for future in as_completed(future_to_file):
-                try:
-                    file_matches = future.result()
-                    all_matches.extend(file_matches)
-                except Exception as e:
-                    errors.append(str(e))
+        Args:
+            files: Files to scan; missing files contribute no matches
+            patterns: List of patterns to match
+            start_time: ``time.time()`` the scan started at, for ``scan_time_ms``
+
+        Returns:
+            PatternScanResult with matches
+        """
+        import time
+
+        if start_time is None:
+            start_time = time.time()
+
+        all_matches: list[PatternMatch] = []
+        timeouts: list[PatternTimeout] = []
+        errors: list[str] = []
+        reuse = {"reused": 0, "rescanned": 0}
+        counters_before = self.cache.counters() if self.cache is not None else reuse
+
+        if self.processes is not None and len(files) > 1:
+            for file_matches, file_timeouts, error, counters in self._scan_in_processes(
+                files, patterns
+            ):
+                all_matches.extend(file_matches)
+                timeouts.extend(file_timeouts)
+                if error:
+                    errors.append(error)
+                for key in reuse:
+                    reuse[key] += counters.get(key, 0)
+        else:
+            # Compile the pattern set once for the whole scan
+            compiled = CompiledPatternSet(patterns)
+
+            if self.max_workers <= 1 or len(files) <= 1:
+                for file_path in files:
+                    all_matches.extend(self._scan_file(file_path, compiled, timeouts))
+            else:
+                # Scan files in parallel
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    future_to_file = {
+                        executor.submit(
+                            self._scan_file, file_path, compiled, timeouts
+                        ): file_path
+                        for file_path in files
+                    }
+
+                    for future in as_completed(future_to_file):
+                        try:
+                            file_matches = future.result()
+                            all_matches.extend(file_matches)
+                        except Exception as e:
+                            errors.append(str(e))
+
+        if self.cache is not None:
+            counters = self.cache.counters()
+            for key in reuse:
+                reuse[key] += counters[key] - counters_before[key]
 
         scan_time_ms = (time.time() - start_time) * 1000
 
@@ -241,143 +376,385 @@ class PatternScanner:
             matches=all_matches,
             errors=errors,
             scan_time_ms=scan_time_ms,
+            timeouts=timeouts,
+            files_reused=reuse["reused"],
+            files_rescanned=reuse["rescanned"],
         )
 
+    def _scan_in_processes(
+        self, files: list[Path], patterns: list[PatternDefinition]
+    ) -> Iterator[
+        tuple[list[PatternMatch], list[PatternTimeout], str | None, dict[str, int]]
+    ]:
+        """
+        Yield per-batch results from a process pool, in file order.
+
+        At most ``processes * MAX_PENDING_BATCHES_PER_WORKER`` batches are in
+        flight, so results stream back without holding the whole scan.
+        """
+        workers = min(self.processes or 1, len(files))
+        max_pending = workers * MAX_PENDING_BATCHES_PER_WORKER
+        pending: deque[Future] = deque()
+
+        def drain() -> tuple[
+            list[PatternMatch], list[PatternTimeout], str | None, dict[str, int]
+        ]:
+            try:
+                return pending.popleft().result()
+            except Exception as e:
+                return [], [], str(e), {}
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_scan_worker,
+            initargs=(
+                patterns,
+                self.context_lines,
+                self.pattern_timeout,
+                self.cache.cache_dir if self.cache is not None else None,
+            ),
+        ) as executor:
+            for start in range(0, len(files), self.batch_size):
+                batch = [str(path) for path in files[start : start + self.batch_size]]
+                pending.append(executor.submit(_scan_batch, batch))
+                if len(pending) >= max_pending:
+                    yield drain()
+            while pending:
+                yield drain()
+
     def _scan_file(
-        self, file_path: Path, patterns: list[PatternDefinition]
+        self,
+        file_path: Path,
+        patterns: list[PatternDefinition] | CompiledPatternSet,
+        timeouts: list[PatternTimeout] | None = None,
     ) -> list[PatternMatch]:
-        """Scan a single file for pattern matches."""
+        """
+        Scan a single file for pattern matches.
+
+        Patterns that exceed ``pattern_timeout`` are appended to ``timeouts``
+        (when given) and contribute no matches.
+        """
+        if not isinstance(patterns, CompiledPatternSet):
+            patterns = CompiledPatternSet(patterns)
         matches = []
 
         # Determine file language from extension
-        file_ext = file_path.suffix.lower()
-        lang_map = {
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".java": "java",
-            ".go": "go",
-            ".rs": "rust",
-            ".cpp": "cpp",
-            ".c": "c",
-            ".h": "c",
-            ".rb": "ruby",
-        }
-        file_lang = lang_map.get(file_ext)
+        file_lang = _LANGUAGE_BY_EXTENSION.get(file_path.suffix.lower())
 
         try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                content = f.read()
+            with open(file_path, "rb") as f:
+                raw = f.read()
+
+            cached: dict[str, list] = {}
+            if self.cache is not None:
+                digest = hashlib.sha256(raw).hexdigest()
+                variant = f"context={self.context_lines}"
+                cached = self.cache.get(digest, str(file_path), variant)
+                if all(p.cache_key in cached for p in patterns.patterns):
+                    self.cache.count(reused=True)
+                    return [
+                        self._cached_match(p.definition, file_path, row)
+                        for p in patterns.patterns
+                        for row in cached[p.cache_key]
+                    ]
+
+            content = raw.decode("utf-8", errors="ignore")
+            if "\r" in content:
+                # Same line endings as reading in text mode
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
             lines = content.splitlines()
 
-            for pattern in patterns:
-                # Skip if pattern is language-specific and doesn't match
-                if pattern.languages:
-                    if not file_lang or file_lang not in pattern.languages:
-                        continue
-
-                is_multiline = "\\n" in pattern.pattern or "(?s)" in pattern.pattern
-                flags = re.MULTILINE | (re.DOTALL if is_multiline else 0)
-                regex = re.compile(pattern.pattern, flags)
-
-                if is_multiline:
-                    for match in regex.finditer(content):
-                        line_number = content.count("\n", 0, match.start()) + 1
-                        line_idx = max(0, line_number - 1)
-                        line_content = lines[line_idx].rstrip() if line_idx < len(lines) else ""
-                        matched_text = match.group()
-
-                        message = pattern.message
-                        message = message.replace("{{file}}", str(file_path))
-                        message = message.replace("{{line}}", str(line_number))
-                        message = message.replace("{{match}}", matched_text)
-
-                        context_before = [
-                            lines[i].rstrip()
-                            for i in range(
-                                max(0, line_idx - self.context_lines), line_idx
-                            )
-                        ]
-                        context_after = [
-                            lines[i].rstrip()
-                            for i in range(
-                                line_idx + 1,
-                                min(len(lines), line_idx + self.context_lines + 1),
-                            )
-                        ]
-
-                        matches.append(
-                            PatternMatch(
-                                pattern_id=pattern.id,
-                                pattern_name=pattern.name,
-                                file_path=file_path,
-                                line_number=line_number,
-                                line_content=line_content,
-                                matched_text=matched_text,
-                                severity=pattern.severity,
-                                message=message,
-                                description=pattern.description,
-                                tags=pattern.tags,
-                                context_before=context_before,
-                                context_after=context_after,
-                            )
+            # Only patterns whose required literals occur in the file run,
+            # and single-line patterns only on the lines holding them
+            results: dict[str, list] = {}
+            with _time_budget(self.pattern_timeout) as budget:
+                for compiled, line_indexes in patterns.candidates(
+                    content, lines, file_lang
+                ):
+                    pattern = compiled.definition
+                    if compiled.cache_key in cached:
+                        results[compiled.cache_key] = cached[compiled.cache_key]
+                        matches.extend(
+                            self._cached_match(pattern, file_path, row)
+                            for row in cached[compiled.cache_key]
                         )
-                else:
-                    for line_idx, line in enumerate(lines):
-                        match = regex.search(line)
-                        if not match:
-                            continue
-
-                        matched_text = match.group()
-
-                        message = pattern.message
-                        message = message.replace("{{file}}", str(file_path))
-                        message = message.replace("{{line}}", str(line_idx + 1))
-                        message = message.replace("{{match}}", matched_text)
-
-                        context_before = [
-                            lines[i].rstrip()
-                            for i in range(
-                                max(0, line_idx - self.context_lines), line_idx
+                        continue
+                    try:
+                        with budget():
+                            found = self._match_pattern(
+                                compiled, file_path, content, lines, line_indexes
                             )
-                        ]
-                        context_after = [
-                            lines[i].rstrip()
-                            for i in range(
-                                line_idx + 1,
-                                min(len(lines), line_idx + self.context_lines + 1),
+                    except _PatternTimedOut:
+                        if timeouts is not None:
+                            timeouts.append(
+                                PatternTimeout(
+                                    pattern_id=pattern.id,
+                                    pattern_name=pattern.name,
+                                    file_path=file_path,
+                                    budget_seconds=float(self.pattern_timeout or 0),
+                                )
                             )
+                        results[compiled.cache_key] = None  # never cached
+                        continue
+                    matches.extend(found)
+                    results[compiled.cache_key] = [
+                        [
+                            m.line_number,
+                            m.line_content,
+                            m.matched_text,
+                            m.context_before,
+                            m.context_after,
                         ]
+                        for m in found
+                    ]
 
-                        matches.append(
-                            PatternMatch(
-                                pattern_id=pattern.id,
-                                pattern_name=pattern.name,
-                                file_path=file_path,
-                                line_number=line_idx + 1,
-                                line_content=line.rstrip(),
-                                matched_text=matched_text,
-                                severity=pattern.severity,
-                                message=message,
-                                description=pattern.description,
-                                tags=pattern.tags,
-                                context_before=context_before,
-                                context_after=context_after,
-                            )
-                        )
+            if self.cache is not None:
+                self.cache.count(reused=False)
+                self._store_results(digest, file_path, patterns, cached, results)
 
         except (UnicodeDecodeError, PermissionError, OSError):
             pass
 
         return matches
 
+    def _store_results(
+        self,
+        digest: str,
+        file_path: Path,
+        patterns: CompiledPatternSet,
+        cached: dict[str, list],
+        results: dict[str, list | None],
+    ) -> None:
+        """Write this file's matches back, replacing older versions of its patterns."""
+        current = {p.definition.id for p in patterns.patterns}
+        record = {
+            key: rows
+            for key, rows in cached.items()
+            if key.partition(":")[0] not in current
+        }
+        for compiled in patterns.patterns:
+            # Patterns the prefilter ruled out cannot match this content
+            rows = results.get(compiled.cache_key, [])
+            if rows is not None:
+                record[compiled.cache_key] = rows
+        self.cache.put(
+            digest, str(file_path), record, f"context={self.context_lines}"
+        )
+
+    def _match_pattern(
+        self,
+        compiled: CompiledPattern,
+        file_path: Path,
+        content: str,
+        lines: list[str],
+        line_indexes: list[int] | None,
+    ) -> list[PatternMatch]:
+        """Run one compiled pattern over a file's content or candidate lines."""
+        pattern = compiled.definition
+        regex = compiled.regex
+        matches = []
+
+        if compiled.multiline:
+            for match in regex.finditer(content):
+                line_number = content.count("\n", 0, match.start()) + 1
+                line_idx = max(0, line_number - 1)
+                line_content = lines[line_idx].rstrip() if line_idx < len(lines) else ""
+                matches.append(
+                    self._build_match(
+                        pattern, file_path, lines, line_idx, line_content, match
+                    )
+                )
+        else:
+            if line_indexes is None:
+                hits = enumerate(map(regex.search, lines))
+            else:
+                hits = ((i, regex.search(lines[i])) for i in line_indexes)
+            for line_idx, match in hits:
+                if not match:
+                    continue
+                matches.append(
+                    self._build_match(
+                        pattern,
+                        file_path,
+                        lines,
+                        line_idx,
+                        lines[line_idx].rstrip(),
+                        match,
+                    )
+                )
+
+        return matches
+
+    def _build_match(
+        self,
+        pattern: PatternDefinition,
+        file_path: Path,
+        lines: list[str],
+        line_idx: int,
+        line_content: str,
+        match: re.Match[str],
+    ) -> PatternMatch:
+        """Create a PatternMatch with message placeholders and context filled in."""
+        matched_text = match.group()
+
+        context_before = [
+            lines[i].rstrip()
+            for i in range(max(0, line_idx - self.context_lines), line_idx)
+        ]
+        context_after = [
+            lines[i].rstrip()
+            for i in range(
+                line_idx + 1,
+                min(len(lines), line_idx + self.context_lines + 1),
+            )
+        ]
+
+        return PatternMatch(
+            pattern_id=pattern.id,
+            pattern_name=pattern.name,
+            file_path=file_path,
+            line_number=line_idx + 1,
+            line_content=line_content,
+            matched_text=matched_text,
+            severity=pattern.severity,
+            message=_render_message(pattern, file_path, line_idx + 1, matched_text),
+            description=pattern.description,
+            tags=pattern.tags,
+            context_before=context_before,
+            context_after=context_after,
+        )
+
+    def _cached_match(
+        self, pattern: PatternDefinition, file_path: Path, row: list
+    ) -> PatternMatch:
+        """Rebuild a PatternMatch from a cached match row."""
+        line_number, line_content, matched_text, context_before, context_after = row
+        return PatternMatch(
+            pattern_id=pattern.id,
+            pattern_name=pattern.name,
+            file_path=file_path,
+            line_number=line_number,
+            line_content=line_content,
+            matched_text=matched_text,
+            severity=pattern.severity,
+            message=_render_message(pattern, file_path, line_number, matched_text),
+            description=pattern.description,
+            tags=pattern.tags,
+            context_before=list(context_before),
+            context_after=list(context_after),
+        )
+
+
+def _render_message(
+    pattern: PatternDefinition, file_path: Path, line_number: int, matched_text: str
+) -> str:
+    """Fill the ``{{file}}``/``{{line}}``/``{{match}}`` placeholders."""
+    message = pattern.message
+    message = message.replace("{{file}}", str(file_path))
+    message = message.replace("{{line}}", str(line_number))
+    return message.replace("{{match}}", matched_text)
+
+
+class _PatternTimedOut(Exception):
+    """Raised inside a pattern run when its time budget expires."""
+
+
+def _raise_timed_out(signum, frame) -> None:
+    raise _PatternTimedOut()
+
+
+@contextmanager
+def _time_budget(seconds: float | None):
+    """
+    Arm a per-pattern SIGALRM budget for the duration of a file scan.
+
+    Yields a context-manager factory; each ``with budget():`` block may raise
+    ``_PatternTimedOut`` once ``seconds`` have elapsed. Where signals cannot
+    be used (no budget, non-POSIX, or not on the main thread) the blocks run
+    unbounded.
+    """
+    if (
+        not seconds
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield _unbounded
+        return
+
+    @contextmanager
+    def budget():
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    previous = signal.signal(signal.SIGALRM, _raise_timed_out)
+    try:
+        yield budget
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+@contextmanager
+def _unbounded():
+    yield
+
+
+def _init_scan_worker(
+    patterns: list[PatternDefinition],
+    context_lines: int,
+    pattern_timeout: float | None,
+    cache_dir: Path | None = None,
+) -> None:
+    """Compile the pattern set once per worker process."""
+    global _WORKER_SCANNER, _WORKER_PATTERNS
+    _WORKER_SCANNER = PatternScanner(
+        max_workers=1,
+        context_lines=context_lines,
+        pattern_timeout=pattern_timeout,
+        cache=PatternMatchCache(cache_dir) if cache_dir is not None else None,
+    )
+    _WORKER_PATTERNS = CompiledPatternSet(patterns)
+
+
+def _scan_batch(
+    paths: list[str],
+) -> tuple[list[PatternMatch], list[PatternTimeout], str | None, dict[str, int]]:
+    """Scan a batch of files in a worker process."""
+    matches: list[PatternMatch] = []
+    timeouts: list[PatternTimeout] = []
+    cache = _WORKER_SCANNER.cache
+    before = cache.counters() if cache is not None else {}
+    for path in paths:
+        matches.extend(_WORKER_SCANNER._scan_file(Path(path), _WORKER_PATTERNS, timeouts))
+    after = cache.counters() if cache is not None else {}
+    return matches, timeouts, None, {key: after[key] - before[key] for key in after}
+
 
 class PatternManager:
     """High-level pattern management."""
 
-    def __init__(self):
+    def __init__(self, storage_root: Path | str | None = None):
         self.loader = PatternLoader()
-        self.scanner = PatternScanner()
+        # With a storage root, unchanged files are served from the match cache
+        cache = (
+            PatternMatchCache.for_storage_root(storage_root)
+            if storage_root is not None
+            else None
+        )
+        self.scanner = PatternScanner(cache=cache)
+
+    def scan(
+        self,
+        path: Path,
+        category: str | None = None,
+        glob: str = "*",
+        max_files: int = 10000,
+    ) -> PatternScanResult:
+        """Scan a path with every pattern (or one category's patterns)."""
+        return self.scanner.scan(path, self.list_patterns(category), glob, max_files)
 
     def list_patterns(self, category: str | None = None) -> list[PatternDefinition]:
         """List available patterns."""
@@ -0,0 +1,304 @@
+"""
+patterns/prefilter.py - Compiled pattern sets with literal prefiltering.
+
+Each pattern is compiled once per scan, and the literal substrings that any
+match must contain are extracted from its parsed regex (for example
+``re.compile(`` or one of ``password``/``passwd``/``pwd``). One pass per
+distinct literal over the case-folded file content then decides which
+patterns can match at all. It also decides which lines a single-line
+pattern needs to be tried on. Patterns without a usable literal are always
+run, exactly as before.
+
+The prefilter only ever skips work: literals are compared case-insensitively
+and every occurrence is considered, so no match the plain per-line scan
+would report is lost.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import accumulate
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants  # type: ignore[no-redef]
+    import sre_parse  # type: ignore[no-redef]
+
+MAX_ALTERNATIVES = 16
+"""Largest alternative set kept for one required position."""
+
+# Line boundaries exactly as ``str.splitlines`` sees them
+_LINE_BREAK = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+_OTHER_LINE_BREAK = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+_REPEATS = tuple(
+    getattr(sre_constants, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_constants, name)
+)
+
+_Literals = frozenset[str]
+
+
+@dataclass(frozen=True)
+class CompiledPattern:
+    """One pattern compiled for scanning, with its required literals."""
+
+    definition: object  # PatternDefinition (kept untyped to avoid a cycle)
+    regex: re.Pattern[str]
+    multiline: bool
+    literals: _Literals | None  # None: no prefilter possible, always run
+    fingerprint: str = ""  # Digest of everything that decides the matches
+
+    @property
+    def cache_key(self) -> str:
+        """Match-cache key: the pattern ID plus its fingerprint."""
+        return f"{self.definition.id}:{self.fingerprint}"  # type: ignore[attr-defined]
+
+    @property
+    def line_filtered(self) -> bool:
+        """Whether candidate lines can be derived from literal positions."""
+        return (
+            not self.multiline
+            and self.literals is not None
+            and not any("\n" in literal for literal in self.literals)
+        )
+
+
+class CompiledPatternSet:
+    """
+    Patterns compiled once for a whole scan.
+
+    Usage:
+        compiled = CompiledPatternSet(patterns)
+        for pattern, lines in compiled.candidates(content, lines, "python"):
+            ...  # lines is None for "try every line / the whole content"
+    """
+
+    def __init__(self, patterns: Iterable[object]) -> None:
+        self.patterns: list[CompiledPattern] = []
+        for definition in patterns:
+            source = definition.pattern  # type: ignore[attr-defined]
+            # Patterns spanning lines name their line breaks (``\n``); ``.``
+            # stays line-local unless the pattern opts in with ``(?s)``.
+            # Implicit DOTALL let ``.*`` run to the end of the file, which
+            # matched unrelated later lines and backtracked quadratically
+            # (or worse, for ``(?:...){50,}``) on every candidate.
+            multiline = "\\n" in source or "(?s)" in source
+            flags = re.MULTILINE
+            languages = definition.languages  # type: ignore[attr-defined]
+            self.patterns.append(
+                CompiledPattern(
+                    definition=definition,
+                    regex=re.compile(source, flags),
+                    multiline=multiline,
+                    literals=required_literals(source),
+                    fingerprint=_fingerprint(source, flags, languages),
+                )
+            )
+        self._literals = sorted(
+            {lit for p in self.patterns if p.literals for lit in p.literals}
+        )
+        self._positioned = {
+            lit for p in self.patterns if p.line_filtered for lit in p.literals or ()
+        }
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def candidates(
+        self, content: str, lines: list[str], language: str | None
+    ) -> list[tuple[CompiledPattern, list[int] | None]]:
+        """
+        Patterns that can match this file, in definition order.
+
+        Returns:
+            (pattern, line_indexes) pairs. ``line_indexes`` lists the only
+            lines a single-line pattern has to be tried on; None means every
+            line (or, for multiline patterns, the whole content).
+        """
+        lowered = content.casefold()
+        # Case folding can change string length for a few code points; then
+        # offsets no longer map to lines and only file-level filtering applies
+        positions_valid = len(lowered) == len(content)
+
+        present: set[str] = set()
+        occurrences: dict[str, list[int]] = {}
+        for literal in self._literals:
+            index = lowered.find(literal)
+            if index == -1:
+                continue
+            present.add(literal)
+            if positions_valid and literal in self._positioned:
+                found = []
+                while index != -1:
+                    found.append(index)
+                    index = lowered.find(literal, index + 1)
+                occurrences[literal] = found
+
+        starts: list[int] | None = None
+        selected: list[tuple[CompiledPattern, list[int] | None]] = []
+        for pattern in self.patterns:
+            languages = pattern.definition.languages  # type: ignore[attr-defined]
+            if languages and (not language or language not in languages):
+                continue
+            if pattern.literals is None:
+                selected.append((pattern, None))
+                continue
+            matched = pattern.literals & present
+            if not matched:
+                continue
+            if not (pattern.line_filtered and positions_valid):
+                selected.append((pattern, None))
+                continue
+
+            if starts is None:
+                starts = _line_starts(content, lines)
+            line_indexes: set[int] = set()
+            for literal in matched:
+                for index in occurrences[literal]:
+                    line_indexes.add(bisect.bisect_right(starts, index) - 1)
+            selected.append(
+                (pattern, sorted(i for i in line_indexes if i < len(lines)))
+            )
+
+        return selected
+
+
+def _fingerprint(source: str, flags: int, languages: Iterable[str]) -> str:
+    scope = ",".join(sorted(languages or ()))
+    payload = f"{source}\0{int(flags)}\0{scope}".encode()
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def _line_starts(content: str, lines: list[str]) -> list[int]:
+    """Offset of every ``splitlines`` line in ``content``."""
+    if not _OTHER_LINE_BREAK.search(content):
+        # Plain "\n" endings: each line is followed by exactly one character
+        return list(accumulate((len(line) + 1 for line in lines), initial=0))
+    return [0] + [m.end() for m in _LINE_BREAK.finditer(content)]
+
+
+def required_literals(pattern: str, fold: bool = True) -> _Literals | None:
+    """
+    Case-folded substrings of which every match contains at least one.
+
+    With ``fold=False`` the literals are returned as written in the pattern
+    (``casefold`` rewrites some letters, e.g. ``ß`` to ``ss``, which a byte
+    level index must not see).
+
+    Returns None when no such set can be derived (e.g. ``^.{121,}$``).
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except (re.error, RecursionError):
+        return None
+    required = _required(list(parsed))
+    if not required or "" in required:
+        return None
+    if not fold:
+        return frozenset(required)
+    return frozenset(literal.casefold() for literal in required)
+
+
+def _required(items: list) -> _Literals | None:
+    """Best required-literal set for a node sequence."""
+    candidates: list[_Literals] = []
+    run: _Literals | None = frozenset({""})
+
+    def flush() -> None:
+        nonlocal run
+        if run and run != frozenset({""}):
+            candidates.append(run)
+        run = frozenset({""})
+
+    for op, av in items:
+        exact = _exact(op, av)
+        if exact is not None:
+            product = frozenset(a + b for a in run or {""} for b in exact)
+            if len(product) <= MAX_ALTERNATIVES:
+                run = product
+                continue
+            flush()
+            if len(exact) <= MAX_ALTERNATIVES:
+                run = exact
+            continue
+        flush()
+        inner = _inner_required(op, av)
+        if inner:
+            candidates.append(inner)
+    flush()
+
+    if not candidates:
+        return None
+    # Prefer sets whose shortest alternative is longest, then fewer alternatives
+    return max(candidates, key=lambda c: (min(map(len, c)), -len(c)))
+
+
+def _exact(op, av) -> _Literals | None:
+    """The finite set of strings a node matches, if small and known."""
+    if op is sre_constants.LITERAL:
+        return frozenset({chr(av)})
+    if op is sre_constants.IN:
+        chars = []
+        for item_op, item_av in av:
+            if item_op is not sre_constants.LITERAL:
+                return None
+            chars.append(chr(item_av))
+        return frozenset(chars) if 0 < len(chars) <= MAX_ALTERNATIVES else None
+    if op is sre_constants.SUBPATTERN:
+        return _exact_sequence(list(av[-1]))
+    if op is sre_constants.BRANCH:
+        union: set[str] = set()
+        for branch in av[1]:
+            exact = _exact_sequence(list(branch))
+            if exact is None:
+                return None
+            union |= exact
+            if len(union) > MAX_ALTERNATIVES:
+                return None
+        return frozenset(union)
+    if op in _REPEATS:
+        low, high, item = av
+        if low == high == 1:
+            return _exact_sequence(list(item))
+    return None
+
+
+def _exact_sequence(items: list) -> _Literals | None:
+    result: _Literals = frozenset({""})
+    for op, av in items:
+        exact = _exact(op, av)
+        if exact is None:
+            return None
+        result = frozenset(a + b for a in result for b in exact)
+        if len(result) > MAX_ALTERNATIVES:
+            return None
+    return result
+
+
+def _inner_required(op, av) -> _Literals | None:
+    """Required literals of a node that is not itself an exact string."""
+    if op is sre_constants.SUBPATTERN:
+        return _required(list(av[-1]))
+    if op is sre_constants.BRANCH:
+        union: set[str] = set()
+        for branch in av[1]:
+            required = _required(list(branch))
+            if not required:
+                return None
+            union |= required
+            if len(union) > MAX_ALTERNATIVES:
+                return None
+        return frozenset(union)
+    if op in _REPEATS:
+        low, _, item = av
+        if low >= 1:
+            return _required(list(item))
+    return None
@@ -0,0 +1,356 @@
+"""
+embedding_shard.py - Append-friendly, memory-mapped embedding shard.
+
+Purpose:
+    Hold every embedding of one investigation in three files written in
+    bulk, instead of one ``.npy`` plus one ``.json`` per chunk. Similarity
+    search runs directly over the memory-mapped vector file; only the
+    winning rows' metadata is ever decoded.
+
+Format:
+    <directory>/vectors.f32
+        Raw little-endian float32 rows of ``dim`` values, normalized to unit
+        length (zero vectors stay zero). The original norm is kept in the
+        row's metadata, so stored embeddings read back at their own scale.
+
+    <directory>/rows.jsonl
+        Metadata table: one compact JSON object per row, in row order.
+
+    <directory>/rows.idx
+        ID -> row offset map, fixed-width entries
+        ``<16-byte id key><u32 row><u64 metadata offset><u32 metadata length>``
+        in append order. An entry with length 0 is a tombstone for ``row``.
+        A later insert of the same ID supersedes the earlier row.
+
+    <directory>/shard.json
+        Committed sizes of the three files. It is replaced atomically after
+        every batch; bytes beyond the committed sizes (a torn batch) are
+        truncated on the next open.
+
+Constitutional Basis:
+    - Article 9: Immutable Observations (rows are appended, never rewritten)
+    - Article 15: Checkpoints (the header is the commit point of a batch)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from .atomic import atomic_write_json_compatible
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+SHARD_FORMAT = 1
+HEADER_FILE = "shard.json"
+VECTORS_FILE = "vectors.f32"
+ROWS_FILE = "rows.jsonl"
+INDEX_FILE = "rows.idx"
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _entry_dtype() -> Any:
+    return np.dtype(
+        [("key", "V16"), ("row", "<u4"), ("offset", "<u8"), ("length", "<u4")]
+    )
+
+
+def id_key(embedding_id: str) -> bytes:
+    """16-byte index key for an embedding ID."""
+    return hashlib.blake2b(embedding_id.encode("utf-8"), digest_size=16).digest()
+
+
+def _fsync(handle: BinaryIO) -> None:
+    handle.flush()
+    try:
+        os.fsync(handle.fileno())
+    except OSError:
+        pass  # Best effort (e.g. filesystems without fsync support)
+
+
+class EmbeddingShard:
+    """
+    One investigation's embeddings as a memory-mapped vector file.
+
+    Usage:
+        shard = EmbeddingShard(directory)
+        shard.append([(metadata, vector), ...])
+        scores = shard.vectors() @ query
+        metadata = shard.metadata(shard.row_of("chunk_1"))
+    """
+
+    def __init__(self, directory: Path | str) -> None:
+        self.directory = Path(directory)
+        self.dim = 0
+        self.row_count = 0
+        self._vector_bytes = 0
+        self._row_bytes = 0
+        self._index_bytes = 0
+
+        self._rows: dict[bytes, int] = {}
+        self._offsets: Any = None  # (row_count, 2) uint64: metadata offset, length
+        self._live: Any = None
+        self._mmap: Any = None
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def live(self) -> Any:
+        """Boolean mask of rows that are neither deleted nor superseded."""
+        return self._live[: self.row_count]
+
+    def vectors(self) -> Any:
+        """Memory-mapped (row_count, dim) float32 matrix of unit rows."""
+        if self.row_count == 0:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        if self._mmap is None:
+            self._mmap = np.memmap(
+                self.directory / VECTORS_FILE,
+                dtype="<f4",
+                mode="r",
+                shape=(self.row_count, self.dim),
+            )
+        return self._mmap
+
+    def row_of(self, embedding_id: str) -> int | None:
+        """Live row for an ID, or None."""
+        return self._rows.get(id_key(embedding_id))
+
+    def metadata(self, row: int) -> dict[str, Any]:
+        """Decode one row's metadata (a single seek and read)."""
+        offset, length = (int(value) for value in self._offsets[row])
+        with open(self.directory / ROWS_FILE, "rb") as handle:
+            handle.seek(offset)
+            return json.loads(handle.read(length))
+
+    def embedding(self, row: int, metadata: dict[str, Any]) -> Any:
+        """The stored embedding of a row, at its original scale and shape."""
+        vector = np.array(self.vectors()[row], dtype=np.float32)
+        vector *= np.float32(metadata.get("norm", 1.0))
+        shape = metadata.get("embedding_shape") or [self.dim]
+        dtype = metadata.get("embedding_dtype") or "float32"
+        try:
+            return vector.reshape(shape).astype(dtype, copy=False)
+        except (TypeError, ValueError):
+            return vector
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, items: list[tuple[dict[str, Any], Any]]) -> list[int]:
+        """
+        Append rows in one batch.
+
+        Args:
+            items: (metadata, vector) pairs; metadata must carry an ``id``
+
+        Returns:
+            Row numbers assigned to the items, in order
+        """
+        if not items:
+            return []
+
+        matrix = np.ascontiguousarray(
+            np.stack([np.ravel(vector) for _, vector in items]), dtype=np.float32
+        )
+        if self.dim and matrix.shape[1] != self.dim:
+            raise ValueError(
+                f"Embedding dimension {matrix.shape[1]} does not match shard "
+                f"dimension {self.dim}"
+            )
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+        encode = _ENCODER.encode
+        lines = [
+            (encode(dict(metadata, norm=norm)) + "\n").encode("utf-8")
+            for (metadata, _), norm in zip(items, norms[:, 0].tolist(), strict=True)
+        ]
+
+        first_row = self.row_count
+        rows = list(range(first_row, first_row + len(items)))
+        lengths = np.fromiter(
+            (len(line) for line in lines), dtype=np.uint64, count=len(lines)
+        )
+        entries = np.zeros(len(items), dtype=_entry_dtype())
+        entries["key"] = np.frombuffer(
+            b"".join(id_key(str(metadata["id"])) for metadata, _ in items), dtype="V16"
+        )
+        entries["row"] = rows
+        entries["offset"] = self._row_bytes + np.cumsum(lengths) - lengths
+        entries["length"] = lengths - 1  # without the newline
+        offset = self._row_bytes + int(lengths.sum())
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._release_mmap()
+        self._write_at(VECTORS_FILE, self._vector_bytes, matrix.astype("<f4").tobytes())
+        self._write_at(ROWS_FILE, self._row_bytes, b"".join(lines))
+        self._write_at(INDEX_FILE, self._index_bytes, entries.tobytes())
+
+        self.dim = matrix.shape[1]
+        self._vector_bytes += matrix.nbytes
+        self._row_bytes = offset
+        self._index_bytes += entries.nbytes
+        self.row_count += len(items)
+        self._grow(self.row_count)
+        self._offsets[first_row : self.row_count, 0] = entries["offset"]
+        self._offsets[first_row : self.row_count, 1] = entries["length"]
+        for key, row in zip(entries["key"].tolist(), rows, strict=True):
+            self._insert(key, row)
+        self._commit()
+        return rows
+
+    def delete(self, embedding_ids: Iterable[str]) -> int:
+        """Tombstone the live rows of these IDs; returns how many were live."""
+        entries = []
+        for embedding_id in embedding_ids:
+            key = id_key(embedding_id)
+            row = self._rows.pop(key, None)
+            if row is None:
+                continue
+            self._live[row] = False
+            entries.append((key, row, 0, 0))
+        if not entries:
+            return 0
+
+        data = np.array(entries, dtype=_entry_dtype()).tobytes()
+        self._write_at(INDEX_FILE, self._index_bytes, data)
+        self._index_bytes += len(data)
+        self._commit()
+        return len(entries)
+
+    def close(self) -> None:
+        """Release the memory map (required before removing the files)."""
+        self._release_mmap()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        header_path = self.directory / HEADER_FILE
+        if not header_path.exists():
+            self._grow(0)
+            return
+        try:
+            header = json.loads(header_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Unreadable embedding shard header: {header_path}") from e
+        if header.get("format") != SHARD_FORMAT:
+            raise ValueError(
+                f"Unsupported embedding shard format: {header.get('format')}"
+            )
+
+        self.dim = int(header["dim"])
+        self.row_count = int(header["rows"])
+        self._vector_bytes = int(header["vector_bytes"])
+        self._row_bytes = int(header["row_bytes"])
+        self._index_bytes = int(header["index_bytes"])
+
+        # Drop any torn batch written after the last commit
+        for name, size in (
+            (VECTORS_FILE, self._vector_bytes),
+            (ROWS_FILE, self._row_bytes),
+            (INDEX_FILE, self._index_bytes),
+        ):
+            path = self.directory / name
+            if path.exists() and path.stat().st_size > size:
+                with open(path, "r+b") as handle:
+                    handle.truncate(size)
+
+        self._grow(self.row_count)
+        if not self._index_bytes:
+            return
+        with open(self.directory / INDEX_FILE, "rb") as handle:
+            entries = np.frombuffer(
+                handle.read(self._index_bytes), dtype=_entry_dtype()
+            )
+
+        inserts = entries[entries["length"] > 0]
+        rows = inserts["row"].astype(np.int64)
+        self._offsets[rows, 0] = inserts["offset"]
+        self._offsets[rows, 1] = inserts["length"]
+
+        if len(inserts) == len(entries) and len(np.unique(inserts["key"])) == len(
+            inserts
+        ):
+            # Fast path: no tombstones and no superseded IDs
+            self._rows = dict(zip(inserts["key"].tolist(), rows.tolist(), strict=True))
+            self._live[rows] = True
+            return
+        for key, row, _, length in entries.tolist():
+            if length:
+                self._insert(key, row)
+            elif self._rows.get(key) == row:
+                del self._rows[key]
+                self._live[row] = False
+
+    def _insert(self, key: bytes, row: int) -> None:
+        previous = self._rows.get(key)
+        if previous is not None:
+            self._live[previous] = False
+        self._rows[key] = row
+        self._live[row] = True
+
+    def _grow(self, rows: int) -> None:
+        capacity = 0 if self._live is None else len(self._live)
+        if self._live is not None and rows <= capacity:
+            return
+        new_capacity = max(rows, capacity * 2, 16)
+        live = np.zeros(new_capacity, dtype=bool)
+        offsets = np.zeros((new_capacity, 2), dtype=np.uint64)
+        if self._live is not None:
+            live[:capacity] = self._live
+            offsets[:capacity] = self._offsets
+        self._live = live
+        self._offsets = offsets
+
+    def _write_at(self, name: str, offset: int, data: bytes) -> None:
+        path = self.directory / name
+        with open(path, "r+b" if path.exists() else "wb") as handle:
+            handle.truncate(offset)
+            handle.seek(offset)
+            handle.write(data)
+            _fsync(handle)
+
+    def _commit(self) -> None:
+        atomic_write_json_compatible(
+            self.directory / HEADER_FILE,
+            {
+                "format": SHARD_FORMAT,
+                "dim": self.dim,
+                "rows": self.row_count,
+                "vector_bytes": self._vector_bytes,
+                "row_bytes": self._row_bytes,
+                "index_bytes": self._index_bytes,
+            },
+            indent=None,
+        )
+
+    def _release_mmap(self) -> None:
+        if self._mmap is not None:
+            mmap = getattr(self._mmap, "_mmap", None)
+            self._mmap = None
+            if mmap is not None:
+                try:
+                    mmap.close()
+                except (BufferError, ValueError):
+                    pass  # Still referenced by a caller's view; GC closes it
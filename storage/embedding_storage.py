@@ -11,9 +11,16 @@ Constitutional Basis:
     - Article 18: Explicit Limitations (storage limits declared)
 
 Storage Format:
-    - Embeddings stored as numpy arrays (.npy files)
-    - Metadata stored as JSON
-    - Hierarchical structure by investigation
+    - One shard per investigation (storage/embedding_shard.py): a
+      memory-mapped float32 vector file, a JSONL metadata table and a
+      fixed-width ID -> row offset map, appended in bulk
+    - index.json maps source files to embedding IDs
+    - Legacy per-embedding ``.npy``/``.json`` files are imported on first use
+
+Search:
+    Shard rows are stored pre-normalized, so a query is a single
+    matrix-vector product over the memory map followed by an
+    ``argpartition`` top-k selection.
 """
 
 from __future__ import annotations
@@ -21,9 +28,12 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from .embedding_shard import EmbeddingShard
+
 try:
     import numpy as np
 
@@ -53,7 +63,7 @@ class EmbeddingRecord:
             "line_number": self.line_number,
             "content": self.content[:200] if self.content else "",
             "embedding_shape": list(self.embedding.shape),
-            "embedding_dtype": str(self.embedding.dtype),
+            "embedding_dtype": _dtype_name(self.embedding.dtype),
             "created_at": self.created_at.isoformat(),
             "investigation_id": self.investigation_id,
         }
@@ -117,9 +127,9 @@ class EmbeddingStorage:
     Storage for code embeddings with efficient retrieval.
 
     Features:
-    - Persistent storage as numpy arrays
+    - One memory-mapped shard per investigation (see embedding_shard.py)
     - Metadata indexing
-    - Incremental updates
+    - Incremental, batched updates
     - Investigation-scoped storage
     """
 
@@ -139,6 +149,7 @@ class EmbeddingStorage:
         # In-memory cache
         self._embedding_cache: dict[str, EmbeddingRecord] = {}
         self._index_cache: dict[str, EmbeddingIndex] = {}
+        self._shard_cache: dict[str, EmbeddingShard] = {}
         self._max_cache_size = 10000
 
     def store_embedding(
@@ -153,6 +164,9 @@ class EmbeddingStorage:
         """
         Store a single embedding.
 
+        Prefer ``store_embeddings`` for many embeddings: each call commits
+        its own batch.
+
         Args:
             embedding_id: Unique identifier for this embedding
             file_path: Path to source file
@@ -164,31 +178,10 @@ class EmbeddingStorage:
         Returns:
             Stored EmbeddingRecord
         """
-        _require_numpy()
-        record = EmbeddingRecord(
-            id=embedding_id,
-            file_path=file_path,
-            line_number=line_number,
-            content=content,
-            embedding=embedding,
-            created_at=datetime.now(UTC),
+        return self.store_embeddings(
+            [(embedding_id, file_path, line_number, content, embedding)],
             investigation_id=investigation_id,
-        )
-
-        # Store in cache
-        self._embedding_cache[embedding_id] = record
-
-        # Persist to disk
-        self._persist_embedding(record, investigation_id)
-
-        # Update index
-        self._update_index(file_path, embedding_id, investigation_id)
-
-        # Manage cache size
-        if len(self._embedding_cache) > self._max_cache_size:
-            self._trim_cache()
-
-        return record
+        )[0]
 
     def store_embeddings(
         self,
@@ -196,7 +189,7 @@ class EmbeddingStorage:
         investigation_id: str | None = None,
     ) -> list[EmbeddingRecord]:
         """
-        Store multiple embeddings.
+        Store multiple embeddings in one shard append.
 
         Args:
             embeddings: List of (id, file_path, line, content, embedding) tuples
@@ -205,26 +198,54 @@ class EmbeddingStorage:
         Returns:
             List of stored EmbeddingRecords
         """
-        records = []
-        for emb_data in embeddings:
-            record = self.store_embedding(
-                embedding_id=emb_data[0],
+        _require_numpy()
+        created_at = datetime.now(UTC)
+        records = [
+            EmbeddingRecord(
+                id=emb_data[0],
                 file_path=emb_data[1],
                 line_number=emb_data[2],
                 content=emb_data[3],
                 embedding=emb_data[4],
+                created_at=created_at,
                 investigation_id=investigation_id,
             )
-            records.append(record)
+            for emb_data in embeddings
+        ]
+        if not records:
+            return []
+
+        # Persist vectors, metadata and offsets in bulk
+        self._get_shard(investigation_id).append(
+            [(record.to_dict(), record.embedding) for record in records]
+        )
+
+        # Update index once for the whole batch
+        index = self._get_index(investigation_id)
+        for record in records:
+            index.add_embedding(record.file_path, record.id)
+        index.embedding_dim = int(np.size(records[0].embedding))
+        self._persist_index(index, investigation_id)
+
+        # Store in cache
+        for record in records:
+            self._embedding_cache[record.id] = record
+        if len(self._embedding_cache) > self._max_cache_size:
+            self._trim_cache()
 
         return records
 
-    def get_embedding(self, embedding_id: str) -> EmbeddingRecord | None:
+    def get_embedding(
+        self,
+        embedding_id: str,
+        investigation_id: str | None = None,
+    ) -> EmbeddingRecord | None:
         """
         Retrieve an embedding by ID.
 
         Args:
             embedding_id: Embedding identifier
+            investigation_id: Investigation to look in (default: search all)
 
         Returns:
             EmbeddingRecord or None
@@ -234,7 +255,7 @@ class EmbeddingStorage:
             return self._embedding_cache[embedding_id]
 
         # Load from disk
-        return self._load_embedding(embedding_id)
+        return self._load_embedding(embedding_id, investigation_id)
 
     def get_embeddings_for_file(
         self,
@@ -256,7 +277,7 @@ class EmbeddingStorage:
 
         records = []
         for emb_id in embedding_ids:
-            record = self.get_embedding(emb_id)
+            record = self.get_embedding(emb_id, investigation_id)
             if record:
                 records.append(record)
 
@@ -280,7 +301,7 @@ class EmbeddingStorage:
         records = []
         for emb_ids in index.file_paths.values():
             for emb_id in emb_ids:
-                record = self.get_embedding(emb_id)
+                record = self.get_embedding(emb_id, investigation_id)
                 if record:
                     records.append(record)
 
@@ -308,9 +329,9 @@ class EmbeddingStorage:
         for emb_id in removed_ids:
             self._embedding_cache.pop(emb_id, None)
 
-        # Remove from disk
-        for emb_id in removed_ids:
-            self._delete_embedding_file(emb_id, investigation_id)
+        # Tombstone the shard rows
+        if removed_ids:
+            self._get_shard(investigation_id).delete(removed_ids)
 
         # Persist updated index
         self._persist_index(index, investigation_id)
@@ -327,6 +348,9 @@ class EmbeddingStorage:
         """
         Find similar embeddings using cosine similarity.
 
+        Scores the memory-mapped shard directly; only the top-k rows are
+        turned into records.
+
         Args:
             query_embedding: Query embedding vector
             top_k: Number of results
@@ -337,27 +361,17 @@ class EmbeddingStorage:
             List of (EmbeddingRecord, similarity_score) tuples
         """
         _require_numpy()
-        records = self.get_all_embeddings(investigation_id)
-
-        if not records:
+        shard = self._get_shard(investigation_id)
+        if not len(shard):
             return []
 
-        # Normalize query
-        query_norm = query_embedding / np.linalg.norm(query_embedding)
-
-        # Compute similarities
-        similarities = []
-        for record in records:
-            emb_norm = record.embedding / np.linalg.norm(record.embedding)
-            similarity = np.dot(query_norm, emb_norm)
-
-            if similarity >= threshold:
-                similarities.append((record, float(similarity)))
-
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        results = []
+        for row, similarity in top_k_cosine(
+            shard.vectors(), query_embedding, top_k, threshold, live=shard.live
+        ):
+            results.append((self._record_from_row(shard, row), similarity))
 
-        return similarities[:top_k]
+        return results
 
     def get_stats(self, investigation_id: str | None = None) -> dict[str, Any]:
         """
@@ -398,9 +412,16 @@ class EmbeddingStorage:
         """Clear in-memory cache."""
         self._embedding_cache.clear()
         self._index_cache.clear()
+        for shard in self._shard_cache.values():
+            shard.close()
+        self._shard_cache.clear()
 
     def clear_investigation(self, investigation_id: str) -> None:
         """Clear all data for an investigation."""
+        shard = self._shard_cache.pop(investigation_id, None)
+        if shard is not None:
+            shard.close()
+
         inv_dir = self._get_investigation_dir(investigation_id)
         if inv_dir.exists():
             import shutil
@@ -423,77 +444,97 @@ class EmbeddingStorage:
             return self.storage_dir / investigation_id
         return self.storage_dir / "default"
 
-    def _persist_embedding(
-        self,
-        record: EmbeddingRecord,
-        investigation_id: str | None,
-    ) -> None:
-        """Persist embedding to disk."""
+    def _get_shard(self, investigation_id: str | None) -> EmbeddingShard:
+        """Get or open the shard for an investigation."""
         _require_numpy()
+        inv_id = investigation_id or "default"
+        shard = self._shard_cache.get(inv_id)
+        if shard is not None:
+            return shard
+
         inv_dir = self._get_investigation_dir(investigation_id)
-        emb_dir = inv_dir / "embeddings"
-        emb_dir.mkdir(parents=True, exist_ok=True)
+        shard = EmbeddingShard(inv_dir / "shard")
+        if not shard.row_count:
+            self._import_legacy_embeddings(inv_dir, shard)
 
-        # Save embedding as numpy file
-        emb_file = emb_dir / f"{record.id}.npy"
-        np.save(emb_file, record.embedding)
+        self._shard_cache[inv_id] = shard
+        return shard
 
-        # Save metadata as JSON
-        meta_file = emb_dir / f"{record.id}.json"
-        with open(meta_file, "w", encoding="utf-8") as f:
-            json.dump(record.to_dict(), f, indent=2)
+    def _import_legacy_embeddings(self, inv_dir: Path, shard: EmbeddingShard) -> None:
+        """
+        Move per-embedding ``.npy``/``.json`` pairs into an empty shard.
 
-    def _load_embedding(self, embedding_id: str) -> EmbeddingRecord | None:
-        """Load embedding from disk."""
-        _require_numpy()
-        # Try default first, then other investigations
-        for inv_dir in self.storage_dir.iterdir():
-            if not inv_dir.is_dir():
-                continue
+        Only the pairs that were imported are removed; a pair that fails to
+        load stays in ``embeddings/`` (and so does the directory).
+        """
+        emb_dir = inv_dir / "embeddings"
+        if not emb_dir.is_dir():
+            return
 
-            emb_dir = inv_dir / "embeddings"
-            emb_file = emb_dir / f"{embedding_id}.npy"
-            meta_file = emb_dir / f"{embedding_id}.json"
-
-            if emb_file.exists() and meta_file.exists():
-                try:
-                    # Load embedding
-                    embedding = np.load(emb_file)
-
-                    # Load metadata
-                    with open(meta_file, "r", encoding="utf-8") as f:
-                        meta = json.load(f)
-
-                    return EmbeddingRecord(
-                        id=meta["id"],
-                        file_path=meta["file_path"],
-                        line_number=meta["line_number"],
-                        content=meta.get("content", ""),
-                        embedding=embedding,
-                        created_at=datetime.fromisoformat(meta["created_at"]),
-                        investigation_id=meta.get("investigation_id"),
-                    )
-                except (OSError, json.JSONDecodeError, KeyError):
-                    continue
+        items = []
+        imported: list[Path] = []
+        for meta_file in sorted(emb_dir.glob("*.json")):
+            emb_file = meta_file.with_suffix(".npy")
+            try:
+                with open(meta_file, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                items.append((meta, np.load(emb_file)))
+            except (OSError, ValueError, KeyError):
+                continue
+            imported += [meta_file, emb_file]
+        shard.append(items)
 
-        return None
+        for path in imported:
+            path.unlink(missing_ok=True)
+        try:
+            emb_dir.rmdir()
+        except OSError:
+            pass  # Pairs that could not be imported are kept
 
-    def _delete_embedding_file(
+    def _load_embedding(
         self,
         embedding_id: str,
         investigation_id: str | None,
-    ) -> None:
-        """Delete embedding files from disk."""
-        inv_dir = self._get_investigation_dir(investigation_id)
-        emb_dir = inv_dir / "embeddings"
+    ) -> EmbeddingRecord | None:
+        """Load embedding from its investigation's shard."""
+        _require_numpy()
+        if investigation_id is not None:
+            candidates = [investigation_id]
+        else:
+            # Open shards first, then any other investigation on disk
+            candidates = list(self._shard_cache)
+            candidates += [
+                inv_dir.name
+                for inv_dir in sorted(self.storage_dir.iterdir())
+                if inv_dir.is_dir() and inv_dir.name not in self._shard_cache
+            ]
+
+        for inv_id in candidates:
+            try:
+                shard = self._get_shard(None if inv_id == "default" else inv_id)
+            except ValueError:
+                continue
+            row = shard.row_of(embedding_id)
+            if row is None:
+                continue
+            record = self._record_from_row(shard, row)
+            if record.id == embedding_id:
+                return record
 
-        emb_file = emb_dir / f"{embedding_id}.npy"
-        meta_file = emb_dir / f"{embedding_id}.json"
+        return None
 
-        if emb_file.exists():
-            emb_file.unlink()
-        if meta_file.exists():
-            meta_file.unlink()
+    def _record_from_row(self, shard: EmbeddingShard, row: int) -> EmbeddingRecord:
+        """Materialize one shard row as a record."""
+        meta = shard.metadata(row)
+        return EmbeddingRecord(
+            id=meta["id"],
+            file_path=meta["file_path"],
+            line_number=meta["line_number"],
+            content=meta.get("content", ""),
+            embedding=shard.embedding(row, meta),
+            created_at=datetime.fromisoformat(meta["created_at"]),
+            investigation_id=meta.get("investigation_id"),
+        )
 
     def _get_index(self, investigation_id: str | None) -> EmbeddingIndex:
         """Get or load index for investigation."""
@@ -519,17 +560,6 @@ class EmbeddingStorage:
         self._index_cache[inv_id] = index
         return index
 
-    def _update_index(
-        self,
-        file_path: str,
-        embedding_id: str,
-        investigation_id: str | None,
-    ) -> None:
-        """Update index with new embedding."""
-        index = self._get_index(investigation_id)
-        index.add_embedding(file_path, embedding_id)
-        self._persist_index(index, investigation_id)
-
     def _persist_index(
         self,
         index: EmbeddingIndex,
@@ -541,19 +571,17 @@ class EmbeddingStorage:
 
         index_file = inv_dir / "index.json"
         with open(index_file, "w", encoding="utf-8") as f:
-            json.dump(index.to_dict(), f, indent=2)
+            json.dump(index.to_dict(), f, separators=(",", ":"))
 
     def _trim_cache(self) -> None:
         """Trim cache to max size."""
         if len(self._embedding_cache) <= self._max_cache_size:
             return
 
-        # Remove oldest entries (simple FIFO)
-        to_remove = len(self._embedding_cache) - self._max_cache_size // 2
-        for _ in range(to_remove):
-            if self._embedding_cache:
-                key = next(iter(self._embedding_cache))
-                self._embedding_cache.pop(key)
+        # Keep the newest entries (simple FIFO); rebuilding in one pass
+        # avoids rescanning popped slots when a bulk store overflows
+        keep = self._max_cache_size // 2
+        self._embedding_cache = dict(list(self._embedding_cache.items())[-keep:])
 
 
 def create_embedding_storage(
@@ -571,6 +599,67 @@ def create_embedding_storage(
     return EmbeddingStorage(storage_dir)
 
 
+def normalize_rows(vectors: Any) -> Any:
+    """
+    Return ``vectors`` as a contiguous float32 matrix of unit-length rows.
+
+    Zero rows stay zero (they score 0 against every query).
+    """
+    _require_numpy()
+    matrix = np.ascontiguousarray(np.atleast_2d(vectors), dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def top_k_cosine(
+    matrix: Any,
+    query_embedding: Any,
+    top_k: int,
+    threshold: float,
+    live: Any = None,
+) -> list[tuple[int, float]]:
+    """
+    Select the best rows of a pre-normalized matrix for a query.
+
+    Args:
+        matrix: (n, dim) float32 matrix with unit-length rows
+        query_embedding: Query vector (normalized here)
+        top_k: Number of results
+        threshold: Minimum similarity score
+        live: Optional boolean row mask; rows outside it are never returned
+
+    Returns:
+        List of (row, similarity_score) tuples, best first
+    """
+    _require_numpy()
+    count = len(matrix)
+    if count == 0 or top_k <= 0:
+        return []
+
+    query = normalize_rows(query_embedding)[0]
+    scores = np.asarray(matrix @ query, dtype=np.float32)
+    if live is not None:
+        scores[~live] = -np.inf
+
+    if top_k < count:
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        candidates = np.arange(count)
+    ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+    return [
+        (int(row), float(scores[row]))
+        for row in ordered
+        if scores[row] >= threshold
+    ]
+
+
+@lru_cache(maxsize=32)
+def _dtype_name(dtype: Any) -> str:
+    return str(dtype)
+
+
 def _require_numpy() -> None:
     if not NUMPY_AVAILABLE:
         raise RuntimeError(
@@ -6,18 +6,48 @@ Moved from core layer to storage layer to preserve Article 9 (layer independence
 
 import hashlib
 import json
+import sqlite3
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from storage.atomic import atomic_write_json_compatible
 from storage.corruption import CorruptionEvidence, CorruptionMarker, CorruptionType
+from storage.observation_patch import (
+    SourcedObservation,
+    apply_patches,
+    is_patch,
+    merge_patches,
+    patch_record,
+)
+from storage.query_index import QueryIndex, index_path_for, sidecar_path, source_key
+from storage.segment_store import (
+    DEFAULT_FSYNC_INTERVAL,
+    DEFAULT_MAX_SEGMENT_BYTES,
+    SegmentLocation,
+    SegmentReader,
+    SegmentStoreError,
+    SegmentWriter,
+    index_path,
+    list_streams,
+    record_key,
+)
+from storage.session_catalog import (
+    SESSION_SUFFIX,
+    SessionCatalog,
+    read_session_file,
+    scan_sessions,
+)
 from storage.transactional import (
     DiskSpaceChecker,
     TransactionalStorageError,
     TransactionalWriter,
 )
 
+# Streaming manifest IDs (and their segment stream names) start with this
+STREAM_ID_PREFIX = "obs_stream_"
+
 
 class InvestigationStorage:
     """
@@ -45,6 +75,7 @@ class InvestigationStorage:
             base_path=self.base_path, enable_backups=enable_backups
         )
         self._ensure_directories()
+        self.session_catalog = SessionCatalog.for_storage_root(self.base_path)
         self.schema_version = "v2.1.0"
         self.storage_version = "2.1.0"
 
@@ -82,7 +113,7 @@ class InvestigationStorage:
                 filename,
                 session_data,
                 type(self.writer)._create_backup(self.writer, filename)
-                if filename.exists()
+                if self.writer.enable_backups and filename.exists()
                 else None,
             )
             # Record transaction journal entry for session + referenced artifacts
@@ -106,57 +137,91 @@ class InvestigationStorage:
                     / f"{p_id}.pattern.json"
                 )
             self.writer.record_transaction(paths, {"session_id": session_id})
+            self._catalog_session(filename, session_data)
             return session_id
         except Exception as e:
             raise TransactionalStorageError(f"Failed to save session: {e}") from e
 
     def load_session_metadata(self, session_id: str) -> dict[str, Any] | None:
         """Load session metadata by session ID."""
-        session_file = self.base_path / "sessions" / f"{session_id}.session.json"
-        if not session_file.exists():
-            return None
+        session_file = self.base_path / "sessions" / f"{session_id}{SESSION_SUFFIX}"
+        if session_file.exists():
+            return read_session_file(session_file)
+        # Sessions whose file name differs from their ID
+        return self._catalog_call(
+            "get",
+            session_id,
+            fallback=lambda sessions: next(
+                (
+                    metadata
+                    for stem, metadata in sessions
+                    if session_id in (stem, str(metadata.get("id")))
+                ),
+                None,
+            ),
+        )
 
-        try:
-            data = json.loads(session_file.read_text(encoding="utf-8"))
-            if not isinstance(data, dict):
-                return None
-            data.setdefault("id", session_id)
-            data.setdefault("session_id", data.get("id", session_id))
-            return data
-        except (OSError, json.JSONDecodeError, ValueError):
-            return None
+    def find_session(self, fragment: str) -> dict[str, Any] | None:
+        """Most recent session whose file name contains ``fragment``."""
+        return self._catalog_call(
+            "find",
+            fragment,
+            fallback=lambda sessions: next(
+                (metadata for stem, metadata in sessions if fragment in stem), None
+            ),
+        )
 
     def list_sessions(self, limit: int = 10) -> list[dict[str, Any]]:
         """List session metadata ordered by most recently updated first."""
-        sessions_dir = self.base_path / "sessions"
-        if not sessions_dir.exists():
-            return []
-
-        records: list[tuple[float, dict[str, Any]]] = []
-        for session_file in sessions_dir.glob("*.session.json"):
-            session_id = session_file.name[: -len(".session.json")]
-            metadata = self.load_session_metadata(session_id)
-            if not metadata:
-                continue
-
-            sort_ts = self._session_timestamp(metadata, session_file.stat().st_mtime)
-            records.append((sort_ts, metadata))
+        sessions = self._catalog_call(
+            "recent",
+            limit,
+            fallback=lambda sessions: [
+                metadata for _stem, metadata in sessions[: limit if limit > 0 else None]
+            ],
+        )
+        return sessions if sessions is not None else []
 
-        records.sort(key=lambda item: item[0], reverse=True)
-        if limit <= 0:
-            return [item[1] for item in records]
-        return [item[1] for item in records[:limit]]
+    def rebuild_session_catalog(self) -> int:
+        """Rebuild the session catalog from the session files; returns its size."""
+        return self.session_catalog.rebuild()
 
     def delete_session_metadata(self, session_id: str) -> bool:
         """Delete session metadata file if it exists."""
-        session_file = self.base_path / "sessions" / f"{session_id}.session.json"
+        session_file = self.base_path / "sessions" / f"{session_id}{SESSION_SUFFIX}"
         if not session_file.exists():
             return False
         try:
             session_file.unlink()
-            return True
         except OSError:
             return False
+        self._catalog_call("remove", session_id)
+        return True
+
+    def _catalog_session(self, session_file: Path, session_data: dict[str, Any]) -> None:
+        # The catalog is derived data; a failure here must not fail the save
+        self._catalog_call("record", session_file, session_data)
+
+    def _catalog_call(
+        self,
+        method: str,
+        *args: Any,
+        fallback: Callable[[list[tuple[str, dict[str, Any]]]], Any] | None = None,
+    ) -> Any:
+        """
+        Run a catalog operation.
+
+        The catalog is derived data: on a catalog error (e.g. "database is
+        locked" under concurrent writers) lookups answer from a directory scan
+        via ``fallback``; maintenance calls are skipped.
+        """
+        try:
+            return getattr(self.session_catalog, method)(*args)
+        except (OSError, sqlite3.Error) as e:
+            print(f"[WARNING] Session catalog unavailable: {e}", flush=True)
+            if fallback is None:
+                return None
+            return fallback(scan_sessions(self.base_path / "sessions"))
 
     def save_observation(self, observation_data, session_id):
         """
@@ -194,7 +259,13 @@ class InvestigationStorage:
                 obs_id=f"corrupt_{int(datetime.now().timestamp() * 1000)}",
             )
 
-    def create_streaming_observation(self, session_id: str) -> "StreamingObservation":
+    def create_streaming_observation(
+        self,
+        session_id: str,
+        storage_format: str = "segments",
+        fsync_interval: float | None = DEFAULT_FSYNC_INTERVAL,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+    ) -> "StreamingObservation":
         """
         Create a streaming observation writer for incremental saves.
 
@@ -206,14 +277,279 @@ class InvestigationStorage:
 
         Args:
             session_id: Session identifier
+            storage_format: "segments" (packed segment files) or "files"
+                (one JSON file per source file, the pre-2.3 layout)
+            fsync_interval: Seconds between segment group commits
+            max_segment_bytes: Segment rollover threshold
 
         Returns:
             StreamingObservation context manager
         """
         return StreamingObservation(
-            storage=self, session_id=session_id, base_path=self.base_path
+            storage=self,
+            session_id=session_id,
+            base_path=self.base_path,
+            storage_format=storage_format,
+            fsync_interval=fsync_interval,
+            max_segment_bytes=max_segment_bytes,
         )
 
+    def iter_observation_payloads(
+        self, observation_ids: list[str], stream_id: str | None = None
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Yield ``(observation_id, payload)`` for stored observations, in order.
+
+        An ID may name a single observation file, a streaming manifest (which
+        expands to every observation of that stream), or an observation
+        record packed in a segment stream. ``stream_id`` (a session's
+        ``manifest_id``) names the stream to resolve packed records in first.
+        Unknown or unreadable IDs are skipped.
+        """
+        observations_dir = self.base_path / "observations"
+        locator = _SegmentLocator(
+            self.base_path / "observations" / "segments", stream_id
+        )
+
+        for obs_id in observation_ids:
+            obs_file = observations_dir / f"{obs_id}.observation.json"
+            if obs_file.exists():
+                payload = _read_json_dict(obs_file)
+                if payload is not None:
+                    yield obs_id, payload
+                continue
+
+            manifest_file = observations_dir / f"{obs_id}.manifest.json"
+            if manifest_file.exists():
+                manifest = _read_json_dict(manifest_file)
+                if manifest is not None:
+                    yield from self._iter_manifest_payloads(manifest)
+                continue
+
+            # Per-file IDs of segment streams (e.g. from `observe --persist`)
+            found = locator.locate(obs_id)
+            if found is None:
+                continue
+            record_stream, location = found
+            try:
+                payload = self._segment_reader(record_stream).read(location)
+            except (OSError, ValueError, SegmentStoreError):
+                continue
+            if payload.get("id") == obs_id:
+                yield obs_id, payload
+
+    def iter_session_observations(
+        self, observation_ids: list[str], stream_id: str | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield individual observations for a session, unwrapping stored envelopes.
+
+        See ``unwrap_observation_payload``. A malformed payload is skipped
+        without losing the observations of the others.
+        """
+        for _obs_id, data in self.iter_observation_payloads(
+            observation_ids, stream_id
+        ):
+            try:
+                observations = self.unwrap_observation_payload(data)
+            except (AttributeError, TypeError, ValueError):
+                continue
+            yield from observations
+
+    def iter_sourced_observations(
+        self, session_data: dict[str, Any]
+    ) -> Iterator[SourcedObservation]:
+        """
+        Yield ``(source file, observation)`` for a session, patches applied.
+
+        The source is the ``file_path`` of the streaming record holding the
+        observation, else the observation's ``file`` (None for summaries).
+        Watch patches listed under ``patch_ids`` supersede the observations
+        of the files they name (see storage/observation_patch.py).
+        """
+        records = self._iter_sourced_records(
+            list(session_data.get("observation_ids", []) or []),
+            session_data.get("manifest_id"),
+        )
+        patch_ids = list(session_data.get("patch_ids", []) or [])
+        if not patch_ids:
+            yield from records
+            return
+        replaced, removed = merge_patches(
+            payload
+            for _obs_id, payload in self.iter_observation_payloads(patch_ids)
+            if is_patch(payload)
+        )
+        yield from apply_patches(records, replaced, removed)
+
+    def _iter_sourced_records(
+        self, observation_ids: list[str], stream_id: str | None
+    ) -> Iterator[SourcedObservation]:
+        for _obs_id, data in self.iter_observation_payloads(observation_ids, stream_id):
+            try:
+                observations = self.unwrap_observation_payload(data)
+            except (AttributeError, TypeError, ValueError):
+                continue
+            record_source = data.get("file_path") if "observations" in data else None
+            for obs in observations:
+                if not isinstance(obs, dict):
+                    continue
+                source = record_source or obs.get("file")
+                yield (str(source) if source else None), obs
+
+    def save_watch_patch(
+        self,
+        session_data: dict[str, Any],
+        files: dict[str, list[dict[str, Any]]],
+        removed: list[str],
+        changes: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Append a watch patch to a session and save the session.
+
+        Returns the updated session data (with the new patch ID appended to
+        ``patch_ids``); the caller's dict is not modified.
+        """
+        session_id = str(session_data.get("id") or session_data.get("session_id"))
+        record = patch_record(str(session_data.get("path", "")), files, removed, changes)
+        patch_id = self.save_observation(record, session_id)
+        updated = dict(session_data)
+        updated["patch_ids"] = [*(session_data.get("patch_ids") or []), patch_id]
+        self.save_session(updated)
+        return updated
+
+    def compact_watch_patches(self, session_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Fold a session's watch patches into one and save the session.
+
+        The merged patch replaces the session's ``patch_ids``, so readers
+        apply one patch instead of re-merging every batch. The folded
+        patches are kept. Returns the updated session data; with fewer than
+        two patches, or if any patch fails to load, it is returned as is.
+        """
+        patch_ids = list(session_data.get("patch_ids") or [])
+        if len(patch_ids) < 2:
+            return session_data
+        patches = [
+            payload
+            for _obs_id, payload in self.iter_observation_payloads(patch_ids)
+            if is_patch(payload)
+        ]
+        if len(patches) != len(patch_ids):
+            return session_data
+
+        session_id = str(session_data.get("id") or session_data.get("session_id"))
+        replaced, removed = merge_patches(patches)
+        record = patch_record(str(session_data.get("path", "")), replaced, removed)
+        record["compacted"] = patch_ids
+        patch_id = self.save_observation(record, session_id)
+        updated = dict(session_data)
+        updated["patch_ids"] = [patch_id]
+        self.save_session(updated)
+        return updated
+
+    @staticmethod
+    def unwrap_observation_payload(data: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Individual observations of one stored payload.
+
+        Batch envelopes (``{"data": {"observations": [...]}}``) and streaming
+        records (``{"observations": [...]}``) are flattened; a batch envelope
+        without nested observations is reported as one file_sight summary.
+        """
+        if isinstance(data.get("data"), dict):
+            obs_data = data["data"]
+            if obs_data.get("observations"):
+                return list(obs_data["observations"])
+            return [
+                {
+                    "type": "file_sight",
+                    "result": obs_data,
+                    "path": obs_data.get("path", ""),
+                }
+            ]
+        if isinstance(data.get("observations"), list):
+            return list(data["observations"])
+        return [data]
+
+    def query_index_path(self, session_id: str) -> Path:
+        """Location of a session's query index sidecar."""
+        return index_path_for(self.base_path, session_id)
+
+    def dependency_graph_path(self, session_id: str) -> Path:
+        """Location of a session's persisted dependency graph."""
+        return sidecar_path(self.base_path, session_id, ".depgraph")
+
+    def pattern_matches_path(self, session_id: str) -> Path:
+        """Location of the pattern matches watch mode keeps for a session."""
+        return sidecar_path(self.base_path, session_id, ".patterns.json")
+
+    def observation_set_key(self, session_data: dict[str, Any]) -> str:
+        """
+        Digest keying a session's derived sidecars (query index, dependency graph).
+
+        Covers the observation IDs plus the committed progress of every
+        streaming manifest the session names: a manifest ID stays the same
+        while a resumed or extended stream grows, so its ID alone is not
+        content derived. Watch patch IDs are included too.
+        """
+        observation_ids = list(session_data.get("observation_ids", []) or [])
+        manifest_ids = [
+            obs_id for obs_id in observation_ids if obs_id.startswith(STREAM_ID_PREFIX)
+        ]
+        if session_data.get("manifest_id"):
+            manifest_ids.append(str(session_data["manifest_id"]))
+
+        parts = list(observation_ids)
+        for manifest_id in manifest_ids:
+            manifest = _read_json_dict(
+                self.base_path / "observations" / f"{manifest_id}.manifest.json"
+            )
+            if manifest is not None:
+                records = (manifest.get("segments") or {}).get("records")
+                parts.append(
+                    f"{manifest_id}:{manifest.get('files_processed')}:{records}"
+                )
+        parts.extend(f"patch:{patch_id}" for patch_id in session_data.get("patch_ids") or [])
+        return source_key(parts)
+
+    def ensure_query_index(self, session_data: dict[str, Any]) -> QueryIndex:
+        """
+        Return the session's query index, building it if missing or stale.
+
+        Called once at the end of observation; later queries reuse it.
+        """
+        session_id = str(session_data.get("id") or session_data.get("session_id"))
+        key = self.observation_set_key(session_data)
+        index = QueryIndex(self.query_index_path(session_id))
+        if index.is_current(key):
+            return index
+        return QueryIndex.build(
+            index.path, self.iter_sourced_observations(session_data), key
+        )
+
+    def _iter_manifest_payloads(
+        self, manifest: dict[str, Any]
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        if manifest.get("storage_format") == "segments":
+            reader = self._segment_reader(manifest.get("id", ""))
+            limit = (manifest.get("segments") or {}).get("records")
+            for count, payload in enumerate(reader.iter_records()):
+                # Records past the last manifest checkpoint were never committed
+                if limit is not None and count >= limit:
+                    break
+                yield payload.get("id", ""), payload
+            return
+
+        observations_dir = self.base_path / "observations"
+        for obs_id in manifest.get("observation_ids", []):
+            payload = _read_json_dict(observations_dir / f"{obs_id}.observation.json")
+            if payload is not None:
+                yield obs_id, payload
+
+    def _segment_reader(self, stream_id: str) -> SegmentReader:
+        return SegmentReader(self.base_path / "observations" / "segments", stream_id)
+
     def save_question(self, question_data, session_id):
         """Save question with transactional guarantees."""
         question_id = question_data.get("id")
@@ -241,7 +577,7 @@ class InvestigationStorage:
                 filename,
                 question_data,
                 type(self.writer)._create_backup(self.writer, filename)
-                if filename.exists()
+                if self.writer.enable_backups and filename.exists()
                 else None,
             )
             return question_id
@@ -275,31 +611,48 @@ class InvestigationStorage:
                 filename,
                 pattern_data,
                 type(self.writer)._create_backup(self.writer, filename)
-                if filename.exists()
+                if self.writer.enable_backups and filename.exists()
                 else None,
             )
             return pattern_id
         except Exception as e:
             raise TransactionalStorageError(f"Failed to save pattern: {e}") from e
 
-    def verify_storage_integrity(self) -> dict[str, Any]:
+    def verify_storage_integrity(
+        self,
+        tier: str = "full",
+        workers: int | None = None,
+        progress: Callable[[Any], None] | None = None,
+        resume: bool = True,
+    ) -> dict[str, Any]:
         """
         Verify all stored data for corruption.
 
+        Args:
+            tier: "full" (parse and checksum) or "quick" (size, header, trailer)
+            workers: Worker processes; None picks by storage size
+            progress: Called with a VerificationProgress after every batch
+            resume: Continue from an interrupted run's checkpoint
+
         Returns:
             Dictionary with integrity report
         """
         # Check observations
-        observation_evidence = self.writer.verify_all_observations()
+        verification = self.writer.verify_observations(
+            tier=tier, workers=workers, progress=progress, resume=resume
+        )
 
         # Check other files
-        all_evidence = observation_evidence.copy()
+        all_evidence = list(verification.evidence)
 
         # Check session files
         sessions_dir = self.base_path / "sessions"
         if sessions_dir.exists():
-            for session_file in sessions_dir.glob("*.session.json"):
-                if CorruptionMarker.has_marker(session_file):
+            # One listing instead of a marker lookup per session
+            names = {path.name for path in sessions_dir.iterdir()}
+            for session_file in sorted(sessions_dir.glob("*.session.json")):
+                marker_name = session_file.name + CorruptionMarker.MARKER_SUFFIX
+                if marker_name in names:
                     all_evidence.append(
                         CorruptionEvidence(
                             path=session_file,
@@ -325,6 +678,13 @@ class InvestigationStorage:
                 for e in all_evidence[:10]  # Limit to first 10
             ],
             "storage_stats": stats,
+            "verification": {
+                "tier": verification.tier.value,
+                "checked": verification.checked,
+                "resumed_from": verification.resumed_from,
+                "workers": verification.workers,
+                "elapsed_seconds": round(verification.elapsed_seconds, 3),
+            },
             "verified_at": datetime.now().isoformat(),
         }
 
@@ -391,18 +751,58 @@ class InvestigationStorage:
         data_str = json.dumps(data, sort_keys=True, default=str)
         return hashlib.sha256(data_str.encode()).hexdigest()
 
-    def _session_timestamp(self, metadata: dict[str, Any], fallback: float) -> float:
-        """Best-effort timestamp extraction for session ordering."""
-        for field in ("modified_at", "saved_at", "created_at"):
-            value = metadata.get(field)
-            if not value:
-                continue
-            try:
-                normalized = str(value).replace("Z", "+00:00")
-                return datetime.fromisoformat(normalized).timestamp()
-            except ValueError:
-                continue
-        return fallback
+
+class _SegmentLocator:
+    """
+    Resolve per-file observation IDs to segment records, one stream at a time.
+
+    A session's IDs come from a single stream: its own stream (when known)
+    and then the stream that resolved the previous ID are tried first.
+    Other indexes (newest stream first) are only read while an ID is still
+    unresolved, and each index is read at most once.
+    """
+
+    def __init__(self, directory: Path, preferred: str | None = None):
+        self.directory = directory
+        self._indexes: dict[str, dict[bytes, SegmentLocation]] = {}
+        self._pending: list[str] | None = None
+        self._last: str | None = None
+        if preferred and index_path(directory, preferred).exists():
+            self._indexes[preferred] = SegmentReader(directory, preferred).load_index()
+            self._last = preferred
+
+    def locate(self, obs_id: str) -> tuple[str, SegmentLocation] | None:
+        key = record_key(obs_id)
+        if self._last is not None and key in self._indexes[self._last]:
+            return self._last, self._indexes[self._last][key]
+        for stream_id, index in self._indexes.items():
+            if key in index:
+                self._last = stream_id
+                return stream_id, index[key]
+
+        if self._pending is None:
+            self._pending = [
+                stream_id
+                for stream_id in reversed(list_streams(self.directory))
+                if stream_id not in self._indexes
+            ]
+        while self._pending:
+            stream_id = self._pending.pop(0)
+            index = SegmentReader(self.directory, stream_id).load_index()
+            self._indexes[stream_id] = index
+            if key in index:
+                self._last = stream_id
+                return stream_id, index[key]
+        return None
+
+
+def _read_json_dict(path: Path) -> dict[str, Any] | None:
+    """Read a JSON object from disk, or None if missing or malformed."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
 
 
 class StreamingObservation:
@@ -410,25 +810,45 @@ class StreamingObservation:
     Streaming observation writer for large-scale operations.
 
     Writes observations incrementally to avoid memory accumulation.
-    Each observation is written atomically as it's collected.
+
+    With the default "segments" format, records are appended to packed
+    segment files under ``observations/segments/`` (see
+    storage/segment_store.py) and fsynced in groups; the manifest records the
+    last durable position. The "files" format writes one JSON file per source
+    file, as before.
 
     Constitutional Guarantees:
     - Article 9: Each observation immutable when written
     - Article 13: Deterministic streaming order
-    - Article 15: Checkpoint after each write for resumability
+    - Article 15: Manifest checkpoints every 100 files for resumability
     """
 
-    def __init__(self, storage: InvestigationStorage, session_id: str, base_path: Path):
+    def __init__(
+        self,
+        storage: InvestigationStorage,
+        session_id: str,
+        base_path: Path,
+        storage_format: str = "segments",
+        fsync_interval: float | None = DEFAULT_FSYNC_INTERVAL,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+    ):
+        if storage_format not in {"segments", "files"}:
+            raise ValueError(f"Unknown streaming storage format: {storage_format}")
         self.storage = storage
         self.session_id = session_id
         self.base_path = base_path
+        self.storage_format = storage_format
+        self.fsync_interval = fsync_interval
+        self.max_segment_bytes = max_segment_bytes
         self.observation_ids: list[str] = []
         self.boundary_crossings: list[dict[str, Any]] = []
         self.files_processed: int = 0
         self.start_time = datetime.now()
+        self._segments: SegmentWriter | None = None
+        self._resume_position: dict[str, int] | None = None
 
         # Create manifest file for this streaming session
-        self.manifest_id = f"obs_stream_{int(self.start_time.timestamp() * 1000)}"
+        self.manifest_id = f"{STREAM_ID_PREFIX}{int(self.start_time.timestamp() * 1000)}"
         self.manifest_path = (
             self.base_path / "observations" / f"{self.manifest_id}.manifest.json"
         )
@@ -440,23 +860,52 @@ class StreamingObservation:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Finalize streaming session and save manifest."""
         # Save final manifest with all observation IDs
+        manifest_data = self._manifest_data()
+        manifest_data["end_time"] = datetime.now().isoformat()
+        manifest_data["complete"] = exc_type is None
+        if self._segments is not None:
+            self._segments.close()
+
+        atomic_write_json_compatible(self.manifest_path, manifest_data, indent=2)
+
+        return False  # Don't suppress exceptions
+
+    def _manifest_data(self) -> dict[str, Any]:
+        """Manifest fields shared by incremental and final manifests."""
         manifest_data = {
             "id": self.manifest_id,
             "session_id": self.session_id,
-            "observation_ids": self.observation_ids,
-            "boundary_crossings": self.boundary_crossings,
+            "observation_ids": self.observation_ids.copy(),
+            "boundary_crossings": self.boundary_crossings.copy(),
             "files_processed": self.files_processed,
             "start_time": self.start_time.isoformat(),
-            "end_time": datetime.now().isoformat(),
             "streaming": True,
-            "complete": exc_type is None,
+            "storage_format": self.storage_format,
             "schema_version": "v2.1.0",
             "storage_version": "2.1.0",
         }
-
-        atomic_write_json_compatible(self.manifest_path, manifest_data, indent=2)
-
-        return False  # Don't suppress exceptions
+        if self.storage_format == "segments":
+            # Sync first, so the manifest never points past durable records
+            position = (
+                self._segments.checkpoint()
+                if self._segments is not None
+                else self._resume_position or {"segment": 0, "offset": 0, "records": 0}
+            )
+            manifest_data["segments"] = {"directory": "segments", **position}
+        return manifest_data
+
+    def _segment_writer(self) -> SegmentWriter:
+        """Open the segment stream on first write (after any resume)."""
+        if self._segments is None:
+            writer = SegmentWriter(
+                self.base_path / "observations" / "segments",
+                self.manifest_id,
+                max_segment_bytes=self.max_segment_bytes,
+                fsync_interval=self.fsync_interval,
+            )
+            writer.open(self._resume_position)
+            self._segments = writer
+        return self._segments
 
     def write_file_observation(
         self, file_path: str, observations: list[dict[str, Any]]
@@ -507,22 +956,11 @@ class StreamingObservation:
         # Calculate hash for immutability (Article 9)
         obs_data["hash"] = self.storage._calculate_hash(obs_data)
 
-        # Write atomically with explicit flush
-        obs_path = self.base_path / "observations" / f"{obs_id}.observation.json"
-        atomic_write_json_compatible(obs_path, obs_data, indent=2)
-
-        # Force flush to ensure write is complete (fix incomplete writes)
-        import os
-
-        try:
-            if not os.name == "nt":  # Non-Windows
-                fd = os.open(obs_path, os.O_RDONLY)
-                try:
-                    os.fsync(fd)
-                finally:
-                    os.close(fd)
-        except OSError:
-            pass  # Best effort
+        if self.storage_format == "segments":
+            # Appended record; durable at the next group commit or checkpoint
+            self._segment_writer().append(obs_id, obs_data)
+        else:
+            self._write_observation_file(obs_id, obs_data)
 
         # Track in manifest and update incrementally (fix missing manifest updates)
         self.observation_ids.append(obs_id)
@@ -548,21 +986,29 @@ class StreamingObservation:
 
         return obs_id
 
+    def _write_observation_file(self, obs_id: str, obs_data: dict[str, Any]) -> None:
+        """Legacy layout: one atomically written JSON file per source file."""
+        obs_path = self.base_path / "observations" / f"{obs_id}.observation.json"
+        atomic_write_json_compatible(obs_path, obs_data, indent=2)
+
+        # Force flush to ensure write is complete (fix incomplete writes)
+        import os
+
+        try:
+            if not os.name == "nt":  # Non-Windows
+                fd = os.open(obs_path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+        except OSError:
+            pass  # Best effort
+
     def _update_incremental_manifest(self):
         """Update manifest incrementally to enable resume functionality."""
-        manifest_data = {
-            "id": self.manifest_id,
-            "session_id": self.session_id,
-            "observation_ids": self.observation_ids.copy(),
-            "boundary_crossings": self.boundary_crossings.copy(),
-            "files_processed": self.files_processed,
-            "start_time": self.start_time.isoformat(),
-            "last_update": datetime.now().isoformat(),
-            "streaming": True,
-            "complete": False,  # Mark as incomplete until final
-            "schema_version": "v2.1.0",
-            "storage_version": "2.1.0",
-        }
+        manifest_data = self._manifest_data()
+        manifest_data["last_update"] = datetime.now().isoformat()
+        manifest_data["complete"] = False  # Mark as incomplete until final
 
         atomic_write_json_compatible(self.manifest_path, manifest_data, indent=2)
 
@@ -623,9 +1069,18 @@ class StreamingObservation:
 
             # Restore state
             self.manifest_id = manifest["id"]
+            self.manifest_path = manifest_path
             self.observation_ids = manifest["observation_ids"]
             self.boundary_crossings = manifest["boundary_crossings"]
             self.files_processed = manifest["files_processed"]
+            # Manifests written before segments existed used one file per source
+            self.storage_format = manifest.get("storage_format", "files")
+            if self.storage_format == "segments":
+                # Records appended after this checkpoint are discarded on reopen
+                self._resume_position = {
+                    key: int(manifest.get("segments", {}).get(key, 0))
+                    for key in ("segment", "offset", "records")
+                }
 
             return {
                 "resumed": True,
@@ -0,0 +1,348 @@
+"""
+knowledge_sqlite.py - SQLite backend for knowledge history.
+
+Purpose:
+    The JSON layout answers every history query and query-suggestion request
+    by parsing all of ``history.jsonl``, and serializes each event again to
+    match free text. After a year of CI runs that is a full scan per
+    command. This backend keeps history in one SQLite database, so filters
+    are index lookups and free-text search is an FTS5 query. Graph and
+    recommendation artifacts stay in the JSON layout.
+
+Layout:
+    <storage_root>/knowledge/knowledge.sqlite  (WAL mode)
+
+    meta(key, value)          format, ``history_offset`` (bytes of
+                              ``history.jsonl`` already indexed)
+    history(seq, event_id, session_id, event_type, timestamp, ts, question,
+            payload)          one row per event; ``payload`` is the event JSON
+                              exactly as the JSONL line held it, ``ts`` its
+                              parsed timestamp (NULL when unparseable)
+    history_text              contentless FTS5 table, trigram tokenizer, over
+                              the lowered payload (rowid = seq)
+    session_patterns(stem, session_id, mtime_ns, size_bytes, pattern_ids)
+                              pattern IDs per session file, refreshed when a
+                              file's size or mtime changes
+
+Migration:
+    ``history.jsonl`` stays the record of every event: new events are
+    appended to it (and to ``history_index.json``) exactly as the JSON
+    layout does, then indexed here. The database indexes the JSONL from
+    ``history_offset`` onwards under ``BEGIN IMMEDIATE``, so the first open
+    imports the whole file, events appended by a JSON-layout fallback are
+    picked up on the next open, and two processes never import a line
+    twice. A database whose offset is missing or past the end of the file
+    is rebuilt from the JSONL.
+
+Constitutional Basis:
+    - Article 9: Immutable Observations (events are only appended)
+    - Article 13: Deterministic (same filters, same order as the JSON layout)
+
+Limitations:
+    - Free-text matching is a case-insensitive substring match, as before.
+      Needles shorter than three characters cannot use the trigram index
+      and scan the filtered rows.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from storage.knowledge_storage import (
+    KnowledgeStorage,
+    _file_size,
+    _parse_date_or_datetime,
+    _rank_suggestions,
+    _read_jsonl_tail,
+)
+
+DATABASE_FORMAT = "2"
+DATABASE_FILE = "knowledge.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS history (
+    seq INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    ts REAL,
+    question TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_session ON history(session_id, timestamp);
+CREATE INDEX IF NOT EXISTS history_type ON history(event_type, timestamp);
+CREATE INDEX IF NOT EXISTS history_time ON history(timestamp);
+CREATE VIRTUAL TABLE IF NOT EXISTS history_text USING fts5(
+    document, content='', tokenize='trigram case_sensitive 1'
+);
+CREATE TABLE IF NOT EXISTS session_patterns (
+    stem TEXT PRIMARY KEY,
+    session_id TEXT,
+    mtime_ns INTEGER NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    pattern_ids TEXT NOT NULL
+);
+"""
+
+_supported: bool | None = None
+
+
+def sqlite_supported() -> bool:
+    """Whether this interpreter's sqlite3 has FTS5 with the trigram tokenizer."""
+    global _supported
+    if _supported is None:
+        try:
+            connection = sqlite3.connect(":memory:")
+            try:
+                connection.execute(
+                    "CREATE VIRTUAL TABLE probe USING fts5(x, tokenize='trigram')"
+                )
+            finally:
+                connection.close()
+            _supported = True
+        except sqlite3.Error:
+            _supported = False
+    return _supported
+
+
+class SQLiteKnowledgeStorage(KnowledgeStorage):
+    """Knowledge storage with history kept in an indexed SQLite database."""
+
+    def __init__(self, storage_root: Path | str | None = None) -> None:
+        super().__init__(storage_root)
+        self.database_path = self.base_path / DATABASE_FILE
+        with self._lock:
+            self._sync_history()
+
+    # ------------------------------------------------------------------
+    # History
+    # ------------------------------------------------------------------
+
+    def record_history_event(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Append a history event to the JSON layout, then index it."""
+        with self._lock:
+            event = super().record_history_event(payload)
+            self._sync_history()
+        return event
+
+    def query_history(
+        self,
+        session_id: str | None = None,
+        query: str | None = None,
+        event_type: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Query history events using exact and text filters."""
+        needle = (query or "").strip().lower()
+        start_ts = _parse_date_or_datetime(from_date) if from_date else None
+        end_ts = _parse_date_or_datetime(to_date, end_of_day=True) if to_date else None
+        with self._lock:
+            self._sync_history()
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        if session_id:
+            clauses.append("h.session_id = ?")
+            params.append(session_id)
+        if event_type:
+            clauses.append("h.event_type = ?")
+            params.append(event_type)
+        # Events with an unparseable timestamp pass date filters, as before
+        if start_ts:
+            clauses.append("(h.ts IS NULL OR h.ts >= ?)")
+            params.append(start_ts.timestamp())
+        if end_ts:
+            clauses.append("(h.ts IS NULL OR h.ts <= ?)")
+            params.append(end_ts.timestamp())
+        if len(needle) >= 3:
+            clauses.append(
+                "h.seq IN (SELECT rowid FROM history_text WHERE history_text MATCH ?)"
+            )
+            params.append('"' + needle.replace('"', '""') + '"')
+
+        sql = "SELECT h.payload FROM history AS h"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY h.timestamp DESC, h.seq"
+
+        events: list[dict[str, Any]] = []
+        connection = self._connect()
+        try:
+            for (payload,) in connection.execute(sql, params):
+                # The index only narrows; the match is decided on the text
+                if needle and needle not in payload.lower():
+                    continue
+                try:
+                    event = json.loads(payload)
+                except json.JSONDecodeError:
+                    continue
+                events.append(event)
+                if 0 < limit <= len(events):
+                    break
+        finally:
+            connection.close()
+        return events
+
+    def get_query_suggestions(
+        self,
+        session_id: str | None = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Return most frequent previous query strings."""
+        sql = (
+            "SELECT question, COUNT(*) FROM history"
+            " WHERE event_type = 'query' AND question != ''"
+        )
+        params: list[Any] = []
+        if session_id:
+            sql += " AND session_id = ?"
+            params.append(session_id)
+        sql += " GROUP BY question"
+        with self._lock:
+            self._sync_history()
+        connection = self._connect()
+        try:
+            counts = dict(connection.execute(sql, params))
+        finally:
+            connection.close()
+        return _rank_suggestions(counts, limit)
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    def session_pattern_sets(self) -> dict[str, set[str]]:
+        """Pattern IDs referenced by each saved session, by session ID."""
+        sessions_dir = self.storage_root / "sessions"
+        on_disk: dict[str, tuple[Path, int, int]] = {}
+        if sessions_dir.exists():
+            for session_file in sessions_dir.glob("*.session.json"):
+                try:
+                    stat = session_file.stat()
+                except OSError:
+                    continue
+                stem = session_file.name[: -len(".session.json")]
+                on_disk[stem] = (session_file, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            connection = self._connect()
+            try:
+                known = {
+                    stem: (mtime_ns, size_bytes)
+                    for stem, mtime_ns, size_bytes in connection.execute(
+                        "SELECT stem, mtime_ns, size_bytes FROM session_patterns"
+                    )
+                }
+                connection.executemany(
+                    "DELETE FROM session_patterns WHERE stem = ?",
+                    [(stem,) for stem in known.keys() - on_disk.keys()],
+                )
+                for stem, (session_file, mtime_ns, size_bytes) in on_disk.items():
+                    if known.get(stem) == (mtime_ns, size_bytes):
+                        continue
+                    data = self._load_json(session_file, None)
+                    session_id = None
+                    pattern_ids: list[str] = []
+                    if isinstance(data, dict) and data.get("id"):
+                        session_id = str(data["id"])
+                        pattern_ids = sorted(
+                            {str(item) for item in data.get("pattern_ids", []) or []}
+                        )
+                    connection.execute(
+                        "INSERT OR REPLACE INTO session_patterns VALUES (?, ?, ?, ?, ?)",
+                        (stem, session_id, mtime_ns, size_bytes, json.dumps(pattern_ids)),
+                    )
+                connection.commit()
+                rows = connection.execute(
+                    "SELECT session_id, pattern_ids FROM session_patterns"
+                    " WHERE session_id IS NOT NULL ORDER BY stem"
+                ).fetchall()
+            finally:
+                connection.close()
+        return {session_id: set(json.loads(pattern_ids)) for session_id, pattern_ids in rows}
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.database_path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def _sync_history(self) -> None:
+        """Index the ``history.jsonl`` lines appended since the last sync."""
+        size = _file_size(self.history_path)
+        connection = self._connect()
+        try:
+            if _history_offset(connection) == size:
+                return
+            # Re-read the offset under the write lock: another process may
+            # have indexed the same lines in the meantime
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                offset = _history_offset(connection)
+                if offset is None or offset > size:
+                    connection.execute("DELETE FROM history")
+                    connection.execute(
+                        "INSERT INTO history_text(history_text) VALUES ('delete-all')"
+                    )
+                    offset = 0
+                offset, events = _read_jsonl_tail(self.history_path, offset)
+                _insert_events(connection, events)
+                connection.executemany(
+                    "INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)",
+                    [("format", DATABASE_FORMAT), ("history_offset", str(offset))],
+                )
+                connection.commit()
+            except BaseException:
+                connection.rollback()
+                raise
+        finally:
+            connection.close()
+
+
+def _history_offset(connection: sqlite3.Connection) -> int | None:
+    row = connection.execute(
+        "SELECT value FROM meta WHERE key = 'history_offset'"
+    ).fetchone()
+    return int(row[0]) if row else None
+
+
+def _insert_events(connection: sqlite3.Connection, events: Iterable[dict[str, Any]]) -> None:
+    seq = connection.execute("SELECT COALESCE(MAX(seq), 0) FROM history").fetchone()[0]
+    rows = []
+    documents = []
+    for event in events:
+        seq += 1
+        # The same text the JSON layout stored and searched
+        payload = json.dumps(event, ensure_ascii=False)
+        timestamp = str(event.get("timestamp") or "")
+        parsed = _parse_date_or_datetime(timestamp)
+        rows.append(
+            (
+                seq,
+                str(event.get("event_id") or ""),
+                str(event.get("session_id")),
+                str(event.get("event_type")),
+                timestamp,
+                parsed.timestamp() if parsed else None,
+                str(event.get("question") or "").strip(),
+                payload,
+            )
+        )
+        documents.append((seq, payload.lower()))
+    connection.executemany("INSERT INTO history VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    connection.executemany(
+        "INSERT INTO history_text(rowid, document) VALUES (?, ?)", documents
+    )
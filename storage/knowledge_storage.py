@@ -2,6 +2,12 @@
 storage/knowledge_storage.py
 
 Persistent storage for knowledge history, graph artifacts, and recommendations.
+
+The graph logs (``graph_nodes.jsonl``, ``graph_edges.jsonl``) hold the merged
+state of every node and edge after each commit; the last record per ID wins.
+``graph_index.json`` is a compacted snapshot of that state plus the log
+offsets it covers, rewritten once enough records have been appended after
+it. Readers load the snapshot once and replay only the log tail.
 """
 
 from __future__ import annotations
@@ -9,6 +15,9 @@ from __future__ import annotations
 import hashlib
 import json
 import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -16,12 +25,17 @@ from typing import Any
 from storage.atomic import atomic_write_json_compatible
 
 
+GRAPH_SNAPSHOT_RECORDS = 10_000
+"""Minimum log records appended after a snapshot before it is rewritten."""
+
+
 class KnowledgeStorage:
     """Storage adapter for knowledge base artifacts."""
 
     def __init__(self, storage_root: Path | str | None = None) -> None:
         self.storage_root = Path(storage_root or "storage")
         self._lock = threading.RLock()
+        self._graph: _GraphState | None = None
         self._configure_paths(self.storage_root / "knowledge")
         self._ensure_layout()
 
@@ -66,6 +80,7 @@ class KnowledgeStorage:
             "edges": {},
             "adjacency": {},
             "reverse_adjacency": {},
+            "log_offsets": {"nodes": 0, "edges": 0},
             "updated_at": _now_iso(),
         }
 
@@ -102,11 +117,7 @@ class KnowledgeStorage:
 
     def record_history_event(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Persist a history event and refresh query/session indexes."""
-        event = dict(payload)
-        event.setdefault("event_id", _event_id(event))
-        event.setdefault("timestamp", _now_iso())
-        event.setdefault("event_type", "unknown")
-        event.setdefault("session_id", "unknown")
+        event = _new_event(payload)
 
         with self._lock:
             self._append_jsonl(self.history_path, event)
@@ -186,96 +197,54 @@ class KnowledgeStorage:
                 continue
             counts[question] = int(counts.get(question, 0)) + 1
 
-        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0].lower()))
-        return [
-            {"query": query, "count": count}
-            for query, count in ranked[: max(limit, 0)]
-        ]
+        return _rank_suggestions(counts, limit)
+
+    def session_pattern_sets(self) -> dict[str, set[str]]:
+        """Pattern IDs referenced by each saved session, by session ID."""
+        sessions_dir = self.storage_root / "sessions"
+        sessions: dict[str, set[str]] = {}
+        if not sessions_dir.exists():
+            return sessions
+        for session_file in sessions_dir.glob("*.session.json"):
+            data = self._load_json(session_file, None)
+            if isinstance(data, dict) and data.get("id"):
+                sessions[str(data["id"])] = set(data.get("pattern_ids", []) or [])
+        return sessions
+
+    @contextmanager
+    def graph_batch(self) -> Iterator[GraphBatch]:
+        """
+        Accumulate graph nodes and edges and commit them together.
+
+        Usage:
+            with storage.graph_batch() as batch:
+                batch.upsert_graph_node({...})
+                batch.add_graph_edge({...})
+
+        On exit the merged records are appended to the node and edge logs
+        in one write each; the index snapshot is only rewritten when enough
+        log records have accumulated since the last one. If the block
+        raises, nothing is written.
+        """
+        with self._lock:
+            state = self._graph_state()
+            batch = GraphBatch(state)
+            try:
+                yield batch
+            except BaseException:
+                self._graph = None  # Drop uncommitted merges; reload from disk
+                raise
+            self._commit_graph(state, batch)
 
     def upsert_graph_node(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Insert or update a graph node in index and append-only log."""
-        node = dict(payload)
-        node_id = str(node.get("node_id") or "").strip()
-        if not node_id:
-            raise ValueError("node_id is required")
-        node.setdefault("node_type", "unknown")
-        node.setdefault("label", node_id)
-        node.setdefault("session_ids", [])
-        node.setdefault("attributes", {})
-        node["updated_at"] = _now_iso()
-
-        with self._lock:
-            index = self._load_json(self.graph_index_path, self._default_graph_index())
-            nodes = dict(index.get("nodes", {}))
-            existing = dict(nodes.get(node_id, {}))
-
-            merged_sessions = set(existing.get("session_ids", []) or [])
-            merged_sessions.update(node.get("session_ids", []) or [])
-            merged_attrs = dict(existing.get("attributes", {}) or {})
-            merged_attrs.update(node.get("attributes", {}) or {})
-
-            merged_node = {
-                "node_id": node_id,
-                "node_type": str(node.get("node_type") or existing.get("node_type") or "unknown"),
-                "label": str(node.get("label") or existing.get("label") or node_id),
-                "session_ids": sorted(merged_sessions),
-                "attributes": merged_attrs,
-                "updated_at": _now_iso(),
-            }
-            nodes[node_id] = merged_node
-            index["nodes"] = nodes
-            index["updated_at"] = _now_iso()
-            atomic_write_json_compatible(self.graph_index_path, index)
-            self._append_jsonl(self.graph_nodes_path, merged_node)
-            self._touch_stats("graph_node")
-            return merged_node
+        with self.graph_batch() as batch:
+            return batch.upsert_graph_node(payload)
 
     def add_graph_edge(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Insert or update graph edges and adjacency index."""
-        edge = dict(payload)
-        from_node = str(edge.get("from_node") or "").strip()
-        to_node = str(edge.get("to_node") or "").strip()
-        edge_type = str(edge.get("edge_type") or "related_to")
-        session_id = str(edge.get("session_id") or "unknown")
-        if not from_node or not to_node:
-            raise ValueError("from_node and to_node are required")
-
-        edge_id = str(edge.get("edge_id") or _edge_id(from_node, to_node, edge_type, session_id))
-        weight = float(edge.get("weight") or 1.0)
-
-        with self._lock:
-            index = self._load_json(self.graph_index_path, self._default_graph_index())
-            edges = dict(index.get("edges", {}))
-            adjacency = _copy_list_map(index.get("adjacency", {}))
-            reverse = _copy_list_map(index.get("reverse_adjacency", {}))
-
-            existing = dict(edges.get(edge_id, {}))
-            merged = {
-                "edge_id": edge_id,
-                "from_node": from_node,
-                "to_node": to_node,
-                "edge_type": edge_type,
-                "session_id": session_id,
-                "weight": float(existing.get("weight", 0.0)) + weight,
-                "timestamp": str(edge.get("timestamp") or _now_iso()),
-            }
-            edges[edge_id] = merged
-
-            adjacency.setdefault(from_node, [])
-            reverse.setdefault(to_node, [])
-            if edge_id not in adjacency[from_node]:
-                adjacency[from_node].append(edge_id)
-            if edge_id not in reverse[to_node]:
-                reverse[to_node].append(edge_id)
-
-            index["edges"] = edges
-            index["adjacency"] = adjacency
-            index["reverse_adjacency"] = reverse
-            index["updated_at"] = _now_iso()
-            atomic_write_json_compatible(self.graph_index_path, index)
-            self._append_jsonl(self.graph_edges_path, merged)
-            self._touch_stats("graph_edge")
-            return merged
+        with self.graph_batch() as batch:
+            return batch.add_graph_edge(payload)
 
     def get_graph(
         self,
@@ -286,11 +255,24 @@ class KnowledgeStorage:
         limit: int = 200,
     ) -> dict[str, Any]:
         """Return graph projection and bounded neighborhood."""
-        index = self._load_json(self.graph_index_path, self._default_graph_index())
-        nodes = dict(index.get("nodes", {}))
-        edges = dict(index.get("edges", {}))
-        adjacency = _copy_list_map(index.get("adjacency", {}))
-        reverse = _copy_list_map(index.get("reverse_adjacency", {}))
+        with self._lock:
+            return self._project_graph(
+                self._graph_state(), session_id, focus, depth, edge_type, limit
+            )
+
+    def _project_graph(
+        self,
+        state: _GraphState,
+        session_id: str | None,
+        focus: str | None,
+        depth: int,
+        edge_type: str | None,
+        limit: int,
+    ) -> dict[str, Any]:
+        nodes = state.nodes
+        edges = state.edges
+        adjacency = state.adjacency
+        reverse = state.reverse_adjacency
 
         focus_id = str(focus or "").strip() or None
         selected_nodes: set[str]
@@ -316,8 +298,6 @@ class KnowledgeStorage:
 
         selected_edges: list[dict[str, Any]] = []
         for edge in edges.values():
-            if not isinstance(edge, dict):
-                continue
             if edge_type and str(edge.get("edge_type")) != edge_type:
                 continue
             if session_id and str(edge.get("session_id")) != session_id:
@@ -325,7 +305,7 @@ class KnowledgeStorage:
             src = str(edge.get("from_node") or "")
             dst = str(edge.get("to_node") or "")
             if src in selected_nodes and dst in selected_nodes:
-                selected_edges.append(edge)
+                selected_edges.append(dict(edge))
 
         selected_edges.sort(
             key=lambda item: (
@@ -344,7 +324,7 @@ class KnowledgeStorage:
             selected_nodes = selected_nodes.intersection(nodes_from_edges)
 
         selected_node_payloads = [
-            nodes[node_id]
+            _copy_node(nodes[node_id])
             for node_id in sorted(selected_nodes)
             if node_id in nodes
         ]
@@ -388,6 +368,109 @@ class KnowledgeStorage:
             return []
         return [item for item in values if isinstance(item, dict)]
 
+    def _graph_state(self) -> _GraphState:
+        """In-memory graph, brought up to date with the logs (caller locks)."""
+        state = self._graph
+        if state is not None:
+            sizes = (_file_size(self.graph_nodes_path), _file_size(self.graph_edges_path))
+            if sizes[0] < state.node_offset or sizes[1] < state.edge_offset:
+                state = None  # Logs were replaced; start over
+            elif sizes != (state.node_offset, state.edge_offset):
+                self._replay_graph_logs(state)  # Another writer appended
+        if state is None:
+            state = self._load_graph_snapshot()
+            self._replay_graph_logs(state)
+            self._graph = state
+            if state.legacy:
+                self._write_graph_snapshot(state)  # Record the log offsets
+        return state
+
+    def _load_graph_snapshot(self) -> _GraphState:
+        index = self._load_json(self.graph_index_path, self._default_graph_index())
+        if not isinstance(index, dict):
+            index = self._default_graph_index()
+        state = _GraphState()
+        for node_id, node in dict(index.get("nodes", {})).items():
+            if isinstance(node, dict):
+                state.nodes[str(node_id)] = node
+        for edge_id, edge in dict(index.get("edges", {})).items():
+            if isinstance(edge, dict):
+                state.edges[str(edge_id)] = edge
+        state.adjacency = _copy_list_map(index.get("adjacency", {}))
+        state.reverse_adjacency = _copy_list_map(index.get("reverse_adjacency", {}))
+
+        offsets = index.get("log_offsets")
+        if isinstance(offsets, dict):
+            state.node_offset = int(offsets.get("nodes", 0))
+            state.edge_offset = int(offsets.get("edges", 0))
+        else:
+            # Written before the logs were authoritative: the index already
+            # includes every logged record
+            state.node_offset = _file_size(self.graph_nodes_path)
+            state.edge_offset = _file_size(self.graph_edges_path)
+            state.legacy = True
+        return state
+
+    def _replay_graph_logs(self, state: _GraphState) -> None:
+        """Apply log records appended after the state's offsets."""
+        state.node_offset, nodes = _read_jsonl_tail(self.graph_nodes_path, state.node_offset)
+        for node in nodes:
+            node_id = str(node.get("node_id") or "")
+            if node_id:
+                state.nodes[node_id] = node
+        state.edge_offset, edges = _read_jsonl_tail(self.graph_edges_path, state.edge_offset)
+        for edge in edges:
+            state.add_edge(edge)
+        state.unsnapshotted += len(nodes) + len(edges)
+
+    def _commit_graph(self, state: _GraphState, batch: GraphBatch) -> None:
+        if not batch.nodes and not batch.edges:
+            return
+        state.node_offset = self._append_records(
+            self.graph_nodes_path, state.node_offset, batch.nodes.values()
+        )
+        state.edge_offset = self._append_records(
+            self.graph_edges_path, state.edge_offset, batch.edges.values()
+        )
+        state.unsnapshotted += len(batch.nodes) + len(batch.edges)
+        if state.unsnapshotted >= max(
+            GRAPH_SNAPSHOT_RECORDS, len(state.nodes) + len(state.edges)
+        ):
+            self._write_graph_snapshot(state)
+        self._touch_stats("graph_edge" if batch.edges else "graph_node")
+
+    def _append_records(
+        self, path: Path, offset: int, records: Iterable[dict[str, Any]]
+    ) -> int:
+        """Append records in one write; returns the new replay offset."""
+        payload = "".join(
+            json.dumps(record, ensure_ascii=False) + "\n" for record in records
+        ).encode("utf-8")
+        if not payload:
+            return offset
+        with path.open("ab") as handle:
+            start = handle.tell()
+            handle.write(payload)
+        # Records another writer appended since our last read are replayed
+        # later; ours are already applied
+        return start + len(payload) if start == offset else offset
+
+    def _write_graph_snapshot(self, state: _GraphState) -> None:
+        atomic_write_json_compatible(
+            self.graph_index_path,
+            {
+                "nodes": state.nodes,
+                "edges": state.edges,
+                "adjacency": state.adjacency,
+                "reverse_adjacency": state.reverse_adjacency,
+                "log_offsets": {"nodes": state.node_offset, "edges": state.edge_offset},
+                "updated_at": _now_iso(),
+            },
+            indent=None,
+        )
+        state.unsnapshotted = 0
+        state.legacy = False
+
     def _touch_stats(self, reason: str) -> None:
         stats = self._load_json(self.stats_path, {})
         if not isinstance(stats, dict):
@@ -397,6 +480,166 @@ class KnowledgeStorage:
         atomic_write_json_compatible(self.stats_path, stats)
 
 
+@dataclass
+class _GraphState:
+    """Current graph and how far into each log it reflects."""
+
+    nodes: dict[str, dict[str, Any]] = field(default_factory=dict)
+    edges: dict[str, dict[str, Any]] = field(default_factory=dict)
+    adjacency: dict[str, list[str]] = field(default_factory=dict)
+    reverse_adjacency: dict[str, list[str]] = field(default_factory=dict)
+    node_offset: int = 0
+    edge_offset: int = 0
+    unsnapshotted: int = 0  # log records not yet in the index snapshot
+    legacy: bool = False  # snapshot predates log offsets
+
+    def add_edge(self, edge: dict[str, Any]) -> None:
+        edge_id = str(edge.get("edge_id") or "")
+        if not edge_id:
+            return
+        known = edge_id in self.edges
+        self.edges[edge_id] = edge
+        if known:
+            return  # Endpoints are part of the ID; adjacency is unchanged
+        # A new ID is in no adjacency list yet (no scan of hub nodes' lists)
+        self.adjacency.setdefault(str(edge.get("from_node") or ""), []).append(edge_id)
+        self.reverse_adjacency.setdefault(str(edge.get("to_node") or ""), []).append(
+            edge_id
+        )
+
+
+class GraphBatch:
+    """Graph writes accumulated by ``KnowledgeStorage.graph_batch``."""
+
+    def __init__(self, state: _GraphState) -> None:
+        self._state = state
+        self.nodes: dict[str, dict[str, Any]] = {}  # latest merged record per ID
+        self.edges: dict[str, dict[str, Any]] = {}
+
+    def upsert_graph_node(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Merge a node into the graph; sessions and attributes accumulate."""
+        node = dict(payload)
+        node_id = str(node.get("node_id") or "").strip()
+        if not node_id:
+            raise ValueError("node_id is required")
+        node.setdefault("node_type", "unknown")
+        node.setdefault("label", node_id)
+        node.setdefault("session_ids", [])
+        node.setdefault("attributes", {})
+
+        existing = self._state.nodes.get(node_id, {})
+        merged_sessions = set(existing.get("session_ids", []) or [])
+        merged_sessions.update(node.get("session_ids", []) or [])
+        merged_attrs = dict(existing.get("attributes", {}) or {})
+        merged_attrs.update(node.get("attributes", {}) or {})
+
+        merged_node = {
+            "node_id": node_id,
+            "node_type": str(node.get("node_type") or existing.get("node_type") or "unknown"),
+            "label": str(node.get("label") or existing.get("label") or node_id),
+            "session_ids": sorted(merged_sessions),
+            "attributes": merged_attrs,
+            "updated_at": _now_iso(),
+        }
+        self._state.nodes[node_id] = merged_node
+        self.nodes.pop(node_id, None)  # Keep log order = last update order
+        self.nodes[node_id] = merged_node
+        return _copy_node(merged_node)
+
+    def add_graph_edge(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Add an edge; repeated edges accumulate weight."""
+        edge = dict(payload)
+        from_node = str(edge.get("from_node") or "").strip()
+        to_node = str(edge.get("to_node") or "").strip()
+        edge_type = str(edge.get("edge_type") or "related_to")
+        session_id = str(edge.get("session_id") or "unknown")
+        if not from_node or not to_node:
+            raise ValueError("from_node and to_node are required")
+
+        edge_id = str(edge.get("edge_id") or _edge_id(from_node, to_node, edge_type, session_id))
+        weight = float(edge.get("weight") or 1.0)
+
+        existing = self._state.edges.get(edge_id, {})
+        merged = {
+            "edge_id": edge_id,
+            "from_node": from_node,
+            "to_node": to_node,
+            "edge_type": edge_type,
+            "session_id": session_id,
+            "weight": float(existing.get("weight", 0.0)) + weight,
+            "timestamp": str(edge.get("timestamp") or _now_iso()),
+        }
+        self._state.add_edge(merged)
+        self.edges.pop(edge_id, None)
+        self.edges[edge_id] = merged
+        return dict(merged)
+
+
+def _copy_node(node: dict[str, Any]) -> dict[str, Any]:
+    copied = dict(node)
+    copied["session_ids"] = list(node.get("session_ids", []) or [])
+    copied["attributes"] = dict(node.get("attributes", {}) or {})
+    return copied
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _read_jsonl_tail(path: Path, offset: int) -> tuple[int, list[dict[str, Any]]]:
+    """JSON records after ``offset`` and the offset after the last full line."""
+    try:
+        with path.open("rb") as handle:
+            handle.seek(offset)
+            data = handle.read()
+    except OSError:
+        return offset, []
+    end = data.rfind(b"\n") + 1  # A torn last line is read once it is complete
+    records = []
+    for line in data[:end].splitlines():
+        if not line.strip():
+            continue
+        try:
+            payload = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if isinstance(payload, dict):
+            records.append(payload)
+    return offset + end, records
+
+
+def _new_event(payload: dict[str, Any]) -> dict[str, Any]:
+    event = dict(payload)
+    event.setdefault("event_id", _event_id(event))
+    event.setdefault("timestamp", _now_iso())
+    event.setdefault("event_type", "unknown")
+    event.setdefault("session_id", "unknown")
+    return event
+
+
+def _rank_suggestions(counts: dict[str, int], limit: int) -> list[dict[str, Any]]:
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0].lower()))
+    return [
+        {"query": query, "count": count}
+        for query, count in ranked[: max(limit, 0)]
+    ]
+
+
+def open_knowledge_storage(storage_root: Path | str | None = None) -> KnowledgeStorage:
+    """
+    Knowledge storage for a storage root: the SQLite backend when the
+    interpreter's sqlite3 supports FTS5 trigram search, else the JSON layout.
+    """
+    from storage.knowledge_sqlite import SQLiteKnowledgeStorage, sqlite_supported
+
+    if sqlite_supported():
+        return SQLiteKnowledgeStorage(storage_root)
+    return KnowledgeStorage(storage_root)
+
+
 def _tokenize(text: str) -> list[str]:
     tokens = []
     for chunk in text.lower().split():
@@ -0,0 +1,197 @@
+"""
+observation_cache.py - Content-addressed cache of per-file eye results.
+
+Purpose:
+    Let re-investigation of a mostly unchanged tree reuse the observations of
+    files whose content has not changed, so the cost of a nightly run is
+    proportional to the diff rather than the repository size.
+
+Layout:
+    <storage_root>/cache/observations/<eye>/<version>/<sha[:2]>/<sha>/<entry>.json
+
+    Records are keyed by (eye name, eye version, SHA-256 of the file content)
+    and hold one serialized observation each; ``<entry>`` is a digest of the
+    file path and caller variant. Observations embed their file path, so an
+    entry is only reused for the same path; a changed file gets a new content
+    hash and therefore a fresh observation. One file per entry keeps writes
+    independent: identical files (e.g. empty ``__init__.py``) never share a
+    growing record, and concurrent workers never overwrite each other.
+
+Constitutional Basis:
+    - Article 9: Immutable Observations (records are never edited in place;
+      a changed file produces a new key)
+    - Article 13: Deterministic (same content + same eye version = same result)
+    - Article 18: Explicit Limitations (reuse counts are always reported)
+
+Limitations:
+    - Cache writes are atomic (temp file + rename) but not fsynced. A record
+      lost in a crash is simply re-observed next run; an unreadable record is
+      treated as a miss.
+    - Eye output that depends on anything besides file content and the
+      caller-provided ``variant`` must not be cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from storage.atomic import normalize_json_data
+
+# Bump when the cached observation shape changes without an eye VERSION bump
+CACHE_FORMAT = 2
+
+
+class ObservationCache:
+    """Persistent content-addressed store of per-file observation entries."""
+
+    def __init__(self, cache_dir: Path | str):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @classmethod
+    def for_storage_root(cls, storage_root: Path | str) -> ObservationCache:
+        """Cache located under a CodeMarshal storage root."""
+        return cls(Path(storage_root) / "cache" / "observations")
+
+    def _record_path(
+        self,
+        eye_name: str,
+        eye_version: str,
+        content_sha256: str,
+        file_path: str,
+        variant: str,
+    ) -> Path:
+        entry = hashlib.sha256(
+            _entry_key(file_path, variant).encode("utf-8")
+        ).hexdigest()
+        return (
+            self.cache_dir
+            / _safe_component(eye_name)
+            / _safe_component(eye_version)
+            / content_sha256[:2]
+            / content_sha256
+            / f"{entry}.json"
+        )
+
+    def _read_record(self, path: Path, entry_key: str) -> dict[str, Any] | None:
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError, ValueError):
+            return None
+        if (
+            not isinstance(record, dict)
+            or record.get("format") != CACHE_FORMAT
+            or record.get("entry_key") != entry_key
+        ):
+            return None
+        return record
+
+    def get(
+        self,
+        eye_name: str,
+        eye_version: str,
+        content_sha256: str,
+        file_path: str,
+        variant: str = "",
+    ) -> dict[str, Any] | None:
+        """Return the cached observation for this file content, or None."""
+        record = self._read_record(
+            self._record_path(
+                eye_name, eye_version, content_sha256, file_path, variant
+            ),
+            _entry_key(file_path, variant),
+        )
+        entry = record.get("observation") if record is not None else None
+
+        if isinstance(entry, dict):
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        eye_name: str,
+        eye_version: str,
+        content_sha256: str,
+        file_path: str,
+        observation: dict[str, Any],
+        variant: str = "",
+    ) -> dict[str, Any]:
+        """
+        Store an observation and return its JSON-normalized form.
+
+        Callers should use the returned value so cached and fresh results are
+        indistinguishable.
+        """
+        normalized = normalize_json_data(observation)
+        path = self._record_path(
+            eye_name, eye_version, content_sha256, file_path, variant
+        )
+        record = {
+            "format": CACHE_FORMAT,
+            "eye": eye_name,
+            "version": eye_version,
+            "content_sha256": content_sha256,
+            "entry_key": _entry_key(file_path, variant),
+            "observation": normalized,
+        }
+
+        try:
+            _write_json_replace(path, record)
+            self.stores += 1
+        except OSError:
+            pass  # Cache is best effort; the observation itself is unaffected
+        return normalized
+
+    def counters(self) -> dict[str, int]:
+        """Raw numeric counters (summable across worker processes)."""
+        return {"reused": self.hits, "reobserved": self.misses, "stored": self.stores}
+
+    def stats(self, extra: Mapping[str, int] | None = None) -> dict[str, Any]:
+        """
+        Reuse counters for honest reporting.
+
+        ``extra`` adds counters gathered elsewhere (e.g. worker processes).
+        """
+        counters = self.counters()
+        for key in counters:
+            counters[key] += int((extra or {}).get(key, 0))
+        lookups = counters["reused"] + counters["reobserved"]
+        return {
+            "cache_dir": str(self.cache_dir),
+            **counters,
+            "reuse_rate": counters["reused"] / lookups if lookups else 0.0,
+        }
+
+
+def _entry_key(file_path: str, variant: str) -> str:
+    return f"{file_path}|{variant}" if variant else file_path
+
+
+def _safe_component(value: str) -> str:
+    return "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in str(value))
+
+
+def _write_json_replace(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, separators=(",", ":"), ensure_ascii=False)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,138 @@
+"""
+observation_patch.py - Watch-mode patches over a session's stored observations.
+
+Purpose:
+    Stored observations are immutable, so watch mode does not rewrite them
+    when a file changes. It appends a patch record holding the re-observed
+    files' new observations (and the files that were deleted); readers
+    apply the session's patches in order while streaming the original
+    records. A patch supersedes every earlier observation of the files it
+    names, whether it came from the investigation or from an older patch.
+
+Layout:
+    <storage_root>/observations/<patch_id>.observation.json
+
+    {"watch_patch": true, "root": ..., "files": {path: [observation, ...]},
+     "order": [path, ...], "removed": [path, ...], "changes": [FileChange dicts]}
+
+    The session lists its patches, oldest first, under ``patch_ids``.
+    Stored JSON has sorted keys, so ``order`` keeps the order the files
+    were patched in. Watch mode periodically folds a session's patches into
+    one compacted patch (``"compacted": [patch_id, ...]``) and lists only
+    that; the folded patches stay on disk.
+    An observation's source file is the ``file_path`` of the streaming
+    record holding it, else its own ``file`` field.
+
+Constitutional Basis:
+    - Article 9: Immutable Observations (originals are never modified)
+    - Article 13: Deterministic (patched files follow the base records, in
+      the order they were last patched)
+    - Article 15: Checkpoints (each patch is one durable record)
+
+Limitations:
+    - Directory-level file_sight summaries are not re-observed; deleted
+      paths are pruned from their listings and new files are listed by
+      their own per-file observations.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+PATCH_MARKER = "watch_patch"
+
+SourcedObservation = tuple[str | None, dict[str, Any]]
+
+
+def patch_record(
+    root: str,
+    files: dict[str, list[dict[str, Any]]],
+    removed: Iterable[str],
+    changes: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """The stored form of one watch batch."""
+    return {
+        PATCH_MARKER: True,
+        "root": root,
+        "files": files,
+        "order": list(files),
+        "removed": sorted(set(removed)),
+        "changes": changes or [],
+    }
+
+
+def is_patch(payload: dict[str, Any]) -> bool:
+    return bool(payload.get(PATCH_MARKER))
+
+
+def merge_patches(
+    patches: Iterable[dict[str, Any]],
+) -> tuple[dict[str, list[dict[str, Any]]], set[str]]:
+    """
+    Fold patches, oldest first, into ``(replaced, removed)``.
+
+    ``replaced`` is ordered by when each file was last patched, which is
+    where ``QueryIndex.patch`` appends its rows.
+    """
+    replaced: dict[str, list[dict[str, Any]]] = {}
+    removed: set[str] = set()
+    for patch in patches:
+        for path in patch.get("removed", []) or []:
+            replaced.pop(path, None)
+            removed.add(path)
+        files = patch.get("files") or {}
+        for path in patch.get("order") or files:
+            replaced.pop(path, None)
+            replaced[path] = list(files[path])
+            removed.discard(path)
+    return replaced, removed
+
+
+def apply_patches(
+    records: Iterable[SourcedObservation],
+    replaced: dict[str, list[dict[str, Any]]],
+    removed: set[str],
+) -> Iterator[SourcedObservation]:
+    """Base ``(source, observation)`` pairs with the merged patches applied."""
+    superseded = removed | set(replaced)
+    for source, obs in records:
+        if source is not None and source in superseded:
+            continue
+        if removed and obs.get("type") == "file_sight":
+            obs = _prune_listing(obs, removed)
+        yield source, obs
+    for source, observations in replaced.items():
+        for obs in observations:
+            yield source, obs
+
+
+def _prune_listing(obs: dict[str, Any], removed: set[str]) -> dict[str, Any]:
+    """Copy of a file_sight summary without the removed paths."""
+    result = obs.get("result")
+    if not isinstance(result, dict):
+        return obs
+    pruned = dict(result)
+    changed = False
+    for key in ("modules", "files"):
+        entries = result.get(key)
+        if not isinstance(entries, list):
+            continue
+        kept = [entry for entry in entries if _entry_path(entry, result) not in removed]
+        if len(kept) != len(entries):
+            pruned[key] = kept
+            changed = True
+    return {**obs, "result": pruned} if changed else obs
+
+
+def _entry_path(entry: Any, result: dict[str, Any]) -> str | None:
+    if isinstance(entry, str):
+        return entry
+    if isinstance(entry, dict):
+        path = entry.get("path") or entry.get("file_path")
+        return str(path) if path else None
+    if isinstance(entry, (list, tuple)) and len(entry) == 2:
+        root = result.get("root_path")
+        return str(Path(root) / entry[0]) if root else str(entry[0])
+    return None
@@ -0,0 +1,114 @@
+"""
+pattern_cache.py - Content-addressed cache of per-file pattern matches.
+
+Purpose:
+    Let repeated pattern scans (CI runs, trend tracking) reuse the matches of
+    files whose content has not changed, so a scan costs roughly the size of
+    the diff instead of the size of the tree.
+
+Layout:
+    <storage_root>/cache/patterns/<sha[:2]>/<sha>/<entry>.json
+
+    One record per (SHA-256 of the file content, file path, caller variant);
+    ``<entry>`` is a digest of the path and variant. A record maps pattern
+    keys - ``<pattern id>:<pattern fingerprint>``, where the fingerprint
+    hashes the regex text and its scope - to the match locations that pattern
+    produced on this content (an empty list when it did not match). Editing
+    a pattern changes its key, so only that pattern is rerun.
+
+Constitutional Basis:
+    - Article 9: Immutable Observations (a changed file gets a new key)
+    - Article 13: Deterministic (same content + same pattern = same matches)
+    - Article 18: Explicit Limitations (reuse counts are always reported)
+
+Limitations:
+    - Writes are atomic (temp file + rename) but not fsynced. A lost or
+      unreadable record is a miss and the file is simply rescanned.
+    - Only match locations are stored; severity, messages and tags are
+      rendered from the current pattern definition on reuse.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from storage.observation_cache import _entry_key, _write_json_replace
+
+# Bump when the cached match shape or matching semantics change
+CACHE_FORMAT = 1
+
+
+class PatternMatchCache:
+    """Persistent content-addressed store of per-file pattern matches."""
+
+    def __init__(self, cache_dir: Path | str):
+        self.cache_dir = Path(cache_dir)
+        self.files_reused = 0
+        self.files_rescanned = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_storage_root(cls, storage_root: Path | str) -> PatternMatchCache:
+        """Cache located under a CodeMarshal storage root."""
+        return cls(Path(storage_root) / "cache" / "patterns")
+
+    def _record_path(self, content_sha256: str, file_path: str, variant: str) -> Path:
+        entry = hashlib.sha256(
+            _entry_key(file_path, variant).encode("utf-8")
+        ).hexdigest()
+        return self.cache_dir / content_sha256[:2] / content_sha256 / f"{entry}.json"
+
+    def get(
+        self, content_sha256: str, file_path: str, variant: str = ""
+    ) -> dict[str, list[Any]]:
+        """Cached matches by pattern key for this file content (may be empty)."""
+        path = self._record_path(content_sha256, file_path, variant)
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError, ValueError):
+            return {}
+        if (
+            not isinstance(record, dict)
+            or record.get("format") != CACHE_FORMAT
+            or record.get("entry_key") != _entry_key(file_path, variant)
+            or not isinstance(record.get("patterns"), dict)
+        ):
+            return {}
+        return record["patterns"]
+
+    def put(
+        self,
+        content_sha256: str,
+        file_path: str,
+        patterns: dict[str, list[Any]],
+        variant: str = "",
+    ) -> None:
+        """Store the full pattern-key -> matches map for this file content."""
+        record = {
+            "format": CACHE_FORMAT,
+            "content_sha256": content_sha256,
+            "entry_key": _entry_key(file_path, variant),
+            "patterns": patterns,
+        }
+        try:
+            _write_json_replace(
+                self._record_path(content_sha256, file_path, variant), record
+            )
+        except OSError:
+            pass  # Cache is best effort; the scan result is unaffected
+
+    def count(self, reused: bool) -> None:
+        """Record whether one file was served entirely from the cache."""
+        with self._lock:
+            if reused:
+                self.files_reused += 1
+            else:
+                self.files_rescanned += 1
+
+    def counters(self) -> dict[str, int]:
+        """Raw numeric counters (summable across worker processes)."""
+        return {"reused": self.files_reused, "rescanned": self.files_rescanned}
@@ -0,0 +1,509 @@
+"""
+query_index.py - Per-session SQLite sidecar for fast `codemarshal query`.
+
+Purpose:
+    Answering a question used to re-read and re-parse every observation of a
+    session. The query index is built once per session (at the end of
+    observation, or lazily on the first query) and lets callers fetch only
+    the observation types they need, plus import edges, export names and
+    file metadata directly.
+
+Layout:
+    <storage_root>/indexes/<session_id>.query.sqlite
+
+    observations(seq, type, file, language, source, payload)
+                                             flattened observation dicts (JSON);
+                                             ``source`` is the file whose stored
+                                             record holds the observation
+    import_edges(seq, file, module, names)   one row per import statement
+    exports(seq, file, name, kind)           one row per exported name
+    listed_paths(seq, path)                  paths listed by file_sight summaries
+    files(path, language, size_bytes)        every observed file
+
+Compact reads:
+    Decoding JSON payloads dominates load time on large sessions. Analyzers
+    that only read import module/names and the paths listed by file_sight
+    summaries (ConnectionMapper) can ask for ``compact=True``: those two
+    types are then rebuilt from ``import_edges`` and ``listed_paths``
+    without decoding any payload.
+
+Staleness:
+    Observations are immutable (Article 9) and their IDs are content
+    derived, so an index stays valid as long as the session's observation
+    IDs are the same. Streaming manifest IDs are not content derived, so the
+    key also covers each manifest's committed progress. The index records a
+    digest of both and is rebuilt when it changes.
+
+Patching:
+    Watch mode supersedes the observations of changed files (see
+    storage/observation_patch.py). ``patch`` applies the same change to the
+    index in place - the rows of those source files are deleted and their
+    new observations appended - and records the new key, so the result
+    matches a rebuild from storage without re-reading the session.
+
+Constitutional Basis:
+    - Article 9: Immutable Observations (the index is a derived, rebuildable view)
+    - Article 13: Deterministic (rows keep observation order via ``seq``)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+INDEX_FORMAT = "2"
+
+# Types that compact reads rebuild from side tables instead of payloads
+COMPACT_TYPES = frozenset({"import_sight", "file_sight"})
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE observations (
+    seq INTEGER PRIMARY KEY,
+    type TEXT NOT NULL,
+    file TEXT,
+    language TEXT,
+    source TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX observations_type ON observations(type, seq);
+CREATE INDEX observations_file ON observations(file);
+CREATE INDEX observations_source ON observations(source);
+CREATE TABLE import_edges (
+    seq INTEGER NOT NULL,
+    file TEXT NOT NULL,
+    module TEXT NOT NULL,
+    names TEXT NOT NULL
+);
+CREATE INDEX import_edges_module ON import_edges(module);
+CREATE INDEX import_edges_file ON import_edges(file);
+CREATE TABLE exports (
+    seq INTEGER NOT NULL,
+    file TEXT NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT
+);
+CREATE INDEX exports_name ON exports(name);
+CREATE TABLE listed_paths (
+    seq INTEGER NOT NULL,
+    path TEXT NOT NULL
+);
+CREATE INDEX listed_paths_seq ON listed_paths(seq);
+CREATE TABLE files (
+    path TEXT PRIMARY KEY,
+    language TEXT,
+    size_bytes INTEGER
+);
+"""
+
+
+def source_key(observation_ids: Iterable[str]) -> str:
+    """Digest identifying the observation set an index was built from."""
+    payload = json.dumps(list(observation_ids), separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def sidecar_path(storage_root: Path | str, session_id: str, suffix: str) -> Path:
+    """Location of a derived per-session file under ``<storage_root>/indexes``."""
+    safe = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in session_id)
+    return Path(storage_root) / "indexes" / f"{safe}{suffix}"
+
+
+def index_path_for(storage_root: Path | str, session_id: str) -> Path:
+    return sidecar_path(storage_root, session_id, ".query.sqlite")
+
+
+class QueryIndex:
+    """Read access to one session's query index."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        path: Path | str,
+        observations: Iterable[dict[str, Any] | tuple[str | None, dict[str, Any]]],
+        key: str,
+    ) -> QueryIndex:
+        """
+        Build an index from flattened observations and atomically install it.
+
+        Items are observation dicts, or ``(source file, observation)`` pairs
+        when the stored record's file is known (see ``patch``). The database
+        is written to a temp file and renamed over ``path``, so readers never
+        see a half-built index.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        os.close(fd)
+        try:
+            connection = sqlite3.connect(temp_name)
+            try:
+                # Throwaway file until renamed; durability comes from the rename
+                connection.execute("PRAGMA journal_mode=OFF")
+                connection.execute("PRAGMA synchronous=OFF")
+                connection.executescript(_SCHEMA)
+                _populate(connection, observations)
+                connection.executemany(
+                    "INSERT INTO meta(key, value) VALUES (?, ?)",
+                    [("format", INDEX_FORMAT), ("source_key", key)],
+                )
+                connection.commit()
+            finally:
+                connection.close()
+            os.replace(temp_name, path)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+        return cls(path)
+
+    def patch(
+        self,
+        replaced: dict[str, list[dict[str, Any]]],
+        removed: Iterable[str],
+        key: str,
+    ) -> None:
+        """
+        Supersede the observations of some source files in place.
+
+        Rows whose source is replaced or removed are deleted, the new
+        observations of ``replaced`` are appended in its order, and removed
+        paths are dropped from the file listings. Runs in one transaction;
+        the index then reports ``key`` as its source key.
+        """
+        removed = set(removed)
+        stale = sorted(removed | set(replaced))
+        connection = sqlite3.connect(self.path)
+        try:
+            with connection:
+                for start in range(0, len(stale), 500):
+                    chunk = stale[start : start + 500]
+                    marks = ",".join("?" for _ in chunk)
+                    seqs = (
+                        f"SELECT seq FROM observations WHERE source IN ({marks})"
+                    )
+                    for table in ("import_edges", "exports", "listed_paths"):
+                        connection.execute(
+                            f"DELETE FROM {table} WHERE seq IN ({seqs})", chunk
+                        )
+                    connection.execute(
+                        f"DELETE FROM observations WHERE source IN ({marks})", chunk
+                    )
+                    connection.execute(f"DELETE FROM files WHERE path IN ({marks})", chunk)
+                    gone = [path for path in chunk if path in removed]
+                    if gone:
+                        gone_marks = ",".join("?" for _ in gone)
+                        connection.execute(
+                            f"DELETE FROM listed_paths WHERE path IN ({gone_marks})", gone
+                        )
+
+                (last,) = connection.execute(
+                    "SELECT COALESCE(MAX(seq), -1) FROM observations"
+                ).fetchone()
+                _populate(
+                    connection,
+                    (
+                        (source, obs)
+                        for source, observations in replaced.items()
+                        for obs in observations
+                    ),
+                    start=last + 1,
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta(key, value) VALUES ('source_key', ?)",
+                    (key,),
+                )
+        finally:
+            connection.close()
+
+    def is_current(self, key: str) -> bool:
+        """True if the index exists and was built from the given observation set."""
+        if not self.path.exists():
+            return False
+        try:
+            meta = dict(self._query("SELECT key, value FROM meta"))
+        except sqlite3.Error:
+            return False
+        return meta.get("format") == INDEX_FORMAT and meta.get("source_key") == key
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def observations(
+        self, types: Iterable[str] | None = None, compact: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Observations in original order, optionally limited to some types.
+
+        With ``compact``, import_sight observations carry only ``module`` and
+        ``names`` per statement, and file_sight observations are reduced to
+        the paths they list (those listing none are omitted).
+        """
+        wanted = None if types is None else sorted(set(types))
+        if wanted == []:
+            return []
+        if not compact:
+            return [json.loads(payload) for (payload,) in self._select(wanted, "payload")]
+
+        connection = self._connect()
+        try:
+            return self._compact_observations(connection, wanted)
+        finally:
+            connection.close()
+
+    def _compact_observations(
+        self, connection: sqlite3.Connection, wanted: list[str] | None
+    ) -> list[dict[str, Any]]:
+        selected = set(wanted) if wanted is not None else None
+        rebuilt: dict[int, dict[str, Any]] = {}
+
+        if selected is None or "import_sight" in selected:
+            for seq, file_path, language in connection.execute(
+                "SELECT seq, file, language FROM observations WHERE type = 'import_sight'"
+            ):
+                rebuilt[seq] = {
+                    "type": "import_sight",
+                    "file": file_path or "",
+                    "language": language,
+                    "statements": [],
+                }
+            for seq, module, names in connection.execute(
+                "SELECT seq, module, names FROM import_edges ORDER BY rowid"
+            ):
+                statements = rebuilt[seq]["statements"]
+                statements.append(
+                    {"module": module, "names": [] if names == "[]" else json.loads(names)}
+                )
+
+        if selected is None or "file_sight" in selected:
+            for seq, path in connection.execute(
+                "SELECT seq, path FROM listed_paths ORDER BY rowid"
+            ):
+                listing = rebuilt.setdefault(
+                    seq, {"type": "file_sight", "result": {"files": []}}
+                )
+                listing["result"]["files"].append(path)
+
+        # Everything else is decoded from its stored payload
+        if selected is None:
+            rows = connection.execute(
+                "SELECT seq, payload FROM observations "
+                "WHERE type NOT IN ('import_sight', 'file_sight')"
+            )
+        else:
+            others = sorted(selected - COMPACT_TYPES)
+            marks = ",".join("?" for _ in others)
+            rows = connection.execute(
+                f"SELECT seq, payload FROM observations WHERE type IN ({marks})", others
+            )
+        for seq, payload in rows:
+            rebuilt[seq] = json.loads(payload)
+
+        return [rebuilt[seq] for seq in sorted(rebuilt)]
+
+    def _select(self, wanted: list[str] | None, columns: str) -> list[tuple]:
+        if wanted is None:
+            return self._query(f"SELECT {columns} FROM observations ORDER BY seq")
+        marks = ",".join("?" for _ in wanted)
+        return self._query(
+            f"SELECT {columns} FROM observations WHERE type IN ({marks}) ORDER BY seq",
+            wanted,
+        )
+
+    def import_edges(
+        self, module: str | None = None, file: str | None = None
+    ) -> list[tuple[str, str, list[str]]]:
+        """``(file, module, names)`` import edges, optionally filtered exactly."""
+        clauses, params = [], []
+        if module is not None:
+            clauses.append("module = ?")
+            params.append(module)
+        if file is not None:
+            clauses.append("file = ?")
+            params.append(file)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._query(
+            f"SELECT file, module, names FROM import_edges{where} ORDER BY seq", params
+        )
+        return [(f, m, json.loads(n)) for f, m, n in rows]
+
+    def export_names(self, file: str | None = None) -> list[tuple[str, str, str | None]]:
+        """``(file, name, kind)`` for exported definitions."""
+        if file is None:
+            rows = self._query("SELECT file, name, kind FROM exports ORDER BY seq")
+        else:
+            rows = self._query(
+                "SELECT file, name, kind FROM exports WHERE file = ? ORDER BY seq", [file]
+            )
+        return [tuple(row) for row in rows]
+
+    def files(self) -> list[dict[str, Any]]:
+        """Observed files with language and size where known."""
+        rows = self._query("SELECT path, language, size_bytes FROM files ORDER BY path")
+        return [
+            {"path": path, "language": language, "size_bytes": size}
+            for path, language, size in rows
+        ]
+
+    def types(self) -> list[str]:
+        """Observation types present in the index."""
+        return [t for (t,) in self._query("SELECT DISTINCT type FROM observations ORDER BY type")]
+
+    def counts(self) -> dict[str, int]:
+        """Row counts per table (for info/diagnostics)."""
+        return {
+            table: int(self._query(f"SELECT COUNT(*) FROM {table}")[0][0])
+            for table in ("observations", "import_edges", "exports", "listed_paths", "files")
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> list[tuple]:
+        connection = self._connect()
+        try:
+            return connection.execute(sql, list(params)).fetchall()
+        finally:
+            connection.close()
+
+
+def _populate(
+    connection: sqlite3.Connection,
+    observations: Iterable[dict[str, Any] | tuple[str | None, dict[str, Any]]],
+    start: int = 0,
+) -> None:
+    observation_rows: list[tuple] = []
+    edge_rows: list[tuple] = []
+    export_rows: list[tuple] = []
+    listed_rows: list[tuple] = []
+    file_rows: dict[str, tuple] = {}
+
+    for seq, item in enumerate(observations, start=start):
+        source, obs = item if isinstance(item, tuple) else (None, item)
+        if not isinstance(obs, dict):
+            continue
+        obs_type = str(obs.get("type", ""))
+        file_path = obs.get("file") or obs.get("path")
+        file_path = str(file_path) if file_path else None
+        language = obs.get("language")
+        if source is None and obs.get("file"):
+            source = str(obs["file"])
+        observation_rows.append(
+            (
+                seq,
+                obs_type,
+                file_path,
+                str(language) if language is not None else None,
+                source,
+                json.dumps(obs, separators=(",", ":"), default=str),
+            )
+        )
+
+        if file_path and obs_type in {"import_sight", "export_sight"}:
+            known = file_rows.get(file_path)
+            file_rows[file_path] = (file_path, language, known[2] if known else None)
+
+        if obs_type == "import_sight" and file_path:
+            for stmt in obs.get("statements", []) or []:
+                if isinstance(stmt, dict) and stmt.get("module"):
+                    edge_rows.append(
+                        (seq, file_path, str(stmt["module"]), json.dumps(stmt.get("names") or []))
+                    )
+        elif obs_type == "export_sight" and file_path:
+            result = obs.get("result") or {}
+            for export in result.get("exports", []) if isinstance(result, dict) else []:
+                if isinstance(export, dict) and export.get("name"):
+                    export_rows.append(
+                        (seq, file_path, str(export["name"]), export.get("type") or export.get("kind"))
+                    )
+        elif obs_type == "file_sight":
+            result = obs.get("result")
+            for path, size in _file_sight_entries(result):
+                known = file_rows.get(path)
+                file_rows[path] = (path, known[1] if known else None, size)
+            listed_rows.extend((seq, path) for path in _listed_paths(result))
+
+        # Bound memory for very large sessions
+        if len(observation_rows) >= 5000:
+            _flush(connection, observation_rows, edge_rows, export_rows, listed_rows)
+
+    _flush(connection, observation_rows, edge_rows, export_rows, listed_rows)
+    connection.executemany(
+        "INSERT OR REPLACE INTO files(path, language, size_bytes) VALUES (?, ?, ?)",
+        file_rows.values(),
+    )
+
+
+def _flush(
+    connection: sqlite3.Connection,
+    observation_rows: list[tuple],
+    edge_rows: list[tuple],
+    export_rows: list[tuple],
+    listed_rows: list[tuple],
+) -> None:
+    connection.executemany(
+        "INSERT INTO observations(seq, type, file, language, source, payload) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        observation_rows,
+    )
+    connection.executemany(
+        "INSERT INTO import_edges(seq, file, module, names) VALUES (?, ?, ?, ?)",
+        edge_rows,
+    )
+    connection.executemany(
+        "INSERT INTO exports(seq, file, name, kind) VALUES (?, ?, ?, ?)", export_rows
+    )
+    connection.executemany("INSERT INTO listed_paths(seq, path) VALUES (?, ?)", listed_rows)
+    observation_rows.clear()
+    edge_rows.clear()
+    export_rows.clear()
+    listed_rows.clear()
+
+
+def _listed_paths(result: Any) -> Iterator[str]:
+    """Paths a file_sight summary lists in ``modules`` (else ``files``)."""
+    if not isinstance(result, dict):
+        return
+    for entry in result.get("modules", []) or result.get("files", []) or []:
+        if isinstance(entry, dict):
+            path = entry.get("path") or entry.get("file_path")
+            if path:
+                yield str(path)
+        elif isinstance(entry, str) and entry:
+            yield entry
+
+
+def _file_sight_entries(result: Any) -> Iterator[tuple[str, int | None]]:
+    """(path, size) pairs from the file_sight payload shapes seen in storage."""
+    if not isinstance(result, dict):
+        return
+    for entry in result.get("modules", []) or []:
+        if isinstance(entry, dict) and entry.get("path"):
+            yield str(entry["path"]), entry.get("size_bytes")
+    for entry in result.get("files", []) or []:
+        if isinstance(entry, str):
+            yield entry, None
+        elif isinstance(entry, dict) and (entry.get("path") or entry.get("file_path")):
+            yield str(entry.get("path") or entry.get("file_path")), entry.get("size_bytes")
+        elif isinstance(entry, (list, tuple)) and len(entry) == 2:
+            # DirectoryTree.files: (relative path, FileMetadata)
+            path, metadata = entry
+            size = metadata.get("size_bytes") if isinstance(metadata, dict) else None
+            root = result.get("root_path")
+            yield str(Path(root) / path) if root else str(path), size
@@ -0,0 +1,524 @@
+"""
+search_index.py - Persistent trigram index for `codemarshal search`.
+
+Purpose:
+    A regex search over a large tree reads every file. The trigram index
+    records, per investigation root, which files contain which three-byte
+    sequences, so a search only reads the files that can contain the
+    query's required literals. It is built during ``observe``/``investigate``
+    and kept current incrementally from file sizes, mtimes and hashes.
+
+Layout:
+    <storage_root>/indexes/search-<root digest>.trigram.sqlite
+
+    meta(key, value)                  format, indexed root
+    files(id, path, size, mtime_ns, sha256, indexed, live)
+                                      one row per file version; paths are
+                                      relative to the root, ``live`` = 0 for
+                                      deleted or superseded versions
+    postings(trigram, segment, ids)   file ids (uint32 array) per trigram,
+                                      one row per trigram per segment
+
+Trigrams:
+    Only windows of three ASCII bytes are indexed, ASCII letters lowered.
+    The few non-ASCII characters Python's IGNORECASE equates with ASCII
+    letters (İ, ı, ſ, Kelvin sign) are indexed as those letters, and query
+    literals are lowered the same way. A file's posting set is therefore a
+    superset of the files any case variant of a literal can occur in.
+    Files are indexed as search decodes them (UTF-8, undecodable bytes
+    dropped, newlines normalized), binary files included. Files over
+    ``MAX_INDEXED_BYTES`` or unreadable ones are not indexed and are always
+    candidates.
+
+Segments:
+    Every update appends a new segment instead of rewriting posting lists.
+    When there are more than ``MAX_SEGMENTS`` segments, or more dead file
+    versions than live ones, all segments are merged into one and dead
+    versions are dropped.
+
+Constitutional Basis:
+    - Article 9: Immutable Observations (the index is a derived, rebuildable
+      view; source files are only read)
+    - Article 18: Explicit Limitations (unindexed files are always searched)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import stat
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from storage.query_index import sidecar_path
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+INDEX_FORMAT = "1"
+MAX_INDEXED_BYTES = 16 * 1024 * 1024
+SEGMENT_FILES = 4096
+MAX_SEGMENTS = 16
+
+# Non-ASCII characters that IGNORECASE matches against ASCII letters
+_CASE_EQUIVALENTS = str.maketrans(
+    {"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"}
+)
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT,
+    indexed INTEGER NOT NULL,
+    live INTEGER NOT NULL
+);
+CREATE INDEX files_live_path ON files(path) WHERE live = 1;
+CREATE TABLE postings (
+    trigram INTEGER NOT NULL,
+    segment INTEGER NOT NULL,
+    ids BLOB NOT NULL,
+    PRIMARY KEY (trigram, segment)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass
+class IndexUpdate:
+    """What one update pass did."""
+
+    indexed: int = 0  # new or changed files (re)indexed
+    touched: int = 0  # mtime changed, content hash unchanged
+    unchanged: int = 0
+    removed: int = 0
+
+
+def index_path_for_root(storage_root: Path | str, root: Path | str) -> Path:
+    """Location of the search index for an investigation root."""
+    resolved = str(Path(root).resolve())
+    digest = hashlib.sha256(resolved.encode("utf-8")).hexdigest()[:16]
+    return sidecar_path(storage_root, f"search-{digest}", ".trigram.sqlite")
+
+
+def query_trigrams(literal: str) -> set[int]:
+    """Indexed trigrams that every occurrence of ``literal`` contains."""
+    return {int(gram) for gram in _trigrams(_normalize(literal.encode("utf-8")))}
+
+
+class TrigramIndex:
+    """Trigram index over the files below one root directory."""
+
+    def __init__(self, path: Path | str, root: Path | str):
+        self.path = Path(path)
+        self.root = Path(root).resolve()
+
+    @classmethod
+    def for_root(cls, storage_root: Path | str, root: Path | str) -> TrigramIndex:
+        """Index for ``root`` (created by the first ``update``)."""
+        return cls(index_path_for_root(storage_root, root), root)
+
+    @classmethod
+    def find(cls, storage_root: Path | str, path: Path | str) -> TrigramIndex | None:
+        """Existing index covering ``path`` (its own or an ancestor's)."""
+        resolved = Path(path).resolve()
+        for root in (resolved, *resolved.parents):
+            index_path = index_path_for_root(storage_root, root)
+            if index_path.exists():
+                return cls(index_path, root)
+        return None
+
+    @staticmethod
+    def list_indexes(storage_root: Path | str) -> list[dict[str, Any]]:
+        """Size report of every search index under a storage root."""
+        reports = []
+        for index_path in sorted(
+            (Path(storage_root) / "indexes").glob("search-*.trigram.sqlite")
+        ):
+            try:
+                connection = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True)
+                try:
+                    root = connection.execute(
+                        "SELECT value FROM meta WHERE key = 'root'"
+                    ).fetchone()
+                finally:
+                    connection.close()
+            except sqlite3.Error:
+                continue
+            if root:
+                reports.append(TrigramIndex(index_path, root[0]).stats())
+        return reports
+
+    # ------------------------------------------------------------------
+    # Updating
+    # ------------------------------------------------------------------
+
+    def update(self, under: Path | str | None = None) -> IndexUpdate:
+        """
+        Bring the index up to date with the files below ``under`` (default:
+        the whole root). Files whose size and mtime are unchanged are not
+        read; files whose content hash is unchanged are not re-indexed.
+        """
+        base = self.root if under is None else Path(under).resolve()
+        prefix = _relative(base, self.root)
+        connection = self._connect(create=True)
+        result = IndexUpdate()
+        try:
+            known = {
+                path: (file_id, size, mtime_ns, sha256)
+                for file_id, path, size, mtime_ns, sha256 in connection.execute(
+                    "SELECT id, path, size, mtime_ns, sha256 FROM files WHERE live = 1"
+                )
+                if _is_under(path, prefix)
+            }
+            next_id = (
+                connection.execute("SELECT COALESCE(MAX(id), 0) FROM files").fetchone()[
+                    0
+                ]
+                + 1
+            )
+            segment = _Segment(connection)
+
+            for rel, full_path, info in _walk_files(base, self.root):
+                row = known.pop(rel, None)
+                if row and row[1] == info.st_size and row[2] == info.st_mtime_ns:
+                    result.unchanged += 1
+                    continue
+
+                indexed, sha256, grams = _read_trigrams(full_path, info.st_size)
+                if row and sha256 is not None and row[3] == sha256:
+                    connection.execute(
+                        "UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?",
+                        (info.st_size, info.st_mtime_ns, row[0]),
+                    )
+                    result.touched += 1
+                    continue
+                if row:
+                    connection.execute(
+                        "UPDATE files SET live = 0 WHERE id = ?", (row[0],)
+                    )
+                connection.execute(
+                    "INSERT INTO files(id, path, size, mtime_ns, sha256, indexed, live)"
+                    " VALUES (?, ?, ?, ?, ?, ?, 1)",
+                    (
+                        next_id,
+                        rel,
+                        info.st_size,
+                        info.st_mtime_ns,
+                        sha256,
+                        int(indexed),
+                    ),
+                )
+                if grams is not None:
+                    segment.add(next_id, grams)
+                next_id += 1
+                result.indexed += 1
+
+            # Whatever was not walked again is gone
+            connection.executemany(
+                "UPDATE files SET live = 0 WHERE id = ?",
+                [(row[0],) for row in known.values()],
+            )
+            result.removed = len(known)
+            segment.flush()
+            connection.commit()
+
+            if _needs_compaction(connection):
+                _compact(connection)
+                connection.commit()
+        finally:
+            connection.close()
+        return result
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def candidates(
+        self, alternatives: Iterable[str] | None, under: Path | str | None = None
+    ) -> list[Path] | None:
+        """
+        Files below ``under`` that may contain one of ``alternatives``.
+
+        ``alternatives`` is a set of literals of which every match contains
+        at least one. Returns absolute paths sorted by path, or None when the
+        literals cannot narrow the search (no usable trigram).
+        """
+        if not alternatives:
+            return None
+        plans = [query_trigrams(literal) for literal in alternatives]
+        if not all(plans):
+            return None
+
+        base = self.root if under is None else Path(under).resolve()
+        prefix = _relative(base, self.root)
+        connection = self._connect()
+        try:
+            matched: set[int] = set()
+            for grams in plans:
+                matched |= _intersect(connection, grams)
+            rows = connection.execute(
+                "SELECT id, path, indexed FROM files WHERE live = 1 ORDER BY path"
+            ).fetchall()
+        finally:
+            connection.close()
+        return [
+            self.root / path
+            for file_id, path, indexed in rows
+            if (not indexed or file_id in matched) and _is_under(path, prefix)
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        """Size report: root, files, trigrams, segments and bytes on disk."""
+        connection = self._connect()
+        try:
+            files, unindexed = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(indexed = 0), 0) FROM files WHERE live = 1"
+            ).fetchone()
+            trigrams, segments = connection.execute(
+                "SELECT COUNT(DISTINCT trigram), COUNT(DISTINCT segment) FROM postings"
+            ).fetchone()
+        finally:
+            connection.close()
+        return {
+            "root": str(self.root),
+            "path": str(self.path),
+            "files": files,
+            "unindexed_files": unindexed,
+            "trigrams": trigrams,
+            "segments": segments,
+            "size_bytes": self.path.stat().st_size if self.path.exists() else 0,
+        }
+
+    def _connect(self, create: bool = False) -> sqlite3.Connection:
+        if not create and not self.path.exists():
+            raise FileNotFoundError(f"Search index not found: {self.path}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        meta = None
+        try:
+            meta = dict(connection.execute("SELECT key, value FROM meta"))
+        except sqlite3.OperationalError:
+            pass
+        if meta is None or meta.get("format") != INDEX_FORMAT:
+            # Missing or from another format: start over (it is derived data)
+            connection.executescript(
+                "DROP TABLE IF EXISTS meta; DROP TABLE IF EXISTS files;"
+                " DROP TABLE IF EXISTS postings;" + _SCHEMA
+            )
+            connection.executemany(
+                "INSERT INTO meta(key, value) VALUES (?, ?)",
+                [("format", INDEX_FORMAT), ("root", str(self.root))],
+            )
+            connection.commit()
+        return connection
+
+
+class _Segment:
+    """Postings of the files indexed by one update, written as new segments."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.grams: list[Any] = []
+        self.file_ids: list[int] = []
+
+    def add(self, file_id: int, grams: Any) -> None:
+        self.grams.append(grams)
+        self.file_ids.append(file_id)
+        if len(self.file_ids) >= SEGMENT_FILES:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.file_ids:
+            return
+        number = self.connection.execute(
+            "SELECT COALESCE(MAX(segment), -1) + 1 FROM postings"
+        ).fetchone()[0]
+        # Rows in key order: B-tree appends instead of random inserts
+        self.connection.executemany(
+            "INSERT INTO postings(trigram, segment, ids) VALUES (?, ?, ?)",
+            ((gram, number, blob) for gram, blob in self._postings()),
+        )
+        self.grams = []
+        self.file_ids = []
+
+    def _postings(self) -> Iterator[tuple[int, bytes]]:
+        if NUMPY_AVAILABLE:
+            grams = np.concatenate(self.grams)
+            ids = np.repeat(
+                np.array(self.file_ids, dtype=np.uint32),
+                [len(file_grams) for file_grams in self.grams],
+            )
+            order = np.argsort(grams, kind="stable")  # ids stay ascending
+            grams, ids = grams[order], ids[order]
+            bounds = np.flatnonzero(np.diff(grams)) + 1
+            starts = [0, *bounds.tolist()]
+            ends = [*bounds.tolist(), len(grams)]
+            for start, end in zip(starts, ends, strict=True):
+                yield int(grams[start]), ids[start:end].tobytes()
+            return
+
+        postings: dict[int, array] = {}
+        for file_id, file_grams in zip(self.file_ids, self.grams, strict=True):
+            for gram in file_grams:
+                ids = postings.get(gram)
+                if ids is None:
+                    postings[gram] = ids = array("I")
+                ids.append(file_id)
+        for gram in sorted(postings):
+            yield gram, postings[gram].tobytes()
+
+
+def _intersect(connection: sqlite3.Connection, grams: set[int]) -> set[int]:
+    """File ids whose postings contain every trigram (rarest first)."""
+    lists = []
+    for gram in grams:
+        ids = array("I")
+        for (blob,) in connection.execute(
+            "SELECT ids FROM postings WHERE trigram = ?", (gram,)
+        ):
+            ids.frombytes(blob)
+        if not ids:
+            return set()
+        lists.append(ids)
+    lists.sort(key=len)
+    result = set(lists[0])
+    for ids in lists[1:]:
+        result.intersection_update(ids)
+        if not result:
+            break
+    return result
+
+
+def _needs_compaction(connection: sqlite3.Connection) -> bool:
+    segments = connection.execute(
+        "SELECT COUNT(DISTINCT segment) FROM postings"
+    ).fetchone()[0]
+    live, dead = connection.execute(
+        "SELECT COALESCE(SUM(live = 1), 0), COALESCE(SUM(live = 0), 0) FROM files"
+    ).fetchone()
+    return segments > MAX_SEGMENTS or dead > max(live, SEGMENT_FILES)
+
+
+def _compact(connection: sqlite3.Connection) -> None:
+    """Merge all segments into one and drop dead file versions."""
+    dead = {
+        file_id
+        for (file_id,) in connection.execute("SELECT id FROM files WHERE live = 0")
+    }
+    connection.execute(
+        "CREATE TEMP TABLE merged (trigram INTEGER PRIMARY KEY, ids BLOB)"
+    )
+
+    def merged() -> Iterator[tuple[int, bytes]]:
+        current, ids = None, array("I")
+        for gram, blob in connection.execute(
+            "SELECT trigram, ids FROM postings ORDER BY trigram, segment"
+        ):
+            if gram != current:
+                if ids:
+                    yield current, ids.tobytes()
+                current, ids = gram, array("I")
+            chunk = array("I")
+            chunk.frombytes(blob)
+            if dead:
+                ids.extend(file_id for file_id in chunk if file_id not in dead)
+            else:
+                ids.extend(chunk)
+        if ids:
+            yield current, ids.tobytes()
+
+    connection.executemany(
+        "INSERT INTO merged(trigram, ids) VALUES (?, ?)", list(merged())
+    )
+    connection.execute("DELETE FROM postings")
+    connection.execute(
+        "INSERT INTO postings(trigram, segment, ids) SELECT trigram, 0, ids FROM merged"
+    )
+    connection.execute("DROP TABLE merged")
+    connection.execute("DELETE FROM files WHERE live = 0")
+
+
+def _read_trigrams(path: str, size: int) -> tuple[bool, str | None, Any]:
+    """(indexed, sha256, trigrams) for one file; unreadable files stay unindexed."""
+    if size > MAX_INDEXED_BYTES:
+        return False, None, None
+    try:
+        with open(path, "rb") as handle:
+            raw = handle.read()
+    except OSError:
+        return False, None, None
+    return True, hashlib.sha256(raw).hexdigest(), _trigrams(_normalize(raw))
+
+
+def _normalize(raw: bytes) -> bytes:
+    """File bytes as search sees them: decoded, newline-normalized, lowered."""
+    if not raw.isascii():
+        text = raw.decode("utf-8", errors="ignore").translate(_CASE_EQUIVALENTS)
+        raw = text.encode("utf-8")
+    if b"\r" in raw:
+        raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return raw.lower()
+
+
+def _trigrams(data: bytes) -> Any:
+    """Distinct ASCII trigrams of normalized bytes (a uint32 array with numpy)."""
+    if NUMPY_AVAILABLE:
+        if len(data) < 3:
+            return np.zeros(0, dtype=np.uint32)
+        values = np.frombuffer(data, dtype=np.uint8).astype(np.uint32)
+        grams = values[:-2] << 14 | values[1:-1] << 7 | values[2:]
+        ascii_only = (values[:-2] | values[1:-1] | values[2:]) < 128
+        return np.unique(grams[ascii_only])
+    grams = set()
+    for i in range(len(data) - 2):
+        a, b, c = data[i], data[i + 1], data[i + 2]
+        if a < 128 and b < 128 and c < 128:
+            grams.add(a << 14 | b << 7 | c)
+    return grams
+
+
+def _walk_files(base: Path, root: Path) -> Iterator[tuple[str, str, os.stat_result]]:
+    """
+    (relative path, path, stat) of regular files below ``base``.
+
+    Symlinked directories are not followed; symlinks to files are included.
+    """
+    if base.is_file():
+        yield _relative(base, root), str(base), base.stat()
+        return
+    skip = len(str(root).rstrip(os.sep)) + 1
+    for directory, _dirs, names in os.walk(base):
+        for name in names:
+            full_path = os.path.join(directory, name)
+            try:
+                info = os.stat(full_path)
+            except OSError:
+                continue
+            if stat.S_ISREG(info.st_mode):
+                relative = full_path[skip:]
+                if os.sep != "/":
+                    relative = relative.replace(os.sep, "/")
+                yield relative, full_path, info
+
+
+def _relative(path: Path, root: Path) -> str:
+    relative = Path(path).resolve().relative_to(root).as_posix()
+    return "" if relative == "." else relative
+
+
+def _is_under(path: str, prefix: str) -> bool:
+    return not prefix or path == prefix or path.startswith(prefix + "/")
@@ -0,0 +1,430 @@
+"""
+segment_store.py - Append-only packed segment files for streaming observations.
+
+Purpose:
+    Store one record per observed source file without creating one inode and
+    two fsyncs per file. Records are appended to segment files, rolled over at
+    a size threshold, and made durable in groups.
+
+Format:
+    <directory>/<stream_id>.<n:05d>.seg
+        8-byte header ``SEGMENT_MAGIC``, then records of
+        ``<u32 length><u32 crc32><length bytes of compact UTF-8 JSON>``
+        (little endian). The CRC covers the payload bytes.
+
+    <directory>/<stream_id>.idx
+        Fixed-width entries ``<8-byte id key><u32 segment><u64 offset><u32 length>``,
+        one per record in append order. ``offset`` points at the record header.
+
+Durability:
+    Data is fsynced at most every ``fsync_interval`` seconds (group commit)
+    and always on ``checkpoint()`` and ``close()``. A crash can lose the
+    records written since the last sync; it cannot leave a record that reads
+    back wrong, because readers verify length and CRC and stop at a torn tail.
+    Callers that persist a checkpoint position (the streaming manifest) can
+    truncate back to it with ``truncate_to`` before resuming.
+
+Constitutional Basis:
+    - Article 9: Immutable Observations (append-only, checksummed records)
+    - Article 13: Deterministic (records are read back in append order)
+    - Article 15: Checkpoints (checkpoint positions enable resume)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import time
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+SEGMENT_MAGIC = b"CMSEG\x00\x00\x01"
+SEGMENT_SUFFIX = ".seg"
+INDEX_SUFFIX = ".idx"
+
+RECORD_HEADER = struct.Struct("<II")  # payload length, crc32
+INDEX_ENTRY = struct.Struct("<8sIQI")  # id key, segment, offset, length
+
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_FSYNC_INTERVAL = 1.0  # seconds
+
+
+class SegmentStoreError(Exception):
+    """Raised when a segment cannot be written or read back intact."""
+
+
+@dataclass(frozen=True)
+class SegmentIssue:
+    """A torn or corrupt spot found while reading a segment."""
+
+    path: Path
+    offset: int
+    kind: str  # "bad_magic", "torn", "checksum" or "undecodable"
+    message: str
+
+
+@dataclass(frozen=True)
+class SegmentLocation:
+    """Where one record lives: segment number, header offset, payload length."""
+
+    segment: int
+    offset: int
+    length: int
+
+
+def record_key(record_id: str) -> bytes:
+    """
+    8-byte index key for a record ID.
+
+    Observation IDs (``obs_<16 hex>``) map to their own hex digits; any other
+    ID maps to the first 8 bytes of its SHA-256.
+    """
+    suffix = record_id[4:] if record_id.startswith("obs_") else ""
+    if len(suffix) == 16:
+        try:
+            return bytes.fromhex(suffix)
+        except ValueError:
+            pass
+    return hashlib.sha256(record_id.encode("utf-8")).digest()[:8]
+
+
+def segment_path(directory: Path, stream_id: str, segment: int) -> Path:
+    return Path(directory) / f"{stream_id}.{segment:05d}{SEGMENT_SUFFIX}"
+
+
+def index_path(directory: Path, stream_id: str) -> Path:
+    return Path(directory) / f"{stream_id}{INDEX_SUFFIX}"
+
+
+def list_streams(directory: Path) -> list[str]:
+    """Stream IDs that have an index in ``directory``."""
+    directory = Path(directory)
+    if not directory.exists():
+        return []
+    return sorted(p.name[: -len(INDEX_SUFFIX)] for p in directory.glob(f"*{INDEX_SUFFIX}"))
+
+
+def count_records(directory: Path) -> int:
+    """Total indexed records across every stream in ``directory``."""
+    total = 0
+    for stream_id in list_streams(directory):
+        total += index_path(directory, stream_id).stat().st_size // INDEX_ENTRY.size
+    return total
+
+
+def _encode(payload: dict[str, Any]) -> bytes:
+    data = json.dumps(
+        payload, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+    return RECORD_HEADER.pack(len(data), zlib.crc32(data)) + data
+
+
+def _fsync(handle: BinaryIO) -> None:
+    handle.flush()
+    try:
+        os.fsync(handle.fileno())
+    except OSError:
+        pass  # Best effort (e.g. filesystems without fsync support)
+
+
+class SegmentWriter:
+    """
+    Append records to a segment stream with group-commit durability.
+
+    Usage:
+        with SegmentWriter(directory, "obs_stream_123") as writer:
+            writer.append("obs_0123456789abcdef", {"id": ...})
+            position = writer.checkpoint()
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        stream_id: str,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        fsync_interval: float | None = DEFAULT_FSYNC_INTERVAL,
+    ):
+        """
+        Args:
+            directory: Directory holding the stream's segments and index
+            stream_id: Stream name (file prefix)
+            max_segment_bytes: Roll over to a new segment past this size
+            fsync_interval: Seconds between group commits. 0 syncs every
+                record; None syncs only on checkpoint/close.
+        """
+        self.directory = Path(directory)
+        self.stream_id = stream_id
+        self.max_segment_bytes = max(len(SEGMENT_MAGIC) + 1, int(max_segment_bytes))
+        self.fsync_interval = fsync_interval
+
+        self.records_written = 0
+        self.syncs = 0
+        self._segment = 0
+        self._offset = 0
+        self._handle: BinaryIO | None = None
+        self._index: BinaryIO | None = None
+        self._dirty = False
+        self._last_sync = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def __enter__(self) -> SegmentWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+    def open(self, position: dict[str, int] | None = None) -> None:
+        """
+        Open the stream for appending.
+
+        With ``position`` (from ``checkpoint()``), anything written after that
+        checkpoint is discarded first so a resumed run does not duplicate
+        records.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if position:
+            self.truncate_to(position)
+        else:
+            self._segment = 0
+            self._offset = 0
+            self.records_written = 0
+            for stale in self.segment_paths():
+                stale.unlink()
+            index_path(self.directory, self.stream_id).unlink(missing_ok=True)
+
+        self._index = open(index_path(self.directory, self.stream_id), "ab")
+        self._open_segment()
+
+    def close(self) -> None:
+        """Sync and close all files."""
+        if self._handle is None and self._index is None:
+            return
+        self.sync()
+        for handle in (self._handle, self._index):
+            if handle is not None:
+                handle.close()
+        self._handle = None
+        self._index = None
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, record_id: str, payload: dict[str, Any]) -> SegmentLocation:
+        """Append one record; durable after the next group commit."""
+        if self._handle is None:
+            self.open()
+        assert self._handle is not None and self._index is not None
+
+        data = _encode(payload)
+        if self._offset > len(SEGMENT_MAGIC) and (
+            self._offset + len(data) > self.max_segment_bytes
+        ):
+            self._roll_over()
+
+        location = SegmentLocation(
+            segment=self._segment,
+            offset=self._offset,
+            length=len(data) - RECORD_HEADER.size,
+        )
+        self._handle.write(data)
+        self._index.write(
+            INDEX_ENTRY.pack(
+                record_key(record_id), location.segment, location.offset, location.length
+            )
+        )
+        self._offset += len(data)
+        self.records_written += 1
+        self._dirty = True
+
+        if self.fsync_interval is not None and (
+            time.monotonic() - self._last_sync >= self.fsync_interval
+        ):
+            self.sync()
+        return location
+
+    def sync(self) -> None:
+        """Group commit: make every appended record durable."""
+        if not self._dirty:
+            return
+        # Data before index, so a durable index entry never points at lost data
+        if self._handle is not None:
+            _fsync(self._handle)
+        if self._index is not None:
+            _fsync(self._index)
+        self._dirty = False
+        self._last_sync = time.monotonic()
+        self.syncs += 1
+
+    def checkpoint(self) -> dict[str, int]:
+        """Sync and return a position that ``truncate_to`` can restore."""
+        self.sync()
+        return {
+            "segment": self._segment,
+            "offset": self._offset,
+            "records": self.records_written,
+        }
+
+    def truncate_to(self, position: dict[str, int]) -> None:
+        """Discard everything written after a checkpoint position."""
+        segment = int(position.get("segment", 0))
+        offset = max(int(position.get("offset", 0)), len(SEGMENT_MAGIC))
+        records = int(position.get("records", 0))
+
+        for path in self.segment_paths():
+            if _segment_number(path) > segment:
+                path.unlink()
+        current = segment_path(self.directory, self.stream_id, segment)
+        if current.exists() and current.stat().st_size > offset:
+            with open(current, "r+b") as handle:
+                handle.truncate(offset)
+
+        index = index_path(self.directory, self.stream_id)
+        if index.exists() and index.stat().st_size > records * INDEX_ENTRY.size:
+            with open(index, "r+b") as handle:
+                handle.truncate(records * INDEX_ENTRY.size)
+
+        self._segment = segment
+        self._offset = offset if current.exists() else 0
+        self.records_written = records
+
+    def segment_paths(self) -> list[Path]:
+        return _segment_paths(self.directory, self.stream_id)
+
+    def _open_segment(self) -> None:
+        path = segment_path(self.directory, self.stream_id, self._segment)
+        self._handle = open(path, "ab")
+        if self._handle.tell() == 0:
+            self._handle.write(SEGMENT_MAGIC)
+        self._offset = self._handle.tell()
+
+    def _roll_over(self) -> None:
+        assert self._handle is not None
+        _fsync(self._handle)
+        self._handle.close()
+        self._segment += 1
+        self._open_segment()
+
+
+class SegmentReader:
+    """Read records back from a segment stream, verifying each checksum."""
+
+    def __init__(self, directory: Path | str, stream_id: str):
+        self.directory = Path(directory)
+        self.stream_id = stream_id
+        # Human-readable notes about torn or corrupt records that were skipped
+        self.errors: list[str] = []
+        # The same findings, structured for integrity verification
+        self.issues: list[SegmentIssue] = []
+
+    def exists(self) -> bool:
+        return index_path(self.directory, self.stream_id).exists() or bool(
+            _segment_paths(self.directory, self.stream_id)
+        )
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Yield every intact record in append order."""
+        for path in _segment_paths(self.directory, self.stream_id):
+            yield from self._iter_segment(path)
+
+    def verify(self) -> list[SegmentIssue]:
+        """Read every record, checking length and CRC; return what was wrong."""
+        self.errors.clear()
+        self.issues.clear()
+        for _record in self.iter_records():
+            pass
+        return list(self.issues)
+
+    def load_index(self) -> dict[bytes, SegmentLocation]:
+        """Map index keys to record locations."""
+        path = index_path(self.directory, self.stream_id)
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            return {}
+
+        entries: dict[bytes, SegmentLocation] = {}
+        usable = len(raw) - len(raw) % INDEX_ENTRY.size
+        for key, segment, offset, length in INDEX_ENTRY.iter_unpack(raw[:usable]):
+            entries[key] = SegmentLocation(segment, offset, length)
+        return entries
+
+    def read(self, location: SegmentLocation) -> dict[str, Any]:
+        """Random-access read of one record."""
+        path = segment_path(self.directory, self.stream_id, location.segment)
+        with open(path, "rb") as handle:
+            handle.seek(location.offset)
+            header = handle.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                raise SegmentStoreError(f"Truncated record header in {path.name}")
+            length, crc = RECORD_HEADER.unpack(header)
+            data = handle.read(length)
+        if length != location.length or len(data) != length:
+            raise SegmentStoreError(f"Truncated record in {path.name}")
+        if zlib.crc32(data) != crc:
+            raise SegmentStoreError(
+                f"Checksum mismatch in {path.name} at offset {location.offset}"
+            )
+        return json.loads(data.decode("utf-8"))
+
+    def _iter_segment(self, path: Path) -> Iterator[dict[str, Any]]:
+        with open(path, "rb") as handle:
+            if handle.read(len(SEGMENT_MAGIC)) != SEGMENT_MAGIC:
+                self._report(path, 0, "bad_magic", "not a segment file")
+                return
+            offset = len(SEGMENT_MAGIC)
+            while True:
+                header = handle.read(RECORD_HEADER.size)
+                if not header:
+                    return
+                if len(header) < RECORD_HEADER.size:
+                    self._report(path, offset, "torn", f"torn record header at {offset}")
+                    return
+                length, crc = RECORD_HEADER.unpack(header)
+                data = handle.read(length)
+                if len(data) < length:
+                    self._report(path, offset, "torn", f"torn record at {offset}")
+                    return
+                if zlib.crc32(data) != crc:
+                    # Length is intact, so later records are still reachable
+                    self._report(path, offset, "checksum", f"checksum mismatch at {offset}")
+                else:
+                    try:
+                        yield json.loads(data.decode("utf-8"))
+                    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                        self._report(
+                            path, offset, "undecodable", f"undecodable record at {offset}: {e}"
+                        )
+                offset += RECORD_HEADER.size + length
+
+    def _report(self, path: Path, offset: int, kind: str, message: str) -> None:
+        self.errors.append(f"{path.name}: {message}")
+        self.issues.append(SegmentIssue(path, offset, kind, message))
+
+
+def _segment_number(path: Path) -> int:
+    try:
+        return int(path.name[: -len(SEGMENT_SUFFIX)].rsplit(".", 1)[1])
+    except (IndexError, ValueError):
+        return -1
+
+
+def _segment_paths(directory: Path, stream_id: str) -> list[Path]:
+    directory = Path(directory)
+    if not directory.exists():
+        return []
+    paths = [
+        p
+        for p in directory.glob(f"{stream_id}.*{SEGMENT_SUFFIX}")
+        if p.name[: -len(SEGMENT_SUFFIX)].rsplit(".", 1)[0] == stream_id
+    ]
+    return sorted(paths, key=_segment_number)
@@ -0,0 +1,298 @@
+"""
+session_catalog.py - Maintained catalog of saved sessions.
+
+Purpose:
+    Locating a session used to mean globbing ``sessions/*.session.json`` and
+    parsing every file, twice when the ID was unknown. The catalog maps each
+    session file to its session ID, timestamps and path so lookups, prefix
+    matches and "most recent" listings read only the files they return.
+
+Layout:
+    <storage_root>/indexes/sessions.sqlite
+
+    sessions(stem, session_id, path, created_at, sort_ts, mtime_ns, size_bytes)
+        stem is the file name without ``.session.json``
+    meta(key, value)
+        ``dir_mtime_ns`` of the sessions directory at the last sync
+
+Consistency:
+    Session files stay the source of truth. ``InvestigationStorage``
+    records every session it saves; files added or removed by other means
+    (older versions, restores, manual edits) are picked up by ``sync()``,
+    which only lists the directory when its mtime changed. Rows whose file
+    changed size or mtime are refreshed when read. A missing or unreadable
+    catalog is rebuilt from disk; while the catalog cannot be used at all
+    (e.g. locked), callers fall back to ``scan_sessions``.
+
+Constitutional Basis:
+    - Article 9: Immutable Observations (the catalog is a derived, rebuildable view)
+    - Article 13: Deterministic (ties in recency are ordered by stem)
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+SESSION_SUFFIX = ".session.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS sessions (
+    stem TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    created_at TEXT,
+    sort_ts REAL NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size_bytes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_session_id ON sessions(session_id);
+CREATE INDEX IF NOT EXISTS sessions_recent ON sessions(sort_ts DESC, stem);
+"""
+
+
+def session_timestamp(metadata: dict[str, Any], fallback: float) -> float:
+    """Best-effort timestamp extraction for session ordering."""
+    for field in ("modified_at", "saved_at", "created_at"):
+        value = metadata.get(field)
+        if not value:
+            continue
+        try:
+            normalized = str(value).replace("Z", "+00:00")
+            return datetime.fromisoformat(normalized).timestamp()
+        except ValueError:
+            continue
+    return fallback
+
+
+def read_session_file(session_file: Path) -> dict[str, Any] | None:
+    """Load one session file, filling in ``id``/``session_id`` from its name."""
+    try:
+        data = json.loads(session_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    stem = session_file.name[: -len(SESSION_SUFFIX)]
+    data.setdefault("id", stem)
+    data.setdefault("session_id", data.get("id", stem))
+    return data
+
+
+def scan_sessions(sessions_dir: Path | str) -> list[tuple[str, dict[str, Any]]]:
+    """
+    ``(stem, metadata)`` for every session file, most recently updated first.
+
+    The catalog-free path: reads every file. Used when the catalog itself is
+    unavailable (e.g. locked by a concurrent writer).
+    """
+    records: list[tuple[float, str, dict[str, Any]]] = []
+    for session_file in Path(sessions_dir).glob(f"*{SESSION_SUFFIX}"):
+        metadata = read_session_file(session_file)
+        if metadata is None:
+            continue
+        try:
+            mtime = session_file.stat().st_mtime
+        except OSError:
+            continue
+        stem = session_file.name[: -len(SESSION_SUFFIX)]
+        records.append((session_timestamp(metadata, mtime), stem, metadata))
+    records.sort(key=lambda item: (-item[0], item[1]))
+    return [(stem, metadata) for _ts, stem, metadata in records]
+
+
+class SessionCatalog:
+    """SQLite catalog of the session files in one storage root."""
+
+    def __init__(self, path: Path | str, sessions_dir: Path | str):
+        self.path = Path(path)
+        self.sessions_dir = Path(sessions_dir)
+
+    @classmethod
+    def for_storage_root(cls, storage_root: Path | str) -> SessionCatalog:
+        root = Path(storage_root)
+        return cls(root / "indexes" / "sessions.sqlite", root / "sessions")
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        session_file: Path,
+        metadata: dict[str, Any],
+        connection: sqlite3.Connection | None = None,
+    ) -> None:
+        """Insert or refresh the row for one session file."""
+        try:
+            stat = session_file.stat()
+        except OSError:
+            return
+        stem = session_file.name[: -len(SESSION_SUFFIX)]
+        row = (
+            stem,
+            str(metadata.get("id") or stem),
+            str(session_file),
+            metadata.get("created_at"),
+            session_timestamp(metadata, stat.st_mtime),
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        sql = "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?)"
+        if connection is not None:
+            connection.execute(sql, row)
+            return
+        with self._open() as conn:
+            conn.execute(sql, row)
+
+    def remove(self, stem: str) -> None:
+        with self._open() as conn:
+            conn.execute("DELETE FROM sessions WHERE stem = ?", (stem,))
+
+    def sync(self) -> None:
+        """Pick up session files added or removed since the last sync."""
+        try:
+            dir_mtime = str(self.sessions_dir.stat().st_mtime_ns)
+        except OSError:
+            return
+        with self._open() as conn:
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'dir_mtime_ns'"
+            ).fetchone()
+            if row is not None and row[0] == dir_mtime:
+                return
+
+            on_disk = {
+                path.name[: -len(SESSION_SUFFIX)]: path
+                for path in self.sessions_dir.glob(f"*{SESSION_SUFFIX}")
+            }
+            known = {stem for (stem,) in conn.execute("SELECT stem FROM sessions")}
+            gone = known - set(on_disk)
+            conn.executemany(
+                "DELETE FROM sessions WHERE stem = ?", [(stem,) for stem in gone]
+            )
+            for stem in sorted(set(on_disk) - known):
+                metadata = read_session_file(on_disk[stem])
+                if metadata is not None:
+                    self.record(on_disk[stem], metadata, connection=conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES ('dir_mtime_ns', ?)",
+                (dir_mtime,),
+            )
+
+    def rebuild(self) -> int:
+        """Drop the catalog and rebuild it from the session files on disk."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        self.sync()
+        with self._open() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0])
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, session_id: str) -> dict[str, Any] | None:
+        """Load the session whose ID (or file stem) is ``session_id``."""
+        self.sync()
+        rows = self._rows(
+            "WHERE session_id = ? OR stem = ? ORDER BY stem = ? DESC LIMIT 1",
+            (session_id, session_id, session_id),
+        )
+        return next(iter(self._load(rows)), None)
+
+    def find(self, fragment: str) -> dict[str, Any] | None:
+        """Most recent session whose file stem contains ``fragment``."""
+        self.sync()
+        rows = self._rows(
+            "WHERE instr(stem, ?) > 0 ORDER BY sort_ts DESC, stem LIMIT 1",
+            (fragment,),
+        )
+        return next(iter(self._load(rows)), None)
+
+    def recent(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Session metadata ordered by most recently updated first."""
+        self.sync()
+        if limit <= 0:
+            rows = self._rows("ORDER BY sort_ts DESC, stem", ())
+        else:
+            rows = self._rows("ORDER BY sort_ts DESC, stem LIMIT ?", (limit,))
+        return self._load(rows)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _rows(self, clause: str, params: Iterable[Any]) -> list[tuple]:
+        with self._open() as conn:
+            return conn.execute(
+                f"SELECT stem, path, mtime_ns, size_bytes FROM sessions {clause}",
+                list(params),
+            ).fetchall()
+
+    def _load(self, rows: list[tuple]) -> list[dict[str, Any]]:
+        """Read the session files behind ``rows``, refreshing stale rows."""
+        sessions: list[dict[str, Any]] = []
+        for stem, path, mtime_ns, size_bytes in rows:
+            session_file = Path(path)
+            try:
+                stat = session_file.stat()
+            except OSError:
+                self.remove(stem)
+                continue
+            metadata = read_session_file(session_file)
+            if metadata is None:
+                continue
+            if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size_bytes):
+                self.record(session_file, metadata)
+            sessions.append(metadata)
+        return sessions
+
+    def _open(self) -> _Connection:
+        return _Connection(self)
+
+
+class _Connection:
+    """Connection context that commits on success and rebuilds a bad catalog."""
+
+    def __init__(self, catalog: SessionCatalog):
+        self._catalog = catalog
+        self._connection: sqlite3.Connection | None = None
+
+    def __enter__(self) -> sqlite3.Connection:
+        path = self._catalog.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._connection = self._connect(path)
+        except sqlite3.DatabaseError:
+            # Unreadable catalog: it is derived data, start over
+            path.unlink(missing_ok=True)
+            self._connection = self._connect(path)
+        return self._connection
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        assert self._connection is not None
+        try:
+            if exc_type is None:
+                self._connection.commit()
+            else:
+                self._connection.rollback()
+        finally:
+            self._connection.close()
+
+    @staticmethod
+    def _connect(path: Path) -> sqlite3.Connection:
+        connection = sqlite3.connect(path, timeout=30)
+        try:
+            connection.executescript(_SCHEMA)
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        return connection
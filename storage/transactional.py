@@ -19,16 +19,35 @@ import threading
 import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .atomic import AtomicWriteError, normalize_json_data
 from .atomic import atomic_write_json_compatible as atomic_write
 from .corruption import (
     CorruptionEvidence,
-    CorruptionMarker,
     CorruptionType,
 )
+from .segment_store import (
+    INDEX_SUFFIX,
+    SEGMENT_SUFFIX,
+    count_records,
+)
+
+if TYPE_CHECKING:
+    from .verification import VerificationReport
+
+
+def calculate_checksum(data: dict[str, Any]) -> str:
+    """SHA-256 checksum of a stored JSON object, excluding its checksum field."""
+    # Normalize JSON for consistent hashing.
+    # Exclude the checksum field itself to avoid self-referential mismatch.
+    normalized = dict(data)
+    normalized.pop("checksum", None)
+    normalized = normalize_json_data(normalized)
+    json_str = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(json_str.encode("utf-8")).hexdigest()
 
 
 @dataclass(frozen=True)
@@ -433,73 +452,40 @@ class TransactionalWriter:
 
     def _calculate_checksum(self, data: dict[str, Any]) -> str:
         """Calculate SHA-256 checksum of data."""
-        # Normalize JSON for consistent hashing.
-        # Exclude the checksum field itself to avoid self-referential mismatch.
-        normalized = dict(data)
-        normalized.pop("checksum", None)
-        normalized = normalize_json_data(normalized)
-        json_str = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(json_str.encode("utf-8")).hexdigest()
-
-    def verify_all_observations(self) -> list[CorruptionEvidence]:
+        return calculate_checksum(data)
+
+    def verify_all_observations(
+        self,
+        tier: str = "full",
+        workers: int | None = None,
+        progress: Callable[[Any], None] | None = None,
+        resume: bool = True,
+    ) -> list[CorruptionEvidence]:
         """
         Verify all observation files for corruption.
 
+        Segment streams (the default streaming format) are read back in full
+        and every record's length and CRC is checked. The ``"quick"`` tier
+        checks only sizes, headers and trailers. See storage.verification
+        for fan-out, progress reporting and checkpoint/resume.
+
         Returns:
             List of corruption evidence found
         """
-        evidence_list: list[CorruptionEvidence] = []
-        obs_dir = self.base_path / "observations"
+        return self.verify_observations(tier, workers, progress, resume).evidence
 
-        if not obs_dir.exists():
-            return evidence_list
-
-        for obs_file in obs_dir.glob("*.observation.json"):
-            # Check for corruption marker
-            if CorruptionMarker.has_marker(obs_file):
-                marker_data = CorruptionMarker.read_marker(obs_file)
-                if marker_data:
-                    evidence_list.append(
-                        CorruptionEvidence(
-                            path=obs_file,
-                            corruption_type=CorruptionType.CORRUPTION_MARKER,
-                            expected_value="No corruption marker",
-                            actual_value=f"Corruption detected: {marker_data.get('corruption_type')}",
-                            context=marker_data,
-                        )
-                    )
-                continue
-
-            # Verify file integrity
-            try:
-                with open(obs_file, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Verify checksum if present
-                if "checksum" in data:
-                    expected_checksum = data["checksum"]
-                    actual_checksum = self._calculate_checksum(data)
-                    if actual_checksum != expected_checksum:
-                        evidence_list.append(
-                            CorruptionEvidence(
-                                path=obs_file,
-                                corruption_type=CorruptionType.HASH_MISMATCH,
-                                expected_value=expected_checksum,
-                                actual_value=actual_checksum,
-                            )
-                        )
-
-            except (json.JSONDecodeError, OSError) as e:
-                evidence_list.append(
-                    CorruptionEvidence(
-                        path=obs_file,
-                        corruption_type=CorruptionType.JSON_PARSE_ERROR,
-                        expected_value="Valid JSON",
-                        actual_value=str(e),
-                    )
-                )
+    def verify_observations(
+        self,
+        tier: str = "full",
+        workers: int | None = None,
+        progress: Callable[[Any], None] | None = None,
+        resume: bool = True,
+    ) -> "VerificationReport":
+        """Run the storage verifier and return its full report."""
+        from .verification import StorageVerifier
 
-        return evidence_list
+        verifier = StorageVerifier(self.base_path, tier=tier, workers=workers)
+        return verifier.run(progress=progress, resume=resume)
 
     def repair_corrupted_observations(self) -> tuple[int, list[str]]:
         """
@@ -574,12 +560,24 @@ class TransactionalWriter:
         obs_files = list(obs_dir.glob("*.observation.json"))
         total_size = sum(f.stat().st_size for f in obs_files)
 
+        # Streamed observations packed in segment files
+        segments_dir = obs_dir / "segments"
+        segment_records = count_records(segments_dir)
+        segment_files = [
+            f
+            for f in segments_dir.glob("*")
+            if f.suffix in {SEGMENT_SUFFIX, INDEX_SUFFIX}
+        ]
+        total_size += sum(f.stat().st_size for f in segment_files)
+
         # Get disk space info
         space_info = DiskSpaceChecker.get_space_info(self.base_path)
 
         return {
-            "total_observations": len(obs_files),
+            "total_observations": len(obs_files) + segment_records,
             "total_size_bytes": total_size,
+            "observation_files": len(obs_files),
+            "segment_records": segment_records,
             "disk_space": space_info,
             "backup_count": len(list(self.backup_dir.glob("*.backup*")))
             if self.backup_dir.exists()
@@ -0,0 +1,582 @@
+"""
+verification.py - Parallel, resumable integrity verification of a storage root.
+
+Purpose:
+    Check every stored observation (``*.observation.json`` files and segment
+    streams) without one serial pass that can only start over. Units of work
+    are fanned out across worker processes in sorted order, progress is
+    reported per batch, and the position reached is checkpointed so an
+    interrupted verification resumes where it stopped.
+
+Tiers:
+    quick   Size, header and trailer only. An observation file must be
+            non-empty, start with ``{`` and end with ``}``. A segment stream's
+            index must hold whole entries, every segment must start with
+            ``SEGMENT_MAGIC``, and the last indexed record must fit inside
+            its segment. Nothing is parsed or hashed.
+    full    The quick checks, then every observation file is parsed and its
+            checksum recomputed, and every segment record's CRC is checked.
+
+Checkpoint:
+    <base_path>/verification/checkpoint.json
+        {"format": 1, "tier": ..., "last_unit": ..., "checked": ...,
+         "evidence": [...]}
+
+    Units are verified in sorted key order and only a contiguous completed
+    prefix is ever recorded, so resuming skips exactly the units that were
+    already checked. Files changed after they were checked are not looked at
+    again until a fresh run. The checkpoint is removed when a run completes.
+
+Constitutional Basis:
+    - Article 13: Deterministic (units and evidence are in sorted order)
+    - Article 15: Checkpoints (interrupted runs resume from their position)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from .atomic import atomic_write_json_compatible
+from .corruption import CorruptionEvidence, CorruptionMarker, CorruptionType
+from .segment_store import (
+    INDEX_ENTRY,
+    INDEX_SUFFIX,
+    RECORD_HEADER,
+    SEGMENT_MAGIC,
+    SegmentReader,
+    _segment_number,
+    _segment_paths,
+    index_path,
+    segment_path,
+)
+
+OBSERVATION_SUFFIX = ".observation.json"
+SEGMENTS_DIRNAME = "segments"
+CHECKPOINT_FORMAT = 1
+
+DEFAULT_BATCH_SIZE = 256
+MAX_PENDING_BATCHES_PER_WORKER = 4
+# Below this many units a process pool costs more than it saves
+PARALLEL_THRESHOLD = 2000
+# Seconds between checkpoint writes
+CHECKPOINT_INTERVAL = 2.0
+
+# Bytes read from each end of a file by the quick tier
+_EDGE_BYTES = 64
+
+# How segment reader findings map onto corruption types
+SEGMENT_ISSUE_TYPES = {
+    "bad_magic": CorruptionType.BINARY_PARSE_ERROR,
+    "torn": CorruptionType.PARTIAL_WRITE,
+    "checksum": CorruptionType.HASH_MISMATCH,
+    "undecodable": CorruptionType.JSON_PARSE_ERROR,
+}
+
+
+class VerificationTier(Enum):
+    """How deeply each unit is checked."""
+
+    QUICK = "quick"
+    FULL = "full"
+
+
+@dataclass(frozen=True)
+class VerificationUnit:
+    """One observation file or one segment stream."""
+
+    kind: str  # "file", "marked" (has a corruption marker) or "stream"
+    name: str
+
+    @property
+    def key(self) -> str:
+        """Sort and checkpoint key: the unit's path below ``observations/``."""
+        if self.kind == "stream":
+            return f"{SEGMENTS_DIRNAME}/{self.name}"
+        return self.name
+
+
+@dataclass(frozen=True)
+class VerificationProgress:
+    """Where a verification run is, reported after every batch."""
+
+    checked: int
+    total: int
+    corrupt: int
+    resumed_from: int
+    elapsed_seconds: float
+
+    @property
+    def fraction(self) -> float:
+        return self.checked / self.total if self.total else 1.0
+
+
+@dataclass
+class VerificationReport:
+    """Outcome of a verification run."""
+
+    tier: VerificationTier
+    evidence: list[CorruptionEvidence] = field(default_factory=list)
+    checked: int = 0
+    total: int = 0
+    resumed_from: int = 0
+    workers: int = 1
+    elapsed_seconds: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        return self.checked >= self.total
+
+
+ProgressCallback = Callable[[VerificationProgress], None]
+
+
+# ============================================================================
+# UNIT CHECKS (run in worker processes)
+# ============================================================================
+
+
+def _evidence(
+    path: Path,
+    corruption_type: CorruptionType,
+    expected: Any,
+    actual: Any,
+    context: dict[str, Any] | None = None,
+) -> CorruptionEvidence:
+    return CorruptionEvidence(
+        path=path,
+        corruption_type=corruption_type,
+        expected_value=expected,
+        actual_value=actual,
+        context=context,
+    )
+
+
+def _check_file_edges(path: Path) -> CorruptionEvidence | None:
+    """Quick tier for one observation file: size, header and trailer."""
+    try:
+        with open(path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            head = handle.read(min(size, _EDGE_BYTES))
+            if size > _EDGE_BYTES:
+                handle.seek(-_EDGE_BYTES, os.SEEK_END)
+                tail = handle.read(_EDGE_BYTES)
+            else:
+                tail = head
+    except OSError as e:
+        return _evidence(path, CorruptionType.JSON_PARSE_ERROR, "Readable file", str(e))
+
+    if size == 0:
+        return _evidence(
+            path, CorruptionType.PARTIAL_WRITE, "Non-empty file", "0 bytes"
+        )
+    if not head.lstrip().startswith(b"{"):
+        return _evidence(
+            path, CorruptionType.JSON_PARSE_ERROR, "JSON object header", repr(head[:16])
+        )
+    if not tail.rstrip().endswith(b"}"):
+        return _evidence(
+            path,
+            CorruptionType.PARTIAL_WRITE,
+            "JSON object trailer",
+            repr(tail[-16:]),
+            {"size": size},
+        )
+    return None
+
+
+def _check_file(path: Path, tier: VerificationTier) -> list[CorruptionEvidence]:
+    from .transactional import calculate_checksum
+
+    found = _check_file_edges(path)
+    if found is not None or tier is VerificationTier.QUICK:
+        return [found] if found is not None else []
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        return [_evidence(path, CorruptionType.JSON_PARSE_ERROR, "Valid JSON", str(e))]
+
+    # Verify checksum if present
+    if isinstance(data, dict) and "checksum" in data:
+        expected_checksum = data["checksum"]
+        actual_checksum = calculate_checksum(data)
+        if actual_checksum != expected_checksum:
+            return [
+                _evidence(
+                    path,
+                    CorruptionType.HASH_MISMATCH,
+                    expected_checksum,
+                    actual_checksum,
+                )
+            ]
+    return []
+
+
+def _check_marked(path: Path) -> list[CorruptionEvidence]:
+    marker_data = CorruptionMarker.read_marker(path)
+    if not marker_data:
+        return []
+    return [
+        _evidence(
+            path,
+            CorruptionType.CORRUPTION_MARKER,
+            "No corruption marker",
+            f"Corruption detected: {marker_data.get('corruption_type')}",
+            marker_data,
+        )
+    ]
+
+
+def _check_stream_edges(segments_dir: Path, stream_id: str) -> list[CorruptionEvidence]:
+    """Quick tier for one segment stream: index size, magics, last record."""
+    found: list[CorruptionEvidence] = []
+    context = {"stream_id": stream_id}
+
+    index = index_path(segments_dir, stream_id)
+    try:
+        index_size = index.stat().st_size
+    except OSError as e:
+        return [
+            _evidence(index, CorruptionType.PARTIAL_WRITE, "Readable index", str(e))
+        ]
+    if index_size % INDEX_ENTRY.size:
+        found.append(
+            _evidence(
+                index,
+                CorruptionType.PARTIAL_WRITE,
+                f"Multiple of {INDEX_ENTRY.size} bytes",
+                f"{index_size} bytes",
+                context,
+            )
+        )
+
+    sizes: dict[int, int] = {}
+    for path in _segment_paths(segments_dir, stream_id):
+        try:
+            with open(path, "rb") as handle:
+                magic = handle.read(len(SEGMENT_MAGIC))
+                sizes[_segment_number(path)] = os.fstat(handle.fileno()).st_size
+        except OSError as e:
+            found.append(
+                _evidence(
+                    path, CorruptionType.PARTIAL_WRITE, "Readable segment", str(e)
+                )
+            )
+            continue
+        if magic != SEGMENT_MAGIC:
+            found.append(
+                _evidence(
+                    path,
+                    CorruptionType.BINARY_PARSE_ERROR,
+                    "Segment header",
+                    repr(magic),
+                    {**context, "offset": 0},
+                )
+            )
+
+    last = index_size // INDEX_ENTRY.size
+    if last:
+        with open(index, "rb") as handle:
+            handle.seek((last - 1) * INDEX_ENTRY.size)
+            _key, segment, offset, length = INDEX_ENTRY.unpack(
+                handle.read(INDEX_ENTRY.size)
+            )
+        end = offset + RECORD_HEADER.size + length
+        if sizes.get(segment, -1) < end:
+            found.append(
+                _evidence(
+                    segment_path(segments_dir, stream_id, segment),
+                    CorruptionType.PARTIAL_WRITE,
+                    f"At least {end} bytes",
+                    f"{sizes.get(segment, 0)} bytes",
+                    {**context, "offset": offset},
+                )
+            )
+    return found
+
+
+def _check_stream(
+    segments_dir: Path, stream_id: str, tier: VerificationTier
+) -> list[CorruptionEvidence]:
+    if tier is VerificationTier.QUICK:
+        return _check_stream_edges(segments_dir, stream_id)
+
+    return [
+        _evidence(
+            issue.path,
+            SEGMENT_ISSUE_TYPES.get(issue.kind, CorruptionType.BINARY_PARSE_ERROR),
+            "Intact segment record",
+            issue.message,
+            {"stream_id": stream_id, "offset": issue.offset},
+        )
+        for issue in SegmentReader(segments_dir, stream_id).verify()
+    ]
+
+
+def verify_units(
+    obs_dir: str | Path, units: Sequence[VerificationUnit], tier: str
+) -> list[CorruptionEvidence]:
+    """Check a batch of units, in order. Picklable for worker processes."""
+    obs_dir = Path(obs_dir)
+    verification_tier = VerificationTier(tier)
+    found: list[CorruptionEvidence] = []
+    for unit in units:
+        if unit.kind == "marked":
+            found.extend(_check_marked(obs_dir / unit.name))
+        elif unit.kind == "stream":
+            found.extend(
+                _check_stream(obs_dir / SEGMENTS_DIRNAME, unit.name, verification_tier)
+            )
+        else:
+            found.extend(_check_file(obs_dir / unit.name, verification_tier))
+    return found
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+
+def list_units(obs_dir: Path) -> list[VerificationUnit]:
+    """Every unit under ``obs_dir``, sorted by key, from one directory listing."""
+    if not obs_dir.exists():
+        return []
+
+    marker_suffix = OBSERVATION_SUFFIX + CorruptionMarker.MARKER_SUFFIX
+    names: list[str] = []
+    marked: set[str] = set()
+    with os.scandir(obs_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(OBSERVATION_SUFFIX):
+                names.append(entry.name)
+            elif entry.name.endswith(marker_suffix):
+                marked.add(entry.name[: -len(CorruptionMarker.MARKER_SUFFIX)])
+
+    units = [
+        VerificationUnit("marked" if name in marked else "file", name) for name in names
+    ]
+
+    segments_dir = obs_dir / SEGMENTS_DIRNAME
+    if segments_dir.is_dir():
+        with os.scandir(segments_dir) as entries:
+            units.extend(
+                VerificationUnit("stream", entry.name[: -len(INDEX_SUFFIX)])
+                for entry in entries
+                if entry.name.endswith(INDEX_SUFFIX)
+            )
+    return sorted(units, key=lambda unit: unit.key)
+
+
+def _evidence_to_dict(evidence: CorruptionEvidence) -> dict[str, Any]:
+    return {
+        "path": str(evidence.path),
+        "type": evidence.corruption_type.name,
+        "expected": evidence.expected_value,
+        "actual": evidence.actual_value,
+        "context": evidence.context,
+        "detected_at": evidence.detected_at,
+    }
+
+
+def _evidence_from_dict(data: dict[str, Any]) -> CorruptionEvidence:
+    evidence = _evidence(
+        Path(data["path"]),
+        CorruptionType[data["type"]],
+        data.get("expected"),
+        data.get("actual"),
+        data.get("context"),
+    )
+    # Keep the original detection time rather than the resume time
+    object.__setattr__(evidence, "detected_at", data.get("detected_at", 0.0))
+    return evidence
+
+
+class StorageVerifier:
+    """
+    Verify a storage root's observations across worker processes.
+
+    Usage:
+        verifier = StorageVerifier(storage.base_path, tier=VerificationTier.QUICK)
+        report = verifier.run(progress=lambda p: print(f"{p.fraction:.0%}"))
+
+    ``workers=None`` uses one process per CPU once there are at least
+    ``PARALLEL_THRESHOLD`` units and verifies in-process below that. If the
+    run is interrupted (including by an exception raised from ``progress``),
+    the checkpoint is written before the exception propagates.
+    """
+
+    def __init__(
+        self,
+        base_path: Path | str,
+        tier: VerificationTier | str = VerificationTier.FULL,
+        workers: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        checkpoint_path: Path | str | None = None,
+    ):
+        self.base_path = Path(base_path)
+        self.obs_dir = self.base_path / "observations"
+        self.tier = VerificationTier(tier)
+        self.workers = workers
+        self.batch_size = max(1, int(batch_size))
+        self.checkpoint_path = (
+            Path(checkpoint_path)
+            if checkpoint_path is not None
+            else self.base_path / "verification" / "checkpoint.json"
+        )
+
+    def run(
+        self, progress: ProgressCallback | None = None, resume: bool = True
+    ) -> VerificationReport:
+        """Verify every unit not already covered by a matching checkpoint."""
+        started = time.monotonic()
+        units = list_units(self.obs_dir)
+        report = VerificationReport(tier=self.tier, total=len(units))
+
+        last_unit = None
+        checkpoint = self.load_checkpoint() if resume else None
+        if checkpoint is not None:
+            last_unit = checkpoint["last_unit"]
+            report.evidence = [_evidence_from_dict(e) for e in checkpoint["evidence"]]
+            units = [unit for unit in units if unit.key > last_unit]
+            report.resumed_from = report.total - len(units)
+        report.checked = report.resumed_from
+
+        workers = self._resolve_workers(len(units))
+        report.workers = workers
+        last_saved = time.monotonic()
+
+        try:
+            for batch, found in self._run_batches(units, workers):
+                report.evidence.extend(found)
+                report.checked += len(batch)
+                last_unit = batch[-1].key
+                if time.monotonic() - last_saved >= CHECKPOINT_INTERVAL:
+                    self._save_checkpoint(report, last_unit)
+                    last_saved = time.monotonic()
+                if progress is not None:
+                    progress(
+                        VerificationProgress(
+                            checked=report.checked,
+                            total=report.total,
+                            corrupt=len(report.evidence),
+                            resumed_from=report.resumed_from,
+                            elapsed_seconds=time.monotonic() - started,
+                        )
+                    )
+        except BaseException:
+            if last_unit is not None and not report.complete:
+                self._save_checkpoint(report, last_unit)
+            raise
+
+        self.clear_checkpoint()
+        report.elapsed_seconds = time.monotonic() - started
+        return report
+
+    # ------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------
+
+    def load_checkpoint(self) -> dict[str, Any] | None:
+        """The saved position for this tier, or None."""
+        try:
+            data = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("format") != CHECKPOINT_FORMAT
+            or data.get("tier") != self.tier.value
+            or not isinstance(data.get("last_unit"), str)
+        ):
+            return None
+        data.setdefault("evidence", [])
+        return data
+
+    def clear_checkpoint(self) -> None:
+        self.checkpoint_path.unlink(missing_ok=True)
+
+    def _save_checkpoint(self, report: VerificationReport, last_unit: str) -> None:
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json_compatible(
+            self.checkpoint_path,
+            {
+                "format": CHECKPOINT_FORMAT,
+                "tier": self.tier.value,
+                "last_unit": last_unit,
+                "checked": report.checked,
+                "total": report.total,
+                "evidence": [_evidence_to_dict(e) for e in report.evidence],
+                "updated_at": datetime.now(UTC).isoformat(),
+            },
+            indent=None,
+        )
+
+    # ------------------------------------------------------------------
+    # Fan-out
+    # ------------------------------------------------------------------
+
+    def _resolve_workers(self, unit_count: int) -> int:
+        if self.workers is None:
+            if unit_count < PARALLEL_THRESHOLD:
+                return 1
+            return max(1, os.cpu_count() or 1)
+        if self.workers <= 0:
+            return max(1, os.cpu_count() or 1)
+        return int(self.workers)
+
+    def _run_batches(
+        self, units: list[VerificationUnit], workers: int
+    ) -> Iterator[tuple[list[VerificationUnit], list[CorruptionEvidence]]]:
+        """``(batch, evidence)`` for every batch, in unit order."""
+        batches = [
+            units[start : start + self.batch_size]
+            for start in range(0, len(units), self.batch_size)
+        ]
+        if workers <= 1:
+            for batch in batches:
+                yield batch, verify_units(self.obs_dir, batch, self.tier.value)
+            return
+
+        max_pending = workers * MAX_PENDING_BATCHES_PER_WORKER
+        pending: deque[tuple[list[VerificationUnit], Future]] = deque()
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            for batch in batches:
+                pending.append(
+                    (
+                        batch,
+                        executor.submit(
+                            verify_units, str(self.obs_dir), batch, self.tier.value
+                        ),
+                    )
+                )
+                if len(pending) >= max_pending:
+                    batch_done, future = pending.popleft()
+                    yield batch_done, future.result()
+            while pending:
+                batch_done, future = pending.popleft()
+                yield batch_done, future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+__all__ = [
+    "VerificationTier",
+    "VerificationUnit",
+    "VerificationProgress",
+    "VerificationReport",
+    "StorageVerifier",
+    "list_units",
+    "verify_units",
+]
@@ -0,0 +1,160 @@
+"""Tests for parallel, incremental snapshot anchor generation."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+from observations.record import anchors as anchors_module
+from observations.record.anchors import (
+    AnchorSet,
+    ContentFingerprintMethod,
+    SnapshotAnchorStage,
+    compute_anchors_for_snapshot,
+    hash_file_content,
+    observed_file_paths,
+)
+from observations.record.integrity import compute_integrity_root, verify_integrity
+from observations.record.snapshot import ObservationCategory, Snapshot, SnapshotBuilder
+from observations.record.utils import create_snapshot
+
+
+def _tree(root: Path, count: int) -> list[Path]:
+    (root / "pkg").mkdir(parents=True, exist_ok=True)
+    paths = []
+    for idx in range(count):
+        path = root / "pkg" / f"mod_{idx}.py"
+        path.write_text(f"value = {idx}\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _snapshot(root: Path, paths: list[Path]) -> Snapshot:
+    builder = SnapshotBuilder(root)
+    builder.start_recording()
+    builder.add_observations(
+        ObservationCategory.CONTENT,
+        "import_sight",
+        [{"file": str(path), "statements": []} for path in paths[1:]],
+    )
+    # file_sight lists files relative to its root, as (path, metadata) pairs
+    builder.add_observations(
+        ObservationCategory.STRUCTURE,
+        "file_sight",
+        [
+            {
+                "root_path": str(root / "pkg"),
+                "files": [[paths[0].name, {"size": 1}]],
+                "directories": ["."],
+            }
+        ],
+    )
+    return builder.build()
+
+
+def test_observed_file_paths_follow_observation_layouts(tmp_path: Path) -> None:
+    paths = _tree(tmp_path, 4)
+    snapshot = _snapshot(tmp_path, paths)
+
+    assert observed_file_paths(snapshot) == sorted(paths, key=str)
+
+
+def test_stage_hashes_in_parallel_in_path_order(tmp_path: Path) -> None:
+    paths = _tree(tmp_path, 40)
+    stage = SnapshotAnchorStage(workers=4)
+
+    anchors = list(stage.iter_anchors([*paths, tmp_path / "missing.py"], tmp_path))
+
+    assert [a.original_path for a in anchors] == [str(p) for p in paths]
+    assert [a.content_fingerprint for a in anchors] == [
+        hashlib.sha256(p.read_bytes()).hexdigest() for p in paths
+    ]
+    assert anchors[0].relative_path == os.path.join("pkg", "mod_0.py")
+    assert anchors[0].metadata.parameters["file_stat"][0] == paths[0].stat().st_size
+    assert stage.stats.to_dict() == {
+        "files": 41,
+        "hashed": 40,
+        "reused": 0,
+        "skipped": 1,
+    }
+
+
+def test_stage_reuses_anchors_for_unchanged_files(tmp_path: Path) -> None:
+    paths = _tree(tmp_path, 5)
+    snapshot = _snapshot(tmp_path, paths)
+    first = SnapshotAnchorStage().generate(snapshot)
+    # Round-trip through storage form, as a previous snapshot would be loaded
+    previous = AnchorSet.from_dict(first.to_dict())
+
+    paths[2].write_text("value = 'changed'\n", encoding="utf-8")
+    stage = SnapshotAnchorStage(previous=previous)
+    second = stage.generate(snapshot)
+
+    assert stage.stats.reused == 4 and stage.stats.hashed == 1
+    changed = second.find_anchors_by_path(str(paths[2]))[0]
+    assert (
+        changed.content_fingerprint == hashlib.sha256(paths[2].read_bytes()).hexdigest()
+    )
+    assert first.count == second.count == 5
+
+    # A different method never reuses content anchors
+    ast_stage = SnapshotAnchorStage(
+        method=ContentFingerprintMethod.AST_HASH, previous=previous
+    )
+    ast_stage.generate(snapshot)
+    assert ast_stage.stats.reused == 0 and ast_stage.stats.hashed == 5
+
+
+def test_large_files_are_hashed_through_mmap(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "blob.bin"
+    path.write_bytes(os.urandom(300_000))
+    expected = hashlib.sha256(path.read_bytes()).hexdigest()
+
+    monkeypatch.setattr(anchors_module, "MMAP_THRESHOLD", 1024)
+    assert hash_file_content(path) == expected
+    assert hash_file_content(path, chunk_size=4096) == expected
+    monkeypatch.setattr(anchors_module, "MMAP_THRESHOLD", 1 << 40)
+    assert hash_file_content(path, chunk_size=4096) == expected
+
+
+def test_compute_anchors_for_snapshot_feeds_integrity(tmp_path: Path) -> None:
+    paths = _tree(tmp_path, 3)
+    snapshot = _snapshot(tmp_path, paths)
+
+    anchors = compute_anchors_for_snapshot(snapshot, workers=2)
+    assert len(anchors) == 3
+
+    anchored = snapshot.with_anchors(anchors)
+    complete = anchored.with_integrity(compute_integrity_root(anchored))
+    assert verify_integrity(complete) == (True, None)
+
+
+def test_create_snapshot_anchors_and_reuses_previous(tmp_path: Path) -> None:
+    paths = _tree(tmp_path, 3)
+    composite = SimpleNamespace(
+        target=tmp_path,
+        observations=[
+            SimpleNamespace(
+                confidence=1.0,
+                raw_payload=SimpleNamespace(
+                    to_dict=lambda path=path: {"file": str(path), "statements": []}
+                ),
+                provenance=SimpleNamespace(observer_name="import_sight"),
+            )
+            for path in paths
+        ],
+    )
+    first = create_snapshot(composite)
+    assert first.has_anchors() and len(first.anchors) == 3
+
+    paths[0].write_text("value = 'changed'\n", encoding="utf-8")
+    # Loaded from storage form, as the previous snapshot would be
+    second = create_snapshot(composite, previous=Snapshot.from_json(first.to_json()))
+
+    old = {anchor.original_path: anchor for anchor in first.anchors}
+    new = {anchor.original_path: anchor for anchor in second.anchors}
+    assert new[str(paths[0])] != old[str(paths[0])]
+    assert new[str(paths[1])] == old[str(paths[1])]
+    assert new[str(paths[2])] == old[str(paths[2])]
@@ -135,3 +135,59 @@ class TestSearchContext:
                 or len(first_result.context_after) > 0
             )
 
+
+
+class TestRegexFallback:
+    """Test the streaming Python regex search used without ripgrep."""
+
+    def _command(self, **kwargs) -> SearchCommand:
+        cmd = SearchCommand(**kwargs)
+        cmd._ripgrep_available = False
+        return cmd
+
+    def test_matches_line_by_line_semantics(self, tmp_path: Path):
+        """Whole-buffer search reports exactly the lines a per-line scan would."""
+        (tmp_path / "a.py").write_text(
+            "import os\r\nx = 1  \n\ndef f():\n    return x\n", encoding="utf-8"
+        )
+        cmd = self._command(context_lines=1)
+
+        def lines(query: str) -> list[tuple[int, str]]:
+            result = cmd.execute(query=query, path=tmp_path, output_format="count")
+            return [(r.line_number, r.matched_text) for r in result.results.results]
+
+        assert lines(r"\s+$") == [(1, "\n"), (2, "  \n"), (3, "\n"), (4, "\n"), (5, "\n")]
+        assert lines(r"^def \w+") == [(4, "def f")]
+        assert lines(r"\Areturn") == []
+        assert lines(r"x\b") == [(2, "x"), (5, "x")]
+
+        first = cmd.execute(query="return", path=tmp_path, output_format="count")
+        match = first.results.results[0]
+        assert match.context_before == ["def f():"]
+        assert match.context_after == []
+
+    def test_limit_stops_the_walk(self, tmp_path: Path):
+        """Reaching the limit returns exactly that many results, in walk order."""
+        for i in range(50):
+            (tmp_path / f"m{i:02}.py").write_text("hit\nhit\n", encoding="utf-8")
+
+        cmd = self._command(max_workers=2)
+        result = cmd.execute(query="hit", path=tmp_path, limit=3, output_format="count")
+
+        assert result.results.total_matches == 3
+        files = cmd._find_files(tmp_path, None, None, None)
+        assert [r.file_path for r in result.results.results] == [files[0], files[0], files[1]]
+
+    def test_json_is_streamed_to_file(self, tmp_path: Path):
+        """The streamed JSON document is complete and parseable."""
+        import json
+
+        (tmp_path / "a.py").write_text("def a():\n    pass\n", encoding="utf-8")
+        out = tmp_path / "out" / "results.json"
+
+        result = self._command().execute(query="def", path=tmp_path, json_file=out)
+
+        data = json.loads(out.read_text())
+        assert result.success is True
+        assert data["total_matches"] == 1
+        assert data["results"][0]["line"] == 1
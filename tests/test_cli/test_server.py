@@ -0,0 +1,176 @@
+"""
+tests/test_cli/test_server.py - Tests for the JSON-RPC editor server
+"""
+
+import json
+import queue
+import threading
+from pathlib import Path
+
+from bridge.entry.cli import CodeMarshalCLI
+from bridge.entry.server import (
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    REQUEST_CANCELLED,
+    CodeMarshalServer,
+    WarmCLI,
+    command_args,
+)
+
+
+class _Pipe:
+    """Line reader/writer pair standing in for the editor's stdio pipes."""
+
+    def __init__(self):
+        self._lines: queue.Queue = queue.Queue()
+
+    def readline(self) -> str:
+        return self._lines.get()
+
+    def write(self, text: str) -> int:
+        self._lines.put(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+class _Client:
+    def __init__(self, server: CodeMarshalServer):
+        self.requests = _Pipe()
+        self.responses = _Pipe()
+        self.thread = threading.Thread(
+            target=server.serve, args=(self.requests, self.responses), daemon=True
+        )
+        self.thread.start()
+
+    def send(self, method: str, params=None, request_id=None) -> None:
+        message = {"jsonrpc": "2.0", "method": method, "params": params or {}}
+        if request_id is not None:
+            message["id"] = request_id
+        self.requests.write(json.dumps(message) + "\n")
+
+    def receive(self, timeout: float = 60) -> dict:
+        return json.loads(self.responses._lines.get(timeout=timeout))
+
+    def call(self, method: str, params=None, request_id=1) -> dict:
+        self.send(method, params, request_id)
+        return self.receive()
+
+    def close(self) -> None:
+        self.send("exit")
+        self.thread.join(timeout=10)
+
+
+class TestServer:
+    """Test the server against the in-process CLI."""
+
+    def test_run_and_search_match_the_cli(self, tmp_path: Path, capsys):
+        (tmp_path / "a.py").write_text("def hello():\n    return 1\n", encoding="utf-8")
+        CodeMarshalCLI().run(
+            ["search", "--no-index", "--output=json", "--", "-?hello", str(tmp_path)]
+        )
+        expected = json.loads(capsys.readouterr().out)
+
+        client = _Client(CodeMarshalServer())
+        try:
+            run = client.call("run", {"args": ["--version"]})["result"]
+            assert run["exit_code"] == 0 and "CodeMarshal" in run["stdout"]
+
+            found = client.call(
+                "search", {"query": "-?hello", "path": str(tmp_path), "no_index": True}, 2
+            )["result"]
+            assert found["results"] == expected["results"]
+        finally:
+            client.close()
+        # Command output went to the response, not to the process's stdout
+        assert "CodeMarshal" not in capsys.readouterr().out
+
+    def test_errors(self):
+        client = _Client(CodeMarshalServer())
+        try:
+            client.requests.write("not json\n")
+            assert client.receive()["error"]["code"] == PARSE_ERROR
+            assert client.call("nope")["error"]["code"] == METHOD_NOT_FOUND
+            error = client.call("query", {"investigation_id": "x"})["error"]
+            assert error["code"] == INVALID_PARAMS
+            assert "question_type" in error["message"]
+            assert client.call("run", {"args": "--version"})["error"]["code"] == INVALID_PARAMS
+        finally:
+            client.close()
+
+    def test_cancel_queued_and_running_requests(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        class BlockingCLI(CodeMarshalCLI):
+            def run(self, args=None):
+                if args == ["block"]:
+                    started.set()
+                    release.wait(30)
+                print("ran", args)
+                return 0
+
+        client = _Client(CodeMarshalServer(BlockingCLI()))
+        try:
+            client.send("run", {"args": ["block"]}, 1)
+            assert started.wait(30)
+            client.send("run", {"args": ["queued"]}, 2)
+            client.send("$/cancelRequest", {"id": 2})
+            assert client.receive() == {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "error": {"code": REQUEST_CANCELLED, "message": "Request cancelled"},
+            }
+            client.send("$/cancelRequest", {"id": 1})
+            assert client.receive()["error"]["code"] == REQUEST_CANCELLED
+            release.set()
+
+            # The late result of 1 is dropped and 2 never ran
+            response = client.call("run", {"args": ["after"]}, 3)
+            assert response["id"] == 3
+            assert response["result"]["stdout"] == "ran ['after']\n"
+        finally:
+            release.set()
+            client.close()
+
+    def test_command_args(self):
+        assert command_args(
+            "patterns.scan", {"path": "src", "pattern": ["a", "b"], "max_files": 5}
+        ) == [
+            "patterns",
+            "scan",
+            "--pattern=a",
+            "--pattern=b",
+            "--max-files=5",
+            "--output=json",
+            "--",
+            "src",
+        ]
+
+    def test_warm_cli_reuses_observations_per_observation_set(self, monkeypatch):
+        loads = []
+
+        def load(self, storage, session_data, question_type):
+            loads.append(question_type)
+            return [{"type": question_type}]
+
+        monkeypatch.setattr(CodeMarshalCLI, "_load_query_observations", load)
+
+        class Storage:
+            base_path = Path("storage")
+            key = "v1"
+
+            def observation_set_key(self, session_data):
+                return self.key
+
+        storage = Storage()
+        session = {"id": "s1"}
+        cli = WarmCLI()
+        first = cli._load_query_observations(storage, session, "structure")
+        assert cli._load_query_observations(storage, session, "structure") is first
+        cli._load_query_observations(storage, session, "purpose")
+        storage.key = "v2"  # A new investigation changes the observation set
+        cli._load_query_observations(storage, session, "structure")
+        assert loads == ["structure", "purpose", "structure"]
@@ -0,0 +1,131 @@
+"""
+tests/test_cli/test_startup.py - Cold-start budget for light CLI commands
+
+`--version`, `--help` and `search` must not import the investigation stack.
+The wall-clock budget is measured over a bare interpreter start so machine
+speed mostly cancels out; CODEMARSHAL_STARTUP_BUDGET_SCALE widens it on slow
+runners.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+# Seconds above `python -c pass`, best of several runs
+STARTUP_BUDGET = {
+    "--version": 0.4,
+    "search": 0.6,
+}
+
+# Modules that only investigate/observe/export/query need
+HEAVY_MODULES = {
+    "bridge.commands.investigate",
+    "bridge.commands.export",
+    "core.runtime",
+    "core.engine",
+    "lens.navigation.context",
+    "observations.interface",
+    "storage.investigation_storage",
+    "patterns.loader",
+}
+
+_CHILD = (
+    "import json, sys\n"
+    "from bridge.entry.cli import CodeMarshalCLI\n"
+    "CodeMarshalCLI().run(sys.argv[2:])\n"
+    "open(sys.argv[1], 'w').write(json.dumps(sorted(sys.modules)))\n"
+)
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(PACKAGE_ROOT), env.get("PYTHONPATH")])
+    )
+    return env
+
+
+def _best_time(command: list[str], cwd: Path, runs: int = 3) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            command, cwd=cwd, env=_env(), capture_output=True, check=False
+        )
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _workspace(tmp_path: Path) -> Path:
+    (tmp_path / "a.py").write_text("value = 1\n", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["--version"], ["--help"], ["search", "value", "."]],
+    ids=["version", "help", "search"],
+)
+def test_light_commands_skip_investigation_imports(tmp_path: Path, args) -> None:
+    cwd = _workspace(tmp_path)
+    modules_file = tmp_path / "modules.json"
+    subprocess.run(
+        [sys.executable, "-c", _CHILD, str(modules_file), *args],
+        cwd=cwd,
+        env=_env(),
+        capture_output=True,
+        check=True,
+    )
+    loaded = set(json.loads(modules_file.read_text(encoding="utf-8")))
+
+    assert "bridge.entry.cli" in loaded
+    assert not loaded & HEAVY_MODULES
+
+
+@pytest.mark.parametrize("command", sorted(STARTUP_BUDGET))
+def test_cold_start_within_budget(tmp_path: Path, command: str) -> None:
+    cwd = _workspace(tmp_path)
+    args = ["--version"] if command == "--version" else ["search", "value", "."]
+    scale = float(os.environ.get("CODEMARSHAL_STARTUP_BUDGET_SCALE", "1"))
+
+    baseline = _best_time([sys.executable, "-c", "pass"], cwd)
+    elapsed = _best_time(
+        [sys.executable, "-c", "from bridge.entry.cli import main; main()", *args],
+        cwd,
+    )
+
+    assert elapsed - baseline < STARTUP_BUDGET[command] * scale, (
+        f"`codemarshal {' '.join(args)}` took {elapsed:.3f}s "
+        f"({elapsed - baseline:.3f}s over interpreter start)"
+    )
+
+
+def test_profile_startup_reports_import_times(capsys) -> None:
+    from bridge.entry.cli import CodeMarshalCLI
+
+    assert CodeMarshalCLI().run(["--profile-startup", "--version"]) == 0
+    out = capsys.readouterr().out
+
+    assert out.startswith("Startup profile: codemarshal --version")
+    assert "(exit code 0)" in out
+    assert "import time: self [us] | cumulative | imported package" in out
+    assert "| bridge.entry.cli" in out
+
+
+def test_profile_startup_returns_the_command_exit_code(tmp_path, capsys) -> None:
+    from bridge.entry.cli import CodeMarshalCLI
+
+    # Exporting a session that does not exist fails in the profiled child
+    args = ["export", "no-such-session", "--format=json"]
+    args.append(f"--output={tmp_path / 'export.json'}")
+    assert CodeMarshalCLI().run(["--profile-startup", *args]) == 1
+    assert "(exit code 1)" in capsys.readouterr().out
@@ -0,0 +1,99 @@
+"""Tests for the shared iterative SCC cycle engine."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from inquiry.answers import ConnectionMapper
+from observations.cycles import find_cyclic_components, strongly_connected_components
+from observations.eyes.boundary_sight import (
+    BoundarySeverity,
+    create_package_boundary,
+    observe_boundaries,
+)
+
+
+def test_components_sizes_and_self_loops() -> None:
+    adjacency = {
+        "a": {"b"},
+        "b": {"c"},
+        "c": {"a", "d"},
+        "d": set(),
+        "e": {"e"},
+        "f": {"g"},
+        "g": {"f"},
+    }
+
+    components = find_cyclic_components(adjacency)
+
+    assert [c.nodes for c in components] == [("a", "b", "c"), ("f", "g"), ("e",)]
+    assert components[0].cycles == (("a", "b", "c", "a"),)
+    assert components[2].cycles == (("e", "e"),)
+
+
+def test_deep_chain_does_not_recurse() -> None:
+    size = 50_000
+    successors = {i: [i + 1] for i in range(size - 1)}
+    successors[size - 1] = [0]
+
+    components = strongly_connected_components(
+        range(size), lambda node: successors[node]
+    )
+    assert len(components) == 1 and len(components[0]) == size
+
+    cyclic = find_cyclic_components(successors)
+    assert cyclic[0].size == size
+    assert len(cyclic[0].cycles[0]) == size + 1
+
+
+def test_representative_cycles_are_bounded() -> None:
+    # Complete graph on 6 nodes: many elementary cycles, one component
+    adjacency = {i: {j for j in range(6) if j != i} for i in range(6)}
+
+    (component,) = find_cyclic_components(adjacency, max_cycles=2)
+    assert component.size == 6
+    assert len(component.cycles) == 2
+    assert all(cycle[0] == cycle[-1] for cycle in component.cycles)
+
+
+def test_connection_mapper_reports_components() -> None:
+    observations = [
+        {"type": "import_sight", "file": f"pkg/m{i}.py", "statements": [
+            {"module": f"pkg.m{(i + 1) % 3}", "names": []}
+        ]}
+        for i in range(3)
+    ]
+
+    result = ConnectionMapper().analyze(observations, "Show circular dependencies")
+
+    assert "1 component(s), 3 module(s) involved" in result
+    assert "pkg/m0.py →" in result
+
+
+def test_boundary_sight_marks_circular_crossings(tmp_path: Path) -> None:
+    for package, other in (("alpha", "beta"), ("beta", "alpha")):
+        (tmp_path / package).mkdir()
+        (tmp_path / package / "__init__.py").write_text("", encoding="utf-8")
+        (tmp_path / package / "mod.py").write_text(
+            f"import {other}.mod\n", encoding="utf-8"
+        )
+    (tmp_path / "alpha" / "leaf.py").write_text("import beta\n", encoding="utf-8")
+
+    observation = observe_boundaries(
+        tmp_path,
+        [create_package_boundary("alpha"), create_package_boundary("beta")],
+    )
+
+    assert observation.analysis_errors == ()
+    # Same shape as before: (source_module, target_module) edges on a cycle
+    assert observation.circular_dependencies == (
+        ("alpha.mod", "beta.mod"),
+        ("beta.mod", "alpha.mod"),
+    )
+    severities = {
+        (c.source_module, c.target_module): c.severity for c in observation.crossings
+    }
+    assert severities == {
+        ("alpha.mod", "beta.mod"): BoundarySeverity.CIRCULAR,
+        ("beta.mod", "alpha.mod"): BoundarySeverity.CIRCULAR,
+    }
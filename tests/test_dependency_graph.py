@@ -0,0 +1,79 @@
+"""Tests for the persisted CSR dependency graph used by ConnectionMapper."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from inquiry.answers import ConnectionMapper
+from inquiry.answers.dependency_graph import DependencyGraph, load_or_build
+
+
+def _observations() -> list[dict]:
+    return [
+        {
+            "type": "import_sight",
+            "file": "pkg/a.py",
+            "statements": [{"module": "pkg.b", "names": []}, {"module": "os", "names": []}],
+        },
+        {
+            "type": "import_sight",
+            "file": "pkg/b.py",
+            "statements": [{"module": "pkg.c", "names": []}],
+        },
+        {
+            "type": "import_sight",
+            "file": "pkg/c.py",
+            "statements": [{"module": "pkg.a", "names": []}],
+        },
+        {"type": "file_sight", "result": {"files": ["pkg/d.py"]}},
+    ]
+
+
+def test_graph_resolves_files_and_reverse_edges() -> None:
+    graph = DependencyGraph.from_observations(_observations())
+
+    assert graph.files == ["pkg/a.py", "pkg/b.py", "pkg/c.py", "pkg/d.py"]
+    a, b, c = (graph.node_id(path) for path in ("pkg/a.py", "pkg/b.py", "pkg/c.py"))
+    assert list(graph.successors(a, graph.internal)) == [b]
+    assert list(graph.dependents(b)) == [a]
+    assert graph.internal_edge_count == 3
+    # Unresolved imports stay as path-like nodes in the import adjacency
+    assert "os" in [graph.nodes[t] for t in graph.successors(a)]
+    assert graph.impact_layers([c], max_depth=3) == [[b], [a], []]
+
+
+def test_save_load_roundtrip_and_staleness(tmp_path: Path) -> None:
+    graph = DependencyGraph.from_observations(_observations())
+    path = tmp_path / "session.depgraph"
+    graph.save(path, "key-1")
+
+    loaded = DependencyGraph.load(path, "key-1")
+    assert loaded is not None
+    assert loaded.nodes == graph.nodes
+    assert loaded.imports == graph.imports
+    assert loaded.reverse == graph.reverse
+    assert {name: loaded.alias_index[name] for name in loaded.alias_index} == graph.alias_index
+
+    assert DependencyGraph.load(path, "key-2") is None
+    path.write_bytes(path.read_bytes()[:40])
+    assert DependencyGraph.load(path, "key-1") is None
+
+    rebuilt = load_or_build(path, "key-1", _observations())
+    assert DependencyGraph.load(path, "key-1").nodes == rebuilt.nodes
+
+
+def test_mapper_answers_match_with_persisted_graph(tmp_path: Path) -> None:
+    observations = _observations()
+    path = tmp_path / "session.depgraph"
+    DependencyGraph.from_observations(observations).save(path, "key")
+    persisted = ConnectionMapper(dependency_graph=DependencyGraph.load(path, "key"))
+
+    for question in (
+        "Impact surface for pkg.b",
+        "Show module centrality",
+        "Show circular dependencies",
+    ):
+        # The persisted graph answers without reading observations at all
+        assert persisted.analyze([], question) == ConnectionMapper().analyze(
+            observations, question
+        )
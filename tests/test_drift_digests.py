@@ -0,0 +1,200 @@
+"""Tests for snapshot digest tables and digest-based drift comparison."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from core.context import RuntimeContext
+from integrity.monitoring.drift import DriftMonitor, DriftType
+from observations.record import ObservationCategory, create_anchor
+from observations.record.digests import (
+    DigestTable,
+    build_digest_table,
+    diff_digest_tables,
+    digest_table_path,
+    find_snapshots_by_input_hash,
+    input_index_path,
+    load_digest_table,
+)
+from observations.record.integrity import compute_dict_hash
+from observations.record.snapshot import SnapshotBuilder, save_snapshot
+from storage.layout import get_investigation_path, snapshots_directory
+
+
+def _context(tmp_path: Path) -> RuntimeContext:
+    return RuntimeContext(
+        investigation_root=tmp_path,
+        constitution_hash="a" * 64,
+        code_version_hash="b" * 64,
+        execution_mode="CLI",
+    )
+
+
+def _save(directory: Path, anchored: Path, observations: list[dict]) -> Path:
+    builder = SnapshotBuilder(anchored.parent)
+    builder.start_recording()
+    builder.add_observations(ObservationCategory.CONTENT, "import_sight", observations)
+    snapshot = builder.build().with_anchors([create_anchor(anchored)])
+    return save_snapshot(snapshot, directory / f"{snapshot.snapshot_id}.json")
+
+
+def _observations(count: int) -> list[dict]:
+    return [{"file": f"pkg/mod_{idx}.py", "imports": [idx]} for idx in range(count)]
+
+
+@pytest.fixture
+def monitor(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> DriftMonitor:
+    monkeypatch.chdir(tmp_path)
+    return DriftMonitor(_context(tmp_path))
+
+
+def _snapshots_dir(monitor: DriftMonitor) -> Path:
+    directory = snapshots_directory(
+        get_investigation_path(monitor.context.investigation_id)
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def test_save_snapshot_writes_digest_table_and_input_index(tmp_path: Path) -> None:
+    anchored = tmp_path / "a.py"
+    anchored.write_text("value = 1\n", encoding="utf-8")
+    first = _save(tmp_path, anchored, _observations(3))
+    second = _save(tmp_path, anchored, _observations(3))
+
+    table = load_digest_table(first)
+    snapshot_dict = json.loads(first.read_text(encoding="utf-8"))
+    assert table == build_digest_table(snapshot_dict)
+    assert [key for key, _ in table.entries] == [
+        f"import_sight:pkg/mod_{idx}.py" for idx in range(3)
+    ]
+    assert table.entries[0][1] == compute_dict_hash(_observations(3)[0])
+    assert DigestTable.from_dict(table.to_dict()) == table
+
+    # Sidecars stay out of the snapshot glob
+    assert sorted(tmp_path.glob("*.json")) == sorted([first, second])
+    assert digest_table_path(first).parent == input_index_path(tmp_path).parent
+
+    assert find_snapshots_by_input_hash(tmp_path, table.input_hash) == [first, second]
+    assert find_snapshots_by_input_hash(tmp_path, "0" * 64) == []
+    assert find_snapshots_by_input_hash(tmp_path / "elsewhere", "0" * 64) is None
+
+
+def test_diff_digest_tables_is_a_sorted_merge() -> None:
+    old = DigestTable(entries=(("a", "1"), ("b", "2"), ("d", "4")))
+    new = DigestTable(entries=(("b", "2"), ("c", "3"), ("d", "5"), ("e", "6")))
+
+    assert list(diff_digest_tables(old, new)) == [
+        ("a", "1", None),
+        ("c", None, "3"),
+        ("d", "4", "5"),
+        ("e", None, "6"),
+    ]
+    assert list(diff_digest_tables(new, new)) == []
+
+    with pytest.raises(ValueError, match="sorted"):
+        DigestTable.from_dict({"format": 1, "entries": [["b", "1"], ["a", "2"]]})
+
+
+def test_compare_snapshots_reads_bodies_only_for_changes(
+    monitor: DriftMonitor, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    directory = _snapshots_dir(monitor)
+    anchored = tmp_path / "a.py"
+    anchored.write_text("value = 1\n", encoding="utf-8")
+    observations = _observations(4)
+    base = _save(directory, anchored, observations)
+    same = _save(directory, anchored, observations)
+    changed = observations[1:] + [{"file": "pkg/new.py", "imports": []}]
+    changed[0] = {"file": "pkg/mod_1.py", "imports": ["changed"]}
+    drifted = _save(directory, anchored, changed)
+
+    loaded = []
+    load_snapshot = monitor._load_snapshot
+    monkeypatch.setattr(
+        monitor,
+        "_load_snapshot",
+        lambda version: loaded.append(version) or load_snapshot(version),
+    )
+
+    assert monitor.compare_snapshots(base.stem, same.stem) == []
+    assert loaded == []
+
+    detections = monitor.compare_snapshots(base.stem, drifted.stem)
+    kinds = {(d.drift_type, d.observation_id) for d in detections}
+    assert kinds == {
+        (DriftType.OBSERVATION_REMOVED, "import_sight:pkg/mod_0.py"),
+        (DriftType.OBSERVATION_CHANGED, "import_sight:pkg/mod_1.py"),
+        (DriftType.OBSERVATION_ADDED, "import_sight:pkg/new.py"),
+        (DriftType.REPRODUCIBILITY_FAILED, None),
+    }
+    assert loaded == [base.stem, drifted.stem]
+    changed_detection = next(
+        d for d in detections if d.drift_type == DriftType.OBSERVATION_CHANGED
+    )
+    assert "imports" in changed_detection.evidence["content_diff"]["fields_changed"]
+
+
+def test_compare_snapshots_digests_snapshots_saved_without_tables(
+    monitor: DriftMonitor, tmp_path: Path
+) -> None:
+    directory = _snapshots_dir(monitor)
+    anchored = tmp_path / "a.py"
+    anchored.write_text("value = 1\n", encoding="utf-8")
+    first = _save(directory, anchored, _observations(2))
+    second = _save(directory, anchored, _observations(3))
+    digest_table_path(first).unlink()
+
+    detections = monitor.compare_snapshots(first.stem, second.stem)
+    assert [d.drift_type for d in detections] == [
+        DriftType.OBSERVATION_ADDED,
+        DriftType.REPRODUCIBILITY_FAILED,
+    ]
+
+
+def test_check_reproducibility_uses_input_index(
+    monitor: DriftMonitor, tmp_path: Path
+) -> None:
+    directory = _snapshots_dir(monitor)
+    anchored = tmp_path / "a.py"
+    anchored.write_text("value = 1\n", encoding="utf-8")
+    current = [dict(obs, id=f"obs-{idx}") for idx, obs in enumerate(_observations(2))]
+    saved = _save(directory, anchored, current)
+    input_hash = load_digest_table(saved).input_hash
+
+    assert monitor._snapshots_for_input(input_hash) == [saved]
+    assert monitor.check_reproducibility(current, input_hash) == []
+    assert monitor.check_reproducibility(current[:1], "0" * 64) == []
+
+    detections = monitor.check_reproducibility(current[:1], input_hash)
+    assert [d.drift_type for d in detections] == [DriftType.REPRODUCIBILITY_FAILED]
+    assert detections[0].evidence["matching_snapshot"] == saved.stem
+
+    # Directories saved before the index existed are scanned instead
+    input_index_path(directory).unlink()
+    assert monitor._snapshots_for_input(input_hash) == [saved]
+
+
+def test_check_reproducibility_of_the_same_payload_finds_no_drift(
+    monitor: DriftMonitor, tmp_path: Path
+) -> None:
+    directory = _snapshots_dir(monitor)
+    anchored = tmp_path / "a.py"
+    anchored.write_text("value = 1\n", encoding="utf-8")
+    # No ids, unsorted lists, and two observations without a file
+    payload = [
+        {"type": "import_sight", "file": "pkg/a.py", "imports": ["os", "json"]},
+        {"type": "import_sight", "imports": ["sys"]},
+        {"type": "import_sight", "imports": ["re"]},
+    ]
+    saved = _save(directory, anchored, payload)
+    input_hash = load_digest_table(saved).input_hash
+
+    assert monitor.check_reproducibility(payload, input_hash) == []
+    # Observations of another eye interleaved do not shift the positions
+    mixed = [payload[0], {"type": "file_sight", "path": "pkg"}, *payload[1:]]
+    detections = monitor.check_reproducibility(mixed, input_hash)
+    assert [d.evidence["changed_ids"] for d in detections] == [["file_sight:pkg"]]
@@ -0,0 +1,184 @@
+"""Tests for the vectorized embedding search in EmbeddingStorage."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from storage.embedding_storage import EmbeddingStorage, top_k_cosine  # noqa: E402
+
+
+def _brute_force(query, vectors, top_k, threshold):
+    query = query / np.linalg.norm(query)
+    scored = [
+        (row, float(np.dot(query, vector / np.linalg.norm(vector))))
+        for row, vector in enumerate(vectors)
+    ]
+    scored = [item for item in scored if item[1] >= threshold]
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored[:top_k]
+
+
+def test_top_k_matches_brute_force() -> None:
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(500, 32)).astype(np.float32)
+    query = rng.normal(size=32).astype(np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    fast = top_k_cosine(vectors / norms, query, top_k=10, threshold=0.0)
+    expected = _brute_force(query, vectors, top_k=10, threshold=0.0)
+
+    assert [row for row, _ in fast] == [row for row, _ in expected]
+    assert np.allclose([s for _, s in fast], [s for _, s in expected], atol=1e-5)
+
+
+def test_search_tracks_stores_and_deletes(tmp_path: Path) -> None:
+    storage = EmbeddingStorage(tmp_path / "embeddings")
+    storage.store_embeddings(
+        [
+            ("a", "a.py", 1, "alpha", np.array([1.0, 0.0, 0.0])),
+            ("b", "b.py", 1, "beta", np.array([0.0, 2.0, 0.0])),
+        ],
+        investigation_id="inv",
+    )
+
+    hits = storage.search_similar(np.array([0.1, 1.0, 0.0]), investigation_id="inv")
+    assert [record.id for record, _ in hits] == ["b"]
+
+    # Stores after the matrix is built are searchable immediately
+    storage.store_embedding("c", "c.py", 1, "gamma", np.array([0.0, 3.0, 0.1]), "inv")
+    hits = storage.search_similar(np.array([0.0, 1.0, 0.0]), investigation_id="inv")
+    assert [record.id for record, _ in hits] == ["b", "c"]
+
+    storage.delete_embeddings_for_file("b.py", investigation_id="inv")
+    hits = storage.search_similar(np.array([0.0, 1.0, 0.0]), investigation_id="inv")
+    assert [record.id for record, _ in hits] == ["c"]
+
+    # A fresh instance reads the same shard back from disk
+    reloaded = EmbeddingStorage(tmp_path / "embeddings")
+    hits = reloaded.search_similar(np.array([0.0, 1.0, 0.0]), investigation_id="inv")
+    assert [record.id for record, _ in hits] == ["c"]
+
+
+def test_shard_reopens_and_discards_a_torn_batch(tmp_path: Path) -> None:
+    from storage.embedding_shard import ROWS_FILE, VECTORS_FILE, EmbeddingShard
+
+    shard = EmbeddingShard(tmp_path / "shard")
+    shard.append([({"id": f"e{i}"}, np.full(4, i + 1.0)) for i in range(3)])
+    shard.append([({"id": "e1"}, np.array([0.0, 5.0, 0.0, 0.0]))])
+    shard.delete(["e2"])
+    shard.close()
+
+    # Bytes written after the last commit (a crashed batch) are ignored
+    with open(tmp_path / "shard" / VECTORS_FILE, "ab") as handle:
+        handle.write(b"\x00" * 16)
+    with open(tmp_path / "shard" / ROWS_FILE, "ab") as handle:
+        handle.write(b'{"id":"torn"')
+
+    reopened = EmbeddingShard(tmp_path / "shard")
+    assert len(reopened) == 2
+    assert reopened.row_of("e2") is None
+    assert reopened.row_of("torn") is None
+    row = reopened.row_of("e1")
+    assert row == 3
+    assert list(reopened.live) == [True, False, False, True]
+    assert np.allclose(reopened.embedding(row, reopened.metadata(row)), [0, 5, 0, 0])
+
+
+def test_legacy_embedding_files_are_imported(tmp_path: Path) -> None:
+    import json
+
+    emb_dir = tmp_path / "embeddings" / "inv" / "embeddings"
+    emb_dir.mkdir(parents=True)
+    np.save(emb_dir / "old.npy", np.array([0.0, 1.0, 0.0]))
+    (emb_dir / "old.json").write_text(
+        json.dumps(
+            {
+                "id": "old",
+                "file_path": "old.py",
+                "line_number": 3,
+                "content": "legacy",
+                "created_at": "2025-01-01T00:00:00+00:00",
+                "investigation_id": "inv",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    storage = EmbeddingStorage(tmp_path / "embeddings")
+    hits = storage.search_similar(np.array([0.0, 1.0, 0.0]), investigation_id="inv")
+    assert [(record.id, record.line_number) for record, _ in hits] == [("old", 3)]
+    assert storage.get_embedding("old") is not None
+    assert not emb_dir.exists()
+
+
+def test_legacy_pairs_that_fail_to_load_are_kept(tmp_path: Path) -> None:
+    import json
+
+    emb_dir = tmp_path / "embeddings" / "inv" / "embeddings"
+    emb_dir.mkdir(parents=True)
+    for name in ("good", "bad"):
+        np.save(emb_dir / f"{name}.npy", np.array([0.0, 1.0, 0.0]))
+        (emb_dir / f"{name}.json").write_text(
+            json.dumps(
+                {
+                    "id": name,
+                    "file_path": f"{name}.py",
+                    "line_number": 1,
+                    "created_at": "2025-01-01T00:00:00+00:00",
+                    "investigation_id": "inv",
+                }
+            ),
+            encoding="utf-8",
+        )
+    (emb_dir / "bad.npy").write_bytes(b"not an array")
+
+    storage = EmbeddingStorage(tmp_path / "embeddings")
+    hits = storage.search_similar(np.array([0.0, 1.0, 0.0]), investigation_id="inv")
+
+    assert [record.id for record, _ in hits] == ["good"]
+    assert sorted(path.name for path in emb_dir.iterdir()) == ["bad.json", "bad.npy"]
+
+
+def test_semantic_search_reuses_a_built_chunk_matrix(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from core.search.semantic_search import (
+        ChunkMatrix,
+        SemanticSearchConfig,
+        SemanticSearchEngine,
+    )
+
+    source = tmp_path / "a.py"
+    source.write_text("alpha = 1\nbeta = 2\n", encoding="utf-8")
+    chunks = ChunkMatrix.build(
+        [
+            (
+                source,
+                [("x", np.array([3.0, 0.0]), 1), ("y", np.array([0.0, 2.0]), 2)],
+            )
+        ]
+    )
+    assert chunks.entries == ((source, "x", 1), (source, "y", 2))
+    assert np.allclose(np.linalg.norm(chunks.matrix, axis=1), 1.0)
+    assert len(ChunkMatrix.build([])) == 0
+
+    class _Model:
+        def encode(self, texts, convert_to_numpy=True):
+            return np.array([[0.1, 1.0]])
+
+    # The model itself is optional; the engine only needs encode() here
+    engine = SemanticSearchEngine.__new__(SemanticSearchEngine)
+    engine.config = SemanticSearchConfig(similarity_threshold=0.0)
+    engine._model = _Model()
+    monkeypatch.setattr(ChunkMatrix, "build", None)
+
+    results = engine.search("beta", chunks)
+    assert [(r.line_number, r.context) for r in results] == [
+        (2, "chunk:y"),
+        (1, "chunk:x"),
+    ]
+    assert results[0].content == "beta = 2"
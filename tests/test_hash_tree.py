@@ -0,0 +1,186 @@
+"""Tests for the level-array Merkle tree and snapshot integrity built on it."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from observations.record import (
+    ObservationCategory,
+    compute_integrity_root,
+    create_anchor,
+    verify_integrity,
+)
+from observations.record.integrity import (
+    HashAlgorithm,
+    HashTree,
+    HashTreeNode,
+    _payload_digests,
+    combine_hashes,
+    compute_dict_hash,
+    snapshot_observation_tree,
+    verify_inclusion,
+)
+from observations.record.snapshot import Snapshot, SnapshotBuilder
+
+
+def _items(count: int) -> list[dict]:
+    return [{"file": f"pkg/mod_{idx}.py", "line": idx} for idx in range(count)]
+
+
+def _legacy_root(hashes: list[str], algorithm: HashAlgorithm) -> HashTreeNode:
+    """The linked-node tree HashTree used to build."""
+    nodes = [HashTreeNode.create_leaf(h, algorithm) for h in hashes]
+    while len(nodes) > 1:
+        nodes = [
+            HashTreeNode.create_internal(
+                nodes[i], nodes[i + 1] if i + 1 < len(nodes) else nodes[i], algorithm
+            )
+            for i in range(0, len(nodes), 2)
+        ]
+    return nodes[0]
+
+
+def _snapshot(tmp_path: Path, count: int) -> Snapshot:
+    anchored = tmp_path / "a.py"
+    anchored.write_text("value = 1\n", encoding="utf-8")
+    builder = SnapshotBuilder(tmp_path)
+    builder.start_recording()
+    builder.add_observations(ObservationCategory.CONTENT, "import_sight", _items(count))
+    snapshot = builder.build().with_anchors([create_anchor(anchored)])
+    return snapshot.with_integrity(compute_integrity_root(snapshot))
+
+
+@pytest.mark.parametrize("algorithm", [HashAlgorithm.SHA256, HashAlgorithm.BLAKE2B])
+def test_root_matches_linked_node_tree(algorithm: HashAlgorithm) -> None:
+    for count in range(1, 12):
+        items = _items(count)
+        tree = HashTree(items, algorithm)
+        legacy = _legacy_root(
+            [compute_dict_hash(i, algorithm) for i in items], algorithm
+        )
+
+        assert tree.leaf_count == count
+        assert tree.root_hash == legacy.hash_value
+        assert tree.verify_tree()
+
+
+def test_proofs_are_logarithmic_and_verify() -> None:
+    items = _items(13)
+    tree = HashTree(items)
+
+    for index, item in enumerate(items):
+        valid, proof = tree.verify_item(item, index)
+        assert valid and len(proof) == 4
+        assert tree.verify_proof(tree.leaf_hash(index), index, proof)
+        assert verify_inclusion(
+            tree.leaf_hash(index), index, tree.proof(index), tree.root_digest
+        )
+        assert not tree.verify_proof(tree.leaf_hash(index), index ^ 1, proof)
+
+    assert tree.verify_item(items[0], 1) == (False, None)
+    assert tree.verify_item(items[0], 13) == (False, None)
+    single = HashTree(_items(1))
+    assert single.verify_item(_items(1)[0], 0) == (True, [])
+
+
+def test_append_and_update_match_rebuild() -> None:
+    items = _items(9)
+    tree = HashTree([])
+    assert tree.root_hash is None
+
+    for count, item in enumerate(items, start=1):
+        assert tree.append(item) == count - 1
+        rebuilt = HashTree(items[:count])
+        assert tree.root_hash == rebuilt.root_hash
+        assert tree.levels == rebuilt.levels
+
+    items[4] = {"file": "pkg/changed.py", "line": 99}
+    tree.update(4, items[4])
+    assert tree.levels == HashTree(items).levels
+    with pytest.raises(IndexError):
+        tree.update(9, items[0])
+
+
+def test_binary_round_trip_and_tamper_detection() -> None:
+    tree = HashTree(_items(100), HashAlgorithm.BLAKE2S)
+    data = tree.to_bytes()
+    assert len(data) == HashTree._HEADER.size + 32 * 101
+
+    loaded = HashTree.from_bytes(data)
+    assert loaded.algorithm == HashAlgorithm.BLAKE2S
+    assert loaded.levels == tree.levels
+    assert HashTree.from_dict(tree.to_dict()).root_hash == tree.root_hash
+
+    tampered = bytearray(data)
+    tampered[-1] ^= 0xFF
+    with pytest.raises(ValueError, match="root"):
+        HashTree.from_bytes(bytes(tampered))
+    with pytest.raises(ValueError, match="size"):
+        HashTree.from_bytes(data[:-1])
+
+    tree.levels[1][0] ^= 0xFF
+    assert not tree.verify_tree()
+
+
+def test_from_dict_reads_nested_node_form() -> None:
+    items = _items(5)
+    algorithm = HashAlgorithm.default()
+    legacy = _legacy_root([compute_dict_hash(i, algorithm) for i in items], algorithm)
+
+    tree = HashTree.from_dict(
+        {"algorithm": "sha256", "leaf_count": 5, "root": legacy.to_dict()}
+    )
+    assert tree.levels == HashTree(items).levels
+
+
+def test_snapshot_integrity_records_observation_tree(tmp_path: Path) -> None:
+    snapshot = _snapshot(tmp_path, 50)
+    payload = snapshot.to_dict(canonical=True)["payload"]
+    payload_hash, digests = _payload_digests(payload, HashAlgorithm.default())
+
+    assert payload_hash == compute_dict_hash(payload)
+    assert snapshot.integrity_root.payload_hash == payload_hash
+    assert snapshot.integrity_root.hash_tree == {
+        "algorithm": "sha256",
+        "encoding": HashTree.ENCODING,
+        "leaf_count": 50,
+        "root_hash": HashTree.from_digests(digests).root_hash,
+    }
+    assert verify_integrity(snapshot) == (True, None)
+
+    # A single observation can be proven against the recorded root
+    tree = snapshot_observation_tree(snapshot)
+    observation = payload["groups"][0]["observations"][7]
+    valid, proof = tree.verify_item(observation, 7)
+    assert valid
+    assert verify_inclusion(
+        compute_dict_hash(observation),
+        7,
+        proof,
+        snapshot.integrity_root.hash_tree["root_hash"],
+    )
+
+    # Roots computed before the observation tree existed still verify
+    data = snapshot.to_dict()
+    data["integrity"]["hash_tree"] = {
+        "algorithm": "sha256",
+        "leaf_count": 3,
+        "root": None,
+    }
+    assert verify_integrity(Snapshot.from_dict(data)) == (True, None)
+
+    data["integrity"]["hash_tree"] = {
+        **snapshot.integrity_root.hash_tree,
+        "leaf_count": 49,
+    }
+    assert verify_integrity(Snapshot.from_dict(data)) == (
+        False,
+        "Observation tree mismatch",
+    )
+
+
+def test_combine_hashes_is_the_internal_node_rule() -> None:
+    tree = HashTree(_items(2))
+    assert tree.root_hash == combine_hashes(tree.leaf_hash(0), tree.leaf_hash(1))
@@ -59,3 +59,177 @@ def test_recommendations_generation(tmp_path: Path) -> None:
     assert all("title" in item for item in recommendations)
     assert all("confidence" in item for item in recommendations)
 
+
+
+def test_graph_batch_matches_single_writes_and_replays(tmp_path: Path) -> None:
+    import json
+
+    import pytest
+
+    from storage.knowledge_storage import KnowledgeStorage
+
+    def write(graph) -> None:
+        graph.upsert_graph_node({"node_id": "a", "session_ids": ["s1"]})
+        graph.upsert_graph_node({"node_id": "b", "attributes": {"x": 1}})
+        graph.upsert_graph_node({"node_id": "a", "session_ids": ["s2"]})
+        graph.add_graph_edge({"from_node": "a", "to_node": "b", "session_id": "s1"})
+        graph.add_graph_edge({"from_node": "a", "to_node": "b", "session_id": "s1"})
+
+    def shape(graph: dict) -> tuple:
+        nodes = [(n["node_id"], n["session_ids"], n["attributes"]) for n in graph["nodes"]]
+        edges = [(e["from_node"], e["to_node"], e["weight"]) for e in graph["edges"]]
+        return nodes, edges
+
+    single = KnowledgeStorage(tmp_path / "single")
+    write(single)
+    batched = KnowledgeStorage(tmp_path / "batched")
+    with batched.graph_batch() as batch:
+        write(batch)
+
+    expected = ([("a", ["s1", "s2"], {}), ("b", [], {"x": 1})], [("a", "b", 2.0)])
+    assert shape(single.get_graph()) == expected
+    assert shape(batched.get_graph()) == expected
+    # One record per node and edge in the log, not one per call
+    log = (tmp_path / "batched" / "knowledge" / "graph_nodes.jsonl").read_text()
+    assert len(log.splitlines()) == 2
+
+    # A new instance reads the log tail; appends from it reach the first one
+    reopened = KnowledgeStorage(tmp_path / "batched")
+    assert shape(reopened.get_graph()) == expected
+    reopened.add_graph_edge({"from_node": "b", "to_node": "a", "session_id": "s1"})
+    assert len(batched.get_graph(focus="b", depth=1)["edges"]) == 2
+
+    # A failed batch writes nothing
+    with pytest.raises(RuntimeError):
+        with batched.graph_batch() as batch:
+            batch.upsert_graph_node({"node_id": "c"})
+            raise RuntimeError("abort")
+    assert [n["node_id"] for n in batched.get_graph()["nodes"]] == ["a", "b"]
+
+    index = json.loads(
+        (tmp_path / "batched" / "knowledge" / "graph_index.json").read_text()
+    )
+    assert index["nodes"] == {}  # Below the snapshot threshold: log only
+
+
+def test_graph_snapshot_compaction_and_legacy_index(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import json
+
+    import storage.knowledge_storage as knowledge_storage
+    from storage.knowledge_storage import KnowledgeStorage
+
+    monkeypatch.setattr(knowledge_storage, "GRAPH_SNAPSHOT_RECORDS", 3)
+    storage = KnowledgeStorage(tmp_path)
+    with storage.graph_batch() as batch:
+        for i in range(4):
+            batch.upsert_graph_node({"node_id": f"n{i}"})
+    index_path = tmp_path / "knowledge" / "graph_index.json"
+    index = json.loads(index_path.read_text())
+    assert sorted(index["nodes"]) == ["n0", "n1", "n2", "n3"]
+    nodes_log = tmp_path / "knowledge" / "graph_nodes.jsonl"
+    assert index["log_offsets"]["nodes"] == nodes_log.stat().st_size
+
+    # Indexes written before log offsets existed already hold every record
+    del index["log_offsets"]
+    index_path.write_text(json.dumps(index))
+    legacy = KnowledgeStorage(tmp_path)
+    assert len(legacy.get_graph(limit=0)["nodes"]) == 4
+    legacy.upsert_graph_node({"node_id": "n4"})
+    assert len(KnowledgeStorage(tmp_path).get_graph(limit=0)["nodes"]) == 5
+
+
+def test_sqlite_history_matches_json_layout(tmp_path: Path) -> None:
+    import json
+    import sqlite3
+
+    import pytest
+
+    from storage.knowledge_sqlite import SQLiteKnowledgeStorage, sqlite_supported
+    from storage.knowledge_storage import KnowledgeStorage
+
+    if not sqlite_supported():
+        pytest.skip("sqlite3 without FTS5 trigram tokenizer")
+
+    legacy = KnowledgeStorage(tmp_path)
+    events = [
+        ("s1", "query", "Where are IMPORTS?", "2025-01-01T10:00:00+00:00"),
+        ("s1", "query", "where are imports?", "2025-01-02T10:00:00+00:00"),
+        ("s2", "query", "Where are IMPORTS?", "2025-01-02T10:00:00+00:00"),
+        ("s2", "observe", "", "2025-02-01T00:00:00+00:00"),
+        ("s2", "insight", "Straße naming", "not a date"),
+    ]
+    for session_id, event_type, question, timestamp in events[:3]:
+        legacy.record_history_event(
+            {
+                "session_id": session_id,
+                "event_type": event_type,
+                "question": question,
+                "timestamp": timestamp,
+            }
+        )
+
+    # The first open migrates history.jsonl; later events still append to it
+    migrated = SQLiteKnowledgeStorage(tmp_path)
+    session_id, event_type, question, timestamp = events[3]
+    migrated.record_history_event(
+        {
+            "session_id": session_id,
+            "event_type": event_type,
+            "question": question,
+            "timestamp": timestamp,
+        }
+    )
+    # An event written by the JSON layout (e.g. a fallback) is indexed too
+    session_id, event_type, question, timestamp = events[4]
+    legacy.record_history_event(
+        {
+            "session_id": session_id,
+            "event_type": event_type,
+            "question": question,
+            "timestamp": timestamp,
+        }
+    )
+    assert len(SQLiteKnowledgeStorage(tmp_path).query_history(limit=0)) == 5
+    assert len(legacy.query_history(limit=0)) == 5
+    index = json.loads(legacy.history_index_path.read_text(encoding="utf-8"))
+    assert index["total_events"] == 5
+
+    for filters in [
+        {},
+        {"session_id": "s2"},
+        {"event_type": "query", "limit": 2},
+        {"query": "imports"},
+        {"query": "STRASSE"},
+        {"query": "straße"},
+        {"query": "s2"},
+        {"from_date": "2025-01-02", "to_date": "2025-01-31"},
+        {"query": '"question"', "limit": 0},
+    ]:
+        assert migrated.query_history(**filters) == legacy.query_history(**filters)
+    assert migrated.get_query_suggestions() == legacy.get_query_suggestions()
+    assert migrated.get_query_suggestions(session_id="s2", limit=1) == [
+        {"query": "Where are IMPORTS?", "count": 1}
+    ]
+
+    sessions = tmp_path / "sessions"
+    sessions.mkdir()
+    for name, patterns in [("a", ["p1", "p2"]), ("b", ["p2"]), ("c", [])]:
+        (sessions / f"{name}.session.json").write_text(
+            json.dumps({"id": name, "pattern_ids": patterns}), encoding="utf-8"
+        )
+    assert migrated.session_pattern_sets() == legacy.session_pattern_sets()
+    (sessions / "c.session.json").write_text(
+        json.dumps({"id": "c", "pattern_ids": ["p1", "p3"]}), encoding="utf-8"
+    )
+    (sessions / "b.session.json").unlink()
+    assert migrated.session_pattern_sets() == {"a": {"p1", "p2"}, "c": {"p1", "p3"}}
+
+    # A database that lost its place in the JSONL is rebuilt, not duplicated
+    with sqlite3.connect(migrated.database_path) as connection:
+        connection.execute("DELETE FROM meta WHERE key = 'history_offset'")
+    assert len(SQLiteKnowledgeStorage(tmp_path).query_history(limit=0)) == 5
+    assert SQLiteKnowledgeStorage(tmp_path).query_history(query="imports") == (
+        legacy.query_history(query="imports")
+    )
@@ -0,0 +1,137 @@
+"""Tests for the persistent content-addressed observation cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.context import RuntimeContext
+from observations.interface import MinimalObservationInterface
+from observations.parallel import ParallelObservationPool
+from storage.observation_cache import ObservationCache
+
+
+def _make_project(root: Path, count: int = 4) -> list[Path]:
+    root.mkdir(parents=True, exist_ok=True)
+    files = []
+    for idx in range(count):
+        path = root / f"module_{idx}.py"
+        path.write_text(f"import os\n\n\ndef func_{idx}():\n    return os\n", encoding="utf-8")
+        files.append(path)
+    return files
+
+
+def _observe(interface: MinimalObservationInterface, cache: ObservationCache, files):
+    observations: list[dict] = []
+    interface._observation_cache = cache
+    try:
+        for obs_type in ("import_sight", "export_sight"):
+            interface._observe_import_export_files(files, obs_type, observations)
+    finally:
+        interface._observation_cache = None
+    return observations
+
+
+def test_cache_get_put_roundtrip(tmp_path: Path) -> None:
+    cache = ObservationCache.for_storage_root(tmp_path)
+    digest = "ab" * 32
+
+    assert cache.get("import_sight", "1.0.0", digest, "a.py") is None
+    stored = cache.put("import_sight", "1.0.0", digest, "a.py", {"file": Path("a.py")})
+    assert stored == {"file": "a.py"}
+
+    # A new cache instance (next run) sees the persisted record
+    reopened = ObservationCache.for_storage_root(tmp_path)
+    assert reopened.get("import_sight", "1.0.0", digest, "a.py") == {"file": "a.py"}
+    assert reopened.get("import_sight", "2.0.0", digest, "a.py") is None
+    assert reopened.get("import_sight", "1.0.0", digest, "b.py") is None
+    assert reopened.stats()["reused"] == 1
+    assert reopened.stats()["reobserved"] == 2
+
+
+def test_identical_content_at_many_paths_gets_one_record_each(tmp_path: Path) -> None:
+    cache = ObservationCache.for_storage_root(tmp_path)
+    digest = "cd" * 32
+
+    for idx in range(5):
+        cache.put("import_sight", "1.0.0", digest, f"pkg{idx}/__init__.py", {"n": idx})
+
+    records = list(cache.cache_dir.rglob("*.json"))
+    assert len(records) == 5
+    assert max(path.stat().st_size for path in records) < 1024
+    for idx in range(5):
+        path = f"pkg{idx}/__init__.py"
+        assert cache.get("import_sight", "1.0.0", digest, path) == {"n": idx}
+
+
+def test_unchanged_files_are_reused(tmp_path: Path) -> None:
+    files = _make_project(tmp_path / "src")
+    interface = MinimalObservationInterface(None)
+
+    first_cache = ObservationCache.for_storage_root(tmp_path / "storage")
+    first = _observe(interface, first_cache, files)
+    assert first_cache.stats()["reused"] == 0
+    assert first_cache.stats()["stored"] == len(files) * 2
+
+    files[0].write_text("import sys\n", encoding="utf-8")
+
+    second_cache = ObservationCache.for_storage_root(tmp_path / "storage")
+    second = _observe(interface, second_cache, files)
+    stats = second_cache.stats()
+    assert stats["reused"] == (len(files) - 1) * 2
+    assert stats["reobserved"] == 2
+
+    # Only the changed file's observations differ
+    uncached: list[dict] = []
+    for obs_type in ("import_sight", "export_sight"):
+        interface._observe_import_export_files(files, obs_type, uncached)
+    assert second == uncached
+    assert second != first
+
+
+def test_observe_directory_reports_reuse(tmp_path: Path) -> None:
+    _make_project(tmp_path / "src")
+
+    class _Request:
+        parameters = {
+            "observation_types": ["import_sight", "export_sight"],
+            "incremental": True,
+            "storage_root": str(tmp_path / "storage"),
+        }
+
+    context = RuntimeContext(
+        investigation_root=tmp_path,
+        constitution_hash="a" * 64,
+        code_version_hash="b" * 64,
+        execution_mode="CLI",
+    )
+    interface = MinimalObservationInterface(context)
+    interface._last_request = _Request()
+
+    first = interface.observe_directory(tmp_path / "src")
+    second = interface.observe_directory(tmp_path / "src")
+
+    assert first["observation_cache"]["reused"] == 0
+    assert second["observation_cache"]["reused"] == first["observation_cache"]["stored"]
+    assert second["observation_cache"]["reobserved"] == 0
+    assert second["observations"] == first["observations"]
+
+
+def test_worker_processes_share_cache_and_report_counters(tmp_path: Path) -> None:
+    files = _make_project(tmp_path / "src", count=5)
+    interface = MinimalObservationInterface(None)
+    warm = ObservationCache.for_storage_root(tmp_path / "storage")
+    expected = _observe(interface, warm, files)
+
+    options = {"observation_cache_dir": str(warm.cache_dir)}
+    observations: list[dict] = []
+    with ParallelObservationPool(
+        None, workers=2, batch_size=2, worker_options=options
+    ) as pool:
+        for obs_type in ("import_sight", "export_sight"):
+            interface._observe_import_export_files(
+                files, obs_type, observations, pool=pool
+            )
+
+    assert observations == expected
+    assert pool.counters["reused"] == len(files) * 2
+    assert pool.counters["reobserved"] == 0
@@ -0,0 +1,79 @@
+"""Tests for process-pool parallel observation."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from observations.interface import MinimalObservationInterface
+from observations.parallel import ParallelObservationPool, resolve_worker_count
+
+
+def _make_project(root: Path, count: int = 12) -> None:
+    for idx in range(count):
+        (root / f"module_{idx:02d}.py").write_text(
+            f"import os\nfrom pathlib import Path\n\n\ndef func_{idx}():\n    return {idx}\n",
+            encoding="utf-8",
+        )
+
+
+def test_resolve_worker_count() -> None:
+    cpus = max(1, os.cpu_count() or 1)
+    assert resolve_worker_count(None) == 1
+    assert resolve_worker_count(1) == 1
+    assert resolve_worker_count(3) == 3
+    assert resolve_worker_count("2") == 2
+    assert resolve_worker_count(0) == cpus
+    assert resolve_worker_count("auto") == cpus
+
+
+def test_parallel_import_export_matches_serial_order(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    interface = MinimalObservationInterface(None)
+    files = interface._iter_code_files(tmp_path)
+
+    serial: list[dict] = []
+    interface._observe_import_export_files(files, "import_sight", serial)
+
+    parallel: list[dict] = []
+    with ParallelObservationPool(None, workers=2, batch_size=3) as pool:
+        interface._observe_import_export_files(
+            files, "import_sight", parallel, pool=pool
+        )
+
+    assert len(serial) == len(files)
+    assert parallel == serial
+    assert [obs["file"] for obs in parallel] == [str(path) for path in files]
+
+
+def test_parallel_single_file_observation_preserves_order(tmp_path: Path) -> None:
+    _make_project(tmp_path, count=7)
+    interface = MinimalObservationInterface(None)
+    files = interface._iter_code_files(tmp_path)
+    types = ["import_sight", "export_sight"]
+
+    with ParallelObservationPool(None, workers=2, batch_size=2) as pool:
+        results = list(
+            pool.map_ordered("_observe_single_file", files, types, tmp_path)
+        )
+
+    assert [path for path, _ in results] == files
+    for path, observations in results:
+        assert observations == interface._observe_single_file(path, types, tmp_path)
+
+
+def test_configured_eye_is_built_once_per_root(tmp_path: Path) -> None:
+    _make_project(tmp_path, count=3)
+    interface = MinimalObservationInterface(None)
+    builds: list[str] = []
+    build = interface._build_configured_eye
+
+    def counting_build(obs_type: str, directory_path: Path):
+        builds.append(obs_type)
+        return build(obs_type, directory_path)
+
+    interface._build_configured_eye = counting_build  # type: ignore[method-assign]
+    for path in interface._iter_code_files(tmp_path):
+        interface._observe_eye_file(path, "boundary_sight", tmp_path)
+
+    assert builds == ["boundary_sight"]
@@ -0,0 +1,117 @@
+"""Tests for the shared per-run source/AST cache used by eyes."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from observations.eyes.export_sight import ExportSight
+from observations.eyes.import_sight import ImportSight
+from observations.eyes.parse_cache import (
+    ParseCache,
+    get_active_parse_cache,
+    parse_cache_scope,
+    parse_source,
+    read_source_text,
+)
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_import_and_export_sight_share_one_read_and_parse(tmp_path: Path) -> None:
+    module = _write(tmp_path / "mod.py", "import os\n\n\ndef public():\n    return os\n")
+
+    with parse_cache_scope() as cache:
+        imports = ImportSight().observe(module)
+        exports = ExportSight().observe(module)
+
+    assert [s.module for s in imports.raw_payload.statements] == ["os"]
+    assert "public" in [d.name for d in exports.raw_payload.definitions]
+
+    stats = cache.stats()
+    assert stats["source_misses"] == 1
+    assert stats["source_hits"] >= 1
+    assert stats["parse_misses"] == 1
+    assert stats["parse_hits"] == 1
+
+
+def test_cache_rereads_when_file_changes(tmp_path: Path) -> None:
+    module = _write(tmp_path / "mod.py", "x = 1\n")
+    cache = ParseCache()
+
+    assert cache.read_text(module) == "x = 1\n"
+    assert cache.read_text(module) == "x = 1\n"
+
+    _write(module, "x = 22\n")
+    stat = module.stat()
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.read_text(module) == "x = 22\n"
+    assert cache.source_hits == 1
+    assert cache.source_misses == 2
+
+
+def test_cache_is_bounded_lru(tmp_path: Path) -> None:
+    cache = ParseCache(max_sources=2, max_trees=2)
+    files = [_write(tmp_path / f"m{i}.py", f"value = {i}\n") for i in range(3)]
+
+    for path in files:
+        cache.parse(cache.read_text(path), path)
+
+    stats = cache.stats()
+    assert stats["cached_sources"] == 2
+    assert stats["cached_trees"] == 2
+    assert stats["evictions"] == 2
+
+    # Oldest entry was evicted, so reading it again is a miss
+    cache.read_text(files[0])
+    assert cache.source_misses == 4
+
+
+def test_syntax_errors_are_cached_and_reraised() -> None:
+    cache = ParseCache()
+    with pytest.raises(SyntaxError):
+        cache.parse("def broken(:\n", "broken.py")
+    with pytest.raises(SyntaxError):
+        cache.parse("def broken(:\n", "broken.py")
+    assert cache.tree_misses == 1
+    assert cache.tree_hits == 1
+
+
+def test_helpers_bypass_cache_outside_scope(tmp_path: Path) -> None:
+    module = _write(tmp_path / "mod.py", "a = 1\r\nb = 2\r\n")
+
+    assert get_active_parse_cache() is None
+    uncached = read_source_text(module)
+    with parse_cache_scope() as cache:
+        assert get_active_parse_cache() is cache
+        assert read_source_text(module) == uncached
+        parse_source(uncached, module)
+        with parse_cache_scope() as nested:
+            assert nested is cache
+    assert get_active_parse_cache() is None
+
+
+def test_batch_observation_reuses_parses_across_eyes(tmp_path: Path) -> None:
+    from observations.interface import MinimalObservationInterface
+
+    for idx in range(5):
+        _write(tmp_path / f"mod_{idx}.py", f"import os\n\n\ndef f{idx}():\n    pass\n")
+    interface = MinimalObservationInterface(None)
+    files = interface._iter_code_files(tmp_path)
+    types = ["import_sight", "export_sight"]
+
+    # Tiny cache: a type-major pass would evict every tree before reuse
+    with parse_cache_scope(ParseCache(max_sources=1, max_trees=1)) as cache:
+        grouped = interface._observe_import_export_by_file(files, types)
+
+    assert cache.stats()["parse_hits"] == len(files)
+    for obs_type in types:
+        expected: list[dict] = []
+        interface._observe_import_export_files(files, obs_type, expected)
+        assert grouped[obs_type][0] == expected
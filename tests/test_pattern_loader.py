@@ -15,3 +15,152 @@ def test_builtin_pattern_counts() -> None:
     for pattern in performance + style + architecture:
         assert pattern.id
         assert pattern.name
+
+
+def test_required_literals_cover_alternatives() -> None:
+    from patterns.prefilter import required_literals
+
+    assert required_literals(r"for\s+.*:\s*\n\s+.*re\.compile\(") == {"re.compile("}
+    assert required_literals(r"(password|passwd|pwd)\s*[=:]") == {
+        "password",
+        "passwd",
+        "pwd",
+    }
+    assert required_literals(r"(?i)\bSELECT\b.+\bFROM\b") == {"select"}
+    assert required_literals(r"^.{121,}$") is None
+    assert required_literals(r"\s+$") is None
+
+
+def test_prefiltered_scan_matches_unfiltered_scan(tmp_path) -> None:
+    from patterns.loader import PatternDefinition, PatternScanner
+
+    source = tmp_path / "sample.py"
+    source.write_text(
+        "import os\n"
+        "API_KEY = 'abc'\n"
+        "def f(x=[]):\n"
+        "    for i in range(len(x)):\n"
+        "        print(i)   \n"
+        "    Password = \"hunter2\"\n",
+        encoding="utf-8",
+    )
+    patterns = [
+        PatternDefinition(id="print", name="print", pattern=r"\bprint\("),
+        PatternDefinition(id="pw", name="pw", pattern=r"(?i)(password)\s*=\s*[\"']"),
+        PatternDefinition(id="key", name="key", pattern=r"(api_key|apikey)\s*="),
+        PatternDefinition(id="ws", name="ws", pattern=r"\s+$"),
+        PatternDefinition(id="loop", name="loop", pattern=r"for\s+.*:\s*\n\s+.*\bprint\("),
+        PatternDefinition(id="none", name="none", pattern=r"deepcopy\("),
+    ]
+
+    matches = PatternScanner(max_workers=1).scan(source, patterns).matches
+    found = sorted((m.pattern_id, m.line_number, m.matched_text) for m in matches)
+
+    assert found == [
+        ("loop", 4, "for i in range(len(x)):\n        print("),
+        ("print", 5, "print("),
+        ("pw", 6, 'Password = "'),
+        ("ws", 5, "   "),
+    ]
+
+
+def test_dot_stays_line_local_in_multiline_patterns(tmp_path) -> None:
+    from patterns.loader import PatternDefinition, PatternScanner
+
+    source = tmp_path / "sample.py"
+    source.write_text("for x in y:\n    pass\nz = sorted(x)\n", encoding="utf-8")
+    pattern = PatternDefinition(
+        id="sorted_in_loop", name="sorted", pattern=r"for\s+.*:\s*\n\s+.*\bsorted\("
+    )
+
+    assert PatternScanner(max_workers=1).scan(source, [pattern]).matches == []
+
+
+def test_pattern_over_budget_is_recorded_and_skipped(tmp_path) -> None:
+    from patterns.loader import PatternDefinition, PatternScanner
+
+    (tmp_path / "slow.py").write_text("a" * 40 + "b\n", encoding="utf-8")
+    patterns = [
+        PatternDefinition(id="backtrack", name="backtrack", pattern=r"(a+)+$"),
+        PatternDefinition(id="b", name="b", pattern=r"b$"),
+    ]
+
+    result = PatternScanner(max_workers=1, pattern_timeout=0.2).scan(
+        tmp_path, patterns, glob="*.py"
+    )
+
+    assert [m.pattern_id for m in result.matches] == ["b"]
+    assert [(t.pattern_id, t.file_path.name) for t in result.timeouts] == [
+        ("backtrack", "slow.py")
+    ]
+
+
+def test_process_scan_matches_inline_scan(tmp_path) -> None:
+    from patterns.loader import PatternDefinition, PatternScanner
+
+    for index in range(5):
+        (tmp_path / f"m{index}.py").write_text(
+            f"print({index})\nx = eval(y)\n" * (index + 1), encoding="utf-8"
+        )
+    patterns = [
+        PatternDefinition(id="print", name="print", pattern=r"\bprint\("),
+        PatternDefinition(id="eval", name="eval", pattern=r"\beval\("),
+    ]
+
+    def found(scanner):
+        result = scanner.scan(tmp_path, patterns, glob="*.py")
+        return result.files_scanned, [
+            (m.file_path.name, m.line_number, m.pattern_id) for m in result.matches
+        ]
+
+    inline = found(PatternScanner(max_workers=1))
+    assert found(PatternScanner(processes=2, batch_size=2)) == inline
+    assert len(inline[1]) == 30
+
+
+def test_match_cache_reuses_unchanged_files(tmp_path) -> None:
+    from patterns.loader import PatternDefinition, PatternScanner
+    from storage.pattern_cache import PatternMatchCache
+
+    project = tmp_path / "project"
+    project.mkdir()
+    for index in range(3):
+        (project / f"m{index}.py").write_text(
+            f"print({index})\r\nx = eval(y)\n", encoding="utf-8"
+        )
+    patterns = [
+        PatternDefinition(id="print", name="print", pattern=r"\bprint\("),
+        PatternDefinition(
+            id="eval", name="eval", pattern=r"\beval\(", message="{{match}} at {{line}}"
+        ),
+    ]
+
+    def scan(scanner, scan_patterns=patterns):
+        result = scanner.scan(project, scan_patterns, glob="*.py")
+        found = sorted(
+            (m.file_path.name, m.line_number, m.pattern_id, m.message, m.context_after)
+            for m in result.matches
+        )
+        return found, result.files_reused, result.files_rescanned
+
+    expected, _, _ = scan(PatternScanner(max_workers=1, context_lines=1))
+    cache = PatternMatchCache.for_storage_root(tmp_path / "storage")
+
+    def cached_scanner(**kwargs):
+        return PatternScanner(context_lines=1, cache=cache, **kwargs)
+
+    assert scan(cached_scanner(max_workers=1)) == (expected, 0, 3)
+    assert scan(cached_scanner(max_workers=1)) == (expected, 3, 0)
+
+    # An edited file is rescanned; the others come from the cache
+    (project / "m1.py").write_text("print(1)\n", encoding="utf-8")
+    found, reused, rescanned = scan(cached_scanner(processes=2, batch_size=1))
+    assert (reused, rescanned) == (2, 1)
+    assert [row for row in found if row[0] == "m1.py"] == [
+        ("m1.py", 1, "print", "print detected", [])
+    ]
+
+    # An edited pattern is rerun on every file
+    edited = [patterns[0], PatternDefinition(id="eval", name="eval", pattern=r"eval")]
+    assert scan(cached_scanner(max_workers=1), edited)[1:] == (0, 3)
+    assert scan(cached_scanner(max_workers=1), edited)[1:] == (3, 0)
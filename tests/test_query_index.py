@@ -0,0 +1,159 @@
+"""Tests for the per-session query index sidecar."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from bridge.entry.cli import CodeMarshalCLI
+from storage.investigation_storage import InvestigationStorage
+from storage.query_index import QueryIndex
+
+
+def _persist_streamed_session(storage: InvestigationStorage, session_id: str) -> dict:
+    with storage.create_streaming_observation(session_id) as stream:
+        for idx in range(6):
+            file_path = f"pkg/mod_{idx}.py"
+            stream.write_file_observation(
+                file_path,
+                [
+                    {
+                        "type": "import_sight",
+                        "file": file_path,
+                        "language": "python",
+                        "statements": [{"module": f"pkg.mod_{(idx + 1) % 6}", "names": []}],
+                    },
+                    {
+                        "type": "export_sight",
+                        "file": file_path,
+                        "language": "python",
+                        "result": {"exports": [{"name": f"func_{idx}"}]},
+                    },
+                ],
+            )
+    session_data = {"id": session_id, "observation_ids": [stream.manifest_id]}
+    storage.save_session(session_data)
+    return session_data
+
+
+def test_index_filters_by_type_and_exposes_edges(tmp_path: Path) -> None:
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    session_data = _persist_streamed_session(storage, "session-a")
+
+    index = storage.ensure_query_index(session_data)
+
+    imports = index.observations({"import_sight"})
+    assert [obs["file"] for obs in imports] == [f"pkg/mod_{i}.py" for i in range(6)]
+    assert all(obs["type"] == "import_sight" for obs in imports)
+    assert len(index.observations()) == 12
+
+    assert index.import_edges(module="pkg.mod_0") == [("pkg/mod_5.py", "pkg.mod_0", [])]
+    assert ("pkg/mod_3.py", "func_3", None) in index.export_names()
+    assert {f["path"] for f in index.files()} == {f"pkg/mod_{i}.py" for i in range(6)}
+    assert index.counts()["import_edges"] == 6
+
+
+def test_index_is_reused_until_observation_ids_change(tmp_path: Path) -> None:
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    session_data = _persist_streamed_session(storage, "session-b")
+
+    first = storage.ensure_query_index(session_data)
+    mtime = first.path.stat().st_mtime_ns
+    assert storage.ensure_query_index(session_data).path.stat().st_mtime_ns == mtime
+
+    changed = dict(session_data, observation_ids=[])
+    rebuilt = storage.ensure_query_index(changed)
+    assert rebuilt.observations() == []
+    assert not QueryIndex(rebuilt.path).is_current("other-key")
+
+
+def test_connection_query_uses_index_and_matches_full_load(tmp_path: Path) -> None:
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    session_data = _persist_streamed_session(storage, "session-c")
+    cli = CodeMarshalCLI()
+
+    indexed = cli._load_query_observations(storage, session_data, "connections")
+    assert {obs["type"] for obs in indexed} == {"import_sight"}
+
+    full = cli._load_observations(storage, session_data)
+    question = "Show circular dependencies"
+    assert cli._generate_answer(question, "connections", indexed) == cli._generate_answer(
+        question, "connections", full
+    )
+
+
+def test_persisted_graph_answers_without_loading_observations(tmp_path: Path) -> None:
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    session_data = _persist_streamed_session(storage, "session-g")
+    cli = CodeMarshalCLI()
+    question = "Show circular dependencies"
+
+    # No sidecar yet: observations are needed and the graph is built from them
+    assert cli._analyzer_options(storage, session_data, "connections") == {}
+    observations = cli._load_query_observations(storage, session_data, "connections")
+    built = cli._analyzer_options(storage, session_data, "connections", observations)
+    expected = cli._generate_answer(question, "connections", observations, built)
+
+    persisted = cli._analyzer_options(storage, session_data, "connections")
+    assert "dependency_graph" in persisted
+    assert not cli._needs_observations(question, "connections", persisted)
+    assert cli._needs_observations("What depends on pkg.mod_0?", "connections", persisted)
+    assert cli._generate_answer(question, "connections", [], persisted) == expected
+
+
+def test_compact_reads_rebuild_import_and_listing_shapes(tmp_path: Path) -> None:
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    session_data = _persist_streamed_session(storage, "session-d")
+
+    index = storage.ensure_query_index(session_data)
+    full = index.observations({"import_sight", "export_sight"})
+    compact = index.observations({"import_sight", "export_sight"}, compact=True)
+
+    assert [obs["type"] for obs in compact] == [obs["type"] for obs in full]
+    for loaded, original in zip(compact, full):
+        if original["type"] == "import_sight":
+            assert loaded["file"] == original["file"]
+            assert loaded["statements"] == original["statements"]
+        else:
+            assert loaded == original
+
+
+def test_index_is_rebuilt_when_a_stream_grows(tmp_path: Path) -> None:
+    import json
+
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    session_data = _persist_streamed_session(storage, "session-e")
+    manifest_path = (
+        storage.base_path / "observations" / f"{session_data['observation_ids'][0]}.manifest.json"
+    )
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    # Interrupted run: only the first two records were committed
+    partial = dict(manifest, files_processed=2, segments=dict(manifest["segments"], records=2))
+    manifest_path.write_text(json.dumps(partial), encoding="utf-8")
+    assert len(storage.ensure_query_index(session_data).observations()) == 4
+
+    # Resumed run finished the stream under the same manifest ID
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+    assert len(storage.ensure_query_index(session_data).observations()) == 12
+
+
+def test_full_load_skips_only_the_bad_payload(tmp_path: Path) -> None:
+    import json
+
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    observations_dir = storage.base_path / "observations"
+    payloads = {
+        "obs_good_1": {"data": {"observations": [{"type": "import_sight", "file": "a.py"}]}},
+        "obs_bad": {"data": {"observations": 5}},
+        "obs_good_2": {"observations": [{"type": "export_sight", "file": "b.py"}]},
+    }
+    for obs_id, payload in payloads.items():
+        (observations_dir / f"{obs_id}.observation.json").write_text(
+            json.dumps(payload), encoding="utf-8"
+        )
+
+    loaded = CodeMarshalCLI()._load_observations(
+        storage, {"id": "s", "observation_ids": list(payloads)}
+    )
+
+    assert [obs["file"] for obs in loaded] == ["a.py", "b.py"]
@@ -0,0 +1,131 @@
+"""Tests for the persistent trigram search index."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import storage.search_index as search_index
+from bridge.commands.search import SearchCommand
+from storage.search_index import IndexUpdate, TrigramIndex
+
+
+def _tree(root: Path) -> None:
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "alpha.py").write_text("def alpha():\n    return 1\n", encoding="utf-8")
+    (root / "pkg" / "beta.py").write_text("def beta():\n    return 2\n", encoding="utf-8")
+    (root / "notes.txt").write_text("Straße and Kelvin\r\n", encoding="utf-8")
+
+
+def _names(paths: list[Path] | None) -> list[str] | None:
+    return None if paths is None else [path.name for path in paths]
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_candidates_narrow_by_literal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, numpy: bool
+) -> None:
+    if numpy and not search_index.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(search_index, "NUMPY_AVAILABLE", numpy)
+    root = tmp_path / "repo"
+    _tree(root)
+    index = TrigramIndex.for_root(tmp_path / "storage", root)
+
+    assert index.update() == IndexUpdate(indexed=3)
+    assert _names(index.candidates({"alpha"})) == ["alpha.py"]
+    assert _names(index.candidates({"ALPHA", "beta"})) == ["alpha.py", "beta.py"]
+    assert _names(index.candidates({"return"}, root / "pkg")) == ["alpha.py", "beta.py"]
+    assert _names(index.candidates({"straße"})) == ["notes.txt"]
+    # The Kelvin sign is indexed as "k", as IGNORECASE treats it
+    assert _names(index.candidates({"kelvin"})) == ["notes.txt"]
+    assert index.candidates({"gamma"}) == []
+    # Too short to narrow anything
+    assert index.candidates({"ab"}) is None
+
+
+def test_update_is_incremental(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    _tree(root)
+    index = TrigramIndex.for_root(tmp_path / "storage", root)
+    index.update()
+
+    assert index.update() == IndexUpdate(unchanged=3)
+
+    alpha = root / "pkg" / "alpha.py"
+    stat = alpha.stat()
+    os.utime(alpha, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    (root / "pkg" / "beta.py").write_text("def gamma():\n    pass\n", encoding="utf-8")
+    (root / "notes.txt").unlink()
+    (root / "new.py").write_text("beta = 3\n", encoding="utf-8")
+
+    assert index.update() == IndexUpdate(indexed=2, touched=1, removed=1)
+    assert _names(index.candidates({"beta"})) == ["new.py"]
+    assert _names(index.candidates({"gamma"})) == ["beta.py"]
+    assert index.candidates({"kelvin"}) == []
+    assert index.stats()["files"] == 3
+
+    # Reopened by path lookup from a subdirectory
+    found = TrigramIndex.find(tmp_path / "storage", root / "pkg")
+    assert found is not None and found.root == root.resolve()
+    assert [report["root"] for report in TrigramIndex.list_indexes(tmp_path / "storage")] == [
+        str(root.resolve())
+    ]
+
+
+def test_compaction_drops_dead_versions(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(search_index, "MAX_SEGMENTS", 2)
+    root = tmp_path / "repo"
+    root.mkdir()
+    target = root / "f.py"
+    index = TrigramIndex.for_root(tmp_path / "storage", root)
+    for i in range(4):
+        target.write_text(f"value_{i} = {i}\n" * (i + 1), encoding="utf-8")
+        index.update()
+
+    assert index.stats()["segments"] <= 2
+    assert _names(index.candidates({"value_3"})) == ["f.py"]
+    assert index.candidates({"value_1"}) == []
+
+
+def test_search_uses_index_with_same_results(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    _tree(root)
+    storage_root = tmp_path / "storage"
+    TrigramIndex.for_root(storage_root, root).update()
+
+    cmd = SearchCommand()
+    cmd._ripgrep_available = False
+    searched: list[Path] = []
+    search_file = cmd._search_file
+
+    def spy(file_path: Path, *args, **kwargs):
+        searched.append(file_path)
+        return search_file(file_path, *args, **kwargs)
+
+    cmd._search_file = spy  # type: ignore[method-assign]
+
+    def run(query: str, **kwargs) -> list[tuple[str, int]]:
+        result = cmd.execute(query=query, path=root, output_format="count", **kwargs)
+        assert result.success
+        return [(r.file_path.name, r.line_number) for r in result.results.results]
+
+    for query, kwargs in [
+        (r"def (alpha|beta)\(", {}),
+        ("RETURN", {"case_insensitive": True}),
+        ("alpha", {"glob": "*.py"}),
+        ("Straße", {}),
+    ]:
+        searched.clear()
+        indexed = run(query, storage_root=storage_root, **kwargs)
+        narrowed = len(searched)
+        searched.clear()
+        assert indexed == sorted(run(query, **kwargs))  # path order, not walk order
+        assert narrowed < len(searched)
+
+    # Files changed since the index was built are picked up before searching
+    (root / "pkg" / "alpha.py").write_text("zeta = 1\n", encoding="utf-8")
+    assert run("zeta", storage_root=storage_root) == [("alpha.py", 1)]
+    assert run("alpha", storage_root=storage_root) == []
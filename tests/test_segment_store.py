@@ -0,0 +1,150 @@
+"""Tests for packed segment storage of streaming observations."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from storage.investigation_storage import InvestigationStorage
+from storage.segment_store import (
+    SegmentReader,
+    SegmentWriter,
+    count_records,
+    record_key,
+    segment_path,
+)
+
+
+def _obs_id(idx: int) -> str:
+    return f"obs_{idx:016x}"
+
+
+def test_roundtrip_rollover_and_index(tmp_path: Path) -> None:
+    with SegmentWriter(tmp_path, "stream", max_segment_bytes=256) as writer:
+        for idx in range(20):
+            writer.append(_obs_id(idx), {"id": _obs_id(idx), "value": "x" * 40})
+
+    reader = SegmentReader(tmp_path, "stream")
+    records = list(reader.iter_records())
+    assert [r["id"] for r in records] == [_obs_id(i) for i in range(20)]
+    assert reader.errors == []
+    assert len(writer.segment_paths()) > 1
+    assert count_records(tmp_path) == 20
+
+    index = reader.load_index()
+    assert reader.read(index[record_key(_obs_id(13))])["id"] == _obs_id(13)
+
+
+def test_torn_tail_is_skipped(tmp_path: Path) -> None:
+    with SegmentWriter(tmp_path, "stream") as writer:
+        for idx in range(3):
+            writer.append(_obs_id(idx), {"id": _obs_id(idx)})
+
+    path = segment_path(tmp_path, "stream", 0)
+    path.write_bytes(path.read_bytes()[:-3])
+
+    reader = SegmentReader(tmp_path, "stream")
+    assert [r["id"] for r in reader.iter_records()] == [_obs_id(0), _obs_id(1)]
+    assert reader.errors and "torn" in reader.errors[0]
+
+
+def test_truncate_to_checkpoint_discards_uncommitted_records(tmp_path: Path) -> None:
+    writer = SegmentWriter(tmp_path, "stream", max_segment_bytes=128, fsync_interval=None)
+    for idx in range(3):
+        writer.append(_obs_id(idx), {"id": _obs_id(idx)})
+    position = writer.checkpoint()
+    for idx in range(3, 8):
+        writer.append(_obs_id(idx), {"id": _obs_id(idx)})
+    writer.close()
+
+    resumed = SegmentWriter(tmp_path, "stream", max_segment_bytes=128)
+    resumed.open(position)
+    resumed.append(_obs_id(99), {"id": _obs_id(99)})
+    resumed.close()
+
+    ids = [r["id"] for r in SegmentReader(tmp_path, "stream").iter_records()]
+    assert ids == [_obs_id(0), _obs_id(1), _obs_id(2), _obs_id(99)]
+    assert count_records(tmp_path) == 4
+
+
+def test_streaming_observation_segments_are_loadable(tmp_path: Path) -> None:
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+
+    with storage.create_streaming_observation("session-1") as stream:
+        for idx in range(5):
+            stream.write_file_observation(
+                f"src/mod_{idx}.py", [{"type": "import_sight", "file": f"mod_{idx}.py"}]
+            )
+
+    observations_dir = storage.base_path / "observations"
+    assert not list(observations_dir.glob("*.observation.json"))
+
+    by_manifest = list(storage.iter_observation_payloads([stream.manifest_id]))
+    assert [obs_id for obs_id, _ in by_manifest] == stream.observation_ids
+
+    by_file_ids = list(storage.iter_observation_payloads(stream.observation_ids))
+    assert by_file_ids == by_manifest
+    assert by_file_ids[2][1]["observations"][0]["file"] == "mod_2.py"
+
+
+def test_legacy_file_format_still_readable(tmp_path: Path) -> None:
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+
+    with storage.create_streaming_observation("session-2", storage_format="files") as stream:
+        stream.write_file_observation("a.py", [{"type": "export_sight", "file": "a.py"}])
+
+    observations_dir = storage.base_path / "observations"
+    assert len(list(observations_dir.glob("*.observation.json"))) == 1
+
+    payloads = list(storage.iter_observation_payloads([stream.manifest_id]))
+    assert [obs_id for obs_id, _ in payloads] == stream.observation_ids
+
+
+def test_session_stream_is_resolved_without_reading_other_indexes(
+    tmp_path: Path, monkeypatch
+) -> None:
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    segments_dir = storage.base_path / "observations" / "segments"
+    for name in ("obs_stream_1", "obs_stream_2", "obs_stream_3"):
+        with SegmentWriter(segments_dir, name) as writer:
+            for idx in range(3):
+                record_id = _obs_id(int(name[-1]) * 100 + idx)
+                writer.append(record_id, {"id": record_id})
+
+    loaded: list[str] = []
+    load_index = SegmentReader.load_index
+
+    def counting_load_index(self):
+        loaded.append(self.stream_id)
+        return load_index(self)
+
+    monkeypatch.setattr(SegmentReader, "load_index", counting_load_index)
+    wanted = [_obs_id(100 + idx) for idx in range(3)]
+
+    payloads = list(storage.iter_observation_payloads(wanted, "obs_stream_1"))
+
+    assert [obs_id for obs_id, _ in payloads] == wanted
+    assert loaded == ["obs_stream_1"]
+
+
+def test_integrity_checks_and_stats_cover_segments(tmp_path: Path) -> None:
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    with storage.create_streaming_observation("session-3") as stream:
+        for idx in range(4):
+            stream.write_file_observation(f"m{idx}.py", [{"type": "import_sight"}])
+
+    writer = storage.writer
+    assert writer.verify_all_observations() == []
+    stats = writer.get_storage_stats()
+    assert stats["segment_records"] == 4
+    assert stats["total_observations"] == 4
+    assert stats["total_size_bytes"] > 0
+
+    # Flip one payload byte of the last record: its CRC no longer matches
+    path = segment_path(storage.base_path / "observations" / "segments", stream.manifest_id, 0)
+    data = bytearray(path.read_bytes())
+    data[-2] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    evidence = writer.verify_all_observations()
+    assert [e.corruption_type.name for e in evidence] == ["HASH_MISMATCH"]
+    assert evidence[0].path == path
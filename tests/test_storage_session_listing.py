@@ -47,3 +47,68 @@ def test_delete_session_metadata_removes_file(tmp_path) -> None:
     assert storage.load_session_metadata("session-delete") is None
     assert storage.delete_session_metadata("session-delete") is False
 
+
+
+def test_session_catalog_tracks_saves_and_external_files(tmp_path) -> None:
+    storage = InvestigationStorage(base_path=tmp_path)
+    storage.save_session({"id": "investigation_1_abc", "created_at": "2026-01-01T00:00:00"})
+
+    # Written by another tool, with an ID that differs from its file name
+    external = tmp_path / "sessions" / "imported.session.json"
+    external.write_text(
+        '{"id": "ext-1", "modified_at": "2030-01-01T00:00:00"}', encoding="utf-8"
+    )
+
+    assert [s["id"] for s in storage.list_sessions(limit=10)] == [
+        "ext-1",
+        "investigation_1_abc",
+    ]
+    assert storage.load_session_metadata("ext-1")["id"] == "ext-1"
+    assert storage.find_session("1_ab")["id"] == "investigation_1_abc"
+    assert storage.find_session("missing") is None
+
+    external.unlink()
+    assert [s["id"] for s in storage.list_sessions(limit=10)] == ["investigation_1_abc"]
+
+
+def test_session_catalog_is_rebuilt_when_missing_or_corrupt(tmp_path) -> None:
+    storage = InvestigationStorage(base_path=tmp_path)
+    for idx in range(3):
+        storage.save_session({"id": f"session-{idx}"})
+
+    catalog_path = storage.session_catalog.path
+    catalog_path.unlink()
+    assert len(storage.list_sessions(limit=0)) == 3
+
+    catalog_path.write_bytes(b"not a database")
+    assert storage.rebuild_session_catalog() == 3
+    assert {s["id"] for s in storage.list_sessions(limit=0)} == {
+        "session-0",
+        "session-1",
+        "session-2",
+    }
+
+
+def test_lookups_fall_back_to_directory_scan_when_catalog_is_locked(
+    tmp_path, monkeypatch
+) -> None:
+    import sqlite3
+
+    storage = InvestigationStorage(base_path=tmp_path)
+    older = datetime.now(UTC) - timedelta(days=1)
+    storage.save_session({"id": "run-old", "modified_at": older.isoformat()})
+    storage.save_session({"id": "run-new", "modified_at": datetime.now(UTC).isoformat()})
+    (tmp_path / "sessions" / "renamed.session.json").write_text(
+        '{"id": "uuid-1", "modified_at": "2000-01-01T00:00:00"}', encoding="utf-8"
+    )
+
+    def locked(*_args, **_kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    for method in ("get", "find", "recent"):
+        monkeypatch.setattr(storage.session_catalog, method, locked)
+
+    assert [s["id"] for s in storage.list_sessions(limit=2)] == ["run-new", "run-old"]
+    assert storage.find_session("run")["id"] == "run-new"
+    assert storage.load_session_metadata("uuid-1")["id"] == "uuid-1"
+    assert storage.load_session_metadata("missing") is None
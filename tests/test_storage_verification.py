@@ -0,0 +1,158 @@
+"""Tests for the parallel, resumable storage verifier."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bridge.commands.repair import RepairCommand
+from storage.corruption import CorruptionEvidence, CorruptionMarker, CorruptionType
+from storage.investigation_storage import InvestigationStorage
+from storage.segment_store import INDEX_ENTRY, index_path, segment_path
+from storage.verification import StorageVerifier, VerificationTier, list_units
+
+
+def _storage(tmp_path: Path, count: int = 8) -> InvestigationStorage:
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    for idx in range(count):
+        storage.writer.write_observation(
+            {"type": "file_sight", "path": f"m{idx}.py"}, "session-1", f"obs_{idx:03d}"
+        )
+    return storage
+
+
+def _obs_path(storage: InvestigationStorage, idx: int) -> Path:
+    return storage.base_path / "observations" / f"obs_{idx:03d}.observation.json"
+
+
+def _damage(storage: InvestigationStorage) -> None:
+    # Truncated: caught by the trailer check
+    path = _obs_path(storage, 1)
+    path.write_bytes(path.read_bytes()[:-20])
+    # Empty file
+    _obs_path(storage, 3).write_bytes(b"")
+    # Edited value: only a checksum catches it
+    path = _obs_path(storage, 5)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["path"] = "edited.py"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    # Explicit corruption marker
+    CorruptionMarker.create_marker(
+        _obs_path(storage, 6),
+        CorruptionEvidence(_obs_path(storage, 6), CorruptionType.SIZE_MISMATCH),
+    )
+
+
+def _found(evidence: list[CorruptionEvidence]) -> list[tuple[str, str]]:
+    return [(e.path.name[:7], e.corruption_type.name) for e in evidence]
+
+
+def test_quick_tier_checks_edges_and_full_tier_checksums(tmp_path: Path) -> None:
+    storage = _storage(tmp_path)
+    assert storage.writer.verify_all_observations() == []
+    _damage(storage)
+
+    quick = StorageVerifier(storage.base_path, tier="quick").run()
+    assert _found(quick.evidence) == [
+        ("obs_001", "PARTIAL_WRITE"),
+        ("obs_003", "PARTIAL_WRITE"),
+        ("obs_006", "CORRUPTION_MARKER"),
+    ]
+
+    full = storage.writer.verify_all_observations()
+    assert _found(full) == [
+        ("obs_001", "PARTIAL_WRITE"),
+        ("obs_003", "PARTIAL_WRITE"),
+        ("obs_005", "HASH_MISMATCH"),
+        ("obs_006", "CORRUPTION_MARKER"),
+    ]
+
+    report = storage.verify_storage_integrity(tier="quick")
+    assert report["corruption_count"] == 3
+    assert report["verification"]["tier"] == "quick"
+    assert report["verification"]["checked"] == 8
+
+
+def test_interrupted_run_resumes_from_checkpoint(tmp_path: Path) -> None:
+    storage = _storage(tmp_path, count=10)
+    _damage(storage)
+    verifier = StorageVerifier(storage.base_path, batch_size=3)
+    seen = []
+
+    def interrupt(progress) -> None:
+        seen.append(progress)
+        if progress.checked >= 6:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        verifier.run(progress=interrupt)
+
+    assert [p.checked for p in seen] == [3, 6]
+    checkpoint = verifier.load_checkpoint()
+    assert checkpoint["last_unit"] == "obs_005.observation.json"
+    assert checkpoint["checked"] == 6
+
+    # A quick run does not pick up the full run's position
+    assert StorageVerifier(storage.base_path, tier="quick").load_checkpoint() is None
+
+    resumed = verifier.run(progress=seen.append)
+    assert resumed.resumed_from == 6
+    assert [p.checked for p in seen[2:]] == [9, 10]
+    assert resumed.complete and resumed.checked == 10
+    assert _found(resumed.evidence) == _found(
+        StorageVerifier(storage.base_path).run(resume=False).evidence
+    )
+    assert not verifier.checkpoint_path.exists()
+
+
+def test_worker_processes_match_serial_order(tmp_path: Path) -> None:
+    storage = _storage(tmp_path, count=12)
+    _damage(storage)
+
+    serial = StorageVerifier(storage.base_path, workers=1, batch_size=2).run()
+    parallel = StorageVerifier(storage.base_path, workers=2, batch_size=2).run()
+
+    assert parallel.workers == 2
+    assert _found(parallel.evidence) == _found(serial.evidence)
+
+
+def test_quick_tier_checks_segment_streams(tmp_path: Path) -> None:
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    with storage.create_streaming_observation("session-2") as stream:
+        for idx in range(4):
+            stream.write_file_observation(f"m{idx}.py", [{"type": "import_sight"}])
+    segments_dir = storage.base_path / "observations" / "segments"
+    units = list_units(storage.base_path / "observations")
+    assert [unit.key for unit in units] == [f"segments/{stream.manifest_id}"]
+
+    quick = StorageVerifier(storage.base_path, tier=VerificationTier.QUICK)
+    assert quick.run().evidence == []
+
+    # Lose the tail of the last record and half an index entry
+    seg = segment_path(segments_dir, stream.manifest_id, 0)
+    seg.write_bytes(seg.read_bytes()[:-5])
+    index = index_path(segments_dir, stream.manifest_id)
+    index.write_bytes(index.read_bytes() + b"\x00" * (INDEX_ENTRY.size // 2))
+
+    found = quick.run().evidence
+    assert [(e.path.name, e.corruption_type.name) for e in found] == [
+        (index.name, "PARTIAL_WRITE"),
+        (seg.name, "PARTIAL_WRITE"),
+    ]
+    full = storage.writer.verify_all_observations()
+    assert [e.corruption_type.name for e in full] == ["PARTIAL_WRITE"]
+
+
+def test_repair_verifies_observations_with_the_verifier(tmp_path: Path) -> None:
+    storage = _storage(tmp_path / ".codemarshal", count=4)
+    assert storage.base_path == tmp_path / ".codemarshal" / "storage"
+    _obs_path(storage, 2).write_bytes(b"")
+
+    report = RepairCommand()._repair_storage(tmp_path, verbose=False, quick=True)
+
+    assert not report["valid"]
+    assert report["verification"]["tier"] == "quick"
+    assert report["verification"]["checked"] == 4
+    assert any("obs_002" in error for error in report["errors"])
@@ -0,0 +1,196 @@
+"""Tests for exporters that stream observations to a file handle."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from bridge.entry.cli import CodeMarshalCLI
+from bridge.integration.export_formats import get_exporter, list_supported_formats
+from bridge.integration.streaming_export import (
+    ExportStats,
+    get_streaming_exporter,
+    streaming_formats,
+)
+
+SESSION = {
+    "id": "session-1",
+    "path": "/project",
+    "state": "complete",
+    "created_at": "2026-01-01T00:00:00",
+    "notes": ["first note", "ünïcode"],
+    "patterns": [{"name": "layering"}],
+}
+
+OBSERVATIONS = [
+    {"type": "file_sight", "file": "a.py", "result": {"lines": [1, 2, None]}},
+    {
+        "type": "import_sight",
+        "file": "b.py",
+        "statements": [
+            {"module": "os", "line_number": 1},
+            {"module": "json", "line_number": 2},
+        ],
+    },
+    {"type": "file_sight", "file": "c.py", "empty": []},
+    {},
+]
+
+
+def _render(format_name: str, observations, **flags) -> tuple[str, ExportStats]:
+    handle = io.StringIO()
+    exporter = get_streaming_exporter(format_name)
+    stats = exporter.write(handle, SESSION, observations, **flags)
+    return handle.getvalue(), stats
+
+
+@pytest.mark.parametrize("observations", [OBSERVATIONS, []])
+@pytest.mark.parametrize(
+    "flags", [{}, {"include_notes": True, "include_patterns": True}]
+)
+def test_json_matches_whole_document_layout(observations, flags) -> None:
+    text, _ = _render("json", iter(observations), **flags)
+    document = json.loads(text)
+
+    assert document["investigation"] == SESSION
+    assert document["observations"] == observations
+    assert ("notes" in document) == bool(flags)
+    assert ("patterns" in document) == bool(flags)
+    assert text == json.dumps(document, indent=2)
+
+
+def test_jsonl_writes_one_compact_observation_per_line() -> None:
+    text, stats = _render("jsonl", OBSERVATIONS)
+
+    lines = text.splitlines()
+    assert [json.loads(line) for line in lines] == OBSERVATIONS
+    assert all(", " not in line for line in lines)
+    assert stats.observations == len(OBSERVATIONS)
+
+
+def test_csv_expands_import_statements() -> None:
+    text, stats = _render("csv", OBSERVATIONS)
+
+    assert list(csv.reader(io.StringIO(text))) == [
+        ["type", "file", "line", "module"],
+        ["file_sight", "a.py", "", ""],
+        ["import", "b.py", "1", "os"],
+        ["import", "b.py", "2", "json"],
+        ["file_sight", "c.py", "", ""],
+        ["unknown", "", "", ""],
+    ]
+    assert stats.observations == len(OBSERVATIONS)
+
+
+@pytest.mark.parametrize(
+    ("format_name", "heading"),
+    [
+        ("markdown", "## Observations Summary"),
+        ("html", "<h2>Observations</h2>"),
+        ("plain", "OBSERVATIONS SUMMARY"),
+    ],
+)
+def test_summary_formats_count_observation_types(format_name, heading) -> None:
+    text, stats = _render(
+        format_name, OBSERVATIONS, include_notes=True, include_patterns=True
+    )
+
+    assert heading in text
+    assert "Total Observations: 4" in text
+    assert "File_Sight" in text and "Import_Sight" in text
+    assert stats.observations == len(OBSERVATIONS)
+
+
+@pytest.mark.parametrize("format_name", ["json", "jsonl", "csv", "markdown", "html"])
+def test_stats_count_bytes_and_consume_a_generator_once(format_name) -> None:
+    consumed = []
+
+    def observations():
+        for observation in OBSERVATIONS:
+            consumed.append(observation)
+            yield observation
+
+    text, stats = _render(format_name, observations(), include_notes=True)
+
+    assert consumed == OBSERVATIONS
+    assert stats.format == format_name
+    assert stats.observations == len(OBSERVATIONS)
+    assert stats.bytes_written == len(text.encode("utf-8"))
+    assert stats.to_dict()["bytes_written"] == stats.bytes_written
+
+
+def test_registry_lookup() -> None:
+    assert {"json", "jsonl", "csv", "markdown", "html", "plain"} <= set(
+        streaming_formats()
+    )
+    assert get_streaming_exporter("JSON") is not None
+    assert get_streaming_exporter("pdf") is None
+
+
+def test_cli_streams_export_to_file(tmp_path: Path) -> None:
+    cli = CodeMarshalCLI()
+    output = tmp_path / "export.jsonl"
+
+    stats = cli._stream_export(
+        "jsonl", output, SESSION, iter(OBSERVATIONS), False, False
+    )
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == OBSERVATIONS
+    assert stats.bytes_written == output.stat().st_size
+    assert cli._generate_export_content(
+        "jsonl", SESSION, OBSERVATIONS, False, False
+    ) == output.read_text(encoding="utf-8")
+
+
+def test_cli_failed_export_leaves_existing_file_untouched(tmp_path: Path) -> None:
+    cli = CodeMarshalCLI()
+    output = tmp_path / "export.jsonl"
+    output.write_text("previous export\n", encoding="utf-8")
+
+    def failing():
+        yield OBSERVATIONS[0]
+        raise OSError("storage went away")
+
+    with pytest.raises(OSError, match="storage went away"):
+        cli._stream_export("jsonl", output, SESSION, failing(), False, False)
+
+    assert output.read_text(encoding="utf-8") == "previous export\n"
+    assert list(tmp_path.iterdir()) == [output]
+
+
+def test_observations_that_fail_partway_raise(tmp_path: Path, monkeypatch) -> None:
+    from storage.investigation_storage import InvestigationStorage
+
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    (storage.base_path / "observations").mkdir(parents=True, exist_ok=True)
+    session = {**SESSION, "observation_ids": [], "patch_ids": ["patch-1"]}
+
+    def partial(_session_data):
+        yield None, OBSERVATIONS[0]
+        raise OSError("patch unreadable")
+
+    monkeypatch.setattr(storage, "iter_sourced_observations", partial)
+    observations = CodeMarshalCLI()._iter_observations(storage, session)
+
+    assert next(observations) == OBSERVATIONS[0]
+    with pytest.raises(OSError, match="patch unreadable"):
+        next(observations)
+
+
+@pytest.mark.parametrize(
+    "format_name", [entry["format"] for entry in list_supported_formats()]
+)
+def test_format_exporters_write_matches_export(format_name) -> None:
+    exporter = get_exporter(format_name)
+    handle = io.StringIO()
+    exporter.write(handle)
+
+    # Timestamps differ between the two calls; compare the shape
+    expected = exporter.export()
+    assert handle.getvalue().count("\n") == expected.count("\n")
+    assert len(handle.getvalue()) == len(expected)
@@ -0,0 +1,294 @@
+"""Tests for watch batching and the incremental re-observation pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from bridge.commands.watch import WatchPipeline, watch_command
+from observations.eyes.watcher import (
+    ChangeType,
+    FileChange,
+    FileSystemWatcher,
+    WatcherConfig,
+    _coalesce,
+)
+from observations.interface import MinimalObservationInterface
+from storage.investigation_storage import InvestigationStorage
+from storage.query_index import QueryIndex
+
+
+def _change(path: Path, change_type: ChangeType) -> FileChange:
+    return FileChange(path=path, change_type=change_type, timestamp=datetime.now(UTC))
+
+
+def _polling_config() -> WatcherConfig:
+    return WatcherConfig(use_polling=True, poll_interval=0.05, debounce_seconds=0.2)
+
+
+def _touch(path: Path, text: str) -> None:
+    path.write_text(text, encoding="utf-8")
+    # Coarse mtime clocks: make every write visible to the stat poller
+    stamp = time.time_ns()
+    os.utime(path, ns=(stamp, stamp))
+
+
+def _investigate(storage: InvestigationStorage, root: Path, session_id: str) -> dict:
+    """A streamed session over ``root``, as `investigate` stores it."""
+    interface = MinimalObservationInterface(None)
+    files = sorted(root.rglob("*.py"))
+    types = ["file_sight", "import_sight", "export_sight"]
+    with storage.create_streaming_observation(session_id) as stream:
+        for path, observations in interface.observe_files(files, types, root):
+            stream.write_file_observation(str(path), observations)
+    session = {
+        "id": session_id,
+        "path": str(root),
+        "observation_ids": [stream.manifest_id],
+    }
+    storage.save_session(session)
+    return session
+
+
+def test_coalesce_merges_changes_per_path(tmp_path: Path) -> None:
+    path = tmp_path / "a.py"
+    created = _change(path, ChangeType.CREATED)
+    modified = _change(path, ChangeType.MODIFIED)
+    deleted = _change(path, ChangeType.DELETED)
+
+    assert _coalesce(created, modified).change_type == ChangeType.CREATED
+    assert _coalesce(created, modified).timestamp == modified.timestamp
+    assert _coalesce(created, deleted) is None
+    assert _coalesce(deleted, created).change_type == ChangeType.MODIFIED
+    assert _coalesce(modified, deleted).change_type == ChangeType.DELETED
+
+
+def test_polling_watcher_delivers_debounced_batches(tmp_path: Path) -> None:
+    (tmp_path / "keep.py").write_text("x = 1\n", encoding="utf-8")
+    received = []
+    watcher = FileSystemWatcher(tmp_path, _polling_config(), on_batch=received.append)
+    with watcher:
+        assert watcher.next_batch(0) is None
+        _touch(tmp_path / "a.py", "a = 1\n")
+        _touch(tmp_path / "keep.py", "x = 2\n")
+        _touch(tmp_path / "a.py", "a = 2\n")
+        (tmp_path / "__pycache__").mkdir()
+        _touch(tmp_path / "__pycache__" / "a.pyc", "")
+        batch = watcher.next_batch(10)
+
+    assert batch is not None and received == [batch]
+    kinds = {change.path.name: change.change_type for change in batch}
+    assert kinds == {"a.py": ChangeType.CREATED, "keep.py": ChangeType.MODIFIED}
+
+
+def test_undrained_batches_are_merged_not_accumulated(tmp_path: Path) -> None:
+    config = WatcherConfig(use_polling=True, max_queued_batches=3)
+    seen = []
+    watcher = FileSystemWatcher(tmp_path, config, on_change=seen.append)
+    a, b = tmp_path / "a.py", tmp_path / "b.py"
+    batches = [
+        [_change(a, ChangeType.CREATED)],
+        [_change(a, ChangeType.DELETED), _change(b, ChangeType.MODIFIED)],
+        *[[_change(tmp_path / f"f{idx}.py", ChangeType.MODIFIED)] for idx in range(8)],
+    ]
+    for batch in batches:
+        watcher._pending_changes = {change.path: change for change in batch}
+        watcher._flush_pending_changes()
+
+    assert len(seen) == 11
+    assert len(watcher._batches) == 3
+    drained = [watcher.next_batch(0) for _ in range(3)]
+    assert watcher.next_batch(0) is None
+    # a.py was created and deleted: it cancels out in the merged batch
+    assert sorted(change.path.name for change in drained[0]) == ["b.py"] + [
+        f"f{idx}.py" for idx in range(6)
+    ]
+    assert [[change.path.name for change in batch] for batch in drained[1:]] == [
+        ["f6.py"],
+        ["f7.py"],
+    ]
+
+
+def test_watcher_batches_async_iterator(tmp_path: Path) -> None:
+    watcher = FileSystemWatcher(tmp_path, _polling_config())
+
+    async def first_batch():
+        async for batch in watcher.batches():
+            return batch
+
+    with watcher:
+        _touch(tmp_path / "b.py", "b = 1\n")
+        batch = asyncio.run(asyncio.wait_for(first_batch(), 10))
+
+    assert [change.path.name for change in batch] == ["b.py"]
+
+
+def test_pipeline_patches_observations_graph_and_patterns(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    root.mkdir()
+    (root / "a.py").write_text("import b\n", encoding="utf-8")
+    (root / "b.py").write_text("VALUE = 1\n", encoding="utf-8")
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    session = _investigate(storage, root, "watch-1")
+
+    answers = []
+
+    def answer(current: dict) -> str:
+        answers.append(current)
+        return "answered"
+
+    pipeline = WatchPipeline(session, storage=storage, answer=answer)
+    assert pipeline.observation_types == ["file_sight", "import_sight", "export_sight"]
+    assert pipeline.pattern_match_count == 0
+
+    (root / "a.py").write_text("import c\nx = eval('1')\n", encoding="utf-8")
+    (root / "c.py").write_text("def run():\n    return 1\n", encoding="utf-8")
+    (root / "b.py").unlink()
+    report = pipeline.process(
+        [
+            _change(root / "a.py", ChangeType.MODIFIED),
+            _change(root / "c.py", ChangeType.CREATED),
+            _change(root / "b.py", ChangeType.DELETED),
+        ]
+    )
+
+    a, b, c = (str(root / name) for name in ("a.py", "b.py", "c.py"))
+    assert report.reobserved == [a, c]
+    assert report.removed == [b]
+    # eval_usage in a.py, missing_docstring in c.py
+    assert report.pattern_changes == {"added": 2, "cleared": 0}
+    assert report.pattern_matches == 2
+    assert report.answer == "answered"
+    assert set(report.stage_ms) == {"observe", "store", "index", "graph", "patterns", "answer"}
+    assert report.save_to_answer_ms > 0
+
+    # The session records the patch and the index was patched, not rebuilt
+    updated = answers[-1]
+    assert len(updated["patch_ids"]) == 1
+    key = storage.observation_set_key(updated)
+    index = QueryIndex(storage.query_index_path("watch-1"))
+    assert index.is_current(key)
+    assert [(f, m) for f, m, _ in index.import_edges()] == [(a, "c")]
+    assert [name for _f, name, _k in index.export_names(c)] == ["run"]
+
+    # Patching gives what a rebuild from storage gives
+    patched = index.observations()
+    index.path.unlink()
+    assert storage.ensure_query_index(updated).observations() == patched
+
+    from inquiry.answers.dependency_graph import DependencyGraph
+
+    graph = DependencyGraph.load(storage.dependency_graph_path("watch-1"), key)
+    assert graph is not None
+    assert graph.files == [a, c]
+    assert [graph.files[n] for n in graph.successors(graph.node_id(a))] == [c]
+
+
+def test_watch_command_reports_save_to_answer_latency(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    root.mkdir()
+    (root / "a.py").write_text("import os\n", encoding="utf-8")
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    session = _investigate(storage, root, "watch-2")
+
+    def save_later() -> None:
+        time.sleep(0.6)
+        _touch(root / "a.py", "import sys\n")
+
+    writer = threading.Thread(target=save_later)
+    writer.start()
+    result = watch_command(
+        str(root),
+        duration=4,
+        output_format="none",
+        session=session,
+        storage=storage,
+        answer=lambda current: "ok",
+        patterns=False,
+        polling=True,
+        debounce_seconds=0.1,
+    )
+    writer.join()
+
+    assert result["success"] and result["backend"] == "polling"
+    assert result["latency_ms"]["batches"] >= 1
+    first = result["batches"][0]
+    assert first["reobserved"] == [str(root / "a.py")]
+    assert first["answer"] == "ok"
+    assert 0 < first["save_to_answer_ms"] < 4000
+
+
+def test_pipeline_compacts_patches_and_keeps_the_index_current(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    root.mkdir()
+    for name in ("a.py", "b.py", "c.py"):
+        (root / name).write_text("import os\n", encoding="utf-8")
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    session = _investigate(storage, root, "watch-3")
+
+    pipeline = WatchPipeline(session, storage=storage, patterns=False)
+    pipeline.COMPACT_AFTER = 3
+    edits = [("c.py", "import json\n"), ("a.py", "import sys\n"), ("b.py", "import re\n")]
+    for name, text in edits:
+        (root / name).write_text(text, encoding="utf-8")
+        pipeline.process([_change(root / name, ChangeType.MODIFIED)])
+    (root / "c.py").unlink()
+    pipeline.process([_change(root / "c.py", ChangeType.DELETED)])
+
+    # Three patches were folded into one, then one more was appended
+    assert len(pipeline.session["patch_ids"]) == 2
+    folded = next(storage.iter_observation_payloads(pipeline.session["patch_ids"][:1]))[1]
+    assert len(folded["compacted"]) == 3
+
+    pipeline.close()
+    session = storage.load_session_metadata("watch-3")
+    assert session["patch_ids"] == pipeline.session["patch_ids"]
+    assert len(session["patch_ids"]) == 1
+
+    key = storage.observation_set_key(session)
+    index = QueryIndex(storage.query_index_path("watch-3"))
+    assert index.is_current(key)
+    patched = index.observations()
+    index.path.unlink()
+    # Same content and order as a rebuild from the compacted patch
+    assert storage.ensure_query_index(session).observations() == patched
+    a, b = str(root / "a.py"), str(root / "b.py")
+    assert [(f, m) for f, m, _ in QueryIndex(index.path).import_edges()] == [
+        (a, "sys"),
+        (b, "re"),
+    ]
+
+
+def test_pattern_matches_are_saved_and_reused(tmp_path: Path, monkeypatch) -> None:
+    root = tmp_path / "project"
+    root.mkdir()
+    (root / "a.py").write_text("x = eval('1')\n", encoding="utf-8")
+    (root / "b.py").write_text("y = 2\n", encoding="utf-8")
+    storage = InvestigationStorage(base_path=tmp_path / "storage", enable_backups=False)
+    session = _investigate(storage, root, "watch-4")
+
+    pipeline = WatchPipeline(session, storage=storage)
+    _touch(root / "b.py", "y = eval('2')\n")
+    pipeline.process([_change(root / "b.py", ChangeType.MODIFIED)])
+    matches = dict(pipeline._matches)
+    assert storage.pattern_matches_path("watch-4").exists()
+
+    # A restarted pipeline only rescans the file changed in between
+    _touch(root / "a.py", "x = 1\n")
+    scanned = []
+    original_scan = WatchPipeline._scan
+
+    def scan(self, files):
+        scanned.extend(files)
+        original_scan(self, files)
+
+    monkeypatch.setattr(WatchPipeline, "_scan", scan)
+    restarted = WatchPipeline(session, storage=storage)
+
+    assert scanned == [root / "a.py"]
+    assert restarted._matches[str(root / "b.py")] == matches[str(root / "b.py")]
+    assert restarted._matches[str(root / "a.py")] == set()
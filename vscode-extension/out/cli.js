@@ -35,13 +35,17 @@ var __importStar = (this && this.__importStar) || (function () {
 Object.defineProperty(exports, "__esModule", { value: true });
 exports.getCliPath = getCliPath;
 exports.getScanOnSave = getScanOnSave;
+exports.getUseDaemon = getUseDaemon;
 exports.getWorkspaceRoot = getWorkspaceRoot;
+exports.disposeDaemon = disposeDaemon;
 exports.runCodemarshal = runCodemarshal;
 exports.runJsonCommand = runJsonCommand;
 exports.runJsonCommandSafe = runJsonCommandSafe;
 const child_process_1 = require("child_process");
 const vscode = __importStar(require("vscode"));
 const fs = __importStar(require("fs"));
+const utils_1 = require("./utils");
+const daemon_1 = require("./daemon");
 function getCliPath() {
     return (vscode.workspace
         .getConfiguration("codemarshal")
@@ -52,6 +56,11 @@ function getScanOnSave() {
         .getConfiguration("codemarshal")
         .get("scanOnSave") ?? true);
 }
+function getUseDaemon() {
+    return (vscode.workspace
+        .getConfiguration("codemarshal")
+        .get("useDaemon") ?? true);
+}
 function getWorkspaceRoot() {
     const folders = vscode.workspace.workspaceFolders;
     if (!folders || folders.length === 0) {
@@ -59,6 +68,31 @@ function getWorkspaceRoot() {
     }
     return folders[0].uri.fsPath;
 }
+let daemon = null;
+let daemonUnavailable = false;
+// The server resolves relative paths (and its storage/ directory) against
+// the workspace root it was started in; other working directories spawn.
+function getDaemon(cliPath, cwd) {
+    const root = getWorkspaceRoot();
+    if (!getUseDaemon() || daemonUnavailable || !root) {
+        return null;
+    }
+    if (cwd && (0, utils_1.normalizeFsPath)(cwd) !== (0, utils_1.normalizeFsPath)(root)) {
+        return null;
+    }
+    if (daemon && (daemon.cliPath !== cliPath || daemon.cwd !== root)) {
+        daemon.dispose();
+        daemon = null;
+    }
+    if (!daemon) {
+        daemon = new daemon_1.DaemonClient(cliPath, root);
+    }
+    return daemon;
+}
+function disposeDaemon() {
+    daemon?.dispose();
+    daemon = null;
+}
 function extractJsonPayload(text) {
     const trimmed = text.trim();
     if (!trimmed) {
@@ -116,6 +150,30 @@ async function runCodemarshal(cliPath, args, cwd, options) {
                 };
             }
         }
+        const client = getDaemon(cliPath, cwd);
+        if (client) {
+            try {
+                const run = await client.run(args, options?.token);
+                if (run.exit_code !== 0) {
+                    handleExecutionError(`Command exited with code ${run.exit_code}. Stderr: ${run.stderr}`, run.exit_code);
+                }
+                return { stdout: run.stdout, stderr: run.stderr, exitCode: run.exit_code };
+            }
+            catch (err) {
+                if ((0, daemon_1.isCancelled)(err)) {
+                    return { stdout: "", stderr: "Request cancelled", exitCode: 1 };
+                }
+                if (!(err instanceof daemon_1.DaemonUnreachableError)) {
+                    // The server got the request and may still be running it:
+                    // spawning the CLI now could run the command a second time
+                    const message = err instanceof Error ? err.message : String(err);
+                    handleExecutionError(message, 1);
+                    return { stdout: "", stderr: message, exitCode: 1 };
+                }
+                // Server could not start (e.g. a CLI without `serve`): spawn per call
+                daemonUnavailable = true;
+            }
+        }
         return new Promise((resolve) => {
             const proc = (0, child_process_1.spawn)(cliPath, args, {
                 cwd,
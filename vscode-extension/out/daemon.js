@@ -0,0 +1,135 @@
+"use strict";
+Object.defineProperty(exports, "__esModule", { value: true });
+exports.DaemonClient = exports.DaemonUnreachableError = exports.DaemonError = void 0;
+exports.isCancelled = isCancelled;
+const child_process_1 = require("child_process");
+const REQUEST_CANCELLED = -32800;
+class DaemonError extends Error {
+    constructor(message, code) {
+        super(message);
+        this.code = code;
+    }
+}
+exports.DaemonError = DaemonError;
+/**
+ * The server could not be started, or stopped before it answered anything
+ * (e.g. a CLI without `serve`). No request reached it, so running the
+ * command another way cannot run it twice.
+ */
+class DaemonUnreachableError extends Error {
+}
+exports.DaemonUnreachableError = DaemonUnreachableError;
+/**
+ * Client for `codemarshal serve`: one warm CLI process answering JSON-RPC
+ * 2.0 requests, one JSON message per line on stdin/stdout.
+ */
+class DaemonClient {
+    constructor(cliPath, cwd) {
+        this.cliPath = cliPath;
+        this.cwd = cwd;
+        this.proc = null;
+        this.buffer = "";
+        this.nextId = 1;
+        this.pending = new Map();
+        this.answered = false;
+    }
+    get running() {
+        return this.proc !== null;
+    }
+    request(method, params, token) {
+        const proc = this.start();
+        const id = this.nextId++;
+        return new Promise((resolve, reject) => {
+            this.pending.set(id, {
+                resolve: resolve,
+                reject,
+            });
+            token?.onCancellationRequested(() => {
+                this.notify("$/cancelRequest", { id });
+            });
+            proc.stdin.write(JSON.stringify({ jsonrpc: "2.0", id, method, params }) + "\n");
+        });
+    }
+    run(args, token) {
+        return this.request("run", { args }, token);
+    }
+    dispose() {
+        if (this.proc) {
+            this.notify("exit", {});
+            this.proc.stdin.end();
+        }
+        this.fail(new Error("CodeMarshal server stopped"));
+        this.proc = null;
+    }
+    start() {
+        if (this.proc) {
+            return this.proc;
+        }
+        this.answered = false;
+        const proc = (0, child_process_1.spawn)(this.cliPath, ["serve"], {
+            cwd: this.cwd,
+            shell: false,
+            windowsHide: true,
+        });
+        proc.stdout.on("data", (chunk) => this.receive(chunk.toString()));
+        // Writing to a server that already exited fails with EPIPE; "close"
+        // reports that to the pending requests
+        proc.stdin.on("error", () => undefined);
+        // Warnings and logs of the server; responses carry each command's stderr
+        proc.stderr.on("data", () => undefined);
+        proc.on("error", (err) => this.stopped(err));
+        proc.on("close", (code) => this.stopped(new Error(`CodeMarshal server exited with code ${code}`)));
+        this.proc = proc;
+        return proc;
+    }
+    notify(method, params) {
+        this.proc?.stdin.write(JSON.stringify({ jsonrpc: "2.0", method, params }) + "\n");
+    }
+    receive(text) {
+        this.buffer += text;
+        let newline = this.buffer.indexOf("\n");
+        while (newline >= 0) {
+            const line = this.buffer.slice(0, newline).trim();
+            this.buffer = this.buffer.slice(newline + 1);
+            newline = this.buffer.indexOf("\n");
+            if (!line) {
+                continue;
+            }
+            let message;
+            try {
+                message = JSON.parse(line);
+            }
+            catch {
+                continue;
+            }
+            this.answered = true;
+            const request = typeof message.id === "number" ? this.pending.get(message.id) : undefined;
+            if (!request) {
+                continue;
+            }
+            this.pending.delete(message.id);
+            if (message.error) {
+                request.reject(new DaemonError(message.error.message, message.error.code));
+            }
+            else {
+                request.resolve(message.result);
+            }
+        }
+    }
+    stopped(error) {
+        this.proc = null;
+        this.buffer = "";
+        this.fail(this.answered ? error : new DaemonUnreachableError(error.message));
+    }
+    fail(error) {
+        for (const request of this.pending.values()) {
+            request.reject(error);
+        }
+        this.pending.clear();
+    }
+}
+exports.DaemonClient = DaemonClient;
+function isCancelled(error) {
+    return error instanceof DaemonError && error.code === REQUEST_CANCELLED;
+}
+//# sourceMappingURL=daemon.js.map
\ No newline at end of file
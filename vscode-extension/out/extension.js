@@ -45,6 +45,7 @@ const patterns_1 = require("./commands/patterns");
 const config_1 = require("./commands/config");
 const historyTreeDataProvider_1 = require("./historyTreeDataProvider");
 const historyManager_1 = require("./historyManager");
+const cli_1 = require("./cli");
 function activate(context) {
     // Core services and state
     const output = vscode.window.createOutputChannel("CodeMarshal");
@@ -165,6 +166,6 @@ function activate(context) {
     }));
 }
 function deactivate() {
-    // no-op
+    (0, cli_1.disposeDaemon)();
 }
 //# sourceMappingURL=extension.js.map
\ No newline at end of file
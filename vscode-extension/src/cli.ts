@@ -2,6 +2,7 @@ import { spawn } from "child_process";
 import * as vscode from "vscode";
 import * as fs from "fs";
 import { normalizeFsPath } from "./utils";
+import { DaemonClient, DaemonUnreachableError, isCancelled } from "./daemon";
 
 export function getCliPath(): string {
   return (
@@ -19,6 +20,14 @@ export function getScanOnSave(): boolean {
   );
 }
 
+export function getUseDaemon(): boolean {
+  return (
+    vscode.workspace
+      .getConfiguration("codemarshal")
+      .get<boolean>("useDaemon") ?? true
+  );
+}
+
 export function getWorkspaceRoot(): string | null {
   const folders = vscode.workspace.workspaceFolders;
   if (!folders || folders.length === 0) {
@@ -43,6 +52,35 @@ export interface RetryOptions {
   maxRetries?: number;
   delay?: number;
   onRetry?: (attempt: number, error: Error) => void;
+  token?: vscode.CancellationToken;
+}
+
+let daemon: DaemonClient | null = null;
+let daemonUnavailable = false;
+
+// The server resolves relative paths (and its storage/ directory) against
+// the workspace root it was started in; other working directories spawn.
+function getDaemon(cliPath: string, cwd?: string): DaemonClient | null {
+  const root = getWorkspaceRoot();
+  if (!getUseDaemon() || daemonUnavailable || !root) {
+    return null;
+  }
+  if (cwd && normalizeFsPath(cwd) !== normalizeFsPath(root)) {
+    return null;
+  }
+  if (daemon && (daemon.cliPath !== cliPath || daemon.cwd !== root)) {
+    daemon.dispose();
+    daemon = null;
+  }
+  if (!daemon) {
+    daemon = new DaemonClient(cliPath, root);
+  }
+  return daemon;
+}
+
+export function disposeDaemon(): void {
+  daemon?.dispose();
+  daemon = null;
 }
 
 function extractJsonPayload(text: string): string | null {
@@ -122,6 +160,33 @@ export async function runCodemarshal(
       }
     }
 
+    const client = getDaemon(cliPath, cwd);
+    if (client) {
+      try {
+        const run = await client.run(args, options?.token);
+        if (run.exit_code !== 0) {
+          handleExecutionError(
+            `Command exited with code ${run.exit_code}. Stderr: ${run.stderr}`,
+            run.exit_code,
+          );
+        }
+        return { stdout: run.stdout, stderr: run.stderr, exitCode: run.exit_code };
+      } catch (err) {
+        if (isCancelled(err)) {
+          return { stdout: "", stderr: "Request cancelled", exitCode: 1 };
+        }
+        if (!(err instanceof DaemonUnreachableError)) {
+          // The server got the request and may still be running it:
+          // spawning the CLI now could run the command a second time
+          const message = err instanceof Error ? err.message : String(err);
+          handleExecutionError(message, 1);
+          return { stdout: "", stderr: message, exitCode: 1 };
+        }
+        // Server could not start (e.g. a CLI without `serve`): spawn per call
+        daemonUnavailable = true;
+      }
+    }
+
     return new Promise((resolve) => {
       const proc = spawn(cliPath, args, {
         cwd,
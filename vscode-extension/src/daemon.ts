@@ -0,0 +1,169 @@
+import { ChildProcessWithoutNullStreams, spawn } from "child_process";
+import * as vscode from "vscode";
+
+export interface DaemonRunResult {
+  stdout: string;
+  stderr: string;
+  exit_code: number;
+}
+
+interface PendingRequest {
+  resolve: (value: unknown) => void;
+  reject: (error: Error) => void;
+}
+
+const REQUEST_CANCELLED = -32800;
+
+export class DaemonError extends Error {
+  constructor(
+    message: string,
+    public readonly code: number,
+  ) {
+    super(message);
+  }
+}
+
+/**
+ * The server could not be started, or stopped before it answered anything
+ * (e.g. a CLI without `serve`). No request reached it, so running the
+ * command another way cannot run it twice.
+ */
+export class DaemonUnreachableError extends Error {}
+
+/**
+ * Client for `codemarshal serve`: one warm CLI process answering JSON-RPC
+ * 2.0 requests, one JSON message per line on stdin/stdout.
+ */
+export class DaemonClient implements vscode.Disposable {
+  private proc: ChildProcessWithoutNullStreams | null = null;
+  private buffer = "";
+  private nextId = 1;
+  private pending = new Map<number, PendingRequest>();
+  private answered = false;
+
+  constructor(
+    public readonly cliPath: string,
+    public readonly cwd: string,
+  ) {}
+
+  get running(): boolean {
+    return this.proc !== null;
+  }
+
+  request<T>(
+    method: string,
+    params: Record<string, unknown>,
+    token?: vscode.CancellationToken,
+  ): Promise<T> {
+    const proc = this.start();
+    const id = this.nextId++;
+    return new Promise<T>((resolve, reject) => {
+      this.pending.set(id, {
+        resolve: resolve as (value: unknown) => void,
+        reject,
+      });
+      token?.onCancellationRequested(() => {
+        this.notify("$/cancelRequest", { id });
+      });
+      proc.stdin.write(
+        JSON.stringify({ jsonrpc: "2.0", id, method, params }) + "\n",
+      );
+    });
+  }
+
+  run(
+    args: string[],
+    token?: vscode.CancellationToken,
+  ): Promise<DaemonRunResult> {
+    return this.request<DaemonRunResult>("run", { args }, token);
+  }
+
+  dispose(): void {
+    if (this.proc) {
+      this.notify("exit", {});
+      this.proc.stdin.end();
+    }
+    this.fail(new Error("CodeMarshal server stopped"));
+    this.proc = null;
+  }
+
+  private start(): ChildProcessWithoutNullStreams {
+    if (this.proc) {
+      return this.proc;
+    }
+    this.answered = false;
+    const proc = spawn(this.cliPath, ["serve"], {
+      cwd: this.cwd,
+      shell: false,
+      windowsHide: true,
+    });
+    proc.stdout.on("data", (chunk) => this.receive(chunk.toString()));
+    // Writing to a server that already exited fails with EPIPE; "close"
+    // reports that to the pending requests
+    proc.stdin.on("error", () => undefined);
+    // Warnings and logs of the server; responses carry each command's stderr
+    proc.stderr.on("data", () => undefined);
+    proc.on("error", (err) => this.stopped(err));
+    proc.on("close", (code) =>
+      this.stopped(new Error(`CodeMarshal server exited with code ${code}`)),
+    );
+    this.proc = proc;
+    return proc;
+  }
+
+  private notify(method: string, params: Record<string, unknown>): void {
+    this.proc?.stdin.write(JSON.stringify({ jsonrpc: "2.0", method, params }) + "\n");
+  }
+
+  private receive(text: string): void {
+    this.buffer += text;
+    let newline = this.buffer.indexOf("\n");
+    while (newline >= 0) {
+      const line = this.buffer.slice(0, newline).trim();
+      this.buffer = this.buffer.slice(newline + 1);
+      newline = this.buffer.indexOf("\n");
+      if (!line) {
+        continue;
+      }
+      let message: {
+        id?: number;
+        result?: unknown;
+        error?: { code: number; message: string };
+      };
+      try {
+        message = JSON.parse(line);
+      } catch {
+        continue;
+      }
+      this.answered = true;
+      const request =
+        typeof message.id === "number" ? this.pending.get(message.id) : undefined;
+      if (!request) {
+        continue;
+      }
+      this.pending.delete(message.id as number);
+      if (message.error) {
+        request.reject(new DaemonError(message.error.message, message.error.code));
+      } else {
+        request.resolve(message.result);
+      }
+    }
+  }
+
+  private stopped(error: Error): void {
+    this.proc = null;
+    this.buffer = "";
+    this.fail(this.answered ? error : new DaemonUnreachableError(error.message));
+  }
+
+  private fail(error: Error): void {
+    for (const request of this.pending.values()) {
+      request.reject(error);
+    }
+    this.pending.clear();
+  }
+}
+
+export function isCancelled(error: unknown): boolean {
+  return error instanceof DaemonError && error.code === REQUEST_CANCELLED;
+}
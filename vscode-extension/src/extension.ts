@@ -8,6 +8,7 @@ import { registerPatternCommands } from "./commands/patterns";
 import { registerConfigCommands } from "./commands/config";
 import { HistoryTreeDataProvider } from "./historyTreeDataProvider";
 import { HistoryManager } from "./historyManager";
+import { disposeDaemon } from "./cli";
 
 export function activate(context: vscode.ExtensionContext): void {
   // Core services and state
@@ -179,5 +180,5 @@ export function activate(context: vscode.ExtensionContext): void {
 }
 
 export function deactivate(): void {
-  // no-op
+  disposeDaemon();
 }